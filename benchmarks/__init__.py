@@ -0,0 +1,5 @@
+"""Client-side benchmark suite.
+
+Run ``python -m benchmarks run --help`` for the available cases and
+``python -m benchmarks compare base.json head.json`` to compare two result files.
+"""
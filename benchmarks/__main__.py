@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# File: benchmarks/__main__.py
+"""Benchmark CLI
+
+Usage:
+    python -m benchmarks run --uri memory:// --cases insert search --output head.json
+    python -m benchmarks run --uri http://localhost:19530 --token root:Milvus --quick
+    python -m benchmarks compare base.json head.json --threshold 0.1 --fail-on-regression
+    python -m benchmarks load --uri http://haproxy:19530 --token root:Milvus --qps 500 --duration 60
+"""
+import argparse
+import logging
+import os
+import sys
+
+# Keep debug logging of the code under test out of the measurements unless asked for
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+CASES = ("insert", "search", "embeddings", "overhead", "startup")
+
+
+def _ints(value: str) -> list[int]:
+    return [int(item) for item in value.split(",")]
+
+
+def _run(args: argparse.Namespace) -> int:
+    from benchmarks import cases
+    from benchmarks.harness import Report
+
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+
+    if args.quick:
+        args.batch_sizes, args.dims, args.nq, args.limits = [10, 100], [32], [1, 8], [10]
+        args.rows, args.repeat = 2000, 5
+    report = Report.create(backend=args.uri, cases=args.cases, quick=args.quick)
+    connect_kwargs = {"token": args.token} if args.token else {}
+    if args.latency:
+        connect_kwargs["latency"] = args.latency
+    if {"insert", "search", "embeddings"} & set(args.cases):
+        with cases.open_backend(args.uri, **connect_kwargs) as backend:
+            if "insert" in args.cases:
+                for result in cases.insert_throughput(backend, args.batch_sizes, args.dims, args.repeat):
+                    report.add(result)
+            if "search" in args.cases:
+                for result in cases.search_latency(backend, args.nq, args.limits, args.filters, args.search_dim,
+                                                   args.rows, max(args.repeat, 5)):
+                    report.add(result)
+            if "embeddings" in args.cases:
+                for result in cases.embedding_throughput(backend, args.batch_sizes, repeat=args.repeat):
+                    report.add(result)
+    if "overhead" in args.cases:
+        for result in cases.decorator_overhead(iterations=2000 if args.quick else 20_000):
+            report.add(result)
+    if "startup" in args.cases:
+        for result in cases.startup_time(repeat=3 if args.quick else 10):
+            report.add(result)
+    print(report.format())
+    if args.output:
+        report.save(args.output)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    from benchmarks.harness import Report, compare
+
+    comparison = compare(Report.load(args.base), Report.load(args.head), args.threshold)
+    print(comparison.format())
+    regressions = comparison.regressions
+    print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+def _load(args: argparse.Namespace) -> int:
+    from benchmarks.loadgen import config_from_args, run_load
+
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+
+    report = run_load(config_from_args(args))
+    print(report.format())
+    if args.output:
+        report.save(args.output)
+        print(f"\nReport written to {args.output}")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parses the command line and runs the requested command."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Client-side Milvus benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run benchmark cases and write JSON results")
+    run.add_argument("--uri", default="memory://", help="Backend URI; memory:// uses the in-process stand-in")
+    run.add_argument("--token", default="", help="Token for a real Milvus backend")
+    run.add_argument("--latency", type=float, default=0.0, help="Injected per-call latency (memory:// only)")
+    run.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES), help="Cases to run")
+    run.add_argument("--batch-sizes", type=_ints, default=[1, 10, 100, 1000], help="Insert/embedding batch sizes")
+    run.add_argument("--dims", type=_ints, default=[128, 768], help="Insert vector dimensions")
+    run.add_argument("--nq", type=_ints, default=[1, 10, 100], help="Search query counts")
+    run.add_argument("--limits", type=_ints, default=[10, 100], help="Search limits")
+    run.add_argument("--filters", nargs="+", default=["none", "simple", "range", "compound"],
+                     help="Search filter complexities")
+    run.add_argument("--search-dim", type=int, default=128, help="Search vector dimension")
+    run.add_argument("--rows", type=int, default=10_000, help="Rows in the search collection")
+    run.add_argument("--repeat", type=int, default=20, help="Timed calls per benchmark")
+    run.add_argument("--quick", action="store_true", help="Small smoke-test configuration")
+    run.add_argument("--output", "-o", help="Write results to this JSON file")
+    run.set_defaults(handler=_run)
+
+    diff = commands.add_parser("compare", help="Compare two JSON result files")
+    diff.add_argument("base", help="Reference results")
+    diff.add_argument("head", help="Results under test")
+    diff.add_argument("--threshold", type=float, default=0.1, help="Relative change counted as a regression")
+    diff.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions")
+    diff.set_defaults(handler=_compare)
+
+    load = commands.add_parser("load", help="Drive an open-loop request mix at a target rate")
+    from benchmarks.loadgen import add_arguments
+    add_arguments(load)
+    load.set_defaults(handler=_load)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
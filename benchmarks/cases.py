@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# File: benchmarks/cases.py
+"""Benchmark Cases
+
+Client-side benchmarks of the ``MilvusAPI`` insert, search and embedding paths and
+of the logging decorators. Every case takes a ``Backend`` (a connected ``MilvusAPI``
+plus the raw client used for collection setup) and returns ``BenchmarkResult``s.
+
+Cases:
+- insert: ``MilvusAPI.insert`` throughput across batch sizes and dimensions.
+- search: ``MilvusAPI.search`` latency percentiles across nq, limit and filter complexity.
+- embeddings: ``MilvusAPI.generate_embeddings`` throughput across batch sizes.
+- overhead: cost of ``log_decorator``/``async_log_decorator`` and of log calls.
+- startup: cold import time of the package entry points, in fresh interpreters.
+"""
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from benchmarks.harness import BenchmarkResult, measure_async, measure_batch, run_async
+from src.milvus.connect import ConnectAPI
+from src.milvus.milvus import MilvusAPI
+from src.utils import async_log_decorator, log_decorator
+
+# Entry points timed by the startup case, and the dependencies importing them must not load
+STARTUP_MODULES = ("src.milvus.milvus", "src.milvus.connect")
+HEAVY_MODULES = ("numpy", "pymilvus", "pandas", "grpc", "cryptography", "dotenv")
+
+# Filter expressions of increasing complexity, over the dynamic fields inserted by the cases
+FILTERS = {
+    "none": None,
+    "simple": "category == 3",
+    "range": "category in [1, 2, 3, 5, 8] and score > 0.25",
+    "compound": "(category in [1, 2, 3, 5, 8] and score > 0.25) or (category >= 12 and not (score < 0.9))",
+}
+
+
+@dataclass
+class Backend:
+    """A connected MilvusAPI and the client behind it.
+
+    Attributes:
+        uri (str): The backend URI ("memory://" for the in-process stand-in).
+        api (MilvusAPI): The API under test.
+        client (Any): The MilvusClient (or stand-in) used for collection setup.
+
+    """
+
+    uri: str
+    api: MilvusAPI
+    client: Any
+
+
+@contextmanager
+def open_backend(uri: str = "memory://", **kwargs: Any):
+    """Connects to ``uri`` and yields a Backend; ``kwargs`` go to ConnectAPI."""
+    with ConnectAPI(uri=uri, **kwargs) as connect_api:
+        yield Backend(uri, MilvusAPI(connect_api), connect_api.client)
+
+
+@contextmanager
+def _collection(backend: Backend, name: str, dim: int):
+    if backend.client.has_collection(name):
+        backend.client.drop_collection(name)
+    backend.client.create_collection(name, dimension=dim, metric_type="COSINE")
+    try:
+        yield name
+    finally:
+        backend.client.drop_collection(name)
+
+
+def _rows(rng: np.random.Generator, start: int, count: int, dim: int) -> list[dict[str, Any]]:
+    vectors = rng.standard_normal((count, dim), dtype=np.float32)
+    categories = rng.integers(0, 16, count)
+    scores = rng.random(count)
+    return [{"id": start + i, "vector": vectors[i], "category": int(categories[i]), "score": float(scores[i])}
+            for i in range(count)]
+
+
+def insert_throughput(backend: Backend, batch_sizes: list[int], dims: list[int], repeat: int = 10,
+                      seed: int = 0) -> list[BenchmarkResult]:
+    """Measures ``MilvusAPI.insert`` rows per second for each batch size and dimension."""
+    rng = np.random.default_rng(seed)
+    results = []
+    for dim in dims:
+        for batch_size in batch_sizes:
+            with _collection(backend, f"bench_insert_{dim}", dim) as name:
+                batches = iter([_rows(rng, i * batch_size, batch_size, dim) for i in range(repeat + 1)])
+
+                async def insert():
+                    await backend.api.insert(name, next(batches))
+
+                results.append(run_async(measure_async(
+                    "insert", insert, {"batch_size": batch_size, "dim": dim},
+                    repeat=repeat, warmup=1, items=batch_size, unit="rows/s")))
+    return results
+
+
+def search_latency(backend: Backend, nqs: list[int], limits: list[int], filters: list[str], dim: int = 128,
+                   rows: int = 10_000, repeat: int = 50, seed: int = 0) -> list[BenchmarkResult]:
+    """Measures ``MilvusAPI.search`` latency for each nq, limit and filter complexity."""
+    rng = np.random.default_rng(seed)
+    results = []
+    with _collection(backend, f"bench_search_{dim}", dim) as name:
+        for start in range(0, rows, 5000):
+            backend.client.insert(name, _rows(rng, start, min(5000, rows - start), dim))
+        backend.client.flush(name)
+        backend.client.load_collection(name)
+        for nq in nqs:
+            queries = rng.standard_normal((nq, dim), dtype=np.float32).tolist()
+            for limit in limits:
+                for filter_name in filters:
+                    expr = FILTERS[filter_name]
+
+                    async def search(queries=queries, limit=limit, expr=expr):
+                        await backend.api.search(name, queries, "vector", {"metric_type": "COSINE"}, limit, expr)
+
+                    results.append(run_async(measure_async(
+                        "search", search, {"nq": nq, "limit": limit, "filter": filter_name, "rows": rows},
+                        repeat=repeat, items=nq, unit="queries/s")))
+    return results
+
+
+def embedding_throughput(backend: Backend, batch_sizes: list[int], items: int = 4096, dim: int = 384,
+                         repeat: int = 5) -> list[BenchmarkResult]:
+    """Measures ``MilvusAPI.generate_embeddings`` items per second with a constant-cost model."""
+    data = [f"document {i}" for i in range(items)]
+    projection = np.random.default_rng(0).standard_normal((8, dim), dtype=np.float32)
+
+    def model(batch: list[str]) -> np.ndarray:
+        features = np.array([[len(text), hash(text) % 97, *range(6)] for text in batch], dtype=np.float32)
+        return features @ projection
+
+    results = []
+    for batch_size in batch_sizes:
+        async def embed(batch_size=batch_size):
+            await backend.api.generate_embeddings(data, model, batch_size=batch_size)
+
+        results.append(run_async(measure_async(
+            "embeddings", embed, {"batch_size": batch_size, "items": items, "dim": dim},
+            repeat=repeat, warmup=1, items=items, unit="items/s")))
+    return results
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+async def _async_noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+def decorator_overhead(iterations: int = 20_000, repeat: int = 5) -> list[BenchmarkResult]:
+    """Measures the per-call cost of the logging decorators and of log calls.
+
+    Decorators are measured with DEBUG logging disabled and enabled (records are sent
+    to a null handler); ``log.debug`` is measured below and above the logger level.
+    """
+    logger = logging.getLogger("src.utils")
+    results = []
+    sync_decorated = log_decorator(_noop)
+    async_decorated = async_log_decorator(_async_noop)
+    args = ([0.1] * 128,)
+
+    async def time_async(func: Callable[..., Any]) -> list[float]:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                await func(*args)
+            timings.append((time.perf_counter() - started) / iterations)
+        return timings
+
+    for debug in (False, True):
+        with _log_level(logger, logging.DEBUG if debug else logging.WARNING):
+            params = {"debug": debug}
+            results.append(measure_batch("call.plain", lambda: _noop(*args), params, iterations, repeat))
+            results.append(measure_batch("call.log_decorator", lambda: sync_decorated(*args), params,
+                                         iterations, repeat))
+            results.append(BenchmarkResult.from_timings(
+                "call.async_plain", params, run_async(time_async(_async_noop))))
+            results.append(BenchmarkResult.from_timings(
+                "call.async_log_decorator", params, run_async(time_async(async_decorated))))
+            results.append(measure_batch("log.debug", lambda: logger.debug("benchmark %s", args[0][0]), params,
+                                         iterations, repeat))
+    return results
+
+
+@contextmanager
+def _log_level(logger: logging.Logger, level: int):
+    """Temporarily sets a logger level and routes its records to a null handler only."""
+    previous_level, previous_propagate = logger.level, logger.propagate
+    null = logging.NullHandler()
+    logger.setLevel(level)
+    logger.propagate = False
+    logger.addHandler(null)
+    try:
+        yield
+    finally:
+        logger.removeHandler(null)
+        logger.setLevel(previous_level)
+        logger.propagate = previous_propagate
+
+
+_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": sorted(name for name in {heavy!r} if name in sys.modules)}}))
+"""
+
+
+def cold_import(module: str) -> dict[str, Any]:
+    """Imports ``module`` in a fresh interpreter.
+
+    Returns:
+        Dict[str, Any]: ``seconds`` spent importing and the ``HEAVY_MODULES`` it loaded.
+
+    """
+    probe = _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", probe], cwd=root, check=True, capture_output=True,
+                            text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def startup_time(modules: tuple[str, ...] = STARTUP_MODULES, repeat: int = 5) -> list[BenchmarkResult]:
+    """Measures the cold import time of each module over ``repeat`` fresh interpreters."""
+    return [BenchmarkResult.from_timings("startup", {"module": module},
+                                         [cold_import(module)["seconds"] for _ in range(repeat)])
+            for module in modules]
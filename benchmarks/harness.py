@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# File: benchmarks/harness.py
+"""Benchmark Harness
+
+Timing primitives, result records and the JSON report format shared by the
+benchmark cases. A report holds the environment it was produced in (commit, Python
+and NumPy versions, backend URI) and one ``BenchmarkResult`` per case and parameter
+combination; two reports are compared result by result, keyed by case name and
+parameters.
+
+Example Usage:
+```python
+>>> from benchmarks.harness import Report, compare, measure
+>>> result = measure("noop", lambda: None, repeat=1000)
+>>> report = Report.create(backend="memory://")
+>>> report.add(result)
+>>> report.save("head.json")
+>>> print(compare(Report.load("base.json"), report).format())
+```
+"""
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+
+REPORT_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark case for one parameter combination.
+
+    Attributes:
+        name (str): Case name, e.g. "insert".
+        params (Dict[str, Any]): Parameters of the run, e.g. ``{"batch_size": 100}``.
+        samples (int): Number of timed calls.
+        items (int): Items processed per call (rows, queries, ...).
+        latency_ms (Dict[str, float]): mean/min/p50/p90/p99/max latency per call.
+        throughput (float): Items processed per second.
+        unit (str): Unit of the throughput, e.g. "rows/s".
+
+    """
+
+    name: str
+    params: dict[str, Any]
+    samples: int
+    items: int
+    latency_ms: dict[str, float]
+    throughput: float
+    unit: str
+
+    @property
+    def key(self) -> str:
+        """Identifies the result across reports."""
+        return self.name + "".join(f" {k}={v}" for k, v in sorted(self.params.items()))
+
+    @classmethod
+    def from_timings(cls, name: str, params: dict[str, Any], timings: list[float], items: int = 1,
+                     unit: str = "ops/s") -> "BenchmarkResult":
+        """Summarizes per-call wall times in seconds."""
+        seconds = np.asarray(timings, dtype=np.float64)
+        if not len(seconds):
+            raise ValueError(f"Benchmark {name} produced no samples")
+        milliseconds = seconds * 1000
+        return cls(
+            name=name,
+            params=dict(params),
+            samples=len(seconds),
+            items=items,
+            latency_ms={
+                "mean": float(milliseconds.mean()),
+                "min": float(milliseconds.min()),
+                "p50": float(np.percentile(milliseconds, 50)),
+                "p90": float(np.percentile(milliseconds, 90)),
+                "p99": float(np.percentile(milliseconds, 99)),
+                "max": float(milliseconds.max()),
+            },
+            throughput=float(items * len(seconds) / seconds.sum()) if seconds.sum() > 0 else float("inf"),
+            unit=unit,
+        )
+
+
+def measure(name: str, func: Callable[[], Any], params: dict[str, Any] | None = None, repeat: int = 100,
+            warmup: int = 3, items: int = 1, unit: str = "ops/s") -> BenchmarkResult:
+    """Times ``repeat`` calls of a synchronous function after ``warmup`` untimed calls."""
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return BenchmarkResult.from_timings(name, params or {}, timings, items, unit)
+
+
+async def measure_async(name: str, func: Callable[[], Awaitable[Any]], params: dict[str, Any] | None = None,
+                        repeat: int = 100, warmup: int = 3, items: int = 1, unit: str = "ops/s") -> BenchmarkResult:
+    """Times ``repeat`` awaited calls of a coroutine function after ``warmup`` untimed calls."""
+    for _ in range(warmup):
+        await func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - started)
+    return BenchmarkResult.from_timings(name, params or {}, timings, items, unit)
+
+
+def measure_batch(name: str, func: Callable[[], Any], params: dict[str, Any] | None = None,
+                  iterations: int = 100_000, repeat: int = 5, unit: str = "ops/s") -> BenchmarkResult:
+    """Times ``repeat`` loops of ``iterations`` calls; suited to sub-microsecond operations.
+
+    Latencies are reported per call (loop time divided by ``iterations``).
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        timings.append((time.perf_counter() - started) / iterations)
+    return BenchmarkResult.from_timings(name, params or {}, timings, 1, unit)
+
+
+def run_async(coroutine: Awaitable[Any]) -> Any:
+    """Runs a coroutine from synchronous benchmark code."""
+    return asyncio.run(coroutine)
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+@dataclass
+class Report:
+    """A set of benchmark results with the environment they were produced in.
+
+    Attributes:
+        meta (Dict[str, Any]): Commit, versions, backend and timestamp.
+        results (List[BenchmarkResult]): The measurements.
+
+    """
+
+    meta: dict[str, Any]
+    results: list[BenchmarkResult] = field(default_factory=list)
+
+    @classmethod
+    def create(cls, backend: str, **meta: Any) -> "Report":
+        """Creates an empty report describing the current environment."""
+        return cls(meta={
+            "version": REPORT_VERSION,
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "backend": backend,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            **meta,
+        })
+
+    def add(self, result: BenchmarkResult):
+        """Appends a result."""
+        self.results.append(result)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the JSON-serializable report."""
+        return {"meta": self.meta, "results": [asdict(result) for result in self.results]}
+
+    def save(self, path: str):
+        """Writes the report as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "Report":
+        """Reads a report written by ``save``."""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(meta=data.get("meta", {}), results=[BenchmarkResult(**result) for result in data["results"]])
+
+    def format(self) -> str:
+        """Formats the results as a text table."""
+        lines = [f"{'benchmark':<60} {'throughput':>23} {'p50 ms':>10} {'p99 ms':>10}"]
+        for result in self.results:
+            lines.append(f"{result.key:<60} {result.throughput:>12.1f} {result.unit:<10} "
+                         f"{result.latency_ms['p50']:>10.3f} {result.latency_ms['p99']:>10.3f}")
+        return "\n".join(lines)
+
+
+@dataclass
+class Comparison:
+    """Relative change of each result present in both reports.
+
+    Attributes:
+        rows (List[Dict[str, Any]]): key, base/head throughput and p99, and changes.
+        threshold (float): Relative change counted as a regression.
+
+    """
+
+    rows: list[dict[str, Any]]
+    threshold: float
+
+    @property
+    def regressions(self) -> list[dict[str, Any]]:
+        """Results whose throughput dropped or p99 latency grew by more than the threshold."""
+        return [row for row in self.rows
+                if row["throughput_change"] < -self.threshold or row["p99_change"] > self.threshold]
+
+    def format(self) -> str:
+        """Formats the comparison as a text table, regressions marked with ``!``."""
+        regressions = {row["key"] for row in self.regressions}
+        lines = [f"  {'benchmark':<60} {'throughput':>11} {'p99':>9}"]
+        for row in self.rows:
+            lines.append(f"{'!' if row['key'] in regressions else ' '} {row['key']:<60} "
+                         f"{row['throughput_change']:>+10.1%} {row['p99_change']:>+9.1%}")
+        return "\n".join(lines)
+
+
+def compare(base: Report, head: Report, threshold: float = 0.1) -> Comparison:
+    """Compares two reports result by result.
+
+    Args:
+        base (Report): The reference report (e.g. from the main branch).
+        head (Report): The report under test.
+        threshold (float): Relative change counted as a regression. Defaults to 0.1.
+
+    Returns:
+        Comparison: Changes of the results present in both reports.
+
+    """
+    baseline = {result.key: result for result in base.results}
+    rows = []
+    for result in head.results:
+        before = baseline.get(result.key)
+        if before is None:
+            continue
+        rows.append({
+            "key": result.key,
+            "base_throughput": before.throughput,
+            "head_throughput": result.throughput,
+            "throughput_change": _change(before.throughput, result.throughput),
+            "base_p99_ms": before.latency_ms["p99"],
+            "head_p99_ms": result.latency_ms["p99"],
+            "p99_change": _change(before.latency_ms["p99"], result.latency_ms["p99"]),
+        })
+    return Comparison(rows, threshold)
+
+
+def _change(before: float, after: float) -> float:
+    return (after - before) / before if before else 0.0
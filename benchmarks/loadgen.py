@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+# File: benchmarks/loadgen.py
+"""Open-Loop Load Generator
+
+Drives a target rate of search, insert and delete requests through ``MilvusAPI``.
+Arrivals are scheduled open-loop: request *i* is due at a fixed time computed from
+the target rate (uniform or Poisson spacing), whether or not earlier requests have
+completed, and its latency is measured from that due time. A stalled server therefore
+shows up as growing latency instead of a silently lower request rate (coordinated
+omission).
+
+Latencies go into HDR-style log-linear histograms per operation, both cumulative and
+per reporting interval, so the report has totals and a time series.
+
+Example Usage:
+```python
+>>> from benchmarks.loadgen import LoadConfig, run_load
+>>> report = run_load(LoadConfig(uri="memory://", qps=500, duration=30,
+...                              mix={"search": 0.8, "insert": 0.15, "delete": 0.05}))
+>>> print(report.format())
+```
+
+Command line:
+    python -m benchmarks load --uri http://haproxy:19530 --token root:Milvus --qps 500 --duration 60
+"""
+import asyncio
+import json
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+
+OPERATIONS = ("search", "insert", "delete")
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in the style of HdrHistogram.
+
+    Values are recorded in microseconds. Values below ``2 * sub_buckets`` are counted
+    exactly; above that each power of two is split into ``sub_buckets`` linear buckets,
+    which bounds the relative error of any reported value by ``1 / sub_buckets``.
+
+    Attributes:
+        sub_buckets (int): Linear buckets per power of two (a power of two).
+        count (int): Recorded values.
+        max_us (int): Largest recorded value.
+
+    Example:
+        ```python
+        histogram = LatencyHistogram()
+        histogram.record(0.0042)
+        histogram.percentile(99)  # seconds
+        ```
+
+    """
+
+    def __init__(self, sub_buckets: int = 64, max_seconds: float = 3600.0):
+        if sub_buckets < 2 or sub_buckets & (sub_buckets - 1):
+            raise ValueError("sub_buckets must be a power of two")
+        self.sub_buckets = sub_buckets
+        self._shift = sub_buckets.bit_length()  # values below 2**shift are exact
+        self._max_us = int(max_seconds * 1e6)
+        self.counts = np.zeros(self._index(self._max_us) + 1, dtype=np.int64)
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def _index(self, value_us: int) -> int:
+        exponent = value_us.bit_length() - self._shift
+        if exponent <= 0:
+            return value_us
+        return (exponent + 1) * self.sub_buckets + (value_us >> exponent) - self.sub_buckets
+
+    def _value(self, index: int) -> int:
+        """Upper bound (inclusive) of the values counted in a bucket."""
+        if index < 2 * self.sub_buckets:
+            return index
+        exponent = index // self.sub_buckets - 1
+        mantissa = index - exponent * self.sub_buckets
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, seconds: float):
+        """Records one latency in seconds; values beyond the range are clamped."""
+        value_us = min(max(int(seconds * 1e6), 0), self._max_us)
+        self.counts[self._index(value_us)] += 1
+        self.count += 1
+        self.total_us += value_us
+        self.max_us = max(self.max_us, value_us)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Adds the values recorded in another histogram with the same layout."""
+        self.counts += other.counts
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percentile: float) -> float:
+        """Returns the latency in seconds at or below which ``percentile`` % of values fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return min(self._value(index), self.max_us) / 1e6
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.total_us / self.count / 1e6 if self.count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Returns count, mean, percentiles and max, latencies in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "p999_ms": self.percentile(99.9) * 1000,
+            "max_ms": self.max_us / 1000,
+        }
+
+
+@dataclass
+class LoadConfig:
+    """Load generator settings.
+
+    Attributes:
+        uri (str): Target URI; "memory://" runs against the in-process stand-in.
+        token (str): Authentication token for a real deployment.
+        collection (str): Collection to load; created with quick setup if missing.
+        dim (int): Vector dimension.
+        qps (float): Target request rate over all operations.
+        duration (float): Seconds of load.
+        mix (Dict[str, float]): Relative weight of each operation.
+        arrival (str): "poisson" or "uniform" inter-arrival spacing.
+        workers (int): Concurrent requests in flight.
+        max_backlog (int): Due requests allowed to wait for a worker before new ones are dropped.
+        batch_size (int): Rows per insert.
+        limit (int): Hits per search.
+        filter (str | None): Filter expression of searches.
+        preload (int): Rows inserted before the run.
+        interval (float): Seconds per time-series sample.
+        latency (float): Injected per-call latency of the stand-in.
+        seed (int): Random seed.
+        drop_collection (bool): Drop the collection after the run.
+
+    """
+
+    uri: str = "memory://"
+    token: str = ""
+    collection: str = "loadgen"
+    dim: int = 128
+    qps: float = 100.0
+    duration: float = 10.0
+    mix: dict[str, float] = field(default_factory=lambda: {"search": 0.8, "insert": 0.15, "delete": 0.05})
+    arrival: str = "poisson"
+    workers: int = 32
+    max_backlog: int = 10_000
+    batch_size: int = 10
+    limit: int = 10
+    filter: str | None = None
+    preload: int = 10_000
+    interval: float = 1.0
+    latency: float = 0.0
+    seed: int = 0
+    drop_collection: bool = True
+
+    def __post_init__(self):
+        unknown = set(self.mix) - set(OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown operations in mix: {sorted(unknown)}")
+        if self.qps <= 0 or self.duration <= 0 or self.workers < 1:
+            raise ValueError("qps, duration and workers must be positive")
+        if self.arrival not in ("poisson", "uniform"):
+            raise ValueError("arrival must be 'poisson' or 'uniform'")
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run.
+
+    Attributes:
+        config (Dict[str, Any]): The settings used.
+        elapsed (float): Wall time of the run in seconds.
+        totals (Dict[str, Dict[str, float]]): Per-operation summary over the run.
+        timeseries (List[Dict[str, Any]]): Per-interval, per-operation summaries.
+
+    """
+
+    config: dict[str, Any]
+    elapsed: float
+    totals: dict[str, dict[str, float]]
+    timeseries: list[dict[str, Any]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the JSON-serializable report."""
+        return asdict(self)
+
+    def save(self, path: str):
+        """Writes the report as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def format(self) -> str:
+        """Formats totals and the time series as text."""
+        lines = [f"{'operation':<10} {'count':>8} {'errors':>7} {'dropped':>8} {'rate/s':>9} {'p50 ms':>9} "
+                 f"{'p99 ms':>9} {'p99.9 ms':>9} {'max ms':>9}"]
+        for name, total in self.totals.items():
+            lines.append(f"{name:<10} {total['count']:>8} {total['errors']:>7} {total['dropped']:>8} "
+                         f"{total['rate']:>9.1f} {total['p50_ms']:>9.2f} {total['p99_ms']:>9.2f} "
+                         f"{total['p999_ms']:>9.2f} {total['max_ms']:>9.2f}")
+        lines.append("")
+        lines.append(f"{'t (s)':>6} " + " ".join(f"{name + ' rate':>13} {name + ' p99':>12}" for name in self.totals))
+        for sample in self.timeseries:
+            lines.append(f"{sample['t']:>6.1f} " + " ".join(
+                f"{sample['ops'][name]['rate']:>13.1f} {sample['ops'][name]['p99_ms']:>12.2f}"
+                for name in self.totals))
+        return "\n".join(lines)
+
+
+class _Stats:
+    """Cumulative and current-interval histograms and counters of one operation."""
+
+    def __init__(self):
+        self.total = LatencyHistogram()
+        self.window = LatencyHistogram()
+        self.errors = 0
+        self.window_errors = 0
+        self.dropped = 0
+
+    def record(self, seconds: float, ok: bool):
+        self.total.record(seconds)
+        self.window.record(seconds)
+        if not ok:
+            self.errors += 1
+            self.window_errors += 1
+
+    def roll(self, interval: float) -> dict[str, float]:
+        sample = {**self.window.summary(), "errors": self.window_errors, "rate": self.window.count / interval}
+        self.window = LatencyHistogram()
+        self.window_errors = 0
+        return sample
+
+
+class LoadGenerator:
+    """Runs an open-loop load against a MilvusAPI backend.
+
+    Attributes:
+        config (LoadConfig): The settings.
+
+    Methods:
+        run: Sets up the collection, drives the load and returns a LoadReport.
+
+    Example:
+        ```python
+        report = asyncio.run(LoadGenerator(LoadConfig(qps=200, duration=5)).run())
+        ```
+
+    """
+
+    def __init__(self, config: LoadConfig):
+        self.config = config
+        self._rng = np.random.default_rng(config.seed)
+        self._stats = {name: _Stats() for name in config.mix}
+        self._next_id = 0
+        self._live_ids: list[int] = []
+
+    def _rows(self, count: int) -> list[dict[str, Any]]:
+        vectors = self._rng.standard_normal((count, self.config.dim), dtype=np.float32)
+        categories = self._rng.integers(0, 16, count)
+        rows = [{"id": self._next_id + i, "vector": vectors[i], "category": int(categories[i])} for i in range(count)]
+        self._next_id += count
+        return rows
+
+    def _setup(self, backend):
+        client = backend.client
+        if not client.has_collection(self.config.collection):
+            client.create_collection(self.config.collection, dimension=self.config.dim, metric_type="COSINE")
+        for start in range(0, self.config.preload, 5000):
+            rows = self._rows(min(5000, self.config.preload - start))
+            client.insert(self.config.collection, rows)
+            self._live_ids.extend(row["id"] for row in rows)
+        client.flush(self.config.collection)
+        client.load_collection(self.config.collection)
+
+    async def _execute(self, api, operation: str):
+        config = self.config
+        if operation == "search":
+            query = self._rng.standard_normal((1, config.dim), dtype=np.float32).tolist()
+            await api.search(config.collection, query, "vector", {"metric_type": "COSINE"}, config.limit,
+                             config.filter)
+        elif operation == "insert":
+            rows = self._rows(config.batch_size)
+            await api.insert(config.collection, rows)
+            self._live_ids.extend(row["id"] for row in rows)
+        elif operation == "delete":
+            if not self._live_ids:
+                return
+            count = min(config.batch_size, len(self._live_ids))
+            ids, self._live_ids[-count:] = self._live_ids[-count:], []
+            await api.delete(config.collection, f"id in [{', '.join(map(str, ids))}]")
+
+    def _arrivals(self) -> np.ndarray:
+        """Due times (seconds from start) of all requests of the run."""
+        config = self.config
+        expected = int(config.qps * config.duration * 1.2) + 16
+        if config.arrival == "uniform":
+            gaps = np.full(expected, 1.0 / config.qps)
+        else:
+            gaps = self._rng.exponential(1.0 / config.qps, expected)
+        due = np.cumsum(gaps) - gaps[0]
+        return due[due < config.duration]
+
+    async def run(self) -> LoadReport:
+        """Sets up the collection, drives the load and returns the report."""
+        from benchmarks.cases import open_backend
+
+        config = self.config
+        connect_kwargs: dict[str, Any] = {"token": config.token} if config.token else {}
+        if config.latency:
+            connect_kwargs["latency"] = config.latency
+        with open_backend(config.uri, **connect_kwargs) as backend:
+            try:
+                self._setup(backend)
+                return await self._drive(backend.api)
+            finally:
+                if config.drop_collection:
+                    backend.client.drop_collection(config.collection)
+
+    async def _drive(self, api) -> LoadReport:
+        config = self.config
+        names = list(config.mix)
+        weights = np.array([config.mix[name] for name in names], dtype=np.float64)
+        due_times = self._arrivals()
+        operations = self._rng.choice(len(names), size=len(due_times), p=weights / weights.sum())
+        queue: asyncio.Queue = asyncio.Queue()
+        timeseries = []
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        async def worker():
+            while True:
+                operation, due = await queue.get()
+                ok = True
+                try:
+                    await self._execute(api, operation)
+                except Exception:  # counted as an error of the operation
+                    ok = False
+                # Measured from the due time, so waiting for a worker counts as latency
+                self._stats[operation].record(loop.time() - due, ok)
+                queue.task_done()
+
+        async def sampler():
+            tick = 1
+            while True:
+                await asyncio.sleep(max(0.0, start + tick * config.interval - loop.time()))
+                timeseries.append({"t": tick * config.interval,
+                                   "backlog": queue.qsize(),
+                                   "ops": {name: stats.roll(config.interval) for name, stats in self._stats.items()}})
+                tick += 1
+
+        workers = [asyncio.create_task(worker()) for _ in range(config.workers)]
+        sampling = asyncio.create_task(sampler())
+        try:
+            for operation, offset in zip(operations, due_times, strict=True):
+                due = start + float(offset)
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                name = names[operation]
+                if queue.qsize() >= config.max_backlog:
+                    self._stats[name].dropped += 1
+                    continue
+                queue.put_nowait((name, due))
+            await queue.join()
+        finally:
+            sampling.cancel()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(sampling, *workers, return_exceptions=True)
+        elapsed = loop.time() - start
+        totals = {name: {**stats.total.summary(), "errors": stats.errors, "dropped": stats.dropped,
+                         "rate": stats.total.count / elapsed}
+                  for name, stats in self._stats.items()}
+        return LoadReport(asdict(config), elapsed, totals, timeseries)
+
+
+def run_load(config: LoadConfig) -> LoadReport:
+    """Runs a load from synchronous code."""
+    return asyncio.run(LoadGenerator(config).run())
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """Parses ``search=0.8,insert=0.15,delete=0.05`` into operation weights."""
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def add_arguments(parser):
+    """Adds the load generator options to an argparse parser."""
+    defaults = LoadConfig()
+    parser.add_argument("--uri", default=defaults.uri, help="Target URI; memory:// runs a local dry run")
+    parser.add_argument("--token", default=defaults.token, help="Authentication token")
+    parser.add_argument("--collection", default=defaults.collection, help="Collection name")
+    parser.add_argument("--dim", type=int, default=defaults.dim, help="Vector dimension")
+    parser.add_argument("--qps", type=float, default=defaults.qps, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=defaults.duration, help="Seconds of load")
+    parser.add_argument("--mix", type=parse_mix, default=defaults.mix,
+                        help="Operation weights, e.g. search=0.8,insert=0.15,delete=0.05")
+    parser.add_argument("--arrival", choices=("poisson", "uniform"), default=defaults.arrival,
+                        help="Inter-arrival distribution")
+    parser.add_argument("--workers", type=int, default=defaults.workers, help="Concurrent requests in flight")
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size, help="Rows per insert/delete")
+    parser.add_argument("--limit", type=int, default=defaults.limit, help="Hits per search")
+    parser.add_argument("--filter", default=defaults.filter, help="Search filter expression")
+    parser.add_argument("--preload", type=int, default=defaults.preload, help="Rows inserted before the run")
+    parser.add_argument("--interval", type=float, default=defaults.interval, help="Seconds per time-series sample")
+    parser.add_argument("--latency", type=float, default=defaults.latency,
+                        help="Injected per-call latency (memory:// only)")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed")
+    parser.add_argument("--keep-collection", action="store_true", help="Do not drop the collection afterwards")
+    parser.add_argument("--output", "-o", help="Write the report to this JSON file")
+
+
+def config_from_args(args) -> LoadConfig:
+    """Builds a LoadConfig from parsed ``add_arguments`` options."""
+    return LoadConfig(uri=args.uri, token=args.token, collection=args.collection, dim=args.dim, qps=args.qps,
+                      duration=args.duration, mix=args.mix, arrival=args.arrival, workers=args.workers,
+                      batch_size=args.batch_size, limit=args.limit, filter=args.filter, preload=args.preload,
+                      interval=args.interval, latency=args.latency, seed=args.seed,
+                      drop_collection=not args.keep_collection)
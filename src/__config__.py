@@ -3,20 +3,40 @@
 # --------------------------------------------------------------
 import logging
 import os
+import threading
 import time
 
-import dotenv
-
 log = logging.getLogger(__name__)
+
+_env_loaded: bool | None = None
+_env_lock = threading.Lock()
+
+
 # --------------------------------------------------------------
-# Load environment variables from .env file
+# Load environment variables from .env file, on first use
 # --------------------------------------------------------------
-try:
-    env = dotenv.find_dotenv(filename=".env", raise_error_if_not_found=True, usecwd=False)
-    dotenv.load_dotenv(env, override=True)
-except Exception as e:
-    log.error(f"Error loading .env file: {e}")
-    exit(".env file not found or error loading it.")
+def load_env() -> bool:
+    """Loads the nearest .env file into the environment, once per process.
+
+    Nothing is read at import time; configuration consumers (logging setup,
+    ConfigManager, connection wrappers) call this when they first need it.
+
+    Returns:
+        bool: True if a .env file was found and loaded.
+
+    """
+    global _env_loaded
+    with _env_lock:
+        if _env_loaded is None:
+            import dotenv
+            try:
+                env = dotenv.find_dotenv(filename=".env", raise_error_if_not_found=True, usecwd=False)
+                _env_loaded = dotenv.load_dotenv(env, override=True)
+            except Exception as e:
+                log.warning(f"No .env file loaded, using the process environment: {e}")
+                _env_loaded = False
+        return _env_loaded
+
 
 # --------------------------------------------------------------
 # Define project environment
@@ -68,7 +88,7 @@ log_config = {
             "interval": 1,
             "backupCount": 2,
             "encoding": "utf-8",
-            "delay": False,
+            "delay": True,
             "utc": False,
             "level": "DEBUG",
             "formatter": "standard",
@@ -1,29 +1,292 @@
 #!/usr/bin/env python3
 # File: src.logger.py
+import atexit
+import json
 import logging
-import logging.config
+import logging.handlers
 import os
+import queue
+import random
+import threading
+import time
 import traceback
+from datetime import datetime, timezone
 
-from src.__config__ import LOG_DIR, log_config
+from src.__config__ import LOG_DIR, load_env, log_config
 
 # Flag to track if logging has been configured
 _logging_configured = False
+_configure_lock = threading.RLock()
+# Loggers created without an explicit level follow LOG_LEVEL once the .env file is loaded
+_default_level_loggers: set[str] = set()
 
 
-def getLogger(name: str = None, level: str = os.getenv("LOG_LEVEL", "DEBUG")):
-    """Create and return a logger with the caller's base filename or a custom name."""
+class _DeferredConfigHandler(logging.Handler):
+    """Root handler until the first record: configures logging, then re-emits the record.
+
+    Keeps imports cheap; the .env file, the log directory and the handlers of
+    ``log_config`` are only set up when something is actually logged.
+    """
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        configure_logging()
+        if logging.getLogger(record.name).isEnabledFor(record.levelno):
+            for handler in logging.getLogger().handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord):
+        pass
+
+
+_deferred_handler = _DeferredConfigHandler()
+
+
+def configure_logging():
+    """Loads the .env file and applies ``log_config``, once per process.
+
+    Called on the first log record; call it directly to configure logging eagerly.
+    Handlers installed on the root logger by others (e.g. pytest) are kept.
+    """
     global _logging_configured
-    if not _logging_configured:
+    with _configure_lock:
+        if _logging_configured:
+            return
+        _logging_configured = True
+        import logging.config
+        load_env()
         # Create the log directory if it doesn't exist
         if not os.path.exists(LOG_DIR):
             os.makedirs(LOG_DIR, exist_ok=True)
-            # print(f"Created log directory: {LOG_DIR}")
-        # else:
-        #     print(f"Log directory already exists: {LOG_DIR.split('/')[-1]}")
-        # Configure logging once
+        root = logging.getLogger()
+        foreign = [h for h in root.handlers if h is not _deferred_handler]
         logging.config.dictConfig(log_config)
-        _logging_configured = True
+        root.removeHandler(_deferred_handler)
+        for handler in foreign:
+            root.addHandler(handler)
+        level = os.getenv("LOG_LEVEL", "DEBUG")
+        for name in _default_level_loggers:
+            logging.getLogger(name).setLevel(level)
+        if os.getenv("LOG_MODE", "sync").lower() == "queue":
+            use_queue_logging(
+                queue_size=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+                policy=os.getenv("LOG_QUEUE_POLICY", "drop"),
+                json_format=os.getenv("LOG_FORMAT", "text").lower() == "json",
+                rate_limit=float(os.getenv("LOG_RATE_LIMIT", "0")) or None,
+                sample=float(os.getenv("LOG_SAMPLE", "1")),
+            )
+
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+
+    Fields: ``timestamp`` (UTC, ISO 8601), ``level``, ``logger``, ``message``, ``module``,
+    ``line``, ``thread``, ``exception`` when present, and every ``extra`` attribute.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """Per-logger rate limiting and sampling of low-severity records.
+
+    Records at or above ``always_level`` always pass. Below it, a fraction ``sample``
+    of the records is kept, and each logger may emit at most ``rate`` of them per
+    second (with bursts of ``burst``). Suppressed records are counted per logger.
+    """
+
+    def __init__(self, rate: float | None = None, burst: float | None = None, sample: float = 1.0,
+                 always_level: int = logging.WARNING):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self.sample = sample
+        self.always_level = always_level
+        self._lock = threading.Lock()
+        self._buckets: dict[str, list[float]] = {}
+        self.suppressed: dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.always_level:
+            return True
+        if self.sample < 1.0 and random.random() >= self.sample:
+            return self._suppress(record.name)
+        if self.rate is None:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [self.burst, now]
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return True
+        return self._suppress(record.name)
+
+    def _suppress(self, name: str) -> bool:
+        with self._lock:
+            self.suppressed[name] = self.suppressed.get(name, 0) + 1
+        return False
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler over a bounded queue that drops or blocks when the queue is full.
+
+    With ``policy="drop"`` the calling thread never waits: records arriving at a full
+    queue are dropped and counted. With ``policy="block"`` it waits for space, up to
+    ``timeout`` seconds (forever when None), then drops.
+    """
+
+    def __init__(self, queue_size: int = 10_000, policy: str = "drop", timeout: float | None = None):
+        if policy not in ("drop", "block"):
+            raise ValueError(f"Unknown queue policy {policy!r}; expected 'drop' or 'block'")
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.policy = policy
+        self.timeout = timeout
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args and render the traceback here, keeping extras for structured formatters
+        record = logging.makeLogRecord(vars(record))
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.stack_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if self.policy == "drop":
+                self.queue.put_nowait(record)
+            else:
+                self.queue.put(record, timeout=self.timeout)
+        except queue.Full:
+            self.dropped += 1
+
+
+_queue_handler: BoundedQueueHandler | None = None
+_queue_listener: logging.handlers.QueueListener | None = None
+_moved_handlers: list[logging.Handler] = []
+_atexit_registered = False
+
+
+def use_queue_logging(queue_size: int = 10_000, policy: str = "drop", timeout: float | None = None,
+                      json_format: bool = False, rate_limit: float | None = None, burst: float | None = None,
+                      sample: float = 1.0, handlers: list[logging.Handler] | None = None) -> BoundedQueueHandler:
+    """Moves log output off the calling thread.
+
+    The handlers of ``log_config`` (or ``handlers``) are detached from the root logger
+    and driven by a QueueListener thread; the root logger gets a BoundedQueueHandler,
+    so log calls only enqueue a record. Also selected with ``LOG_MODE=queue`` and the
+    ``LOG_QUEUE_SIZE``, ``LOG_QUEUE_POLICY``, ``LOG_FORMAT``, ``LOG_RATE_LIMIT`` and
+    ``LOG_SAMPLE`` environment variables.
+
+    Args:
+        queue_size (int): Capacity of the queue. Defaults to 10000.
+        policy (str): "drop" or "block" when the queue is full. Defaults to "drop".
+        timeout (Optional[float]): Longest wait of the "block" policy. Defaults to None.
+        json_format (bool): Format records with JsonFormatter. Defaults to False.
+        rate_limit (Optional[float]): Records per second and logger below WARNING.
+        burst (Optional[float]): Burst size of the rate limit. Defaults to ``rate_limit``.
+        sample (float): Fraction of records below WARNING that are kept. Defaults to 1.
+        handlers (Optional[List[logging.Handler]]): Output handlers; defaults to those
+            configured from ``log_config``.
+
+    Returns:
+        BoundedQueueHandler: The handler installed on the root logger.
+
+    """
+    global _queue_handler, _queue_listener, _atexit_registered
+    configure_logging()
+    with _configure_lock:
+        stop_queue_logging()
+        if not _atexit_registered:
+            # Records still queued at exit are written out
+            atexit.register(stop_queue_logging)
+            _atexit_registered = True
+        root = logging.getLogger()
+        if handlers is None:
+            handlers = [h for h in root.handlers if h.name in log_config["handlers"]]
+        for handler in handlers:
+            if handler in root.handlers:
+                root.removeHandler(handler)
+                _moved_handlers.append(handler)
+            if json_format:
+                handler.setFormatter(JsonFormatter())
+        _queue_handler = BoundedQueueHandler(queue_size, policy, timeout)
+        if rate_limit is not None or sample < 1.0:
+            _queue_handler.addFilter(RateLimitFilter(rate_limit, burst, sample))
+        _queue_listener = logging.handlers.QueueListener(_queue_handler.queue, *handlers,
+                                                         respect_handler_level=True)
+        _queue_listener.start()
+        root.addHandler(_queue_handler)
+        return _queue_handler
+
+
+def stop_queue_logging():
+    """Flushes the queue, stops the listener and puts the output handlers back on the root logger."""
+    global _queue_handler, _queue_listener
+    with _configure_lock:
+        if _queue_listener is None:
+            return
+        root = logging.getLogger()
+        root.removeHandler(_queue_handler)
+        _queue_listener.stop()
+        for handler in _moved_handlers:
+            root.addHandler(handler)
+        _moved_handlers.clear()
+        _queue_handler = _queue_listener = None
+
+
+def logging_stats() -> dict:
+    """Returns the queue mode, depth and drops, and records suppressed per logger."""
+    handler = _queue_handler
+    if handler is None:
+        return {"mode": "sync"}
+    suppressed = {}
+    for log_filter in handler.filters:
+        if isinstance(log_filter, RateLimitFilter):
+            suppressed = dict(log_filter.suppressed)
+    return {"mode": "queue", "policy": handler.policy, "queued": handler.queue.qsize(),
+            "capacity": handler.queue.maxsize, "dropped": handler.dropped, "suppressed": suppressed}
+
+
+
+def getLogger(name: str = None, level: str | None = None):
+    """Create and return a logger with the caller's base filename or a custom name.
+
+    Logging itself is configured on the first record (see ``configure_logging``).
+    Without ``level``, the logger uses the LOG_LEVEL environment variable (DEBUG by default).
+    """
+    with _configure_lock:
+        if not _logging_configured and _deferred_handler not in logging.getLogger().handlers:
+            logging.getLogger().addHandler(_deferred_handler)
 
     # Use the caller's base filename if no name is provided
     if name is None:
@@ -31,6 +294,10 @@ def getLogger(name: str = None, level: str = os.getenv("LOG_LEVEL", "DEBUG")):
         name = caller_filename
 
     logger = logging.getLogger(name)
+    if level is None:
+        level = os.getenv("LOG_LEVEL", "DEBUG")
+        with _configure_lock:
+            _default_level_loggers.add(name)
     logger.setLevel(level)
     return logger
 
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# File: src/milvus/capacity.py
+"""Memory and Capacity Estimation
+
+Predicts what a collection will cost before it is created. ``CapacityEstimator``
+reads a schema (a ``CollectionSchema``, a list of ``FieldSchema`` or the dict of
+``describe_collection``), a row count and the index parameters, and estimates:
+
+- raw data size: bytes per row of every field plus Milvus's row id and timestamp;
+- index memory: size of each vector field's index on a query node;
+- loaded memory: scalar fields, vector indexes and ``load_overhead`` headroom, per replica;
+- disk: binlogs plus index files in object storage (plus the on-disk graph of DISKANN).
+
+From those it suggests a sealed segment count (raw size over the segment size limit),
+the number of replicas that fit the query nodes, and a partition count that keeps
+partitions at least a segment large. ``compare`` checks an estimate against the
+output of ``get_collection_stats``.
+
+Sizes follow the index layouts documented by Milvus and Knowhere. VARCHAR, JSON, ARRAY
+and sparse vectors have no fixed size; their averages come from ``avg_lengths`` or from
+``fill_ratio``, ``json_bytes`` and ``sparse_nnz``. Expect estimates within tens of
+percent; plan with headroom.
+
+Example Usage:
+```python
+>>> from src.milvus.capacity import CapacityEstimator
+>>> estimator = CapacityEstimator(query_node_memory_gb=64, query_nodes=8)
+>>> # id INT64, text VARCHAR(512), vector FLOAT_VECTOR(768)
+>>> estimate = estimator.estimate(schema, rows=50_000_000,
+...                               index_params={"index_type": "HNSW", "params": {"M": 16}})
+>>> round(estimate.memory_bytes / 2**30), estimate.segments, estimate.replicas
+(196, 157, 2)
+>>> estimator.compare(estimate, await api.get_collection_stats("docs"))
+```
+"""
+import math
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from pymilvus import CollectionSchema, DataType, FieldSchema
+
+from src.logger import getLogger as GetLogger
+from src.milvus.exceptions import MilvusValidationError
+
+# Logging setup
+log = GetLogger(__name__)
+
+GB = 1 << 30
+MB = 1 << 20
+# Row id and timestamp Milvus stores with every row
+SYSTEM_FIELD_BYTES = 16
+# Defaults of dataCoord.segment.maxSize and rootCoord.maxPartitionNum
+SEGMENT_MAX_SIZE_MB = 1024
+MAX_PARTITIONS = 1024
+
+FIXED_SIZES: dict[DataType, int] = {
+    DataType.BOOL: 1, DataType.INT8: 1, DataType.INT16: 2, DataType.INT32: 4, DataType.INT64: 8,
+    DataType.FLOAT: 4, DataType.DOUBLE: 8,
+}
+VECTOR_TYPES = {DataType.FLOAT_VECTOR, DataType.FLOAT16_VECTOR, DataType.BFLOAT16_VECTOR,
+                DataType.BINARY_VECTOR, DataType.INT8_VECTOR, DataType.SPARSE_FLOAT_VECTOR}
+# Bytes per vector component; binary vectors store 8 components per byte
+COMPONENT_BYTES: dict[DataType, float] = {
+    DataType.FLOAT_VECTOR: 4, DataType.FLOAT16_VECTOR: 2, DataType.BFLOAT16_VECTOR: 2,
+    DataType.INT8_VECTOR: 1, DataType.BINARY_VECTOR: 1 / 8,
+}
+
+
+@dataclass(frozen=True)
+class _Field:
+    name: str
+    dtype: DataType
+    params: dict[str, Any]
+    element_type: DataType | None = None
+    is_partition_key: bool = False
+
+    @property
+    def dim(self) -> int:
+        return int(self.params.get("dim", 0))
+
+
+def _fields(schema: CollectionSchema | Iterable[FieldSchema] | dict[str, Any]) -> list[_Field]:
+    if isinstance(schema, CollectionSchema):
+        schema = schema.fields
+    if isinstance(schema, dict):
+        return [_Field(f["name"], DataType(f["type"]), dict(f.get("params") or {}),
+                       DataType(f["element_type"]) if f.get("element_type") is not None else None,
+                       bool(f.get("is_partition_key"))) for f in schema.get("fields", [])]
+    return [_Field(f.name, f.dtype, dict(f.params), getattr(f, "element_type", None),
+                   bool(getattr(f, "is_partition_key", False))) for f in schema]
+
+
+def _index_size(index_type: str, params: dict[str, Any], rows: int, f: _Field,
+                vector_bytes: float) -> tuple[float, float]:
+    """Returns (memory, disk) bytes of a vector index over ``rows`` vectors."""
+    dim = f.dim
+    nlist = int(params.get("nlist", 128))
+    centroids = nlist * dim * 4
+    if index_type in ("FLAT", "BIN_FLAT", "SPARSE_INVERTED_INDEX", "SPARSE_WAND", ""):
+        size = rows * vector_bytes
+    elif index_type in ("IVF_FLAT", "BIN_IVF_FLAT"):
+        size = rows * (vector_bytes + 8) + nlist * vector_bytes
+    elif index_type == "IVF_SQ8":
+        size = rows * (dim + 8) + centroids
+    elif index_type == "IVF_PQ":
+        m, nbits = int(params.get("m", max(1, dim // 4))), int(params.get("nbits", 8))
+        size = rows * (m * nbits / 8 + 8) + centroids + (1 << nbits) * dim * 4
+    elif index_type == "SCANN":
+        size = rows * (dim / 4 + 8) + centroids
+        if str(params.get("with_raw_data", True)).lower() not in ("false", "0"):
+            size += rows * vector_bytes
+    elif index_type in ("HNSW", "AUTOINDEX"):
+        # Level 0 keeps 2 * M int32 links per node, upper levels add about 1 / (M - 1) of that
+        m = int(params.get("M", 30))
+        size = rows * (vector_bytes + 8 * m * (1 + 1 / max(1, m - 1)) + 8)
+    elif index_type == "DISKANN":
+        # PQ codes stay in memory; the graph and full vectors live on the query node's disk
+        ratio = float(params.get("pq_code_budget_gb_ratio", 0.125))
+        degree = int(params.get("max_degree", 56))
+        return rows * vector_bytes * ratio, rows * (vector_bytes + degree * 4 + 4)
+    else:
+        log.warning(f"No size model for index type {index_type}; estimating it as FLAT")
+        size = rows * vector_bytes
+    return size, size
+
+
+# describe_index keys that are not build parameters
+_INDEX_INFO_KEYS = {"field_name", "index_name", "index_type", "metric_type", "total_rows", "indexed_rows",
+                    "pending_index_rows", "state", "index_state_fail_reason"}
+
+
+def index_params_of(client: Any, collection_name: str, **kwargs: Any) -> dict[str, dict[str, Any]]:
+    """Reads the index of each indexed field in ``CapacityEstimator.estimate`` form.
+
+    Args:
+        client (Any): MilvusClient-compatible client.
+        collection_name (str): Collection whose indexes are described.
+        **kwargs: Further ``list_indexes``/``describe_index`` arguments, e.g. ``db_name``.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: ``{field_name: {"index_type": ..., "params": {...}}}``.
+
+    """
+    indexes = {}
+    for index_name in client.list_indexes(collection_name, **kwargs):
+        info = client.describe_index(collection_name, index_name, **kwargs) or {}
+        params = dict(info.get("params") or {})
+        params.update({k: v for k, v in info.items() if k not in _INDEX_INFO_KEYS and k != "params"})
+        indexes[info.get("field_name", index_name)] = {"index_type": info.get("index_type", ""), "params": params}
+    return indexes
+
+
+@dataclass
+class CapacityEstimate:
+    """Predicted size of a collection and suggested layout.
+
+    Attributes:
+        rows (int): Row count the estimate is for.
+        field_bytes (Dict[str, float]): Average bytes per row of each field.
+        row_bytes (float): Average bytes per row, system fields included.
+        raw_bytes (int): Raw data size (binlogs).
+        index_memory_bytes (int): Memory of the vector indexes on a replica.
+        memory_bytes (int): Query node memory of one loaded replica.
+        disk_bytes (int): Object storage (binlogs and index files) plus local index disk.
+        index_types (Dict[str, str]): Index type assumed per vector field.
+        segments (int): Suggested number of sealed segments.
+        replicas (int): Suggested number of replicas.
+        query_nodes_per_replica (int | None): Query nodes one replica needs, when the node
+            memory is known.
+        partitions (int): Suggested number of partitions.
+        notes (List[str]): Reasons behind the suggestions.
+
+    """
+
+    rows: int
+    field_bytes: dict[str, float]
+    row_bytes: float
+    raw_bytes: int
+    index_memory_bytes: int
+    memory_bytes: int
+    disk_bytes: int
+    index_types: dict[str, str]
+    segments: int
+    replicas: int
+    query_nodes_per_replica: int | None
+    partitions: int
+    notes: list[str] = field(default_factory=list)
+
+    @property
+    def total_memory_bytes(self) -> int:
+        """Query node memory of all suggested replicas."""
+        return self.memory_bytes * self.replicas
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "total_memory_bytes": self.total_memory_bytes}
+
+
+class CapacityEstimator:
+    """Estimates memory, disk and layout of a collection from its schema.
+
+    Attributes:
+        segment_max_size_mb (int): Sealed segment size limit. Defaults to 1024.
+        load_overhead (float): Memory headroom of a loaded replica, for segment metadata,
+            delete buffers and growing segments. Defaults to 0.2.
+        node_usable_fraction (float): Share of a query node's memory given to segments.
+            Defaults to 0.8.
+        query_node_memory_gb (float | None): Memory of one query node.
+        query_nodes (int | None): Number of query nodes.
+        fill_ratio (float): Average VARCHAR length and ARRAY size as a share of their maximum.
+        json_bytes (int): Average size of a JSON value.
+        sparse_nnz (int): Average non-zero entries of a sparse vector.
+
+    Methods:
+        estimate: Estimates a schema at a row count.
+        compare: Checks an estimate against ``get_collection_stats`` output.
+
+    Example:
+        ```python
+        estimator = CapacityEstimator(query_node_memory_gb=64, query_nodes=6)
+        estimate = estimator.estimate(builder.build(), 10_000_000, {"index_type": "IVF_FLAT"})
+        ```
+
+    Raises:
+        MilvusValidationError: If the schema or the row count is invalid.
+
+    """
+
+    def __init__(self, segment_max_size_mb: int = SEGMENT_MAX_SIZE_MB, load_overhead: float = 0.2,
+                 node_usable_fraction: float = 0.8, query_node_memory_gb: float | None = None,
+                 query_nodes: int | None = None, fill_ratio: float = 0.5, json_bytes: int = 256,
+                 sparse_nnz: int = 128):
+        self.segment_max_size_mb = segment_max_size_mb
+        self.load_overhead = load_overhead
+        self.node_usable_fraction = node_usable_fraction
+        self.query_node_memory_gb = query_node_memory_gb
+        self.query_nodes = query_nodes
+        self.fill_ratio = fill_ratio
+        self.json_bytes = json_bytes
+        self.sparse_nnz = sparse_nnz
+
+    def _field_bytes(self, f: _Field, avg_lengths: dict[str, float]) -> float:
+        if f.name in avg_lengths:
+            average = avg_lengths[f.name]
+            if f.dtype == DataType.ARRAY:
+                return average * FIXED_SIZES.get(f.element_type, 8) + 8
+            if f.dtype == DataType.SPARSE_FLOAT_VECTOR:
+                return average * 8
+            return average + (4 if f.dtype in (DataType.VARCHAR, DataType.JSON) else 0)
+        if f.dtype in FIXED_SIZES:
+            return FIXED_SIZES[f.dtype]
+        if f.dtype in COMPONENT_BYTES:
+            if f.dim <= 0:
+                raise MilvusValidationError(f"Vector field {f.name} has no dim")
+            return f.dim * COMPONENT_BYTES[f.dtype]
+        if f.dtype == DataType.SPARSE_FLOAT_VECTOR:
+            return self.sparse_nnz * 8  # int32 index and float32 value per entry
+        if f.dtype == DataType.VARCHAR:
+            return int(f.params.get("max_length", 256)) * self.fill_ratio + 4
+        if f.dtype == DataType.ARRAY:
+            element = FIXED_SIZES.get(f.element_type)
+            if element is None:  # VARCHAR elements
+                element = int(f.params.get("max_length", 64)) * self.fill_ratio + 4
+            return int(f.params.get("max_capacity", 16)) * element * self.fill_ratio + 8
+        return self.json_bytes + 4
+
+    @staticmethod
+    def _index_params(index_params: dict[str, Any] | None, vector_fields: list[_Field]) -> dict[str, dict]:
+        """Index parameters per vector field; a single dict applies to all of them."""
+        if not index_params:
+            return {f.name: {} for f in vector_fields}
+        if "index_type" in index_params or "params" in index_params:
+            return {f.name: index_params for f in vector_fields}
+        return {f.name: index_params.get(f.name) or {} for f in vector_fields}
+
+    def estimate(self, schema: CollectionSchema | Iterable[FieldSchema] | dict[str, Any], rows: int,
+                 index_params: dict[str, Any] | None = None, avg_lengths: dict[str, float] | None = None,
+                 replicas: int | None = None) -> CapacityEstimate:
+        """Estimates a collection of ``rows`` rows.
+
+        Args:
+            schema (CollectionSchema | Iterable[FieldSchema] | Dict[str, Any]): Collection
+                schema, field list or ``describe_collection`` output.
+            rows (int): Expected row count.
+            index_params (Optional[Dict[str, Any]]): ``{"index_type": ..., "params": {...}}``
+                for every vector field, or such a dict per vector field name. Vector fields
+                without one are estimated as FLAT.
+            avg_lengths (Optional[Dict[str, float]]): Average length per field of VARCHAR
+                and JSON (bytes), ARRAY (elements) and sparse vectors (non-zeros).
+            replicas (Optional[int]): Replica count; suggested from the query nodes when None.
+
+        Returns:
+            CapacityEstimate: The estimate.
+
+        Raises:
+            MilvusValidationError: If ``rows`` is negative or the schema has no fields.
+
+        """
+        if rows < 0:
+            raise MilvusValidationError(f"Row count must not be negative, got {rows}")
+        fields = _fields(schema)
+        if not fields:
+            raise MilvusValidationError("Schema must have at least one field")
+        avg_lengths = avg_lengths or {}
+        field_bytes = {f.name: self._field_bytes(f, avg_lengths) for f in fields}
+        row_bytes = sum(field_bytes.values()) + SYSTEM_FIELD_BYTES
+        raw_bytes = rows * row_bytes
+
+        vector_fields = [f for f in fields if f.dtype in VECTOR_TYPES]
+        index_memory = index_disk = 0.0
+        index_types = {}
+        for name, params in self._index_params(index_params, vector_fields).items():
+            f = next(f for f in vector_fields if f.name == name)
+            index_type = str(params.get("index_type") or "FLAT").upper()
+            memory, disk = _index_size(index_type, dict(params.get("params") or {}), rows, f, field_bytes[name])
+            index_types[name] = index_type
+            index_memory += memory
+            index_disk += disk
+        scalar_bytes = rows * (row_bytes - sum(field_bytes[f.name] for f in vector_fields))
+        memory_bytes = (scalar_bytes + index_memory) * (1 + self.load_overhead)
+        disk_bytes = raw_bytes + index_disk
+
+        notes = []
+        segment_bytes = self.segment_max_size_mb * MB
+        segments = max(1, math.ceil(raw_bytes / segment_bytes))
+        notes.append(f"raw data fills {segments} sealed segment(s) of {self.segment_max_size_mb} MB")
+
+        nodes_per_replica = None
+        if self.query_node_memory_gb:
+            usable = self.query_node_memory_gb * GB * self.node_usable_fraction
+            nodes_per_replica = max(1, math.ceil(memory_bytes / usable))
+            notes.append(f"one replica needs {nodes_per_replica} query nodes of {self.query_node_memory_gb} GB")
+        if replicas is None:
+            replicas = 1
+            if nodes_per_replica is not None and self.query_nodes:
+                replicas = max(1, self.query_nodes // nodes_per_replica)
+                if self.query_nodes < nodes_per_replica:
+                    notes.append(f"{self.query_nodes} query nodes cannot hold one replica")
+                else:
+                    notes.append(f"{replicas} replica(s) fit {self.query_nodes} query nodes")
+
+        if any(f.is_partition_key for f in fields):
+            partitions = 1
+            notes.append("partition key field: Milvus manages the partitions")
+        else:
+            partitions = min(segments, MAX_PARTITIONS)
+            notes.append(f"at most {partitions} partition(s) keep each at least one full segment")
+
+        return CapacityEstimate(rows, field_bytes, row_bytes, int(raw_bytes), int(index_memory), int(memory_bytes),
+                                int(disk_bytes), index_types, segments, replicas, nodes_per_replica, partitions, notes)
+
+    def compare(self, estimate: CapacityEstimate, stats: dict[str, Any],
+                schema: CollectionSchema | Iterable[FieldSchema] | dict[str, Any] | None = None,
+                index_params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Checks an estimate against ``get_collection_stats`` output.
+
+        ``row_count`` is compared with the estimated rows. Size keys present in
+        ``stats`` (``data_size``, ``index_size``, ``memory_size``, ``disk_size``) are
+        compared with the estimate rescaled to the actual row count; the rescaling
+        re-estimates ``schema`` when given and scales linearly otherwise.
+
+        Args:
+            estimate (CapacityEstimate): Estimate to check.
+            stats (Dict[str, Any]): Collection statistics.
+            schema (optional): Schema to re-estimate at the actual row count.
+            index_params (Optional[Dict[str, Any]]): Index parameters of the re-estimate.
+
+        Returns:
+            Dict[str, Any]: estimated_rows, actual_rows, row_ratio (actual / estimated), the
+                re-estimated sizes as "expected", and per size key the actual value and
+                the actual / expected ratio.
+
+        """
+        actual_rows = int(stats.get("row_count", 0))
+        if schema is not None:
+            expected = self.estimate(schema, actual_rows, index_params).to_dict()
+        else:
+            scale = actual_rows / estimate.rows if estimate.rows else 0.0
+            expected = {key: int(getattr(estimate, key) * scale) for key in
+                        ("raw_bytes", "index_memory_bytes", "memory_bytes", "disk_bytes")}
+        report = {"estimated_rows": estimate.rows, "actual_rows": actual_rows,
+                  "row_ratio": actual_rows / estimate.rows if estimate.rows else None,
+                  "expected": {key: expected[key] for key in
+                               ("raw_bytes", "index_memory_bytes", "memory_bytes", "disk_bytes")}}
+        for key, estimated in (("data_size", "raw_bytes"), ("index_size", "index_memory_bytes"),
+                               ("memory_size", "memory_bytes"), ("disk_size", "disk_bytes")):
+            if key in stats:
+                actual = float(stats[key])
+                report[key] = {"actual": actual,
+                               "ratio": actual / expected[estimated] if expected[estimated] else None}
+        return report
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from pymilvus import (
@@ -9,7 +10,11 @@ from pymilvus import (
 )
 
 from src.logger import getLogger as GetLogger
+from src.milvus.capacity import CapacityEstimate, CapacityEstimator
+from src.milvus.deadline import step_timeout
+from src.milvus.events import DROP, CollectionEvent, CollectionSubject
 from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
+from src.milvus.index import IndexAPI
 from src.milvus.interfaces import ICollectionAPI, IConnectAPI
 from src.utils import async_log_decorator, log_decorator
 
@@ -113,6 +118,7 @@ class CollectionSchemaBuilder:
         add_field: Adds a field to the schema.
         set_description: Sets the schema description.
         build: Constructs the final CollectionSchema.
+        estimate: Estimates memory and disk of the schema at a row count.
 
     Example:
         ```python
@@ -120,6 +126,7 @@ class CollectionSchemaBuilder:
         builder.add_field("id", DataType.INT64, is_primary=True)
         builder.add_field("vector", DataType.FLOAT_VECTOR, dim=128)
         schema = builder.build()
+        memory = builder.estimate(1_000_000, {"index_type": "HNSW"}).memory_bytes
         ```
 
     Raises:
@@ -170,14 +177,32 @@ class CollectionSchemaBuilder:
             raise MilvusValidationError("Schema must have at least one field")
         return CollectionSchema(fields=self._fields, description=self._description)
 
+    def estimate(self, rows: int, index_params: dict | None = None, estimator: CapacityEstimator | None = None,
+                 **kwargs) -> CapacityEstimate:
+        """Estimates memory, disk and layout of the schema at ``rows`` rows.
 
-class CollectionAPI(ICollectionAPI):
+        Args:
+            rows (int): Expected row count.
+            index_params (Dict | None): Index parameters of the vector fields.
+            estimator (CapacityEstimator | None): Estimator to use. Defaults to a new one.
+            **kwargs: Further ``CapacityEstimator.estimate`` arguments.
+
+        Returns:
+            CapacityEstimate: The estimate.
+
+        """
+        return (estimator or CapacityEstimator()).estimate(self.build(), rows, index_params, **kwargs)
+
+
+class CollectionAPI(ICollectionAPI, CollectionSubject):
     """Manages Milvus collections with methods for creation, listing, describing, and dropping.
 
     Implements the ICollectionAPI interface to handle collection-related operations.
+    Dropped collections are published as CollectionEvents to attached observers.
 
     Attributes:
         _connect_api (IConnectAPI): The connection API instance.
+        _index_api (IndexAPI): The index API used to queue index builds.
 
     Methods:
         create_collection: Creates a new collection.
@@ -201,14 +226,17 @@ class CollectionAPI(ICollectionAPI):
 
     _connect_api: IConnectAPI = None
 
-    def __init__(self, connect_api: IConnectAPI):
+    def __init__(self, connect_api: IConnectAPI, index_api: IndexAPI | None = None):
         """Initializes CollectionAPI with a connection instance.
 
         Args:
             connect_api (IConnectAPI): The connection API instance for Milvus operations.
+            index_api (IndexAPI | None): Index API whose scheduler queues index builds.
+                Defaults to a new IndexAPI.
 
         """
         self._connect_api = connect_api
+        self._index_api = index_api or IndexAPI(connect_api)
 
     # Private helper function
     @log_decorator
@@ -295,9 +323,14 @@ class CollectionAPI(ICollectionAPI):
                                 timeout: float | None = None,
                                 schema: CollectionSchema | None = None,
                                 index_params: dict | None = None,
+                                wait_for_index: bool = True,
                                 **kwargs) -> Collection:
         """Creates a new collection in the specified database.
 
+        The index, if requested, is built through the index build scheduler. With
+        ``wait_for_index=False`` the build is only queued; its handle is available from
+        ``IndexAPI.scheduler.builds`` and must finish before the collection is loaded.
+
         Args:
             collection_name (str): Name of the collection.
             fields (List[FieldSchema]): Field schemas.
@@ -311,6 +344,8 @@ class CollectionAPI(ICollectionAPI):
             timeout (float | None): Operation timeout.
             schema (CollectionSchema | None): Pre-defined schema.
             index_params (Dict | None): Index parameters.
+            wait_for_index (bool): Wait for the index build to finish, so the collection
+                can be loaded right away. Defaults to True.
             **kwargs: Additional arguments.
 
         Raises:
@@ -377,14 +412,16 @@ class CollectionAPI(ICollectionAPI):
                 index_params = dict(index_params)  # Copy to avoid modifying input
                 if "metric_type" not in index_params:
                     index_params["metric_type"] = metric_type
-                status = await collection.create_index(
-                    field_name=vector_field_name,
-                    index_params=index_params,
+                handle = await self._index_api.create_index(
+                    collection_name,
+                    vector_field_name,
+                    index_params,
+                    database_name,
                     index_name=f"{collection_name}_{vector_field_name}_idx",
+                    wait=wait_for_index,
                     timeout=timeout
                 )
-                log.debug(f"Created index status: {status}")
-                log.info(f"Created index on {vector_field_name} with params: {index_params}")
+                log.info(f"Index on {vector_field_name} with params: {index_params}: {handle}")
 
             return collection
         except MilvusException as e:
@@ -445,7 +482,8 @@ class CollectionAPI(ICollectionAPI):
 
         Args:
             collection_name (str): Name of the collection.
-            timeout (str): Database name. Defaults to "default".
+            timeout (float): Timeout in seconds, shortened to the remaining time of the
+                current deadline. Defaults to 10.
 
         Returns:
             Dict[str, str]: Status message and result.
@@ -455,11 +493,13 @@ class CollectionAPI(ICollectionAPI):
 
         """
         try:
-            await self._connect_api.client.drop_collection(
+            await asyncio.to_thread(
+                self._connect_api.client.drop_collection,
                 collection_name=collection_name,
-                timeout= timeout
+                timeout=step_timeout(timeout, step="drop_collection")
             )
             log.info(f"Dropped collection {collection_name} from database {timeout}")
+            self.notify(CollectionEvent(DROP, collection_name))
             return {"message": f"Collection {collection_name} dropped", "status": "success"}
         except MilvusException as e:
             log.error(f"Failed to drop collection: {e}")
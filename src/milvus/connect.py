@@ -3,18 +3,21 @@
 """ConnectAPI and AsyncMilvusClientWrapper
 Handles connections to the Milvus server using synchronous and asynchronous operations.
 Implements the IConnectAPI interface to manage connection establishment and disconnection.
-Uses the Singleton pattern to ensure a single connection instance.
+Each instance is an independent connection; ``src.milvus.registry`` shares them per
+(uri, database, user).
 
 Key Features:
 - Connect to Milvus server with retry logic.
-- Create and check databases.
+- Create and check databases, cached per process (see ``src.milvus.metadata``).
 - Context manager support for automatic connection management.
 - Asynchronous support for non-blocking operations.
-- Singleton pattern to ensure a single instance of the connection.
 - Logging for connection events and errors.
 - Exception handling for connection and disconnection failures.
 - Configuration management for connection parameters.
 - Security management for sensitive information.
+- In-process NumPy backend for ``memory://`` URIs (see ``src.milvus.memory``).
+- Several endpoints with background health checks, latency-based routing and
+  transparent failover (see ``src.milvus.endpoints``).
 
 Example Usage:
 ```python
@@ -34,7 +37,6 @@ Example Usage:
 ```
 """
 
-import datetime
 import json
 import os
 import traceback
@@ -51,9 +53,15 @@ from tenacity import (
     wait_exponential,
 )
 
+from src.__config__ import load_env
 from src.logger import getLogger as GetLogger
+from src.milvus.deadline import deadline_passed, step_timeout
+from src.milvus.endpoints import EndpointPool, FailoverClient
 from src.milvus.exceptions import MilvusAPIError
 from src.milvus.interfaces import IConnectAPI
+from src.milvus.memory import MEMORY_URI_SCHEME, InMemoryMilvusClient
+from src.milvus.metadata import MetadataCache
+from src.milvus.resilience import CircuitBreakers, RetryBudget
 from src.utils import ConfigManager, SecurityManager, async_log_decorator, log_decorator
 
 # Logging setup
@@ -64,11 +72,11 @@ class ConnectAPI(IConnectAPI):
     """Manages connections to the Milvus server using synchronous operations.
 
     Implements the IConnectAPI interface to handle connection establishment and disconnection.
-    Uses the Singleton pattern to ensure a single connection instance.
+    Instances are independent; use ``ConnectionRegistry`` to share them per cluster,
+    database and user.
 
     Attributes:
     ----------
-        __instance (ConnectAPI): Singleton instance of ConnectAPI. \n
         _initialized (bool): Indicates if the connection is initialized. \n
         _alias (str): Connection alias. \n
         _timeout (float): Connection timeout in seconds. \n
@@ -76,11 +84,17 @@ class ConnectAPI(IConnectAPI):
         __password (str): Password for authentication. \n
         _host (str): Milvus server hostname. \n
         _port (str): Milvus server port. \n
-        _uri (str): Milvus server URI. \n
+        _uri (str | List): Milvus server URI, or a list of endpoint URIs. \n
+        _health_check_interval (float | None): Seconds between endpoint health checks. \n
+        _circuit_breakers (CircuitBreakers | None): Per-endpoint, per-operation circuit breakers. \n
+        _retry_budget (RetryBudget | None): Global budget for failover retries. \n
+        metadata_cache (MetadataCache): Cache of known databases and collections. \n
+        metadata_scope (str | None): Identity of the connected cluster in the metadata cache. \n
         _db_name (str): Database name to connect to. \n
         __token (str): Token for authentication. \n
         _kwargs (Dict): Additional connection parameters. \n
-        client (MilvusClient): The Milvus client instance. \n
+        client (MilvusClient): The Milvus client instance; an InMemoryMilvusClient for ``memory://`` URIs,
+            a FailoverClient when several endpoints, circuit breakers or a retry budget are given. \n
 
     Methods:
     -------
@@ -107,7 +121,6 @@ class ConnectAPI(IConnectAPI):
 
     """
 
-    __instance: 'ConnectAPI' = None
     _initialized: bool = False
     _uri: str = "http://localhost:19530"
     _user: str = ""
@@ -115,72 +128,79 @@ class ConnectAPI(IConnectAPI):
     _db_name: str = ""
     __token: str = ""
     _timeout: float = None
+    _health_check_interval: float | None = 5.0
+    _circuit_breakers: CircuitBreakers | None = None
+    _retry_budget: RetryBudget | None = None
+    metadata_cache: MetadataCache | None = None
+    metadata_scope: str | None = None
     _kwargs: dict = None
     client: MilvusClient | None = None
 
-    def __new__(cls, *args, **kwargs):
-        """Ensures a singleton instance of ConnectAPI.
-
-        Args:
-            *args: Positional arguments.
-            **kwargs: Keyword arguments.
-
-        Returns:
-            ConnectAPI: The singleton instance.
-
-        """
-        if cls.__instance is None:
-            cls.__instance = super(ConnectAPI, cls).__new__(cls)
-            log.info(f"New ConnectAPI instance created @ {datetime.datetime.now()}")
-        else:
-            log.info(f"Using existing ConnectAPI instance created @ {datetime.datetime.now()}")
-        return cls.__instance
-
     def __init__(
         self,
         alias: str = "default",
-        uri: str = "http://localhost:19530",
+        uri: str | list[str | dict[str, Any]] = "http://localhost:19530",
         user: str = "",
         password: str = "",
         db_name: str = "",
         token: str = "",
         timeout: float | None = None,
+        health_check_interval: float | None = 5.0,
+        circuit_breakers: CircuitBreakers | None = None,
+        retry_budget: RetryBudget | None = None,
+        metadata_cache: MetadataCache | None = None,
         **kwargs: Any
     ):
         """Initializes ConnectAPI with connection parameters.
 
         Args:
             alias (str): Connection alias. Defaults to "default".
-            uri (str): Milvus server URI. Defaults to "http://localhost:19530".
+            uri (str | List[str | Dict[str, Any]]): Milvus server URI, or several proxy
+                endpoints of the same cluster (URIs, or dictionaries with a "uri" and
+                client arguments for that endpoint). Defaults to "http://localhost:19530".
             user (str): Username for authentication. Defaults to "".
             password (str): Password for authentication. Defaults to "".
             db_name (str): Database name. Defaults to "".
             token (str): Token for authentication. Defaults to "".
             timeout (Optional[float]): Connection timeout in seconds. Defaults to None.
+            health_check_interval (Optional[float]): Seconds between background health
+                checks of multiple endpoints; None disables them. Defaults to 5.
+            circuit_breakers (Optional[CircuitBreakers]): Fail fast on endpoint operations
+                that keep failing. Defaults to None.
+            retry_budget (Optional[RetryBudget]): Caps failover retries across all calls.
+                Defaults to None.
+            metadata_cache (Optional[MetadataCache]): Cache of known databases and
+                collections. Defaults to the process-wide ``MetadataCache.default()``.
             **kwargs: Additional arguments for the Milvus client.
 
         """
-        if not hasattr(self, '_initialized') or not self._initialized:
-            host_port = uri.split("//")[-1].split(":")
-            self._host = host_port[0]
-            self._port = int(host_port[1]) if len(host_port) > 1 else 19530
-            self._alias = alias
-            self._uri = uri
-            self._user = user
-            self.__password = password
-            self._db_name = db_name
-            self.__token = token
-            self._timeout = timeout
-            self._kwargs = kwargs
-            self._initialized = False
-
-            log.info("ConnectAPI initialized...")
-        else:
-            log.warning("ConnectAPI instance already exists. Using existing parameters.")
+        first = uri if isinstance(uri, str) else uri[0]
+        first = first if isinstance(first, str) else first["uri"]
+        host_port = first.split("//")[-1].split(":")
+        self._host = host_port[0]
+        self._port = int(host_port[1]) if len(host_port) > 1 else 19530
+        self._alias = alias
+        self._uri = uri
+        self._user = user
+        self.__password = password
+        self._db_name = db_name
+        self.__token = token
+        self._timeout = timeout
+        self._health_check_interval = health_check_interval
+        self._circuit_breakers = circuit_breakers
+        self._retry_budget = retry_budget
+        self.metadata_cache = metadata_cache or MetadataCache.default()
+        self._kwargs = kwargs
+        self._initialized = False
+
+        log.info("ConnectAPI initialized...")
 
     def _check_and_create_database(self, db_name: str, timeout: float | None) -> bool:
         """Checks if the specified database exists, creates it if it doesn't.
 
+        Known databases are served from the metadata cache; concurrent checks of the
+        same database share one ``list_databases`` call.
+
         Args:
             db_name (str): Name of the database to check/create.
             timeout (Optional[float]): Timeout for the operation.
@@ -193,13 +213,10 @@ class ConnectAPI(IConnectAPI):
 
         """
         try:
-            databases = self.client.list_databases(timeout=timeout)
-            if db_name not in databases:
-                self.client.create_database(db_name, timeout=timeout)
-                log.info(f"Database {db_name} created.")
-                return True
-            log.debug(f"Database {db_name} already exists.")
-            return True
+            return self.metadata_cache.ensure_database(
+                self.metadata_scope, db_name,
+                lambda: self.client.list_databases(timeout=timeout),
+                lambda name: self.client.create_database(name, timeout=timeout))
         except MilvusException as e:
             log.error(f"Failed to check/create database {db_name}: {e}")
             raise MilvusAPIError(f"Database operation failed: {e}")
@@ -208,7 +225,7 @@ class ConnectAPI(IConnectAPI):
     def connect(
         self,
         alias: str = "default",
-        uri: str = "http://localhost:19530",
+        uri: str | list[str | dict[str, Any]] = "http://localhost:19530",
         user: str = "",
         password: str = "",
         db_name: str = "",
@@ -220,7 +237,8 @@ class ConnectAPI(IConnectAPI):
 
         Args:
             alias (str): Connection alias. Defaults to "default".
-            uri (str): Milvus server URI. Defaults to "http://localhost:19530".
+            uri (str | List[str | Dict[str, Any]]): Milvus server URI or endpoints.
+                Defaults to "http://localhost:19530".
             user (str): Username for authentication. Defaults to "".
             password (str): Password for authentication. Defaults to "".
             db_name (str): Database name. Defaults to "".
@@ -247,14 +265,14 @@ class ConnectAPI(IConnectAPI):
 
     @log_decorator
     @retry(
-        stop=stop_after_attempt(3),
+        stop=stop_after_attempt(3) | deadline_passed,
         wait=wait_exponential(multiplier=1, min=1, max=10),
         retry=retry_if_exception_type(MilvusException)
     )
     def _connect(
         self,
         alias: str,
-        uri: str,
+        uri: str | list[str | dict[str, Any]],
         user: str,
         password: str,
         db_name: str,
@@ -264,16 +282,22 @@ class ConnectAPI(IConnectAPI):
     ):
         """Internal method to connect with retry logic.
         This method is decorated with retry logic to handle connection failures.
-        It will attempt to connect up to 3 times with exponential backoff.
+        It will attempt to connect up to 3 times with exponential backoff, and stops early
+        once the current request deadline (``src.milvus.deadline``) has passed; the client
+        timeout is capped by the time left.
         If the connection fails after 3 attempts, a MilvusAPIError is raised.
         This method is called by the connect method.
 
         It attempts to establish a connection to the Milvus server using the provided parameters,
-        and create a MilvusClient instance.
+        and create a MilvusClient instance. URIs starting with ``memory://`` create an
+        InMemoryMilvusClient instead; ``kwargs`` then carry its latency and error rates, or
+        ``shared`` to serve the deployment of another in-memory client.
+        A list of URIs, circuit breakers or a retry budget create a FailoverClient over an
+        EndpointPool of the endpoints; in-memory endpoints then share one deployment.
 
         Args:
             alias (str): Connection alias.
-            uri (str): Milvus server URI.
+            uri (str | List[str | Dict[str, Any]]): Milvus server URI or endpoints.
             user (str): Username for authentication.
             password (str): Password for authentication.
             db_name (str): Database name.
@@ -287,16 +311,37 @@ class ConnectAPI(IConnectAPI):
         """
         try:
             log.info(f" ConnectAPI: {self}")
-            self.client = MilvusClient(
-                # alias=alias,
-                uri=uri,
-                user=user,
-                password=password,
-                # db_name=db_name,
-                token=token,
-                timeout=timeout,
-                **kwargs
-            )
+            timeout = step_timeout(timeout, step="connect")
+            memory: list[InMemoryMilvusClient] = []
+
+            def create_client(endpoint_uri: str, options: dict[str, Any]) -> Any:
+                if endpoint_uri.startswith(MEMORY_URI_SCHEME):
+                    options = {**kwargs, **options}
+                    if memory:
+                        options["shared"] = memory[0]
+                    client = InMemoryMilvusClient(uri=endpoint_uri, **options)
+                    memory.append(client)
+                    return client
+                return MilvusClient(
+                    # alias=alias,
+                    uri=endpoint_uri,
+                    user=user,
+                    password=password,
+                    # db_name=db_name,
+                    token=token,
+                    timeout=timeout,
+                    **{**kwargs, **options}
+                )
+
+            if isinstance(uri, str) and self._circuit_breakers is None and self._retry_budget is None:
+                self.client = create_client(uri, {})
+            else:
+                pool = EndpointPool([uri] if isinstance(uri, str) else uri, create_client,
+                                    health_check_interval=self._health_check_interval,
+                                    breakers=self._circuit_breakers, retry_budget=self._retry_budget)
+                pool.connect()
+                self.client = FailoverClient(pool)
+            self.metadata_scope = self._scope(uri, memory)
             if db_name:
                 self._check_and_create_database(db_name, timeout)
             self.client.use_database(db_name)
@@ -305,6 +350,14 @@ class ConnectAPI(IConnectAPI):
             log.error(f"Failed to connect: {e}")
             raise MilvusAPIError(f"Connection failed: {e}")
 
+    @staticmethod
+    def _scope(uri: str | list[str | dict[str, Any]], memory: list[InMemoryMilvusClient]) -> str:
+        """Identity of the cluster in the metadata cache: its URIs, or its in-memory deployment."""
+        if memory:
+            return f"{MEMORY_URI_SCHEME}{memory[0].deployment}"
+        uris = [uri] if isinstance(uri, str) else [u if isinstance(u, str) else u["uri"] for u in uri]
+        return ",".join(sorted(uris))
+
     @log_decorator
     def disconnect(self):
         """Disconnects from the Milvus server.
@@ -406,28 +459,12 @@ class AsyncMilvusClientWrapper(utility.connections):
         db_name (str): Database name. Defaults to an empty string.
         token (str): Token for authentication. Defaults to an empty string.
         timeout (Optional[float]): Timeout for requests. Defaults to None.
+        metadata_cache (Optional[MetadataCache]): Cache of known databases and collections.
+            Defaults to the process-wide ``MetadataCache.default()``.
         **kwargs (Any): Additional arguments for the client.
 
     """
 
-    _instance = None
-
-    def __new__(cls, *args, **kwargs):
-        """Ensures a singleton instance of ConnectAPI.
-
-        Args:
-            *args: Positional arguments.
-            **kwargs: Keyword arguments.
-
-        Returns:
-            ConnectAPI: The singleton instance.
-
-        """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            log.info("New ConnectAPI instance created.")
-        return cls._instance
-
     def __init__(self,
                  uri: str = "http://localhost:19530",
                  user: str = "",
@@ -437,43 +474,46 @@ class AsyncMilvusClientWrapper(utility.connections):
                  port: int = 19530,
                  token: str = "",
                  timeout: float | None = None,
+                 metadata_cache: MetadataCache | None = None,
                  **kwargs: Any) -> None:
-        if not hasattr(self, '_initialized') or not self._initialized:
-            super().__init__(self, uri=uri,
-                             user=user,
-                             password=password,
-                             db_name=db_name,
-                             token=token,
-                             timeout=timeout,
-                             **kwargs)
-            self._uri = uri
-            self._alias = kwargs.get("alias", "default")
-            self._user = user
-            self._password = password
-            self._host = host
-            self._port = port
-            self._timeout = timeout
-            self._db_name = db_name
-            self._token = token
-            self._config_manager = ConfigManager({
-                "host": self._host,
-                "port": self._port,
-                "user": self._user,
-                "password": self._password,
-                "timeout": self._timeout,
-                "db_name": self._db_name,
-                "token": self._token,
-                "encryption_key": os.environ.get("MILVUS_ENCRYPT_KEY"),
-            })
-            self._security_manager = SecurityManager(self._config_manager)
-            self._initialized = True
-            log.info(f"AsyncMilvusClientWrapper initialized with URI: {self._uri}")
-        else:
-            log.warning("AsyncMilvusClientWrapper instance already exists. Using existing parameters.")
+        super().__init__(self, uri=uri,
+                         user=user,
+                         password=password,
+                         db_name=db_name,
+                         token=token,
+                         timeout=timeout,
+                         **kwargs)
+        self._uri = uri
+        self._alias = kwargs.get("alias", "default")
+        self._user = user
+        self._password = password
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._db_name = db_name
+        self._token = token
+        self._metadata_cache = metadata_cache or MetadataCache.default()
+        load_env()
+        self._config_manager = ConfigManager({
+            "host": self._host,
+            "port": self._port,
+            "user": self._user,
+            "password": self._password,
+            "timeout": self._timeout,
+            "db_name": self._db_name,
+            "token": self._token,
+            "encryption_key": os.environ.get("MILVUS_ENCRYPT_KEY"),
+        })
+        self._security_manager = SecurityManager(self._config_manager)
+        self._initialized = True
+        log.info(f"AsyncMilvusClientWrapper initialized with URI: {self._uri}")
 
     async def _check_and_create_database(self, db_name: str, timeout: float | None) -> bool:
         """Checks if the specified database exists, creates it if it doesn't.
 
+        Known databases are served from the metadata cache; concurrent checks of the
+        same database share one ``list_databases`` call.
+
         Args:
             db_name (str): Name of the database to check/create.
             timeout (Optional[float]): Timeout for the operation.
@@ -485,14 +525,15 @@ class AsyncMilvusClientWrapper(utility.connections):
             MilvusAPIError: If database creation fails.
 
         """
+        async def list_databases() -> list[str]:
+            return await utility.list_databases(using=self._alias, timeout=timeout)
+
+        async def create_database(name: str):
+            await utility.create_database(name, using=self._alias, timeout=timeout)
+
         try:
-            databases = await utility.list_databases(using=self._alias, timeout=timeout)
-            if db_name not in databases:
-                await utility.create_database(db_name, using=self._alias, timeout=timeout)
-                log.info(f"Database {db_name} created.")
-                return True
-            log.debug(f"Database {db_name} already exists.")
-            return True
+            return await self._metadata_cache.ensure_database_async(self._uri, db_name, list_databases,
+                                                                    create_database)
         except MilvusException as e:
             log.error(f"Failed to check/create database {db_name}: {e}")
             raise MilvusAPIError(f"Database operation failed: {e}")
@@ -501,7 +542,7 @@ class AsyncMilvusClientWrapper(utility.connections):
     async def has_collection(self, collection_name: str,
                              using: str = "default",
                              timeout: float | None = None) -> bool:
-        """Check if a collection exists.
+        """Check if a collection exists; known collections are served from the metadata cache.
 
         Args:
             collection_name (str): Name of the collection.
@@ -512,7 +553,10 @@ class AsyncMilvusClientWrapper(utility.connections):
             bool: True if the collection exists, False otherwise.
 
         """
-        return await utility.has_collection(collection_name=collection_name, using=using, timeout=timeout)
+        async def check() -> bool:
+            return await utility.has_collection(collection_name=collection_name, using=using, timeout=timeout)
+
+        return await self._metadata_cache.has_collection_async(self._uri, self._db_name, collection_name, check)
 
     async def __aenter__(self):
         """Enter the runtime context related to this object.
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# File: src/milvus/dataset.py
+"""Synthetic Vector Datasets
+
+Generates reproducible synthetic datasets for tests, benchmarks and tuning: vectors
+drawn from a Gaussian mixture (optionally L2-normalized), the mixture component of
+every vector, and scalar columns with skewed (Zipf), uniform or normal distributions.
+
+Data is produced chunk by chunk. Each chunk is derived from ``(seed, chunk index)``,
+so the same specification always yields the same data whatever the chunk order, and
+``DataGenerator.write`` fills memory-mapped ``.npy`` files one chunk at a time. A
+written ``Dataset`` is opened memory-mapped as well and streamed into ``insert`` in
+batches, so datasets much larger than RAM can be generated and loaded.
+
+Example Usage:
+```python
+>>> from src.milvus.dataset import DataGenerator, ScalarColumn
+>>> generator = DataGenerator(dim=768, clusters=64, normalize=True,
+...                           scalars=[ScalarColumn("category", "zipf", cardinality=1000)])
+>>> dataset = generator.write("/data/synthetic_100m", num_vectors=100_000_000)
+>>> await dataset.insert_into(milvus_api, "synthetic", batch_size=10_000)
+```
+"""
+import json
+import os
+from collections.abc import Iterator, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+
+from src.logger import getLogger as GetLogger
+from src.milvus.exceptions import MilvusValidationError
+
+# Logging setup
+log = GetLogger(__name__)
+
+DISTRIBUTIONS = ("zipf", "uniform", "normal")
+VECTOR_DTYPES = ("float32", "float16")
+METADATA_FILE = "dataset.json"
+VECTORS_FILE = "vectors.npy"
+CLUSTER_COLUMN = "cluster"
+
+
+@dataclass(frozen=True)
+class ScalarColumn:
+    """A generated scalar column.
+
+    Attributes:
+        name (str): Column (field) name.
+        distribution (str): "zipf" (integers 0..cardinality-1, value k with probability
+            proportional to (k + 1) ** -skew), "uniform" (integers 0..cardinality-1) or
+            "normal" (float32, mean 0, std 1).
+        cardinality (int): Number of distinct integer values. Defaults to 100.
+        skew (float): Zipf exponent; larger is more skewed. Defaults to 1.1.
+
+    """
+
+    name: str
+    distribution: str = "zipf"
+    cardinality: int = 100
+    skew: float = 1.1
+
+    def __post_init__(self):
+        if not self.name or not isinstance(self.name, str):
+            raise MilvusValidationError("Column name must be a non-empty string")
+        if self.distribution not in DISTRIBUTIONS:
+            raise MilvusValidationError(f"Unsupported distribution: {self.distribution}")
+        if self.cardinality < 1:
+            raise MilvusValidationError("Column cardinality must be positive")
+
+    @property
+    def dtype(self) -> np.dtype:
+        """NumPy type of the column values."""
+        return np.dtype(np.float32 if self.distribution == "normal" else np.int64)
+
+    def sample(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Draws ``count`` values."""
+        if self.distribution == "normal":
+            return rng.standard_normal(count, dtype=np.float32)
+        if self.distribution == "uniform":
+            return rng.integers(0, self.cardinality, count, dtype=np.int64)
+        # Bounded Zipf by inverse CDF; np.random's zipf is unbounded and needs skew > 1
+        weights = np.arange(1, self.cardinality + 1, dtype=np.float64) ** -self.skew
+        cdf = np.cumsum(weights)
+        return np.searchsorted(cdf, rng.random(count) * cdf[-1], side="right").astype(np.int64)
+
+
+class DataGenerator:
+    """Generates Gaussian-mixture vectors and scalar columns chunk by chunk.
+
+    Attributes:
+        dim (int): Vector dimension.
+        clusters (int): Mixture components.
+        cluster_std (float): Standard deviation of each component around its center.
+        normalize (bool): L2-normalize vectors (and centers), as for COSINE collections.
+        scalars (List[ScalarColumn]): Generated scalar columns.
+        dtype (str): "float32" or "float16" vectors.
+        seed (int): Seed of the whole dataset.
+        chunk_size (int): Vectors per generated chunk.
+        centers (np.ndarray): The mixture centers, shape (clusters, dim).
+
+    Methods:
+        generate_chunk: Generates one chunk.
+        chunks: Yields all chunks of a dataset.
+        write: Writes a dataset to memory-mapped ``.npy`` files.
+
+    Example:
+        ```python
+        generator = DataGenerator(dim=128, clusters=10, normalize=True)
+        for start, vectors, columns in generator.chunks(1_000_000):
+            ...
+        ```
+
+    Raises:
+        MilvusValidationError: If parameters are invalid.
+
+    """
+
+    def __init__(self, dim: int, clusters: int = 16, cluster_std: float = 0.1, normalize: bool = False,
+                 scalars: Sequence[ScalarColumn] = (), dtype: str = "float32", seed: int = 0,
+                 chunk_size: int = 100_000):
+        """Initializes the generator and draws the mixture centers.
+
+        Args:
+            dim (int): Vector dimension.
+            clusters (int): Mixture components. Defaults to 16.
+            cluster_std (float): Standard deviation around each center. Defaults to 0.1.
+            normalize (bool): L2-normalize vectors. Defaults to False.
+            scalars (Sequence[ScalarColumn]): Scalar columns to generate. Defaults to none.
+            dtype (str): "float32" or "float16". Defaults to "float32".
+            seed (int): Seed of the whole dataset. Defaults to 0.
+            chunk_size (int): Vectors per chunk. Defaults to 100000.
+
+        Raises:
+            MilvusValidationError: If parameters are invalid.
+
+        """
+        if dim < 1 or clusters < 1 or chunk_size < 1:
+            raise MilvusValidationError("dim, clusters and chunk_size must be positive")
+        if dtype not in VECTOR_DTYPES:
+            raise MilvusValidationError(f"Unsupported vector type: {dtype}")
+        names = [column.name for column in scalars]
+        if len(set(names)) != len(names) or CLUSTER_COLUMN in names:
+            raise MilvusValidationError(f"Scalar column names must be unique and not '{CLUSTER_COLUMN}'")
+        self.dim = dim
+        self.clusters = clusters
+        self.cluster_std = cluster_std
+        self.normalize = normalize
+        self.scalars = list(scalars)
+        self.dtype = dtype
+        self.seed = seed
+        self.chunk_size = chunk_size
+        centers = np.random.default_rng([seed, 2 ** 32]).standard_normal((clusters, dim), dtype=np.float32)
+        if normalize:
+            centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+        else:
+            # Spread centers so that cluster_std is relative to unit-scale data
+            centers /= np.sqrt(dim)
+        self.centers = centers
+
+    def generate_chunk(self, index: int, count: int | None = None) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """Generates chunk ``index``.
+
+        Args:
+            index (int): Chunk index; the chunk covers vectors from ``index * chunk_size``.
+            count (Optional[int]): Vectors in the chunk. Defaults to ``chunk_size``.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: The vectors, shape (count, dim), and the
+            columns by name, including the mixture component under "cluster".
+
+        """
+        count = self.chunk_size if count is None else count
+        rng = np.random.default_rng([self.seed, index])
+        labels = rng.integers(0, self.clusters, count, dtype=np.int64)
+        vectors = rng.standard_normal((count, self.dim), dtype=np.float32)
+        vectors *= self.cluster_std / np.sqrt(self.dim)
+        vectors += self.centers[labels]
+        if self.normalize:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            np.divide(vectors, norms, out=vectors, where=norms > 0)
+        columns = {CLUSTER_COLUMN: labels}
+        for column in self.scalars:
+            columns[column.name] = column.sample(rng, count)
+        return vectors.astype(self.dtype, copy=False), columns
+
+    def chunks(self, num_vectors: int) -> Iterator[tuple[int, np.ndarray, dict[str, np.ndarray]]]:
+        """Yields ``(start, vectors, columns)`` chunks covering ``num_vectors`` vectors."""
+        for index, start in enumerate(range(0, num_vectors, self.chunk_size)):
+            vectors, columns = self.generate_chunk(index, min(self.chunk_size, num_vectors - start))
+            yield start, vectors, columns
+
+    def write(self, directory: str, num_vectors: int) -> "Dataset":
+        """Writes a dataset to memory-mapped ``.npy`` files, one chunk in memory at a time.
+
+        Args:
+            directory (str): Output directory; created if missing.
+            num_vectors (int): Vectors to generate.
+
+        Returns:
+            Dataset: The written dataset, opened memory-mapped.
+
+        Raises:
+            MilvusValidationError: If ``num_vectors`` is not positive.
+
+        """
+        if num_vectors < 1:
+            raise MilvusValidationError("num_vectors must be positive")
+        os.makedirs(directory, exist_ok=True)
+        vectors_out = np.lib.format.open_memmap(os.path.join(directory, VECTORS_FILE), mode="w+",
+                                                dtype=self.dtype, shape=(num_vectors, self.dim))
+        column_types = {CLUSTER_COLUMN: np.dtype(np.int64), **{c.name: c.dtype for c in self.scalars}}
+        columns_out = {
+            name: np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode="w+", dtype=dtype,
+                                            shape=(num_vectors,))
+            for name, dtype in column_types.items()
+        }
+        for start, vectors, columns in self.chunks(num_vectors):
+            stop = start + len(vectors)
+            vectors_out[start:stop] = vectors
+            for name, values in columns.items():
+                columns_out[name][start:stop] = values
+            log.debug(f"Wrote vectors {start}..{stop} of {num_vectors} to {directory}")
+        vectors_out.flush()
+        for out in columns_out.values():
+            out.flush()
+        del vectors_out, columns_out
+        metadata = {
+            "num_vectors": num_vectors,
+            "dim": self.dim,
+            "dtype": self.dtype,
+            "clusters": self.clusters,
+            "cluster_std": self.cluster_std,
+            "normalize": self.normalize,
+            "seed": self.seed,
+            "chunk_size": self.chunk_size,
+            "columns": list(column_types),
+            "scalars": [asdict(column) for column in self.scalars],
+        }
+        with open(os.path.join(directory, METADATA_FILE), "w") as f:
+            json.dump(metadata, f, indent=2)
+        log.info(f"Wrote {num_vectors} x {self.dim} {self.dtype} vectors to {directory}")
+        return Dataset(directory)
+
+
+class Dataset:
+    """A dataset written by ``DataGenerator.write``, opened memory-mapped and read-only.
+
+    Attributes:
+        directory (str): The dataset directory.
+        metadata (Dict[str, Any]): Generation parameters.
+        vectors (np.memmap): The vectors, shape (num_vectors, dim).
+        columns (Dict[str, np.memmap]): Scalar columns by name, including "cluster".
+
+    Methods:
+        batches: Yields insertable row batches.
+        insert_into: Streams the dataset into a collection.
+
+    Example:
+        ```python
+        dataset = Dataset("/data/synthetic_100m")
+        await dataset.insert_into(milvus_api, "synthetic", batch_size=10_000)
+        ```
+
+    """
+
+    def __init__(self, directory: str):
+        """Opens the dataset files in ``directory``.
+
+        Raises:
+            MilvusValidationError: If the directory does not hold a dataset.
+
+        """
+        path = os.path.join(directory, METADATA_FILE)
+        if not os.path.exists(path):
+            raise MilvusValidationError(f"No dataset found in {directory}")
+        with open(path) as f:
+            self.metadata: dict[str, Any] = json.load(f)
+        self.directory = directory
+        self.vectors = np.load(os.path.join(directory, VECTORS_FILE), mmap_mode="r")
+        self.columns = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+                        for name in self.metadata["columns"]}
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    @property
+    def dim(self) -> int:
+        """Vector dimension."""
+        return self.vectors.shape[1]
+
+    def batches(self, batch_size: int = 10_000, start: int = 0, stop: int | None = None, id_field: str | None = "id",
+                vector_field: str = "vector", columns: Sequence[str] | None = None,
+                id_offset: int = 0) -> Iterator[list[dict[str, Any]]]:
+        """Yields batches of row dictionaries, reading one batch from disk at a time.
+
+        Args:
+            batch_size (int): Rows per batch. Defaults to 10000.
+            start (int): First row. Defaults to 0.
+            stop (Optional[int]): End row (exclusive). Defaults to the dataset length.
+            id_field (Optional[str]): Primary key field set to ``id_offset + row``; None for
+                auto-id collections. Defaults to "id".
+            vector_field (str): Vector field name. Defaults to "vector".
+            columns (Optional[Sequence[str]]): Scalar columns to include. Defaults to all.
+            id_offset (int): Added to row numbers to form primary keys. Defaults to 0.
+
+        Yields:
+            List[Dict[str, Any]]: Rows ready for ``insert``.
+
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        names = list(self.columns) if columns is None else list(columns)
+        for begin in range(start, stop, batch_size):
+            end = min(begin + batch_size, stop)
+            # float32 rows: Milvus FLOAT_VECTOR fields do not take float16 arrays
+            vectors = np.asarray(self.vectors[begin:end], dtype=np.float32)
+            values = {name: np.asarray(self.columns[name][begin:end]).tolist() for name in names}
+            rows = []
+            for i in range(end - begin):
+                row = {vector_field: vectors[i]}
+                if id_field:
+                    row[id_field] = id_offset + begin + i
+                for name in names:
+                    row[name] = values[name][i]
+                rows.append(row)
+            yield rows
+
+    async def insert_into(self, api: Any, collection_name: str, batch_size: int = 10_000, **kwargs: Any) -> int:
+        """Streams the dataset into a collection through ``api.insert``.
+
+        Only the last batch is flushed; flushing every batch would seal many small
+        segments and wait for each of them.
+
+        Args:
+            api (Any): A MilvusAPI or VectorAPI (anything with an async ``insert`` taking ``flush``).
+            collection_name (str): Target collection.
+            batch_size (int): Rows per insert call. Defaults to 10000.
+            **kwargs: Passed to ``batches`` (start, stop, id_field, vector_field, columns, id_offset).
+
+        Returns:
+            int: Rows inserted.
+
+        """
+        inserted = 0
+        pending = None
+        for rows in self.batches(batch_size, **kwargs):
+            if pending is not None:
+                await api.insert(collection_name, pending, flush=False)
+                inserted += len(pending)
+            pending = rows
+        if pending is not None:
+            await api.insert(collection_name, pending, flush=True)
+            inserted += len(pending)
+        log.info(f"Inserted {inserted} rows from {self.directory} into {collection_name}")
+        return inserted
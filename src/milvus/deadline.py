@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# File: src/milvus/deadline.py
+"""Request Deadlines
+
+A deadline is set once per request with ``deadline(seconds)`` and travels with the
+request through a context variable, including into ``asyncio.to_thread`` workers and
+tasks created inside it. Every step below it asks for what is left instead of using its
+own fixed timeout:
+
+- ``step_timeout(default)`` gives a step's gRPC timeout: the remaining budget, capped by the
+  step's default.
+- ``within(awaitable, step)`` cancels an awaited step when the deadline passes.
+- ``check(step)`` fails before starting a step (a failover retry, the next page of a
+  cache fill) once the deadline has passed.
+
+All three raise ``DeadlineExceeded``. Nested deadlines can only shorten the outer one;
+background work started during a request uses ``no_deadline()`` so that it outlives it.
+Without a deadline, every helper is a no-op and steps keep their own timeouts.
+
+Example Usage:
+```python
+>>> from src.milvus.deadline import deadline
+>>> with deadline(0.25):
+...     hits = await api.search("docs", [embedding], "vector", {"metric_type": "COSINE"}, 10)
+```
+"""
+import asyncio
+import inspect
+import time
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from src.milvus.exceptions import MilvusAPIError
+
+T = TypeVar("T")
+
+_deadline: ContextVar[float | None] = ContextVar("milvus_deadline", default=None)
+
+
+class DeadlineExceeded(MilvusAPIError):
+    """Raised when a request's deadline passes before or during a step."""
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """Sets a deadline ``seconds`` from now for the enclosed calls.
+
+    Args:
+        seconds (float): Time budget of the request.
+
+    Yields:
+        float: The effective deadline on the ``time.monotonic()`` clock.
+
+    """
+    expires = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires = min(expires, outer)
+    token = _deadline.set(expires)
+    try:
+        yield expires
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """Clears the deadline for the enclosed calls, e.g. to start background tasks."""
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Returns the seconds left until the current deadline, or None without a deadline."""
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def check(step: str = "request"):
+    """Raises DeadlineExceeded if the current deadline has passed."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(f"Deadline exceeded before {step}")
+
+
+def step_timeout(default: float | None = None, step: str = "request") -> float | None:
+    """Returns the timeout for a step: the remaining budget capped by ``default``.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed.
+
+    """
+    left = remaining()
+    if left is None:
+        return default
+    check(step)
+    return left if default is None else min(default, left)
+
+
+async def within(awaitable: Awaitable[T], step: str = "request") -> T:
+    """Awaits a step, cancelling it when the current deadline passes.
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before or while the step runs.
+
+    """
+    left = remaining()
+    if left is None:
+        return await awaitable
+    if left <= 0:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded(f"Deadline exceeded before {step}")
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except TimeoutError:
+        raise DeadlineExceeded(f"Deadline exceeded during {step}") from None
+
+
+def deadline_passed(retry_state: Any) -> bool:
+    """Tenacity stop condition: stop retrying once the current deadline has passed."""
+    left = remaining()
+    return left is not None and left <= 0
@@ -45,7 +45,7 @@ class EmbeddingAPI(IEmbeddingAPI):
         self._connect_api = connect_api
 
     @async_log_decorator
-    def generate_embeddings(self, data: list[Any], embedding_model: Callable[[list[Any]], np.ndarray],
+    async def generate_embeddings(self, data: list[Any], embedding_model: Callable[[list[Any]], np.ndarray],
                                   embedding_type: str = "float", batch_size: int = 32) -> np.ndarray:
         """Generates embeddings for the provided data.
 
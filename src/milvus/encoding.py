@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# File: src/milvus/encoding.py
+"""Query Vector Encoding
+
+Helpers that take NumPy query matrices (float32, float16, bfloat16 or float64) to
+the raw little-endian bytes of a collection's vector field without building Python
+lists of floats. pymilvus (2.6.15 and later) sends ``bytes`` query rows as-is, using the
+field type from the collection schema, whereas NumPy float32 rows and lists are packed
+float by float; earlier releases send every ``bytes`` row as a binary vector.
+
+bfloat16 arrays (``ml_dtypes.bfloat16``) are handled through their 16-bit pattern, so
+``ml_dtypes`` is only needed by callers that create such arrays.
+
+Example Usage:
+```python
+>>> from pymilvus import DataType
+>>> from src.milvus.encoding import as_query_matrix, encode_queries, l2_normalize
+>>> queries = l2_normalize(as_query_matrix(embeddings))
+>>> rows = encode_queries(queries, DataType.FLOAT16_VECTOR)
+```
+"""
+from typing import Any
+
+import numpy as np
+from pymilvus import DataType
+
+from src.milvus.exceptions import MilvusValidationError
+
+ENCODED_VECTOR_TYPES = {
+    DataType.FLOAT_VECTOR: np.dtype("<f4"),
+    DataType.FLOAT16_VECTOR: np.dtype("<f2"),
+    DataType.BFLOAT16_VECTOR: np.dtype("<u2"),
+}
+
+
+def is_bfloat16(dtype: np.dtype) -> bool:
+    """Returns whether a dtype is ``ml_dtypes.bfloat16``."""
+    return dtype.name == "bfloat16"
+
+
+def is_query_array(data: Any) -> bool:
+    """Returns whether search data is a NumPy array or a list of NumPy arrays."""
+    return isinstance(data, np.ndarray) or (isinstance(data, list | tuple) and len(data) > 0
+                                            and all(isinstance(row, np.ndarray) for row in data))
+
+
+def as_query_matrix(data: Any) -> np.ndarray:
+    """Returns query vectors as a 2-D floating-point array, without copying arrays.
+
+    Args:
+        data (Any): A ``(nq, dim)`` or ``(dim,)`` array, or a list of ``(dim,)`` arrays.
+
+    Returns:
+        np.ndarray: The ``(nq, dim)`` matrix in its original dtype.
+
+    Raises:
+        MilvusValidationError: If the data is empty, not 1-/2-D, or not floating point.
+
+    """
+    matrix = data if isinstance(data, np.ndarray) else np.stack(data)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    if matrix.ndim != 2 or not matrix.size:
+        raise MilvusValidationError("Query array must be a non-empty (nq, dim) or (dim,) array")
+    if not (np.issubdtype(matrix.dtype, np.floating) or is_bfloat16(matrix.dtype)):
+        raise MilvusValidationError(f"Unsupported query dtype: {matrix.dtype}")
+    return matrix
+
+
+def to_float32(matrix: np.ndarray) -> np.ndarray:
+    """Converts a floating-point matrix to float32; float32 input is returned as is."""
+    if matrix.dtype == np.float32:
+        return matrix
+    if is_bfloat16(matrix.dtype):
+        # bfloat16 is the upper half of a float32
+        return (matrix.view(np.uint16).astype(np.uint32) << 16).view(np.float32)
+    return matrix.astype(np.float32)
+
+
+def l2_normalize(matrix: np.ndarray) -> np.ndarray:
+    """Returns float32 rows scaled to unit L2 norm; zero rows stay zero.
+
+    The caller's array is never modified: normalization happens in place only on the
+    float32 copy made for other dtypes.
+    """
+    queries = to_float32(matrix)
+    if queries is matrix:
+        queries = matrix.copy()
+    norms = np.linalg.norm(queries, axis=1, keepdims=True)
+    np.divide(queries, norms, out=queries, where=norms > 0)
+    return queries
+
+
+def _to_bfloat16_bits(matrix: np.ndarray) -> np.ndarray:
+    if is_bfloat16(matrix.dtype):
+        return matrix.view(np.uint16)
+    bits = to_float32(matrix).view(np.uint32)
+    # Round to nearest even on the 16 dropped mantissa bits
+    return ((bits + 0x7FFF + ((bits >> 16) & 1)) >> 16).astype(np.uint16)
+
+
+def encode_queries(matrix: np.ndarray, vector_type: DataType) -> list[bytes]:
+    """Encodes query rows as the raw bytes of a vector field type.
+
+    Args:
+        matrix (np.ndarray): ``(nq, dim)`` floating-point queries.
+        vector_type (DataType): FLOAT_VECTOR, FLOAT16_VECTOR or BFLOAT16_VECTOR.
+
+    Returns:
+        List[bytes]: One little-endian row per query.
+
+    Raises:
+        MilvusValidationError: If the vector type has no float encoding.
+
+    """
+    dtype = ENCODED_VECTOR_TYPES.get(vector_type)
+    if dtype is None:
+        raise MilvusValidationError(f"Cannot encode float queries for vector type {vector_type}")
+    if vector_type == DataType.BFLOAT16_VECTOR:
+        rows = _to_bfloat16_bits(matrix)
+    elif is_bfloat16(matrix.dtype):
+        rows = to_float32(matrix)
+    else:
+        rows = matrix
+    rows = np.ascontiguousarray(rows, dtype=dtype)
+    return [row.tobytes() for row in rows]
+
+
+def decode_queries(rows: list[bytes], vector_type: DataType) -> np.ndarray:
+    """Decodes rows produced by ``encode_queries`` into a float32 matrix."""
+    dtype = ENCODED_VECTOR_TYPES.get(vector_type)
+    if dtype is None:
+        raise MilvusValidationError(f"Cannot decode queries for vector type {vector_type}")
+    matrix = np.frombuffer(b"".join(rows), dtype=dtype).reshape(len(rows), -1)
+    if vector_type == DataType.BFLOAT16_VECTOR:
+        return (matrix.astype(np.uint32) << 16).view(np.float32)
+    return matrix.astype(np.float32)
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# File: src/milvus/endpoints.py
+"""Multi-Endpoint Routing
+
+``EndpointPool`` keeps one client per Milvus proxy endpoint, probes them in a
+background thread and ranks the healthy ones by smoothed probe latency.
+``FailoverClient`` is a MilvusClient-compatible stand-in that sends every call to the
+best endpoint and, when that endpoint turns out to be down, repeats the call on the
+next one. ``ConnectAPI`` uses it when given several URIs, so the sub-APIs of the
+facade keep their ``connect_api.client`` and never notice a failover.
+
+A failed call fails over on backend failures (see ``src.milvus.resilience``) or when a
+probe of its endpoint fails too; errors of the request itself (unknown collection, bad
+filter, ...) are raised unchanged. Inserts are not idempotent and fail over only on
+``MilvusUnavailableException``. Optional per-endpoint, per-operation circuit breakers
+skip endpoints whose circuit is open, and an optional retry budget caps failovers. No
+failover starts once the request's deadline (see ``src.milvus.deadline``) has passed.
+
+Example Usage:
+```python
+>>> from src.milvus.connect import ConnectAPI
+>>> with ConnectAPI(uri=["http://proxy-1:19530", "http://proxy-2:19530"], health_check_interval=5) as connect_api:
+...     connect_api.client.list_collections()  # served by the fastest healthy proxy
+...     connect_api.client.endpoint_stats()
+```
+"""
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+from pymilvus import MilvusException, MilvusUnavailableException
+
+from src.logger import getLogger as GetLogger
+from src.milvus.deadline import check
+from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
+from src.milvus.resilience import CircuitBreakers, CircuitOpenError, RetryBudget, is_backend_failure
+
+# Logging setup
+log = GetLogger(__name__)
+
+_NON_IDEMPOTENT = frozenset({"insert"})
+
+
+@dataclass
+class Endpoint:
+    """State of one proxy endpoint.
+
+    Attributes:
+        uri (str): Endpoint URI.
+        options (Dict[str, Any]): Client arguments specific to this endpoint.
+        client (Any): The endpoint's client, None until it could be created.
+        healthy (bool): Result of the last probe or call.
+        latency (Optional[float]): Exponentially smoothed probe latency in seconds.
+        failures (int): Consecutive failed probes.
+        last_error (Optional[str]): Message of the last failure.
+        checked_at (Optional[float]): ``time.time()`` of the last probe.
+
+    """
+
+    uri: str
+    options: dict[str, Any] = field(default_factory=dict)
+    client: Any = None
+    healthy: bool = False
+    latency: float | None = None
+    failures: int = 0
+    last_error: str | None = None
+    checked_at: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"uri": self.uri, "healthy": self.healthy, "latency": self.latency, "failures": self.failures,
+                "last_error": self.last_error, "checked_at": self.checked_at}
+
+
+class EndpointPool:
+    """Health-checked set of endpoints ranked by latency.
+
+    Attributes:
+        endpoints (List[Endpoint]): All endpoints, in configuration order.
+        health_check_interval (Optional[float]): Seconds between background probes;
+            None disables the background thread.
+        probe_timeout (float): Timeout of a probe call in seconds.
+        smoothing (float): Weight of the newest probe in the latency average.
+        breakers (Optional[CircuitBreakers]): Circuit breakers per endpoint and operation.
+        retry_budget (Optional[RetryBudget]): Budget shared by all failovers.
+
+    Methods:
+        connect: Probes all endpoints and starts the health checks.
+        check: Probes all endpoints once.
+        probe: Probes one endpoint.
+        ranked: Endpoints in routing order.
+        call: Runs a client method with failover.
+        call_alternate: Runs a client method starting on the second-best endpoint.
+        use_database: Switches the database of every endpoint.
+        stats: Endpoint states.
+        metrics: Endpoint, circuit breaker and retry budget states.
+        close: Stops the health checks and closes the clients.
+
+    Example:
+        ```python
+        pool = EndpointPool(["http://a:19530", "http://b:19530"], lambda uri, options: MilvusClient(uri, **options))
+        pool.connect()
+        pool.call("list_collections")
+        ```
+
+    Raises:
+        MilvusValidationError: If no endpoint is given.
+        MilvusAPIError: If no endpoint is reachable on connect.
+
+    """
+
+    def __init__(self, endpoints: list[str | dict[str, Any]], factory: Callable[[str, dict[str, Any]], Any],
+                 health_check_interval: float | None = 5.0, probe_timeout: float = 2.0, smoothing: float = 0.3,
+                 breakers: CircuitBreakers | None = None, retry_budget: RetryBudget | None = None):
+        """Initializes the pool without connecting.
+
+        Args:
+            endpoints (List[str | Dict[str, Any]]): URIs, or dictionaries with a "uri" and
+                client arguments for that endpoint only.
+            factory (Callable[[str, Dict[str, Any]], Any]): Creates the client of an
+                endpoint from its URI and options.
+            health_check_interval (Optional[float]): Seconds between background probes.
+                Defaults to 5; None disables them.
+            probe_timeout (float): Probe timeout in seconds. Defaults to 2.
+            smoothing (float): Weight of the newest probe latency. Defaults to 0.3.
+            breakers (Optional[CircuitBreakers]): Fail fast on endpoint operations whose
+                circuit is open. Defaults to None.
+            retry_budget (Optional[RetryBudget]): Caps failovers to a share of calls.
+                Defaults to None (failover is unbounded).
+
+        """
+        if not endpoints:
+            raise MilvusValidationError("At least one endpoint is required")
+        self.endpoints = [Endpoint(e) if isinstance(e, str)
+                          else Endpoint(e["uri"], {k: v for k, v in e.items() if k != "uri"}) for e in endpoints]
+        self.health_check_interval = health_check_interval
+        self.probe_timeout = probe_timeout
+        self.smoothing = smoothing
+        self.breakers = breakers
+        self.retry_budget = retry_budget
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._db_name: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def connect(self):
+        """Probes every endpoint and starts the background health checks.
+
+        Raises:
+            MilvusAPIError: If no endpoint answers.
+
+        """
+        self.check()
+        if not any(endpoint.healthy for endpoint in self.endpoints):
+            errors = "; ".join(f"{e.uri}: {e.last_error}" for e in self.endpoints)
+            raise MilvusAPIError(f"No reachable endpoint: {errors}")
+        if self.health_check_interval and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="milvus-health-check", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.health_check_interval):
+            self.check()
+
+    def check(self) -> list[dict[str, Any]]:
+        """Probes all endpoints once and returns their states."""
+        for endpoint in self.endpoints:
+            self.probe(endpoint)
+        return self.stats()
+
+    def _open(self, endpoint: Endpoint) -> Any:
+        if endpoint.client is None:
+            client = self._factory(endpoint.uri, dict(endpoint.options))
+            if self._db_name:
+                client.use_database(self._db_name)
+            endpoint.client = client
+            log.info(f"Opened Milvus endpoint {endpoint.uri}")
+        return endpoint.client
+
+    def probe(self, endpoint: Endpoint) -> bool:
+        """Checks that an endpoint answers and updates its latency.
+
+        Returns:
+            bool: True if the endpoint is healthy.
+
+        """
+        started = time.perf_counter()
+        try:
+            self._open(endpoint).list_databases(timeout=self.probe_timeout)
+        except Exception as e:  # connection errors are not always MilvusExceptions
+            self._mark_down(endpoint, e)
+            return False
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            if endpoint.latency is None:
+                endpoint.latency = elapsed
+            else:
+                endpoint.latency += self.smoothing * (elapsed - endpoint.latency)
+            if not endpoint.healthy and endpoint.checked_at is not None:
+                log.info(f"Milvus endpoint {endpoint.uri} is healthy again")
+            endpoint.healthy = True
+            endpoint.failures = 0
+            endpoint.checked_at = time.time()
+        return True
+
+    def _mark_down(self, endpoint: Endpoint, error: Exception):
+        with self._lock:
+            if endpoint.healthy:
+                log.warning(f"Milvus endpoint {endpoint.uri} is unhealthy: {error}")
+            endpoint.healthy = False
+            endpoint.failures += 1
+            endpoint.last_error = str(error)
+            endpoint.checked_at = time.time()
+
+    def ranked(self) -> list[Endpoint]:
+        """Healthy endpoints by latency, then unhealthy ones as a last resort."""
+        with self._lock:
+            healthy = sorted((e for e in self.endpoints if e.healthy), key=lambda e: e.latency or 0.0)
+            unhealthy = sorted((e for e in self.endpoints if not e.healthy), key=lambda e: e.failures)
+        return healthy + unhealthy
+
+    def preferred_client(self) -> Any:
+        """Returns the client of the best endpoint that has one."""
+        for endpoint in self.ranked():
+            if endpoint.client is not None:
+                return endpoint.client
+        raise MilvusAPIError("No Milvus endpoint is connected")
+
+    def _should_fail_over(self, name: str, endpoint: Endpoint, error: MilvusException, backend: bool) -> bool:
+        if name in _NON_IDEMPOTENT and not isinstance(error, MilvusUnavailableException):
+            return False
+        healthy = self.probe(endpoint)
+        return backend or not healthy
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Calls a client method on the best endpoint, failing over to the next ones.
+
+        Args:
+            name (str): Client method name.
+            *args: Positional arguments of the method.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            Any: The method's result.
+
+        Raises:
+            CircuitOpenError: If the circuits of all endpoints are open for the operation.
+            MilvusException: The request's own error, or the last endpoint's error.
+
+        """
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        return self._call(self.ranked(), name, args, kwargs)
+
+    def call_alternate(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Like ``call``, but starts with the second-best endpoint (for hedged requests).
+
+        With a single endpoint the call goes to that endpoint.
+        """
+        candidates = self.ranked()
+        return self._call(candidates[1:] + candidates[:1], name, args, kwargs)
+
+    def _call(self, candidates: list[Endpoint], name: str, args: tuple, kwargs: dict[str, Any]) -> Any:
+        last_error: Exception | None = None
+        attempted = False
+        for position, endpoint in enumerate(candidates):
+            if attempted:
+                check(f"failing over {name}")
+            if attempted and self.retry_budget is not None and not self.retry_budget.try_spend():
+                log.warning(f"Retry budget exhausted, not failing over {name}")
+                break
+            breaker = self.breakers.get(endpoint.uri, name) if self.breakers is not None else None
+            if breaker is not None and not breaker.allow():
+                if last_error is None:
+                    last_error = CircuitOpenError(message=f"Circuit open for {name} on {endpoint.uri}")
+                continue
+            attempted = True
+            try:
+                client = self._open(endpoint)
+            except Exception as e:
+                self._mark_down(endpoint, e)
+                if breaker is not None:
+                    breaker.record_failure()
+                last_error = e
+                continue
+            try:
+                result = getattr(client, name)(*args, **kwargs)
+            except MilvusException as e:
+                backend = is_backend_failure(e)
+                if breaker is not None and backend:
+                    breaker.record_failure()
+                elif breaker is not None:
+                    breaker.record_success()
+                if position == len(candidates) - 1 or not self._should_fail_over(name, endpoint, e, backend):
+                    raise
+                log.warning(f"{name} failed on {endpoint.uri}, failing over: {e}")
+                last_error = e
+                continue
+            if breaker is not None:
+                breaker.record_success()
+            return result
+        if isinstance(last_error, MilvusException):
+            raise last_error
+        raise MilvusUnavailableException(message=f"No Milvus endpoint available for {name}: {last_error}")
+
+    def use_database(self, db_name: str):
+        """Switches every open client to a database; later clients start in it too."""
+        self._db_name = db_name
+        last_error: Exception | None = None
+        switched = False
+        for endpoint in self.endpoints:
+            if endpoint.client is None:
+                continue
+            try:
+                endpoint.client.use_database(db_name)
+                switched = True
+            except MilvusException as e:
+                self._mark_down(endpoint, e)
+                last_error = e
+        if not switched and last_error is not None:
+            raise last_error
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Returns the state of every endpoint."""
+        with self._lock:
+            return [endpoint.to_dict() for endpoint in self.endpoints]
+
+    def metrics(self) -> dict[str, Any]:
+        """Returns endpoint states, circuit breaker states and the retry budget."""
+        return {
+            "endpoints": self.stats(),
+            "circuit_breakers": self.breakers.metrics() if self.breakers is not None else [],
+            "retry_budget": self.retry_budget.metrics() if self.retry_budget is not None else {},
+        }
+
+    def close(self):
+        """Stops the health checks and closes every client."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for endpoint in self.endpoints:
+            if endpoint.client is not None:
+                try:
+                    endpoint.client.close()
+                except MilvusException as e:
+                    log.warning(f"Failed to close endpoint {endpoint.uri}: {e}")
+                endpoint.client = None
+                endpoint.healthy = False
+
+
+class FailoverClient:
+    """MilvusClient-compatible client that routes every call through an EndpointPool.
+
+    Methods are looked up on the client of the best endpoint and run through
+    ``EndpointPool.call``; plain attributes come from that client directly.
+
+    Attributes:
+        pool (EndpointPool): The routed endpoints.
+
+    Methods:
+        use_database: Switches the database of every endpoint.
+        endpoint_stats: Endpoint states.
+        resilience_metrics: Endpoint, circuit breaker and retry budget states.
+        close: Closes the pool.
+
+    Example:
+        ```python
+        client = FailoverClient(pool)
+        client.search("docs", [[0.1, 0.2]], limit=5)
+        ```
+
+    """
+
+    def __init__(self, pool: EndpointPool):
+        self.pool = pool
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "pool":
+            raise AttributeError(name)
+        attribute = getattr(self.pool.preferred_client(), name)
+        if not callable(attribute):
+            return attribute
+        return partial(self.pool.call, name)
+
+    def use_database(self, db_name: str, **kwargs: Any):
+        self.pool.use_database(db_name)
+
+    def endpoint_stats(self) -> list[dict[str, Any]]:
+        return self.pool.stats()
+
+    def resilience_metrics(self) -> dict[str, Any]:
+        return self.pool.metrics()
+
+    def close(self):
+        self.pool.close()
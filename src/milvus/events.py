@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# File: src/milvus/events.py
+"""Collection Change Events
+
+Write paths (``VectorAPI.insert``/``delete``, ``CollectionAPI.drop_collection``)
+publish a ``CollectionEvent`` after each successful change to the
+``ICollectionObserver``s attached to them. Client-side structures that mirror
+collection contents (local search caches, shadow indexes, query caches) observe
+these events to stay current without polling the server.
+
+Example Usage:
+```python
+>>> class Printer(ICollectionObserver):
+...     def update(self, event):
+...         print(event.kind, event.collection_name, event.ids)
+>>> vector_api.attach(Printer())
+```
+"""
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.logger import getLogger as GetLogger
+from src.milvus.interfaces import ICollectionObserver
+
+# Logging setup
+log = GetLogger(__name__)
+
+INSERT = "insert"
+DELETE = "delete"
+DROP = "drop"
+
+
+@dataclass(frozen=True)
+class CollectionEvent:
+    """A successful change to a collection.
+
+    Attributes:
+        kind (str): "insert", "delete" or "drop".
+        collection_name (str): The changed collection.
+        database_name (str): Its database.
+        partition_name (str | None): The partition written to, if any.
+        entities (List[Dict[str, Any]]): Inserted rows (insert only).
+        ids (List[Any]): Primary keys reported by the server (insert only).
+        expr (str | None): Filter of the deleted rows (delete only).
+
+    """
+
+    kind: str
+    collection_name: str
+    database_name: str = "default"
+    partition_name: str | None = None
+    entities: list[dict[str, Any]] = field(default_factory=list)
+    ids: list[Any] = field(default_factory=list)
+    expr: str | None = None
+
+
+class CollectionSubject:
+    """Mixin publishing CollectionEvents to attached observers.
+
+    Observer failures are logged and never fail the write that triggered them.
+
+    Methods:
+        attach: Registers an observer.
+        detach: Unregisters an observer.
+        notify: Publishes an event to all observers.
+
+    """
+
+    def attach(self, observer: ICollectionObserver):
+        """Registers an observer; attaching the same observer twice has no effect."""
+        observers = self.__dict__.setdefault("_observers", [])
+        if observer not in observers:
+            observers.append(observer)
+
+    def detach(self, observer: ICollectionObserver):
+        """Unregisters an observer."""
+        observers = self.__dict__.get("_observers", [])
+        if observer in observers:
+            observers.remove(observer)
+
+    def notify(self, event: CollectionEvent):
+        """Publishes an event to all observers."""
+        for observer in self.__dict__.get("_observers", ()):
+            try:
+                observer.update(event)
+            except Exception as e:
+                log.error(f"Observer {type(observer).__name__} failed on {event.kind} of "
+                          f"{event.collection_name}: {e}")
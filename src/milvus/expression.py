@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# File: src/milvus/expression.py
+"""Filter Expression Parser
+
+Parses Milvus boolean filter expressions (``tenant == "x" and ts > 100``) into a small
+abstract syntax tree that can be evaluated client-side against *partial* knowledge of
+an entity's field values. Evaluation uses three-valued (Kleene) logic: a node returns
+``True`` or ``False`` when the outcome is certain for every value in the bound domains,
+and ``None`` when it cannot be decided. This is what partition pruning needs: a
+partition may be skipped only when the filter is certainly ``False`` for everything
+it can contain.
+
+Supported grammar:
+- Comparisons: ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` (either operand order)
+- Chained ranges: ``10 < ts <= 20``
+- Membership: ``field in [..]``, ``field not in [..]``
+- Boolean operators: ``and``/``&&``, ``or``/``||``, ``not``/``!`` and parentheses
+
+Anything else that Milvus accepts (``like``, JSON paths, arithmetic, functions) is
+parsed as an opaque term that always evaluates to ``None``.
+
+Example Usage:
+```python
+>>> from src.milvus.expression import Interval, parse_expression
+>>> expr = parse_expression('tenant == "acme" and ts >= 86400')
+>>> expr.evaluate({"tenant": Interval.point("acme"), "ts": Interval(0, 86400)})
+False
+```
+"""
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from src.milvus.exceptions import MilvusValidationError
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)
+      | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>==|!=|<=|>=|&&|\|\||[<>!()\[\],+\-*/%])
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    )
+    """,
+    re.VERBOSE,
+)
+_KEYWORDS = {"and", "or", "not", "in", "like", "true", "false"}
+_COMPARISONS = {"==", "!=", "<", "<=", ">", ">="}
+_MIRRORED = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "!=": "!="}
+
+
+@dataclass(frozen=True)
+class Token:
+    """A lexical token of a filter expression."""
+
+    kind: str
+    value: Any
+
+
+def tokenize(expression: str) -> list[Token]:
+    """Splits a filter expression into tokens.
+
+    Args:
+        expression (str): The filter expression.
+
+    Returns:
+        List[Token]: Tokens in source order.
+
+    Raises:
+        MilvusValidationError: If the expression contains an unexpected character.
+
+    """
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN_RE.match(expression, position)
+        if match is None or match.end() == position:
+            raise MilvusValidationError(
+                f"Unexpected character {expression[position]!r} at {position} in filter expression")
+        position = match.end()
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "number":
+            tokens.append(Token("literal", float(text) if any(c in text for c in ".eE") else int(text)))
+        elif kind == "string":
+            tokens.append(Token("literal", re.sub(r"\\(.)", r"\1", text[1:-1])))
+        elif kind == "name" and text.lower() in _KEYWORDS:
+            lowered = text.lower()
+            if lowered in ("true", "false"):
+                tokens.append(Token("literal", lowered == "true"))
+            else:
+                tokens.append(Token("op", lowered))
+        elif kind == "op" and text in ("&&", "||"):
+            tokens.append(Token("op", "and" if text == "&&" else "or"))
+        else:
+            tokens.append(Token(kind, text))
+    return tokens
+
+
+@dataclass(frozen=True)
+class Interval:
+    """The set of values a field can take, as a (possibly unbounded) interval.
+
+    A point value is an interval whose bounds are equal and inclusive. ``None`` bounds
+    are unbounded. Bounds may be any mutually comparable values (numbers or strings).
+
+    Attributes:
+        low (Any): Lower bound, or None for unbounded.
+        high (Any): Upper bound, or None for unbounded.
+        low_inclusive (bool): Whether ``low`` is part of the interval. Defaults to True.
+        high_inclusive (bool): Whether ``high`` is part of the interval. Defaults to False.
+
+    """
+
+    low: Any = None
+    high: Any = None
+    low_inclusive: bool = True
+    high_inclusive: bool = False
+
+    @classmethod
+    def point(cls, value: Any) -> "Interval":
+        """Creates an interval holding exactly one value."""
+        return cls(value, value, True, True)
+
+    @property
+    def is_point(self) -> bool:
+        """Whether the interval holds exactly one value."""
+        return self.low is not None and self.low == self.high and self.low_inclusive and self.high_inclusive
+
+    def _above(self, value: Any, inclusive: bool) -> bool:
+        """Whether every value of the interval is above ``value`` (or equal when inclusive)."""
+        if self.low is None:
+            return False
+        return self.low > value or (self.low == value and (inclusive or not self.low_inclusive))
+
+    def _below(self, value: Any, inclusive: bool) -> bool:
+        """Whether every value of the interval is below ``value`` (or equal when inclusive)."""
+        if self.high is None:
+            return False
+        return self.high < value or (self.high == value and (inclusive or not self.high_inclusive))
+
+    def compare(self, op: str, value: Any) -> bool | None:
+        """Evaluates ``x <op> value`` for every ``x`` in the interval.
+
+        Args:
+            op (str): Comparison operator.
+            value (Any): Right-hand operand.
+
+        Returns:
+            Optional[bool]: True/False if the result is the same for all members,
+                None if it depends on the member or the types are not comparable.
+
+        """
+        try:
+            if op == "==":
+                if self.is_point:
+                    return self.low == value
+                return False if self._above(value, False) or self._below(value, False) else None
+            if op == "!=":
+                equal = self.compare("==", value)
+                return None if equal is None else not equal
+            if op == ">":
+                return True if self._above(value, False) else (False if self._below(value, True) else None)
+            if op == ">=":
+                return True if self._above(value, True) else (False if self._below(value, False) else None)
+            if op == "<":
+                return True if self._below(value, False) else (False if self._above(value, True) else None)
+            if op == "<=":
+                return True if self._below(value, True) else (False if self._above(value, False) else None)
+        except TypeError:
+            return None
+        raise MilvusValidationError(f"Unsupported comparison operator: {op}")
+
+
+class Node:
+    """Base class for expression tree nodes."""
+
+    def evaluate(self, bindings: dict[str, Interval]) -> bool | None:
+        """Evaluates the node with Kleene logic against partially known field values.
+
+        Args:
+            bindings (Dict[str, Interval]): Known value domains per field name.
+
+        Returns:
+            Optional[bool]: The outcome, or None if it cannot be decided.
+
+        """
+        raise NotImplementedError
+
+    def fields(self) -> set[str]:
+        """Returns the names of the fields referenced by the node."""
+        return set()
+
+
+@dataclass(frozen=True)
+class Comparison(Node):
+    """``field <op> value`` comparison."""
+
+    field: str
+    op: str
+    value: Any
+
+    def evaluate(self, bindings: dict[str, Interval]) -> bool | None:
+        domain = bindings.get(self.field)
+        return None if domain is None else domain.compare(self.op, self.value)
+
+    def fields(self) -> set[str]:
+        return {self.field}
+
+
+@dataclass(frozen=True)
+class Membership(Node):
+    """``field [not] in [values]`` membership test."""
+
+    field: str
+    values: tuple
+    negate: bool = False
+
+    def evaluate(self, bindings: dict[str, Interval]) -> bool | None:
+        domain = bindings.get(self.field)
+        if domain is None:
+            return None
+        result = _any(domain.compare("==", value) for value in self.values)
+        return None if result is None else result != self.negate
+
+    def fields(self) -> set[str]:
+        return {self.field}
+
+
+@dataclass(frozen=True)
+class BoolOp(Node):
+    """Conjunction (``and``) or disjunction (``or``) of operands."""
+
+    op: str
+    operands: tuple = field(default_factory=tuple)
+
+    def evaluate(self, bindings: dict[str, Interval]) -> bool | None:
+        results = (operand.evaluate(bindings) for operand in self.operands)
+        return _all(results) if self.op == "and" else _any(results)
+
+    def fields(self) -> set[str]:
+        return set().union(*(operand.fields() for operand in self.operands))
+
+
+@dataclass(frozen=True)
+class Not(Node):
+    """Logical negation."""
+
+    operand: Node
+
+    def evaluate(self, bindings: dict[str, Interval]) -> bool | None:
+        result = self.operand.evaluate(bindings)
+        return None if result is None else not result
+
+    def fields(self) -> set[str]:
+        return self.operand.fields()
+
+
+@dataclass(frozen=True)
+class Opaque(Node):
+    """A term the client cannot reason about; always undecided."""
+
+    text: str
+
+    def evaluate(self, bindings: dict[str, Interval]) -> bool | None:
+        return None
+
+
+def _all(results) -> bool | None:
+    """Kleene conjunction."""
+    undecided = False
+    for result in results:
+        if result is False:
+            return False
+        if result is None:
+            undecided = True
+    return None if undecided else True
+
+
+def _any(results) -> bool | None:
+    """Kleene disjunction."""
+    undecided = False
+    for result in results:
+        if result is True:
+            return True
+        if result is None:
+            undecided = True
+    return None if undecided else False
+
+
+class _Parser:
+    """Recursive-descent parser over a token list."""
+
+    def __init__(self, tokens: list[Token]):
+        self._tokens = tokens
+        self._position = 0
+
+    def _peek(self, offset: int = 0) -> Token | None:
+        index = self._position + offset
+        return self._tokens[index] if index < len(self._tokens) else None
+
+    def _is_op(self, value: str, offset: int = 0) -> bool:
+        token = self._peek(offset)
+        return token is not None and token.kind == "op" and token.value == value
+
+    def _next(self) -> Token:
+        token = self._peek()
+        if token is None:
+            raise MilvusValidationError("Unexpected end of filter expression")
+        self._position += 1
+        return token
+
+    def _expect(self, value: str):
+        token = self._next()
+        if token.kind != "op" or token.value != value:
+            raise MilvusValidationError(f"Expected {value!r} in filter expression, got {token.value!r}")
+
+    def parse(self) -> Node:
+        node = self._parse_or()
+        if self._peek() is not None:
+            raise MilvusValidationError(f"Unexpected token {self._peek().value!r} in filter expression")
+        return node
+
+    def _parse_or(self) -> Node:
+        operands = [self._parse_and()]
+        while self._is_op("or"):
+            self._next()
+            operands.append(self._parse_and())
+        return operands[0] if len(operands) == 1 else BoolOp("or", tuple(operands))
+
+    def _parse_and(self) -> Node:
+        operands = [self._parse_not()]
+        while self._is_op("and"):
+            self._next()
+            operands.append(self._parse_not())
+        return operands[0] if len(operands) == 1 else BoolOp("and", tuple(operands))
+
+    def _parse_not(self) -> Node:
+        if self._is_op("not") or self._is_op("!"):
+            self._next()
+            return Not(self._parse_not())
+        if self._is_op("("):
+            # Parenthesised boolean group; fall back to an opaque term for arithmetic groups
+            start = self._position
+            self._next()
+            try:
+                node = self._parse_or()
+                self._expect(")")
+            except MilvusValidationError:
+                self._position = start
+                return self._parse_opaque()
+            if self._peek() is None or self._peek().value in ("and", "or", ")"):
+                return node
+            self._position = start
+            return self._parse_opaque()
+        return self._parse_term()
+
+    def _parse_term(self) -> Node:
+        first, second = self._peek(), self._peek(1)
+        if first is None:
+            raise MilvusValidationError("Unexpected end of filter expression")
+        # field [not] in [ ... ]
+        if first.kind == "name" and second is not None and (
+                self._is_op("in", 1) or (self._is_op("not", 1) and self._is_op("in", 2))):
+            start = self._position
+            self._next()
+            negate = self._is_op("not")
+            if negate:
+                self._next()
+            self._next()
+            values = self._parse_list()
+            if values is not None and self._at_term_end():
+                return Membership(first.value, values, negate)
+            self._position = start
+            return self._parse_opaque()
+        # comparison chain of simple operands: a < b [< c]
+        start = self._position
+        operands, operators = [self._parse_operand()], []
+        while self._peek() is not None and self._peek().kind == "op" and self._peek().value in _COMPARISONS:
+            operators.append(self._next().value)
+            operands.append(self._parse_operand())
+        if operators and None not in operands and self._at_term_end():
+            nodes = [self._comparison(left, op, right)
+                     for left, op, right in zip(operands, operators, operands[1:], strict=False)]
+            if None not in nodes:
+                return nodes[0] if len(nodes) == 1 else BoolOp("and", tuple(nodes))
+        self._position = start
+        return self._parse_opaque()
+
+    def _parse_operand(self) -> Token | None:
+        token = self._peek()
+        if token is not None and token.kind in ("name", "literal"):
+            return self._next()
+        return None
+
+    def _parse_list(self) -> tuple | None:
+        if not self._is_op("["):
+            return None
+        self._next()
+        values = []
+        while not self._is_op("]"):
+            token = self._next()
+            if token.kind != "literal":
+                return None
+            values.append(token.value)
+            if self._is_op(","):
+                self._next()
+            elif not self._is_op("]"):
+                return None
+        self._next()
+        return tuple(values)
+
+    def _at_term_end(self) -> bool:
+        token = self._peek()
+        return token is None or (token.kind == "op" and token.value in ("and", "or", ")"))
+
+    @staticmethod
+    def _comparison(left: Token, op: str, right: Token) -> Comparison | None:
+        if left.kind == "name" and right.kind == "literal":
+            return Comparison(left.value, op, right.value)
+        if left.kind == "literal" and right.kind == "name":
+            return Comparison(right.value, _MIRRORED[op], left.value)
+        return None
+
+    def _parse_opaque(self) -> Node:
+        """Consumes tokens up to the next top-level boolean operator."""
+        depth, parts = 0, []
+        while self._peek() is not None:
+            token = self._peek()
+            if token.kind == "op" and depth == 0 and token.value in ("and", "or", ")"):
+                break
+            if token.kind == "op" and token.value in ("(", "["):
+                depth += 1
+            elif token.kind == "op" and token.value in (")", "]"):
+                depth -= 1
+            parts.append(str(token.value))
+            self._next()
+        if not parts:
+            raise MilvusValidationError("Empty term in filter expression")
+        if depth != 0:
+            raise MilvusValidationError("Unbalanced brackets in filter expression")
+        return Opaque(" ".join(parts))
+
+
+@lru_cache(maxsize=1024)
+def parse_expression(expression: str) -> Node:
+    """Parses a Milvus filter expression into an expression tree.
+
+    Results are cached, since the same filter strings tend to be issued repeatedly.
+
+    Args:
+        expression (str): The filter expression.
+
+    Returns:
+        Node: Root of the expression tree.
+
+    Raises:
+        MilvusValidationError: If the expression is empty or malformed.
+
+    """
+    if not expression or not isinstance(expression, str) or not expression.strip():
+        raise MilvusValidationError("Filter expression must be a non-empty string")
+    return _Parser(tokenize(expression)).parse()
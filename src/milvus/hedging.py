@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# File: src/milvus/hedging.py
+"""Hedged Requests
+
+Tail latency of searches is dominated by occasional slow query nodes. ``HedgePolicy``
+starts a request and, if it has not completed after the running ``quantile`` (p95 by
+default) of recent latencies, sends a duplicate to another endpoint. The first
+successful response wins and the other is cancelled; a failed attempt leaves the other
+one running. Hedges draw from a ``RetryBudget`` (see ``src.milvus.resilience``) so the
+extra load stays near ``budget`` (5% by default) of requests.
+
+Latencies are tracked per key (the collection name in ``SearchAPI``) over a sliding
+window; no hedge is sent until ``min_samples`` latencies are known.
+
+Cancelling an attempt cancels its asyncio task. Calls already running in a worker thread
+finish in the background and their result is discarded.
+
+Example Usage:
+```python
+>>> api = MilvusAPI(connect_api)
+>>> api.enable_hedging(quantile=0.95, budget=0.05)
+>>> await api.search("docs", [embedding], "vector", {"metric_type": "COSINE"}, 10)
+>>> api.hedging_stats()
+{'requests': 1, 'hedges': 0, 'hedge_wins': 0, ...}
+```
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import numpy as np
+
+from src.logger import getLogger as GetLogger
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.resilience import RetryBudget
+
+# Logging setup
+log = GetLogger(__name__)
+
+
+class HedgePolicy:
+    """Runs requests with a delayed duplicate after the running latency quantile.
+
+    Attributes:
+        quantile (float): Latency quantile after which a hedge is sent.
+        min_delay (float): Lower bound of the hedge delay in seconds.
+        min_samples (int): Latencies needed before hedging starts.
+        window (int): Number of recent latencies kept per key.
+
+    Methods:
+        delay: Current hedge delay of a key.
+        run: Runs a request with an optional hedge.
+        stats: Request, hedge and win counters.
+
+    Example:
+        ```python
+        policy = HedgePolicy(quantile=0.95, budget=0.05)
+        result = await policy.run("docs", lambda: search(primary), lambda: search(secondary))
+        ```
+
+    Raises:
+        MilvusValidationError: If parameters are invalid.
+
+    """
+
+    def __init__(self, quantile: float = 0.95, budget: float = 0.05, min_delay: float = 0.0,
+                 min_samples: int = 20, window: int = 1000):
+        if not 0.0 < quantile < 1.0:
+            raise MilvusValidationError("Hedge quantile must be between 0 and 1")
+        if not 0.0 <= budget <= 1.0:
+            raise MilvusValidationError("Hedge budget must be between 0 and 1")
+        if min_samples < 1 or window < min_samples:
+            raise MilvusValidationError("window must be at least min_samples, which must be positive")
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        # Hedges per request, with a small burst allowance and no time-based floor
+        self._budget = RetryBudget(ratio=budget, min_per_second=0.0, capacity=max(1.0, budget * 100))
+        self._lock = threading.Lock()
+        self._latencies: dict[Hashable, deque] = {}
+        self._counters = dict.fromkeys(("requests", "hedges", "hedge_wins", "budget_exhausted"), 0)
+
+    def _record(self, key: Hashable, seconds: float):
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window)
+            latencies.append(seconds)
+
+    def delay(self, key: Hashable) -> float | None:
+        """Returns the hedge delay of a key, or None while too few latencies are known."""
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            samples = np.fromiter(latencies, dtype=np.float64, count=len(latencies))
+        return max(self.min_delay, float(np.quantile(samples, self.quantile)))
+
+    async def run(self, key: Hashable, primary: Callable[[], Awaitable[Any]],
+                  hedge: Callable[[], Awaitable[Any]]) -> Any:
+        """Runs ``primary`` and, past the hedge delay and within budget, ``hedge`` too.
+
+        Args:
+            key (Hashable): Latency tracking key.
+            primary (Callable[[], Awaitable[Any]]): Starts the request.
+            hedge (Callable[[], Awaitable[Any]]): Starts the duplicate request.
+
+        Returns:
+            Any: The first successful result.
+
+        Raises:
+            Exception: The primary's error when every attempt failed.
+
+        """
+        with self._lock:
+            self._counters["requests"] += 1
+        self._budget.record_request()
+        delay = self.delay(key)
+        started = time.perf_counter()
+        first = asyncio.ensure_future(primary())
+        tasks = {first}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    if self._budget.try_spend():
+                        with self._lock:
+                            self._counters["hedges"] += 1
+                        log.debug(f"Hedging request on {key} after {delay:.4f}s")
+                        tasks.add(asyncio.ensure_future(hedge()))
+                    else:
+                        with self._lock:
+                            self._counters["budget_exhausted"] += 1
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self._record(key, time.perf_counter() - started)
+                        if task is not first:
+                            with self._lock:
+                                self._counters["hedge_wins"] += 1
+                        return task.result()
+            raise first.exception()
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Returns counters, the hedge rate and the current delay per key."""
+        with self._lock:
+            counters = dict(self._counters)
+            keys = list(self._latencies)
+        counters["hedge_rate"] = counters["hedges"] / counters["requests"] if counters["requests"] else 0.0
+        counters["delays"] = {str(key): self.delay(key) for key in keys}
+        return counters
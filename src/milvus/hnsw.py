@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# File: src/milvus/hnsw.py
+"""Pure Python/NumPy HNSW Index
+
+A small Hierarchical Navigable Small World graph (Malkov & Yashunin) for in-process
+approximate search, used by the hot-partition shadow indexes of ``src.milvus.shadow``.
+Graph traversal is plain Python over adjacency lists; distances to each batch of
+neighbours are computed with one NumPy product over a contiguous float32 matrix.
+
+Removal marks nodes as deleted: they keep routing searches but are never returned.
+``deleted_fraction`` tells the owner when a rebuild is worthwhile.
+
+Example Usage:
+```python
+>>> from src.milvus.hnsw import HNSWIndex
+>>> index = HNSWIndex(dim=128, metric_type="COSINE", M=16, ef_construction=100)
+>>> index.add_items(ids, vectors)
+>>> ids, distances, counts = index.search(queries, k=10, ef=64)
+```
+"""
+import heapq
+import math
+from typing import Any
+
+import numpy as np
+
+from src.milvus.exceptions import MilvusValidationError
+
+METRICS = ("L2", "IP", "COSINE")
+
+
+class HNSWIndex:
+    """Hierarchical Navigable Small World graph over float32 vectors.
+
+    Attributes:
+        dim (int): Vector dimension.
+        metric_type (str): "L2", "IP" or "COSINE".
+        M (int): Links per node on upper layers (``2 * M`` on layer 0).
+        ef_construction (int): Candidate list size while inserting.
+        ef_search (int): Default candidate list size while searching.
+
+    Methods:
+        add: Inserts or replaces one vector.
+        add_items: Inserts or replaces several vectors.
+        remove: Marks vectors deleted.
+        search: Approximate top-k search.
+
+    Example:
+        ```python
+        index = HNSWIndex(64, "L2")
+        index.add_items([1, 2, 3], vectors)
+        ids, distances, counts = index.search(queries, 2)
+        ```
+
+    Raises:
+        MilvusValidationError: If parameters or vector dimensions are invalid.
+
+    """
+
+    def __init__(self, dim: int, metric_type: str = "COSINE", M: int = 16, ef_construction: int = 100,
+                 ef_search: int = 64, seed: int = 0, capacity: int = 1024):
+        metric_type = (metric_type or "COSINE").upper()
+        if metric_type not in METRICS:
+            raise MilvusValidationError(f"Unsupported metric type for HNSW: {metric_type}")
+        if M < 2 or ef_construction < 1 or ef_search < 1:
+            raise MilvusValidationError("M must be at least 2 and ef values positive")
+        self.dim = dim
+        self.metric_type = metric_type
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._level_scale = 1 / math.log(M)
+        self._rng = np.random.default_rng(seed)
+        self._vectors = np.empty((max(capacity, 1), dim), dtype=np.float32)
+        self._links: list[list[list[int]]] = []  # node -> layer -> neighbour nodes
+        self._pks: list[Any] = []
+        self._node_of: dict[Any, int] = {}
+        self._deleted: set[int] = set()
+        self._entry: int | None = None
+        self._top = -1
+
+    def __len__(self) -> int:
+        return len(self._node_of)
+
+    def __contains__(self, pk: Any) -> bool:
+        return pk in self._node_of
+
+    @property
+    def deleted_fraction(self) -> float:
+        """Share of graph nodes that are deleted."""
+        return len(self._deleted) / len(self._pks) if self._pks else 0.0
+
+    def _prepare(self, vectors: Any) -> np.ndarray:
+        vectors = np.array(vectors, dtype=np.float32, ndmin=2)
+        if vectors.shape[1] != self.dim:
+            raise MilvusValidationError(f"Vector dimension {vectors.shape[1]} does not match {self.dim}")
+        if self.metric_type == "COSINE":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    def _distances(self, query: np.ndarray, nodes: list[int]) -> np.ndarray:
+        """Distances (smaller is closer) from a prepared query to graph nodes."""
+        candidates = self._vectors[nodes]
+        if self.metric_type == "L2":
+            difference = candidates - query
+            return np.einsum("ij,ij->i", difference, difference)
+        return -(candidates @ query)
+
+    def _search_layer(self, query: np.ndarray, entries: list[tuple[float, int]], ef: int,
+                      layer: int) -> list[tuple[float, int]]:
+        """Best-first search of one layer; returns up to ``ef`` (distance, node) pairs, closest first."""
+        visited = {node for _, node in entries}
+        candidates = list(entries)
+        heapq.heapify(candidates)
+        results = [(-distance, node) for distance, node in entries]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+        while candidates:
+            distance, node = heapq.heappop(candidates)
+            if distance > -results[0][0] and len(results) >= ef:
+                break
+            neighbours = [n for n in self._links[node][layer] if n not in visited]
+            if not neighbours:
+                continue
+            visited.update(neighbours)
+            for neighbour_distance, neighbour in zip(self._distances(query, neighbours).tolist(), neighbours,
+                                                     strict=True):
+                if len(results) < ef or neighbour_distance < -results[0][0]:
+                    heapq.heappush(candidates, (neighbour_distance, neighbour))
+                    heapq.heappush(results, (-neighbour_distance, neighbour))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+        return sorted((-negative, node) for negative, node in results)
+
+    def _select(self, candidates: list[tuple[float, int]], limit: int) -> list[int]:
+        """Neighbour selection heuristic: keeps candidates closer to the base than to any kept one."""
+        if len(candidates) <= limit:
+            return [node for _, node in candidates]
+        nodes = [node for _, node in candidates]
+        vectors = self._vectors[nodes]
+        if self.metric_type == "L2":
+            squared = np.einsum("ij,ij->i", vectors, vectors)
+            pairwise = squared[:, None] + squared[None, :] - 2 * vectors @ vectors.T
+        else:
+            pairwise = -(vectors @ vectors.T)
+        kept: list[int] = []
+        for i, (distance, _) in enumerate(candidates):
+            if all(distance < pairwise[i, j] for j in kept):
+                kept.append(i)
+                if len(kept) == limit:
+                    break
+        if len(kept) < limit:
+            # Fill up with the closest skipped candidates to keep the graph well connected
+            chosen = set(kept)
+            kept.extend(i for i in range(len(nodes)) if i not in chosen)
+            kept = sorted(kept[:limit], key=lambda i: candidates[i][0])
+        return [nodes[i] for i in kept]
+
+    def _grow(self, needed: int):
+        capacity = len(self._vectors)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            vectors = np.empty((capacity, self.dim), dtype=np.float32)
+            vectors[:len(self._pks)] = self._vectors[:len(self._pks)]
+            self._vectors = vectors
+
+    def add(self, pk: Any, vector: Any):
+        """Inserts a vector; a vector already present under ``pk`` is replaced."""
+        self.add_items([pk], [vector])
+
+    def add_items(self, ids: list[Any], vectors: Any):
+        """Inserts vectors; vectors already present under the same keys are replaced.
+
+        Args:
+            ids (List[Any]): Primary keys.
+            vectors (Any): ``(len(ids), dim)`` vectors.
+
+        """
+        vectors = self._prepare(vectors)
+        if len(ids) != len(vectors):
+            raise MilvusValidationError("ids and vectors must have the same length")
+        self.remove([pk for pk in ids if pk in self._node_of])
+        self._grow(len(self._pks) + len(ids))
+        for pk, vector in zip(ids, vectors, strict=True):
+            self._insert(pk, vector)
+
+    def _insert(self, pk: Any, vector: np.ndarray):
+        node = len(self._pks)
+        self._vectors[node] = vector
+        self._pks.append(pk)
+        self._node_of[pk] = node
+        level = int(-math.log(1.0 - self._rng.random()) * self._level_scale)
+        self._links.append([[] for _ in range(level + 1)])
+        if self._entry is None:
+            self._entry, self._top = node, level
+            return
+        entries = [(float(self._distances(vector, [self._entry])[0]), self._entry)]
+        for layer in range(self._top, level, -1):
+            entries = self._search_layer(vector, entries, 1, layer)
+        for layer in range(min(level, self._top), -1, -1):
+            entries = self._search_layer(vector, entries, self.ef_construction, layer)
+            limit = 2 * self.M if layer == 0 else self.M
+            neighbours = self._select(entries, self.M)
+            self._links[node][layer] = neighbours
+            for neighbour in neighbours:
+                links = self._links[neighbour][layer]
+                links.append(node)
+                if len(links) > limit:
+                    distances = self._distances(self._vectors[neighbour], links).tolist()
+                    self._links[neighbour][layer] = self._select(sorted(zip(distances, links, strict=True)), limit)
+        if level > self._top:
+            self._entry, self._top = node, level
+
+    def remove(self, ids: list[Any]) -> int:
+        """Marks vectors deleted; returns the number removed."""
+        removed = 0
+        for pk in ids:
+            node = self._node_of.pop(pk, None)
+            if node is not None:
+                self._deleted.add(node)
+                removed += 1
+        return removed
+
+    def search(self, queries: Any, k: int, ef: int | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Approximate top-k search.
+
+        Args:
+            queries (Any): ``(nq, dim)`` query vectors.
+            k (int): Hits per query.
+            ef (Optional[int]): Candidate list size; at least ``k``. Defaults to ``ef_search``.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: ``(nq, k)`` ids (object) and float32
+            distances in Milvus conventions (squared L2; similarity for IP/COSINE), closest
+            first and padded with None/NaN, and the ``(nq,)`` hit counts.
+
+        """
+        queries = self._prepare(queries)
+        nq = len(queries)
+        ids = np.full((nq, k), None, dtype=object)
+        distances = np.full((nq, k), np.nan, dtype=np.float32)
+        counts = np.zeros(nq, dtype=np.int64)
+        if self._entry is None or not self._node_of:
+            return ids, distances, counts
+        # Deleted nodes still occupy candidate slots, so widen the search accordingly
+        ef = max(ef or self.ef_search, k) + min(len(self._deleted), k)
+        sign = 1.0 if self.metric_type == "L2" else -1.0
+        for row, query in enumerate(queries):
+            entries = [(float(self._distances(query, [self._entry])[0]), self._entry)]
+            for layer in range(self._top, 0, -1):
+                entries = self._search_layer(query, entries, 1, layer)
+            hits = [(distance, node) for distance, node in self._search_layer(query, entries, ef, 0)
+                    if node not in self._deleted][:k]
+            counts[row] = len(hits)
+            for column, (distance, node) in enumerate(hits):
+                ids[row, column] = self._pks[node]
+                distances[row, column] = sign * distance
+        return ids, distances, counts
@@ -1,5 +1,8 @@
+import asyncio
+import time
+from typing import Any
 
-from pymilvus import Collection, MilvusException
+from pymilvus import Collection, MilvusClient, MilvusException
 
 from src.logger import getLogger as GetLogger
 from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
@@ -9,23 +12,278 @@ from src.utils import async_log_decorator
 # Logging setup
 log = GetLogger(__name__)
 
+# Build states reported by describe_index, plus the local "Queued" state (waiting for a
+# build slot; cancellable) and "Issued" (create_index sent, no server state read yet)
+QUEUED = "Queued"
+ISSUED = "Issued"
+FINISHED = "Finished"
+FAILED = "Failed"
+CANCELLED = "Cancelled"
+
+
+class IndexBuildHandle:
+    """Tracks one index build from submission to completion.
+
+    Progress is refreshed from ``describe_index`` while the build runs, so
+    ``indexed_rows``/``total_rows`` reflect the server-side build state.
+
+    Attributes:
+        collection_name (str): Name of the collection.
+        field_name (str): Indexed field.
+        index_name (str): Name of the index.
+        index_params (Dict): Index parameters.
+        state (str): "Queued", "Issued", a server index state ("InProgress", "Finished", ...), or "Cancelled".
+        total_rows (int): Rows to index.
+        indexed_rows (int): Rows indexed so far.
+        pending_rows (int): Rows waiting to be indexed.
+        error (Exception | None): Failure, if the build failed.
+
+    Methods:
+        wait: Waits for the build to finish.
+        cancel: Cancels the build if it has not been issued yet.
+
+    Example:
+        ```python
+        handle = await api.create_index("docs", "vector", {"index_type": "HNSW", "metric_type": "COSINE"})
+        print(handle.progress, handle.rows_per_second)
+        await handle.wait(timeout=600)
+        ```
+
+    """
+
+    def __init__(self, collection_name: str, field_name: str, index_name: str, index_params: dict):
+        self.collection_name = collection_name
+        self.field_name = field_name
+        self.index_name = index_name
+        self.index_params = index_params
+        self.state = QUEUED
+        self.total_rows = 0
+        self.indexed_rows = 0
+        self.pending_rows = 0
+        self.error: Exception | None = None
+        self.submitted_at = time.monotonic()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the build has finished, failed or been cancelled."""
+        return self.state in (FINISHED, FAILED, CANCELLED)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the build was issued to the server (0 while queued)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def progress(self) -> float:
+        """Fraction of rows indexed, between 0 and 1."""
+        if self.state == FINISHED:
+            return 1.0
+        return self.indexed_rows / self.total_rows if self.total_rows else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Indexing throughput so far."""
+        return self.indexed_rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def _update(self, description: dict[str, Any] | None):
+        if not description:
+            return
+        self.total_rows = int(description.get("total_rows", self.total_rows))
+        self.indexed_rows = int(description.get("indexed_rows", self.indexed_rows))
+        self.pending_rows = int(description.get("pending_index_rows", self.pending_rows))
+        self.state = description.get("state", self.state)
+
+    async def wait(self, timeout: float | None = None) -> "IndexBuildHandle":
+        """Waits for the build to finish.
+
+        Args:
+            timeout (float | None): Seconds to wait. Defaults to no limit.
+
+        Returns:
+            IndexBuildHandle: This handle.
+
+        Raises:
+            MilvusAPIError: If the build failed, was cancelled or did not finish in time.
+
+        """
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout)
+            except TimeoutError:
+                raise MilvusAPIError(f"Index build on {self.collection_name}.{self.field_name} "
+                                     f"did not finish within {timeout}s ({self.progress:.0%} done)")
+            except asyncio.CancelledError:
+                if not self._task.cancelled():
+                    raise
+        if self.state == CANCELLED:
+            raise MilvusAPIError(f"Index build on {self.collection_name}.{self.field_name} was cancelled")
+        if self.error is not None:
+            raise MilvusAPIError(f"Index creation failed: {self.error}")
+        return self
+
+    def cancel(self) -> bool:
+        """Cancels the build if it is still queued.
+
+        Builds already issued to the server keep running there and cannot be cancelled.
+
+        Returns:
+            bool: Whether the build was cancelled.
+
+        """
+        if self.state != QUEUED or self._task is None:
+            return False
+        self._task.cancel()
+        self.state = CANCELLED
+        return True
+
+    def __repr__(self) -> str:
+        return (f"IndexBuildHandle({self.collection_name}.{self.field_name}, state={self.state}, "
+                f"rows={self.indexed_rows}/{self.total_rows}, elapsed={self.elapsed:.1f}s, "
+                f"rows_per_second={self.rows_per_second:.0f})")
+
+
+class IndexBuildScheduler:
+    """Queues index builds and limits how many run at once across collections.
+
+    Builds wait for a free slot, are issued without blocking (``sync=False``) and
+    are then polled with ``describe_index`` until the server reports them finished,
+    so a mass reindex never has more than ``max_concurrent_builds`` builds in flight.
+
+    Attributes:
+        _connect_api (IConnectAPI): The connection API instance.
+        max_concurrent_builds (int): Builds allowed in flight at once.
+        poll_interval (float): Seconds between progress polls.
+        builds (List[IndexBuildHandle]): Handles of all submitted builds.
+
+    Methods:
+        submit: Queues a build and returns its handle.
+        active: Returns the builds currently in flight.
+        wait_all: Waits for every submitted build.
+
+    Example:
+        ```python
+        scheduler = IndexBuildScheduler(connect_api, max_concurrent_builds=2)
+        handles = [scheduler.submit(name, "vector", params) for name in collections]
+        await scheduler.wait_all()
+        ```
+
+    Raises:
+        MilvusValidationError: If the scheduler settings are invalid.
+
+    """
+
+    def __init__(self, connect_api: IConnectAPI, max_concurrent_builds: int = 2, poll_interval: float = 1.0):
+        """Initializes the scheduler.
+
+        Args:
+            connect_api (IConnectAPI): The connection API instance for Milvus operations.
+            max_concurrent_builds (int): Builds allowed in flight at once. Defaults to 2.
+            poll_interval (float): Seconds between progress polls. Defaults to 1.0.
+
+        """
+        if not isinstance(max_concurrent_builds, int) or max_concurrent_builds < 1:
+            raise MilvusValidationError("Max concurrent builds must be a positive integer")
+        if poll_interval <= 0:
+            raise MilvusValidationError("Poll interval must be positive")
+        self._connect_api = connect_api
+        self.max_concurrent_builds = max_concurrent_builds
+        self.poll_interval = poll_interval
+        self.builds: list[IndexBuildHandle] = []
+        self._slots: asyncio.Semaphore | None = None
+
+    def submit(self, collection_name: str, field_name: str, index_params: dict,
+               index_name: str | None = None, timeout: float | None = None, **kwargs) -> IndexBuildHandle:
+        """Queues an index build; must be called from a running event loop.
+
+        Args:
+            collection_name (str): Name of the collection.
+            field_name (str): Field to index.
+            index_params (Dict): Index parameters (index_type, metric_type, params).
+            index_name (str | None): Name of the index. Defaults to the field name.
+            timeout (float | None): Timeout of the create_index request.
+            **kwargs: Additional create_index arguments.
+
+        Returns:
+            IndexBuildHandle: Handle tracking the build.
+
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrent_builds)
+        handle = IndexBuildHandle(collection_name, field_name, index_name or field_name, dict(index_params))
+        handle._task = asyncio.create_task(self._run(handle, timeout, kwargs))
+        self.builds = [build for build in self.builds if not build.done] + [handle]
+        log.info(f"Queued index build on {collection_name}.{field_name} ({len(self.active())} in flight)")
+        return handle
+
+    def active(self) -> list[IndexBuildHandle]:
+        """Returns the builds issued to the server and not yet finished."""
+        return [build for build in self.builds if build.started_at is not None and not build.done]
+
+    async def wait_all(self, timeout: float | None = None) -> list[IndexBuildHandle]:
+        """Waits for every submitted build; failures are left on the handles."""
+        builds = [build for build in self.builds if build._task is not None]
+        if builds:
+            await asyncio.wait([build._task for build in builds], timeout=timeout)
+        return builds
+
+    async def _run(self, handle: IndexBuildHandle, timeout: float | None, kwargs: dict):
+        client = self._connect_api.client
+        async with self._slots:
+            handle.state = ISSUED
+            handle.started_at = time.monotonic()
+            try:
+                params = dict(handle.index_params)
+                index_params = MilvusClient.prepare_index_params()
+                index_params.add_index(field_name=handle.field_name, index_type=params.pop("index_type", ""),
+                                       index_name=handle.index_name, **params)
+                await asyncio.to_thread(client.create_index, collection_name=handle.collection_name,
+                                        index_params=index_params, timeout=timeout, sync=False, **kwargs)
+                database = {"db_name": kwargs["db_name"]} if "db_name" in kwargs else {}
+                while not handle.done:
+                    handle._update(await asyncio.to_thread(
+                        client.describe_index, collection_name=handle.collection_name, index_name=handle.index_name,
+                        **database))
+                    if not handle.done:
+                        await asyncio.sleep(self.poll_interval)
+                if handle.state == FAILED:
+                    handle.error = MilvusException(message=f"server reported state {FAILED}")
+            except Exception as e:
+                handle.state = FAILED
+                handle.error = e
+            finally:
+                handle.finished_at = time.monotonic()
+        if handle.error is not None:
+            log.error(f"Failed to create index on {handle.collection_name}.{handle.field_name}: {handle.error}")
+        else:
+            log.info(f"Built index on {handle.collection_name}.{handle.field_name}: {handle.indexed_rows} rows "
+                     f"in {handle.elapsed:.1f}s ({handle.rows_per_second:.0f} rows/s)")
+
+
 class IndexAPI(IIndexAPI):
     """Handles index creation and deletion in Milvus.
 
-    Implements the IIndexAPI interface to manage indexes on collection fields.
+    Implements the IIndexAPI interface to manage indexes on collection fields. Index
+    builds are queued on an IndexBuildScheduler and return a handle immediately.
 
     Attributes:
         _connect_api (IConnectAPI): The connection API instance.
+        scheduler (IndexBuildScheduler): Scheduler limiting concurrent builds.
 
     Methods:
-        create_index: Creates an index on a field.
+        create_index: Queues an index build on a field.
         drop_index: Drops an index from a field.
 
     Example:
         ```python
         connect_api = ConnectAPI()
-        api = IndexAPI(connect_api)
-        api.create_index("test_collection", "vector", {"index_type": "IVF_FLAT"})
+        api = IndexAPI(connect_api, max_concurrent_builds=2)
+        handle = await api.create_index("test_collection", "vector", {"index_type": "IVF_FLAT"})
+        await handle.wait()
         ```
 
     Raises:
@@ -34,25 +292,39 @@ class IndexAPI(IIndexAPI):
 
     """
 
-    def __init__(self, connect_api: IConnectAPI):
-        """Initializes IndexAPI with a connection instance."""
+    def __init__(self, connect_api: IConnectAPI, max_concurrent_builds: int = 2, poll_interval: float = 1.0):
+        """Initializes IndexAPI with a connection instance.
+
+        Args:
+            connect_api (IConnectAPI): The connection API instance for Milvus operations.
+            max_concurrent_builds (int): Index builds allowed in flight at once. Defaults to 2.
+            poll_interval (float): Seconds between build progress polls. Defaults to 1.0.
+
+        """
         self._connect_api = connect_api
+        self.scheduler = IndexBuildScheduler(connect_api, max_concurrent_builds, poll_interval)
 
     @async_log_decorator
-    def create_index(self, collection_name: str, field_name: str,
-                           index_params: dict, database_name: str = "default", **kwargs):
-        """Creates an index on a field in a collection.
+    async def create_index(self, collection_name: str, field_name: str,
+                           index_params: dict, database_name: str = "default",
+                           index_name: str | None = None, wait: bool = False, **kwargs) -> IndexBuildHandle:
+        """Queues an index build on a field in a collection.
 
         Args:
             collection_name (str): Name of the collection.
             field_name (str): Field to index.
             index_params (Dict): Index parameters.
             database_name (str): Database name. Defaults to "default".
+            index_name (str | None): Name of the index. Defaults to the field name.
+            wait (bool): Wait for the build to finish before returning. Defaults to False.
             **kwargs: Additional index arguments.
 
+        Returns:
+            IndexBuildHandle: Handle tracking the build.
+
         Raises:
             MilvusValidationError: If inputs are invalid.
-            MilvusAPIError: If index creation fails.
+            MilvusAPIError: If index creation fails (only raised here when waiting).
 
         """
         if not collection_name or not isinstance(collection_name, str):
@@ -61,13 +333,11 @@ class IndexAPI(IIndexAPI):
             raise MilvusValidationError("Field name must be a non-empty string")
         if not index_params or not isinstance(index_params, dict):
             raise MilvusValidationError("Index parameters must be a non-empty dictionary")
-        try:
-            collection = Collection(collection_name, using=self._connect_api._alias, db_name=database_name)
-            collection.create_index(field_name=field_name, index_params=index_params, **kwargs)
-            log.info(f"Created index on {field_name} in {collection_name}")
-        except MilvusException as e:
-            log.error(f"Failed to create index: {e}")
-            raise MilvusAPIError(f"Index creation failed: {e}")
+        handle = self.scheduler.submit(collection_name, field_name, index_params, index_name=index_name,
+                                       db_name=database_name, **kwargs)
+        if wait:
+            await handle.wait()
+        return handle
 
     @async_log_decorator
     def drop_index(self, collection_name: str, field_name: str, database_name: str = "default"):
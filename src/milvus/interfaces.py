@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 # File: src.interfaces.py
-from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import Annotated, Any
+from __future__ import annotations
 
-import numpy as np
-from pymilvus import Collection, FieldSchema, MilvusClient
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, Annotated, Any
 
 from src.logger import getLogger as GetLogger
 
+if TYPE_CHECKING:
+    # Only used in annotations; importing them here would load pymilvus and NumPy
+    import numpy as np
+    from pymilvus import Collection, FieldSchema, MilvusClient
+
 # Logging setup
 log = GetLogger(__name__)
 
@@ -306,6 +310,106 @@ class ISearchAPI(ABC):
         raise NotImplementedError("The 'search' method must be implemented by subclasses to perform vector search.")
 
 
+class IQueryAPI(ABC):
+    """Interface for scalar queries and paginated result streaming in Milvus.
+
+    Provides a method for filtering entities by scalar expression and async generators
+    that stream query and search results page by page.
+
+    Methods:
+        query: Retrieves entities matching a filter expression.
+        query_iterator: Streams query results in pages.
+        search_iterator: Streams search results in pages.
+
+    Raises:
+        MilvusAPIError: If query operations fail due to server issues.
+        MilvusValidationError: If query parameters are invalid.
+
+    Example:
+        ```python
+        class MilvusQueryAPI(IQueryAPI):
+            def query(self, collection_name, expr, output_fields, partition_names, database_name, **kwargs):
+                return client.query(collection_name, filter=expr, output_fields=output_fields)
+        ```
+
+    """
+
+    @abstractmethod
+    def query(self, collection_name: str, expr: str, output_fields: list[str] | None,
+              partition_names: list[str] | None, database_name: str, **kwargs) -> list[dict]:
+        """Retrieves entities matching a filter expression.
+
+        Parameters
+        ----------
+            collection_name (str): Name of the collection to query.
+            expr (str): Boolean expression to filter entities.
+            output_fields (Optional[List[str]]): Fields to include in results.
+            partition_names (Optional[List[str]]): Partitions to query.
+            database_name (str): Name of the database.
+            **kwargs: Additional query parameters.
+
+        Returns
+        -------
+            List[Dict]: Matching entities.
+
+        Raises
+        ------
+            NotImplementedError: If the method is not implemented by a subclass.
+
+        """
+        raise NotImplementedError("The 'query' method must be implemented by subclasses to query entities.")
+
+    @abstractmethod
+    def query_iterator(self, collection_name: str, expr: str, output_fields: list[str] | None,
+                       partition_names: list[str] | None, page_size: int | None, **kwargs) -> AsyncIterator[list[dict]]:
+        """Streams entities matching a filter expression in pages.
+
+        Parameters
+        ----------
+            collection_name (str): Name of the collection to query.
+            expr (str): Boolean expression to filter entities.
+            output_fields (Optional[List[str]]): Fields to include in results.
+            partition_names (Optional[List[str]]): Partitions to query.
+            page_size (Optional[int]): Number of entities per page.
+            **kwargs: Additional query parameters.
+
+        Returns
+        -------
+            AsyncIterator[List[Dict]]: Pages of matching entities.
+
+        Raises
+        ------
+            NotImplementedError: If the method is not implemented by a subclass.
+
+        """
+        raise NotImplementedError("The 'query_iterator' method must be implemented by subclasses.")
+
+    @abstractmethod
+    def search_iterator(self, collection_name: str, data: list[list[float]], anns_field: str,
+                        param: dict[str, Any], page_size: int | None, **kwargs) -> AsyncIterator[list[dict]]:
+        """Streams vector search results in pages of increasing distance.
+
+        Parameters
+        ----------
+            collection_name (str): Name of the collection to search.
+            data (List[List[float]]): A single query vector.
+            anns_field (str): Name of the vector field to search.
+            param (Dict[str, Any]): Search parameters (e.g., metric type).
+            page_size (Optional[int]): Number of hits per page.
+            **kwargs: Additional search parameters.
+
+        Returns
+        -------
+            AsyncIterator[List[Dict]]: Pages of hits.
+
+        Raises
+        ------
+            NotImplementedError: If the method is not implemented by a subclass.
+
+        """
+        raise NotImplementedError("The 'search_iterator' method must be implemented by subclasses.")
+
+
 class IIndexAPI(ABC):
     """Interface for managing indexes in Milvus collections.
 
@@ -342,6 +446,10 @@ class IIndexAPI(ABC):
             database_name (str): Name of the database.
             **kwargs: Additional index parameters.
 
+        Returns
+        -------
+            A handle for tracking the index build.
+
         Raises
         ------
             NotImplementedError: If the method is not implemented by a subclass.
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# File: src/milvus/local.py
+"""Local Exact Search for Small Collections
+
+For small collections a server round trip (plus ``load_collection``) costs more than
+scanning the vectors locally. ``LocalSearchCache`` mirrors the vectors of configured
+collections into a contiguous float32 NumPy matrix and answers searches exactly with
+one BLAS matrix product and ``argpartition`` per query batch.
+
+The mirror is filled on first use from the server and then kept current from the
+insert/delete/drop events of ``VectorAPI``/``CollectionAPI`` (it is an
+``ICollectionObserver``). Each collection has a row threshold: while the collection
+is at or below it searches run locally, above it (or for searches the mirror cannot
+answer: filters, partitions, output fields other than the primary key) they go to
+the server.
+
+Writes made by other clients are not seen; call ``invalidate`` (or configure only
+collections written through this process) when that matters.
+
+Example Usage:
+```python
+>>> from src.milvus.local import LocalSearchCache
+>>> api = MilvusAPI(connect_api)
+>>> api.enable_local_search("tenant_42", threshold=50_000)
+>>> results = await api.search("tenant_42", [[0.1] * 128], "vector", {"metric_type": "COSINE"}, 10)
+```
+"""
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from pymilvus import DataType, MilvusException
+
+from src.logger import getLogger as GetLogger
+from src.milvus.deadline import check, step_timeout
+from src.milvus.events import DELETE, DROP, INSERT, CollectionEvent
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.expression import Comparison, Membership, parse_expression
+from src.milvus.interfaces import ICollectionObserver, IConnectAPI
+from src.milvus.results import ColumnarSearchResult
+
+# Logging setup
+log = GetLogger(__name__)
+
+DEFAULT_THRESHOLD = 50_000
+METRICS = ("L2", "IP", "COSINE")
+
+
+class BruteForceIndex:
+    """Exact vector index over a contiguous, growable float32 matrix.
+
+    Deleted rows are replaced by the last row, so the first ``len(index)`` rows are
+    always live and a search is a single matrix product. COSINE vectors are stored
+    normalized, which turns the metric into an inner product.
+
+    Attributes:
+        dim (int): Vector dimension.
+        metric_type (str): "L2", "IP" or "COSINE".
+
+    Methods:
+        upsert: Adds or replaces vectors by primary key.
+        delete: Removes vectors by primary key.
+        search: Exact top-k search.
+
+    Example:
+        ```python
+        index = BruteForceIndex(128, "COSINE")
+        index.upsert([1, 2], vectors)
+        ids, distances, counts = index.search(queries, 10)
+        ```
+
+    """
+
+    def __init__(self, dim: int, metric_type: str = "COSINE", capacity: int = 1024):
+        metric_type = (metric_type or "COSINE").upper()
+        if metric_type not in METRICS:
+            raise MilvusValidationError(f"Unsupported metric type for local search: {metric_type}")
+        self.dim = dim
+        self.metric_type = metric_type
+        self._vectors = np.empty((capacity, dim), dtype=np.float32)
+        self._sq_norms = np.empty(capacity, dtype=np.float32)
+        self._ids = np.empty(capacity, dtype=object)
+        self._row_of: dict[Any, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, pk: Any) -> bool:
+        return pk in self._row_of
+
+    def _prepare(self, vectors: Any) -> np.ndarray:
+        vectors = np.array(vectors, dtype=np.float32, ndmin=2)
+        if vectors.shape[1] != self.dim:
+            raise MilvusValidationError(f"Vector dimension {vectors.shape[1]} does not match {self.dim}")
+        if self.metric_type == "COSINE":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    def _grow(self, needed: int):
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_vectors", "_sq_norms", "_ids"):
+            old = getattr(self, name)
+            new = np.empty((capacity, *old.shape[1:]), dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def upsert(self, ids: list[Any], vectors: Any):
+        """Adds vectors, replacing those whose primary key is already present."""
+        vectors = self._prepare(vectors)
+        if len(ids) != len(vectors):
+            raise MilvusValidationError("ids and vectors must have the same length")
+        self._grow(self._size + len(ids))
+        rows = np.empty(len(ids), dtype=np.int64)
+        for i, pk in enumerate(ids):
+            row = self._row_of.get(pk)
+            if row is None:
+                row = self._row_of[pk] = self._size
+                self._ids[row] = pk
+                self._size += 1
+            rows[i] = row
+        self._vectors[rows] = vectors
+        self._sq_norms[rows] = np.einsum("ij,ij->i", vectors, vectors)
+
+    def delete(self, ids: list[Any]) -> int:
+        """Removes vectors by primary key; returns the number removed."""
+        removed = 0
+        for pk in ids:
+            row = self._row_of.pop(pk, None)
+            if row is None:
+                continue
+            last = self._size - 1
+            if row != last:
+                moved = self._ids[last]
+                self._vectors[row] = self._vectors[last]
+                self._sq_norms[row] = self._sq_norms[last]
+                self._ids[row] = moved
+                self._row_of[moved] = row
+            self._ids[last] = None
+            self._size -= 1
+            removed += 1
+        return removed
+
+    def search(self, queries: Any, limit: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the exact top ``limit`` hits of each query.
+
+        Args:
+            queries (Any): ``(nq, dim)`` query vectors.
+            limit (int): Hits per query.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: ``(nq, limit)`` ids (object) and
+            float32 distances, closest first and padded with None/NaN, and the ``(nq,)``
+            hit counts. L2 distances are squared, as Milvus reports them.
+
+        """
+        queries = self._prepare(queries)
+        nq, n = len(queries), self._size
+        k = min(limit, n)
+        ids = np.full((nq, limit), None, dtype=object)
+        distances = np.full((nq, limit), np.nan, dtype=np.float32)
+        if k == 0:
+            return ids, distances, np.zeros(nq, dtype=np.int64)
+        products = queries @ self._vectors[:n].T
+        if self.metric_type == "L2":
+            scores = self._sq_norms[:n][None, :] - 2 * products  # ranks as ||q - v||^2 - ||q||^2
+        else:
+            scores = -products
+        if k < n:
+            top = np.argpartition(scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(n), (nq, n))
+        order = np.take_along_axis(top, np.argsort(np.take_along_axis(scores, top, axis=1), axis=1), axis=1)
+        best = np.take_along_axis(scores, order, axis=1)
+        if self.metric_type == "L2":
+            best = np.maximum(best + np.einsum("ij,ij->i", queries, queries)[:, None], 0)
+        else:
+            best = -best
+        ids[:, :k] = self._ids[order]
+        distances[:, :k] = best
+        return ids, distances, np.full(nq, k, dtype=np.int64)
+
+
+@dataclass
+class _Mirror:
+    """Local state of one configured collection."""
+
+    threshold: int
+    anns_field: str
+    metric_type: str
+    database_name: str
+    index: BruteForceIndex | None = None
+    pk_name: str = "id"
+    string_pk: bool = False
+    oversized: bool = False  # last sync found more rows than the threshold
+    generation: int = 0  # bumped by every write event, to detect writes racing a fill
+    hits: int = 0
+    misses: int = 0
+
+
+class LocalSearchCache(ICollectionObserver):
+    """Answers searches on small collections from local exact indexes.
+
+    Attributes:
+        _connect_api (IConnectAPI): Connection used to fill mirrors.
+        _mirrors (Dict[str, _Mirror]): Mirrors by collection name.
+
+    Methods:
+        configure: Enables local search for a collection.
+        disable: Disables local search for a collection.
+        invalidate: Discards a mirror; it is refilled on the next search.
+        search: Searches locally, or returns None when the server must answer.
+        update: Applies a CollectionEvent (ICollectionObserver).
+        stats: Local/remote counts and mirror sizes.
+
+    Example:
+        ```python
+        cache = LocalSearchCache(connect_api)
+        vector_api.attach(cache)
+        cache.configure("tenant_42", threshold=50_000)
+        result = await cache.search("tenant_42", queries, "vector", {"metric_type": "COSINE"}, 10)
+        ```
+
+    """
+
+    def __init__(self, connect_api: IConnectAPI):
+        """Initializes the cache with the connection used to fill mirrors."""
+        self._connect_api = connect_api
+        self._mirrors: dict[str, _Mirror] = {}
+        self._lock = threading.RLock()
+        self._fill_locks: dict[str, asyncio.Lock] = {}
+
+    def configure(self, collection_name: str, threshold: int = DEFAULT_THRESHOLD, anns_field: str = "vector",
+                  metric_type: str = "COSINE", database_name: str = "default"):
+        """Enables local search for a collection.
+
+        Args:
+            collection_name (str): Name of the collection.
+            threshold (int): Largest row count searched locally; 0 disables. Defaults to 50000.
+            anns_field (str): Vector field mirrored. Defaults to "vector".
+            metric_type (str): Metric of the collection's index. Defaults to "COSINE".
+            database_name (str): Database name. Defaults to "default".
+
+        Raises:
+            MilvusValidationError: If the collection name or metric type is invalid.
+
+        """
+        if not collection_name or not isinstance(collection_name, str):
+            raise MilvusValidationError("Collection name must be a non-empty string")
+        if threshold <= 0:
+            self.disable(collection_name)
+            return
+        metric_type = metric_type.upper()
+        if metric_type not in METRICS:
+            raise MilvusValidationError(f"Unsupported metric type for local search: {metric_type}")
+        with self._lock:
+            self._mirrors[collection_name] = _Mirror(threshold, anns_field, metric_type, database_name)
+        log.info(f"Local search enabled for {collection_name} up to {threshold} rows")
+
+    def disable(self, collection_name: str):
+        """Disables local search for a collection and frees its mirror."""
+        with self._lock:
+            self._mirrors.pop(collection_name, None)
+
+    def invalidate(self, collection_name: str):
+        """Discards the mirror of a collection; the next search refills it."""
+        with self._lock:
+            mirror = self._mirrors.get(collection_name)
+            if mirror is not None:
+                mirror.index = None
+                mirror.oversized = False
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Returns local hits, remote misses and mirrored rows per configured collection."""
+        with self._lock:
+            return {name: {"local": m.hits, "remote": m.misses, "rows": len(m.index) if m.index else None,
+                           "threshold": m.threshold, "oversized": m.oversized}
+                    for name, m in self._mirrors.items()}
+
+    def update(self, event: CollectionEvent):
+        """Applies a write event to the mirror of the collection."""
+        with self._lock:
+            mirror = self._mirrors.get(event.collection_name)
+            if mirror is None or (event.database_name != mirror.database_name and event.kind != DROP):
+                return
+            mirror.generation += 1
+            try:
+                if event.kind == DROP:
+                    mirror.index, mirror.oversized = None, False
+                elif event.kind == INSERT:
+                    self._apply_insert(mirror, event)
+                elif event.kind == DELETE:
+                    self._apply_delete(mirror, event)
+            except Exception:
+                # The server has the write but the mirror does not: refill on the next search
+                mirror.index = None
+                raise
+
+    def _apply_insert(self, mirror: _Mirror, event: CollectionEvent):
+        if mirror.oversized:
+            return
+        if mirror.index is None:
+            return
+        ids = event.ids or [row.get(mirror.pk_name) for row in event.entities]
+        if len(ids) != len(event.entities) or any(pk is None for pk in ids):
+            mirror.index = None
+            return
+        mirror.index.upsert(ids, [row[mirror.anns_field] for row in event.entities])
+        if len(mirror.index) > mirror.threshold:
+            log.info(f"{event.collection_name} grew past {mirror.threshold} rows; searching remotely")
+            mirror.index, mirror.oversized = None, True
+
+    def _apply_delete(self, mirror: _Mirror, event: CollectionEvent):
+        # Deletes can bring an oversized collection back under the threshold
+        mirror.oversized = False
+        if mirror.index is None:
+            return
+        node = parse_expression(event.expr or "")
+        if isinstance(node, Membership) and node.field == mirror.pk_name and not node.negate:
+            mirror.index.delete(list(node.values))
+        elif isinstance(node, Comparison) and node.field == mirror.pk_name and node.op == "==":
+            mirror.index.delete([node.value])
+        else:
+            # Arbitrary filters: refill from the server on the next search
+            mirror.index = None
+
+    def _eligible(self, mirror: _Mirror | None, anns_field: str, param: dict[str, Any], expr: str | None,
+                  output_fields: list[str] | None, partition_names: list[str] | None, database_name: str) -> bool:
+        if mirror is None or mirror.oversized:
+            return False
+        metric_type = (param or {}).get("metric_type") or mirror.metric_type
+        return (anns_field == mirror.anns_field and metric_type.upper() == mirror.metric_type and not expr
+                and not partition_names and database_name == mirror.database_name
+                and all(name == mirror.pk_name for name in output_fields or ()))
+
+    async def search(self, collection_name: str, data: Any, anns_field: str, param: dict[str, Any], limit: int,
+                     expr: str | None = None, output_fields: list[str] | None = None,
+                     partition_names: list[str] | None = None,
+                     database_name: str = "default") -> ColumnarSearchResult | None:
+        """Searches a mirrored collection locally.
+
+        Args:
+            collection_name (str): Name of the collection.
+            data (Any): Query vectors.
+            anns_field (str): Field to search against.
+            param (Dict[str, Any]): Search parameters; only ``metric_type`` is used.
+            limit (int): Hits per query.
+            expr (Optional[str]): Filter expression; filtered searches go to the server.
+            output_fields (Optional[List[str]]): Only the primary key can be served locally.
+            partition_names (Optional[List[str]]): Partition-restricted searches go to the server.
+            database_name (str): Database name. Defaults to "default".
+
+        Returns:
+            ColumnarSearchResult | None: Exact results, or None when the server must answer.
+
+        """
+        mirror = self._mirrors.get(collection_name)
+        if not self._eligible(mirror, anns_field, param, expr, output_fields, partition_names, database_name):
+            if mirror is not None:
+                mirror.misses += 1
+            return None
+        if mirror.index is None:
+            try:
+                await self._fill(collection_name, mirror)
+            except MilvusException as e:
+                # The server path reports (or recovers from) the error
+                log.warning(f"Local mirror fill of {collection_name} failed; searching remotely: {e}")
+        with self._lock:
+            index = mirror.index
+            if index is None:
+                mirror.misses += 1
+                return None
+            ids, distances, counts = index.search(data, limit)
+            mirror.hits += 1
+        if not mirror.string_pk:
+            ids = np.where(ids == None, -1, ids).astype(np.int64)  # noqa: E711 - elementwise
+        fields = {mirror.pk_name: ids} if output_fields else None
+        return ColumnarSearchResult(ids, distances, counts, fields, pk_name=mirror.pk_name)
+
+    async def _fill(self, collection_name: str, mirror: _Mirror):
+        """Loads the collection's vectors from the server, once per concurrent burst."""
+        lock = self._fill_locks.setdefault(collection_name, asyncio.Lock())
+        async with lock:
+            if mirror.index is not None or mirror.oversized:
+                return
+            generation = mirror.generation
+            index = await asyncio.to_thread(self._load, collection_name, mirror)
+            with self._lock:
+                # A write during the fill may be missing from the snapshot; refill next time
+                if self._mirrors.get(collection_name) is mirror and mirror.generation == generation:
+                    mirror.index = index
+                    mirror.oversized = index is None
+
+    def _load(self, collection_name: str, mirror: _Mirror) -> BruteForceIndex | None:
+        client = self._connect_api.client
+        database = {"db_name": mirror.database_name}
+        rows = client.get_collection_stats(collection_name=collection_name, timeout=step_timeout(step="cache fill"),
+                                           **database).get("row_count", 0)
+        if int(rows) > mirror.threshold:
+            log.info(f"{collection_name} has {rows} rows, above the local threshold {mirror.threshold}")
+            return None
+        description = client.describe_collection(collection_name=collection_name,
+                                                 timeout=step_timeout(step="cache fill"), **database)
+        fields = {f["name"]: f for f in description["fields"]}
+        mirror.pk_name = next(name for name, f in fields.items() if f.get("is_primary"))
+        mirror.string_pk = fields[mirror.pk_name].get("type") == DataType.VARCHAR
+        dim = int(fields[mirror.anns_field]["params"]["dim"])
+        index = BruteForceIndex(dim, mirror.metric_type, capacity=max(int(rows), 1))
+        # Iterating needs the collection loaded, as a server search would
+        client.load_collection(collection_name=collection_name, timeout=step_timeout(step="cache fill"), **database)
+        iterator = client.query_iterator(collection_name=collection_name, batch_size=5000, filter="",
+                                         output_fields=[mirror.pk_name, mirror.anns_field], **database)
+        try:
+            while page := iterator.next():
+                check("the next page of the cache fill")
+                index.upsert([row[mirror.pk_name] for row in page], [row[mirror.anns_field] for row in page])
+        finally:
+            iterator.close()
+        log.info(f"Mirrored {len(index)} vectors of {collection_name} for local search")
+        return index
@@ -0,0 +1,832 @@
+#!/usr/bin/env python3
+# File: src/milvus/memory.py
+"""In-Memory Milvus Client
+
+A process-local stand-in for ``pymilvus.MilvusClient`` that keeps collections in
+NumPy arrays and answers searches exactly (brute force). It implements the subset of
+the client API used by this package (databases, collections, partitions, indexes,
+insert/upsert/delete, search, query, iterators, load/release, flush, statistics), so
+``ConnectAPI`` and ``MilvusAPI`` can be exercised, benchmarked and profiled without a
+server.
+
+Latency and failures can be injected per operation to model a real deployment.
+
+Example Usage:
+```python
+>>> from src.milvus.connect import ConnectAPI
+>>> with ConnectAPI(uri="memory://", latency=0.002, error_rate={"search": 0.01}) as connect_api:
+...     client = connect_api.client
+...     client.create_collection("docs", dimension=4)
+...     client.insert("docs", [{"id": 1, "vector": [0.1, 0.2, 0.3, 0.4]}])
+...     client.search("docs", [[0.1, 0.2, 0.3, 0.4]], limit=1)
+```
+"""
+import operator
+import random
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+import numpy as np
+from pymilvus import CollectionSchema, DataType, MilvusClient, MilvusException
+from pymilvus.client.types import LoadState
+
+from src.logger import getLogger as GetLogger
+from src.milvus.encoding import decode_queries
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.expression import BoolOp, Comparison, Membership, Node, Not, parse_expression
+
+# Logging setup
+log = GetLogger(__name__)
+
+# URI scheme that makes ConnectAPI use the in-memory client
+MEMORY_URI_SCHEME = "memory://"
+
+DEFAULT_PARTITION = "_default"
+
+_DENSE_VECTOR_TYPES = {DataType.FLOAT_VECTOR, DataType.FLOAT16_VECTOR, DataType.BFLOAT16_VECTOR}
+
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq, "!=": operator.ne, "<": operator.lt,
+    "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+
+
+def _operation(name: str, scoped: bool = True):
+    """Applies the injected latency and error rate of an operation before running it.
+
+    Like MilvusClient, a ``db_name`` argument of a scoped operation selects the database
+    of that call; without it the database chosen by ``use_database`` is used.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            self._inject(name)
+            with self._lock:
+                db_name = kwargs.get("db_name") if scoped else None
+                if not db_name:
+                    return func(self, *args, **kwargs)
+                if db_name not in self._databases:
+                    raise MilvusException(code=800, message=f"database not found[database={db_name}]")
+                previous, self._call_db_name = self._call_db_name, db_name
+                try:
+                    return func(self, *args, **kwargs)
+                finally:
+                    self._call_db_name = previous
+        return wrapper
+    return decorator
+
+
+class _Column:
+    """Append-only NumPy column with amortized growth."""
+
+    def __init__(self, dtype: Any, width: int | None = None):
+        self._width = width
+        self._data = np.empty((16, width) if width else 16, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: Any):
+        values = np.asarray(values, dtype=self._data.dtype) if self._data.dtype != object else values
+        count = len(values)
+        if self.size + count > len(self._data):
+            capacity = max(self.size + count, 2 * len(self._data))
+            grown = np.empty((capacity, self._width) if self._width else capacity, dtype=self._data.dtype)
+            grown[:self.size] = self._data[:self.size]
+            self._data = grown
+        if self._data.dtype == object and not self._width:
+            for offset, value in enumerate(values):
+                self._data[self.size + offset] = value
+        else:
+            self._data[self.size:self.size + count] = values
+        self.size += count
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[:self.size]
+
+    def take(self, rows: np.ndarray) -> "_Column":
+        column = _Column(self._data.dtype, self._width)
+        column.extend(self.values[rows])
+        return column
+
+
+class _Collection:
+    """Rows of one collection, stored column-wise."""
+
+    def __init__(self, name: str, schema: CollectionSchema, properties: dict[str, Any] | None = None):
+        self.name = name
+        self.schema = schema
+        self.properties = dict(properties or {})
+        self.created_at = time.time()
+        primary = next((f for f in schema.fields if f.is_primary), None)
+        if primary is None:
+            raise MilvusException(message=f"collection {name} has no primary key field")
+        self.pk_name = primary.name
+        self.pk_is_string = primary.dtype == DataType.VARCHAR
+        self.auto_id = bool(primary.auto_id or schema.auto_id)
+        self.vector_fields = {f.name: int(f.params["dim"]) for f in schema.fields if f.dtype in _DENSE_VECTOR_TYPES}
+        self.vector_types = {f.name: f.dtype for f in schema.fields if f.dtype in _DENSE_VECTOR_TYPES}
+        if not self.vector_fields:
+            raise MilvusException(message=f"collection {name} has no dense vector field")
+        self.scalar_fields = [f.name for f in schema.fields
+                              if f.dtype not in _DENSE_VECTOR_TYPES and not f.is_primary]
+        self.dynamic = bool(schema.enable_dynamic_field)
+        self.partitions: list[str] = [DEFAULT_PARTITION]
+        self.loaded_partitions: set[str] = set()
+        self.indexes: dict[str, dict[str, Any]] = {}
+        self.next_auto_id = int(time.time() * 1000) << 16
+        self._reset_storage()
+
+    def _reset_storage(self):
+        self.pks = _Column(object if self.pk_is_string else np.int64)
+        self.vectors = {name: _Column(np.float32, dim) for name, dim in self.vector_fields.items()}
+        self.scalars = {name: _Column(object) for name in self.scalar_fields}
+        self.extra = _Column(object)
+        self.partition_of = _Column(object)
+        self.alive = _Column(bool)
+        self.row_of: dict[Any, int] = {}
+        self._norms: dict[str, np.ndarray] = {}
+
+    @property
+    def size(self) -> int:
+        return self.pks.size
+
+    @property
+    def row_count(self) -> int:
+        return len(self.row_of)
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self.loaded_partitions)
+
+    def metric_type(self, field_name: str, search_params: dict[str, Any] | None) -> str:
+        metric = (search_params or {}).get("metric_type")
+        if not metric:
+            index = next((index for index in self.indexes.values() if index["field_name"] == field_name), None)
+            metric = index.get("metric_type") if index else None
+        return (metric or "COSINE").upper()
+
+    def insert(self, rows: list[dict[str, Any]], partition_name: str) -> list[Any]:
+        pks = []
+        vectors = {name: [] for name in self.vector_fields}
+        scalars = {name: [] for name in self.scalar_fields}
+        extra = []
+        for row in rows:
+            if self.auto_id:
+                if self.pk_name in row:
+                    raise MilvusException(message=f"primary key {self.pk_name} is auto-generated")
+                self.next_auto_id += 1
+                pk = str(self.next_auto_id) if self.pk_is_string else self.next_auto_id
+            elif self.pk_name not in row:
+                raise MilvusException(message=f"missing primary key field {self.pk_name}")
+            else:
+                pk = row[self.pk_name]
+            pks.append(pk)
+            for name, dim in self.vector_fields.items():
+                if name not in row:
+                    raise MilvusException(message=f"missing vector field {name}")
+                vector = np.asarray(row[name], dtype=np.float32)
+                if vector.shape != (dim,):
+                    raise MilvusException(message=f"vector field {name} expects dim {dim}, got {vector.shape}")
+                vectors[name].append(vector)
+            for name in self.scalar_fields:
+                scalars[name].append(row.get(name))
+            unknown = {key: value for key, value in row.items()
+                       if key != self.pk_name and key not in self.vector_fields and key not in scalars}
+            if unknown and not self.dynamic:
+                raise MilvusException(message=f"fields {sorted(unknown)} are not in the schema")
+            extra.append(unknown or None)
+
+        # A re-inserted primary key replaces the previous row
+        self.delete_rows([self.row_of[pk] for pk in pks if pk in self.row_of])
+        start = self.size
+        self.pks.extend(pks)
+        for name in self.vector_fields:
+            self.vectors[name].extend(np.stack(vectors[name]) if vectors[name] else [])
+        for name in self.scalar_fields:
+            self.scalars[name].extend(scalars[name])
+        self.extra.extend(extra)
+        self.partition_of.extend([partition_name] * len(rows))
+        self.alive.extend(np.ones(len(rows), dtype=bool))
+        self.row_of.update((pk, start + offset) for offset, pk in enumerate(pks))
+        self._norms.clear()
+        return pks
+
+    def delete_rows(self, rows: list[int] | np.ndarray) -> int:
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows):
+            return 0
+        alive = self.alive.values
+        rows = rows[alive[rows]]
+        alive[rows] = False
+        for pk in self.pks.values[rows].tolist():
+            self.row_of.pop(pk, None)
+        if self.size > 1024 and self.row_count < self.size // 2:
+            self.compact()
+        return len(rows)
+
+    def compact(self):
+        keep = np.flatnonzero(self.alive.values)
+        self.pks = self.pks.take(keep)
+        self.vectors = {name: column.take(keep) for name, column in self.vectors.items()}
+        self.scalars = {name: column.take(keep) for name, column in self.scalars.items()}
+        self.extra = self.extra.take(keep)
+        self.partition_of = self.partition_of.take(keep)
+        self.alive = self.alive.take(keep)
+        self.row_of = {pk: row for row, pk in enumerate(self.pks.values.tolist())}
+        self._norms.clear()
+
+    def column(self, name: str) -> np.ndarray:
+        if name == self.pk_name:
+            return self.pks.values
+        if name in self.scalars:
+            return self.scalars[name].values
+        if self.dynamic:
+            column = np.empty(self.size, dtype=object)
+            column[:] = [extra.get(name) if extra else None for extra in self.extra.values]
+            return column
+        raise MilvusException(message=f"field {name} does not exist")
+
+    def mask(self, expr: str | None, partition_names: list[str] | None, ids: list | None = None) -> np.ndarray:
+        mask = self.alive.values.copy()
+        if partition_names:
+            missing = set(partition_names) - set(self.partitions)
+            if missing:
+                raise MilvusException(message=f"partitions {sorted(missing)} do not exist")
+            mask &= np.isin(self.partition_of.values, list(partition_names))
+        if ids is not None:
+            rows = [self.row_of[pk] for pk in ids if pk in self.row_of]
+            selected = np.zeros(self.size, dtype=bool)
+            selected[rows] = True
+            mask &= selected
+        if expr:
+            try:
+                node = parse_expression(expr)
+            except MilvusValidationError as e:
+                raise MilvusException(message=str(e))
+            mask &= self._evaluate(node)
+        return mask
+
+    def _evaluate(self, node: Node) -> np.ndarray:
+        if isinstance(node, BoolOp):
+            masks = [self._evaluate(operand) for operand in node.operands]
+            return np.logical_and.reduce(masks) if node.op == "and" else np.logical_or.reduce(masks)
+        if isinstance(node, Not):
+            return ~self._evaluate(node.operand)
+        if isinstance(node, Membership):
+            column = self.column(node.field)
+            if column.dtype != object:
+                result = np.isin(column, node.values)
+            else:
+                values = set(node.values)
+                result = np.fromiter((value in values for value in column), dtype=bool, count=len(column))
+            return ~result if node.negate else result
+        if isinstance(node, Comparison):
+            column = self.column(node.field)
+            compare = _OPERATORS[node.op]
+            if column.dtype != object:
+                return np.asarray(compare(column, node.value), dtype=bool)
+            return np.fromiter((_safe_compare(compare, value, node.value) for value in column),
+                               dtype=bool, count=len(column))
+        raise MilvusException(message=f"filter term {node} is not supported by the in-memory client")
+
+    def entity(self, row: int, output_fields: list[str] | None) -> dict[str, Any]:
+        entity = {}
+        names = output_fields if output_fields is not None else self.scalar_fields
+        if names and "*" in names:
+            names = [*self.scalar_fields, *self.vector_fields]
+            if self.dynamic and self.extra.values[row]:
+                names += list(self.extra.values[row])
+        for name in names:
+            if name == self.pk_name:
+                entity[name] = _python(self.pks.values[row])
+            elif name in self.vectors:
+                entity[name] = self.vectors[name].values[row].tolist()
+            elif name in self.scalars:
+                entity[name] = self.scalars[name].values[row]
+            elif self.dynamic:
+                extra = self.extra.values[row]
+                if extra and name in extra:
+                    entity[name] = extra[name]
+            else:
+                raise MilvusException(message=f"field {name} does not exist")
+        return entity
+
+    def scores(self, field_name: str, queries: np.ndarray, metric: str) -> tuple[np.ndarray, bool]:
+        """Returns ``(nq, size)`` distances and whether larger is closer."""
+        matrix = self.vectors[field_name].values
+        if metric == "L2":
+            norms = self._norms.get(field_name)
+            if norms is None:
+                norms = self._norms[field_name] = np.einsum("ij,ij->i", matrix, matrix)
+            distances = norms[None, :] - 2 * (queries @ matrix.T) + np.einsum("ij,ij->i", queries, queries)[:, None]
+            return np.maximum(distances, 0), False
+        if metric == "IP":
+            return queries @ matrix.T, True
+        if metric == "COSINE":
+            key = f"{field_name}:cosine"
+            norms = self._norms.get(key)
+            if norms is None:
+                norms = self._norms[key] = np.maximum(np.linalg.norm(matrix, axis=1), 1e-12)
+            query_norms = np.maximum(np.linalg.norm(queries, axis=1), 1e-12)
+            return (queries @ matrix.T) / norms[None, :] / query_norms[:, None], True
+        raise MilvusException(message=f"metric type {metric} is not supported by the in-memory client")
+
+
+def _safe_compare(compare: Callable[[Any, Any], Any], value: Any, other: Any) -> bool:
+    if value is None:
+        return False
+    try:
+        return bool(compare(value, other))
+    except TypeError:
+        return False
+
+
+def _python(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class _PageIterator:
+    """Serves precomputed rows in pages through the ``next``/``close`` iterator protocol."""
+
+    def __init__(self, rows: list[dict[str, Any]], batch_size: int):
+        self._rows = rows
+        self._batch_size = batch_size
+        self._position = 0
+
+    def next(self) -> list[dict[str, Any]]:
+        page = self._rows[self._position:self._position + self._batch_size]
+        self._position += len(page)
+        return page
+
+    def close(self):
+        self._rows = []
+
+
+class InMemoryMilvusClient:
+    """MilvusClient-compatible client backed by NumPy arrays with exact search.
+
+    Supports dense float vector fields (FLOAT, FLOAT16 and BFLOAT16 vectors are held as
+    float32), scalar and dynamic fields, partitions, L2/IP/COSINE metrics, and filter
+    expressions made of comparisons, ``in`` lists and boolean operators. Indexes are
+    recorded but searches are always exact. As on a real server, collections must be
+    loaded before they can be searched or queried.
+
+    Attributes:
+        uri (str): The URI the client was created with.
+        latency (float | Dict[str, float]): Seconds added to every call, or per operation.
+        jitter (float): Fraction of random variation applied to the latency.
+        error_rate (float | Dict[str, float]): Probability that a call fails, or per operation.
+        deployment (str): Identity of the deployment, shared by clients created with ``shared``.
+
+    Methods:
+        create_collection, drop_collection, has_collection, list_collections, describe_collection,
+        create_partition, drop_partition, has_partition, list_partitions,
+        insert, upsert, delete, get, query, search, query_iterator, search_iterator,
+        load_collection, release_collection, load_partitions, release_partitions, get_load_state,
+        create_index, drop_index, describe_index, list_indexes, flush, get_collection_stats,
+        list_databases, create_database, drop_database, use_database, close.
+
+    Example:
+        ```python
+        client = InMemoryMilvusClient(latency={"search": 0.003}, error_rate=0.001, seed=7)
+        client.create_collection("docs", dimension=128, metric_type="L2")
+        ```
+
+    Raises:
+        MilvusException: On invalid requests and injected failures, like MilvusClient.
+
+    """
+
+    create_schema = staticmethod(MilvusClient.create_schema)
+    prepare_index_params = staticmethod(MilvusClient.prepare_index_params)
+
+    def __init__(self, uri: str = MEMORY_URI_SCHEME, latency: float | dict[str, float] = 0.0,
+                 jitter: float = 0.0, error_rate: float | dict[str, float] = 0.0, seed: int | None = None,
+                 shared: 'InMemoryMilvusClient | None' = None, **kwargs: Any):
+        """Initializes an empty in-memory deployment with a "default" database.
+
+        Args:
+            uri (str): Informational URI. Defaults to "memory://".
+            latency (float | Dict[str, float]): Seconds added to every call, or per
+                operation name (e.g. ``{"search": 0.005}``). Defaults to 0.
+            jitter (float): Latency varies uniformly by ``±jitter`` of its value. Defaults to 0.
+            error_rate (float | Dict[str, float]): Probability of an injected
+                MilvusException per call, or per operation name. Defaults to 0.
+            seed (int | None): Seed of the random generator for reproducible runs.
+            shared (InMemoryMilvusClient | None): Serve the databases of another client,
+                like a second proxy of the same deployment. Defaults to None.
+            **kwargs: Accepted and ignored MilvusClient arguments (user, token, timeout, ...).
+
+        """
+        self.uri = uri
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.RLock() if shared is None else shared._lock
+        self._databases: dict[str, dict[str, _Collection]] = {"default": {}} if shared is None else shared._databases
+        self.deployment = uuid.uuid4().hex if shared is None else shared.deployment
+        self._db_name = "default"
+        self._call_db_name: str | None = None
+        self.calls: dict[str, int] = {}
+
+    def _inject(self, name: str):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        latency = self.latency.get(name, 0.0) if isinstance(self.latency, dict) else self.latency
+        if latency > 0:
+            if self.jitter:
+                latency *= 1 + self._random.uniform(-self.jitter, self.jitter)
+            time.sleep(latency)
+        error_rate = self.error_rate.get(name, 0.0) if isinstance(self.error_rate, dict) else self.error_rate
+        if error_rate > 0 and self._random.random() < error_rate:
+            raise MilvusException(code=1, message=f"injected failure in {name}")
+
+    @property
+    def _collections(self) -> dict[str, _Collection]:
+        return self._databases[self._call_db_name or self._db_name]
+
+    def _collection(self, collection_name: str) -> _Collection:
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            raise MilvusException(code=100, message=f"collection not found[collection={collection_name}]")
+        return collection
+
+    def _loaded(self, collection_name: str, partition_names: list[str] | None) -> _Collection:
+        collection = self._collection(collection_name)
+        required = set(partition_names or collection.partitions)
+        if not collection.loaded or not required <= collection.loaded_partitions:
+            raise MilvusException(code=101, message=f"collection not loaded[collection={collection_name}]")
+        return collection
+
+    # Databases
+
+    @_operation("list_databases", scoped=False)
+    def list_databases(self, timeout: float | None = None, **kwargs) -> list[str]:
+        return list(self._databases)
+
+    @_operation("create_database", scoped=False)
+    def create_database(self, db_name: str, timeout: float | None = None, **kwargs):
+        if db_name in self._databases:
+            raise MilvusException(code=65535, message=f"database already exist: {db_name}")
+        self._databases[db_name] = {}
+
+    @_operation("drop_database", scoped=False)
+    def drop_database(self, db_name: str, timeout: float | None = None, **kwargs):
+        if db_name == "default":
+            raise MilvusException(code=65535, message="can not drop default database")
+        self._databases.pop(db_name, None)
+        if self._db_name == db_name:
+            self._db_name = "default"
+
+    @_operation("use_database", scoped=False)
+    def use_database(self, db_name: str, **kwargs):
+        db_name = db_name or "default"
+        if db_name not in self._databases:
+            raise MilvusException(code=800, message=f"database not found[database={db_name}]")
+        self._db_name = db_name
+
+    def close(self):
+        """Releases nothing; data stays in memory until the client is garbage collected."""
+
+    # Collections
+
+    @_operation("create_collection")
+    def create_collection(self, collection_name: str, dimension: int | None = None,
+                          primary_field_name: str = "id", id_type: str = "int",
+                          vector_field_name: str = "vector", metric_type: str = "COSINE",
+                          auto_id: bool = False, timeout: float | None = None,
+                          schema: CollectionSchema | None = None, index_params: Any = None, **kwargs):
+        if collection_name in self._collections:
+            raise MilvusException(code=65535, message=f"collection {collection_name} already exists")
+        quick = schema is None
+        if quick:
+            if dimension is None:
+                raise MilvusException(message="dimension is required without a schema")
+            schema = MilvusClient.create_schema(auto_id=auto_id, enable_dynamic_field=True)
+            if id_type in ("int", DataType.INT64):
+                schema.add_field(primary_field_name, DataType.INT64, is_primary=True)
+            else:
+                schema.add_field(primary_field_name, DataType.VARCHAR, is_primary=True,
+                                 max_length=kwargs.get("max_length", 65535))
+            schema.add_field(vector_field_name, DataType.FLOAT_VECTOR, dim=dimension)
+        collection = _Collection(collection_name, schema, kwargs.get("properties"))
+        self._collections[collection_name] = collection
+        if quick:
+            # Like MilvusClient's quick setup: AUTOINDEX and loaded right away
+            collection.indexes[vector_field_name] = self._index_info(
+                vector_field_name, vector_field_name, {"index_type": "AUTOINDEX", "metric_type": metric_type})
+            collection.loaded_partitions = set(collection.partitions)
+        elif index_params:
+            self._add_indexes(collection, index_params)
+            collection.loaded_partitions = set(collection.partitions)
+        log.debug(f"Created in-memory collection {collection_name}")
+
+    @_operation("has_collection")
+    def has_collection(self, collection_name: str, timeout: float | None = None, **kwargs) -> bool:
+        return collection_name in self._collections
+
+    @_operation("list_collections")
+    def list_collections(self, **kwargs) -> list[str]:
+        return list(self._collections)
+
+    @_operation("describe_collection")
+    def describe_collection(self, collection_name: str, timeout: float | None = None, **kwargs) -> dict:
+        collection = self._collection(collection_name)
+        return {
+            "collection_name": collection_name,
+            "auto_id": collection.auto_id,
+            "num_partitions": len(collection.partitions),
+            "enable_dynamic_field": collection.dynamic,
+            "fields": [{"name": f.name, "type": f.dtype, "params": dict(f.params),
+                        "is_primary": f.is_primary, "auto_id": f.auto_id} for f in collection.schema.fields],
+            "properties": dict(collection.properties),
+            "created_timestamp": collection.created_at,
+        }
+
+    @_operation("drop_collection")
+    def drop_collection(self, collection_name: str, timeout: float | None = None, **kwargs):
+        self._collections.pop(collection_name, None)
+
+    @_operation("rename_collection")
+    def rename_collection(self, old_name: str, new_name: str, **kwargs):
+        collection = self._collection(old_name)
+        if new_name in self._collections:
+            raise MilvusException(code=65535, message=f"collection {new_name} already exists")
+        collection.name = new_name
+        self._collections[new_name] = self._collections.pop(old_name)
+
+    @_operation("get_collection_stats")
+    def get_collection_stats(self, collection_name: str, timeout: float | None = None, **kwargs) -> dict:
+        return {"row_count": self._collection(collection_name).row_count}
+
+    # Partitions
+
+    @_operation("create_partition")
+    def create_partition(self, collection_name: str, partition_name: str, timeout: float | None = None, **kwargs):
+        collection = self._collection(collection_name)
+        if partition_name in collection.partitions:
+            raise MilvusException(code=65535, message=f"partition {partition_name} already exists")
+        collection.partitions.append(partition_name)
+        if collection.loaded:
+            collection.loaded_partitions.add(partition_name)
+
+    @_operation("drop_partition")
+    def drop_partition(self, collection_name: str, partition_name: str, timeout: float | None = None, **kwargs):
+        collection = self._collection(collection_name)
+        if partition_name == DEFAULT_PARTITION:
+            raise MilvusException(code=65535, message="default partition cannot be deleted")
+        if partition_name in collection.loaded_partitions:
+            raise MilvusException(code=65535, message=f"partition {partition_name} cannot be dropped while loaded")
+        if partition_name in collection.partitions:
+            collection.delete_rows(np.flatnonzero(collection.partition_of.values == partition_name))
+            collection.partitions.remove(partition_name)
+
+    @_operation("has_partition")
+    def has_partition(self, collection_name: str, partition_name: str, timeout: float | None = None,
+                      **kwargs) -> bool:
+        return partition_name in self._collection(collection_name).partitions
+
+    @_operation("list_partitions")
+    def list_partitions(self, collection_name: str, timeout: float | None = None, **kwargs) -> list[str]:
+        return list(self._collection(collection_name).partitions)
+
+    @_operation("get_partition_stats")
+    def get_partition_stats(self, collection_name: str, partition_name: str, timeout: float | None = None,
+                            **kwargs) -> dict:
+        collection = self._collection(collection_name)
+        rows = collection.alive.values & (collection.partition_of.values == partition_name)
+        return {"row_count": int(rows.sum())}
+
+    # Loading
+
+    @_operation("load_collection")
+    def load_collection(self, collection_name: str, timeout: float | None = None, **kwargs):
+        collection = self._collection(collection_name)
+        collection.loaded_partitions = set(collection.partitions)
+
+    @_operation("release_collection")
+    def release_collection(self, collection_name: str, timeout: float | None = None, **kwargs):
+        self._collection(collection_name).loaded_partitions.clear()
+
+    @_operation("load_partitions")
+    def load_partitions(self, collection_name: str, partition_names: list[str] | str,
+                        timeout: float | None = None, **kwargs):
+        collection = self._collection(collection_name)
+        partition_names = [partition_names] if isinstance(partition_names, str) else list(partition_names)
+        missing = set(partition_names) - set(collection.partitions)
+        if missing:
+            raise MilvusException(code=200, message=f"partitions {sorted(missing)} not found")
+        collection.loaded_partitions.update(partition_names)
+
+    @_operation("release_partitions")
+    def release_partitions(self, collection_name: str, partition_names: list[str] | str,
+                           timeout: float | None = None, **kwargs):
+        partition_names = [partition_names] if isinstance(partition_names, str) else partition_names
+        self._collection(collection_name).loaded_partitions.difference_update(partition_names)
+
+    @_operation("get_load_state")
+    def get_load_state(self, collection_name: str, partition_name: str | None = "",
+                       timeout: float | None = None, **kwargs) -> dict:
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            return {"state": LoadState.NotExist}
+        loaded = partition_name in collection.loaded_partitions if partition_name else collection.loaded
+        return {"state": LoadState.Loaded if loaded else LoadState.NotLoad}
+
+    @_operation("refresh_load")
+    def refresh_load(self, collection_name: str, **kwargs):
+        self._collection(collection_name)
+
+    # Indexes
+
+    @staticmethod
+    def _index_info(field_name: str, index_name: str, configs: dict[str, Any]) -> dict[str, Any]:
+        configs = dict(configs)
+        return {
+            "field_name": field_name,
+            "index_name": index_name or field_name,
+            "index_type": configs.pop("index_type", "AUTOINDEX") or "AUTOINDEX",
+            "metric_type": configs.pop("metric_type", None),
+            **configs,
+        }
+
+    def _add_indexes(self, collection: _Collection, index_params: Any):
+        for index_param in index_params:
+            if index_param.field_name not in collection.vector_fields:
+                raise MilvusException(message=f"cannot index field {index_param.field_name}")
+            info = self._index_info(index_param.field_name, index_param.index_name,
+                                    index_param.get_index_configs())
+            collection.indexes[info["index_name"]] = info
+
+    @_operation("create_index")
+    def create_index(self, collection_name: str, index_params: Any, timeout: float | None = None, **kwargs):
+        self._add_indexes(self._collection(collection_name), index_params)
+
+    @_operation("drop_index")
+    def drop_index(self, collection_name: str, index_name: str, timeout: float | None = None, **kwargs):
+        collection = self._collection(collection_name)
+        if collection.loaded:
+            raise MilvusException(code=65535, message="index cannot be dropped, collection is loaded")
+        collection.indexes.pop(index_name, None)
+
+    @_operation("list_indexes")
+    def list_indexes(self, collection_name: str, field_name: str | None = "", **kwargs) -> list[str]:
+        indexes = self._collection(collection_name).indexes.values()
+        return [index["index_name"] for index in indexes if not field_name or index["field_name"] == field_name]
+
+    @_operation("describe_index")
+    def describe_index(self, collection_name: str, index_name: str, timeout: float | None = None,
+                       **kwargs) -> dict | None:
+        collection = self._collection(collection_name)
+        index = collection.indexes.get(index_name)
+        if index is None:
+            return None
+        return {**index, "total_rows": collection.row_count, "indexed_rows": collection.row_count,
+                "pending_index_rows": 0, "state": "Finished"}
+
+    # Data
+
+    @_operation("insert")
+    def insert(self, collection_name: str, data: dict | list[dict], timeout: float | None = None,
+               partition_name: str | None = "", **kwargs) -> dict:
+        collection = self._collection(collection_name)
+        rows = [data] if isinstance(data, dict) else list(data)
+        partition_name = partition_name or DEFAULT_PARTITION
+        if partition_name not in collection.partitions:
+            raise MilvusException(code=200, message=f"partition not found[partition={partition_name}]")
+        pks = collection.insert(rows, partition_name)
+        return {"insert_count": len(pks), "ids": pks, "cost": 0}
+
+    @_operation("upsert")
+    def upsert(self, collection_name: str, data: dict | list[dict], timeout: float | None = None,
+               partition_name: str | None = "", **kwargs) -> dict:
+        collection = self._collection(collection_name)
+        rows = [data] if isinstance(data, dict) else list(data)
+        pks = collection.insert(rows, partition_name or DEFAULT_PARTITION)
+        return {"upsert_count": len(pks), "cost": 0}
+
+    @_operation("delete")
+    def delete(self, collection_name: str, ids: list | str | int | None = None, timeout: float | None = None,
+               filter: str | None = None, partition_name: str | None = None, **kwargs) -> dict:
+        collection = self._collection(collection_name)
+        filter = filter or kwargs.get("expr")
+        if ids is None and not filter:
+            raise MilvusException(message="delete needs ids or a filter expression")
+        ids = [ids] if isinstance(ids, (int, str)) else ids
+        mask = collection.mask(filter, [partition_name] if partition_name else None, ids)
+        return {"delete_count": collection.delete_rows(np.flatnonzero(mask))}
+
+    @_operation("flush")
+    def flush(self, collection_name: str, timeout: float | None = None, **kwargs):
+        self._collection(collection_name)
+
+    @_operation("compact")
+    def compact(self, collection_name: str, **kwargs) -> int:
+        self._collection(collection_name).compact()
+        return 0
+
+    @_operation("get")
+    def get(self, collection_name: str, ids: list | str | int, output_fields: list[str] | None = None,
+            timeout: float | None = None, partition_names: list[str] | None = None, **kwargs) -> list[dict]:
+        ids = [ids] if isinstance(ids, (int, str)) else ids
+        return self._query(collection_name, None, output_fields, partition_names, ids, None, 0)
+
+    @_operation("query")
+    def query(self, collection_name: str, filter: str = "", output_fields: list[str] | None = None,
+              timeout: float | None = None, ids: list | str | int | None = None,
+              partition_names: list[str] | None = None, limit: int | None = None, offset: int = 0,
+              **kwargs) -> list[dict]:
+        ids = [ids] if isinstance(ids, (int, str)) else ids
+        if not filter and ids is None and limit is None and "count(*)" not in (output_fields or ()):
+            raise MilvusException(message="empty expression should be used with limit")
+        return self._query(collection_name, filter, output_fields, partition_names, ids, limit, offset)
+
+    def _query(self, collection_name: str, filter: str | None, output_fields: list[str] | None,
+               partition_names: list[str] | None, ids: list | None, limit: int | None, offset: int) -> list[dict]:
+        collection = self._loaded(collection_name, partition_names)
+        rows = np.flatnonzero(collection.mask(filter, partition_names, ids))
+        if output_fields and "count(*)" in output_fields:
+            return [{"count(*)": len(rows)}]
+        rows = rows[offset or 0:]
+        if limit is not None and limit >= 0:
+            rows = rows[:limit]
+        fields = [collection.pk_name, *(output_fields if output_fields is not None else collection.scalar_fields)]
+        return [collection.entity(row, list(dict.fromkeys(fields))) for row in rows.tolist()]
+
+    @_operation("search")
+    def search(self, collection_name: str, data: list | np.ndarray, filter: str = "", limit: int = 10,
+               output_fields: list[str] | None = None, search_params: dict | None = None,
+               timeout: float | None = None, partition_names: list[str] | None = None,
+               anns_field: str | None = None, **kwargs) -> list[list[dict]]:
+        return self._search(collection_name, data, filter, limit, output_fields, search_params,
+                            partition_names, anns_field, kwargs.get("offset", 0))
+
+    def _search(self, collection_name: str, data: list | np.ndarray, filter: str | None, limit: int,
+                output_fields: list[str] | None, search_params: dict | None,
+                partition_names: list[str] | None, anns_field: str | None, offset: int = 0) -> list[list[dict]]:
+        collection = self._loaded(collection_name, partition_names)
+        if anns_field is None:
+            if len(collection.vector_fields) != 1:
+                raise MilvusException(message="anns_field is required for collections with several vector fields")
+            anns_field = next(iter(collection.vector_fields))
+        if anns_field not in collection.vector_fields:
+            raise MilvusException(message=f"vector field {anns_field} does not exist")
+        if len(data) and isinstance(data[0], bytes):
+            # Raw rows in the field's encoding, as sent for NumPy queries
+            queries = decode_queries(list(data), collection.vector_types[anns_field])
+        else:
+            queries = np.asarray(data, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None, :]
+        if queries.shape[1] != collection.vector_fields[anns_field]:
+            raise MilvusException(message=f"query dim {queries.shape[1]} does not match field {anns_field}")
+        metric = collection.metric_type(anns_field, search_params)
+        rows = np.flatnonzero(collection.mask(filter, partition_names))
+        if not len(rows):
+            return [[] for _ in range(len(queries))]
+        distances, descending = collection.scores(anns_field, queries, metric)
+        distances = distances[:, rows]
+        keys = -distances if descending else distances
+        k = min(offset + limit, len(rows))
+        if k < len(rows):
+            top = np.argpartition(keys, k - 1, axis=1)[:, :k]
+            order = np.take_along_axis(top, np.argsort(np.take_along_axis(keys, top, axis=1), axis=1), axis=1)
+        else:
+            order = np.argsort(keys, axis=1, kind="stable")
+        order = order[:, offset:]
+        fields = output_fields if output_fields is not None else []
+        results = []
+        for query, columns in enumerate(order):
+            hits = []
+            for column in columns.tolist():
+                row = rows[column]
+                hits.append({collection.pk_name: _python(collection.pks.values[row]),
+                             "distance": float(distances[query, column]),
+                             "entity": collection.entity(row, fields)})
+            results.append(hits)
+        return results
+
+    @_operation("query_iterator")
+    def query_iterator(self, collection_name: str, batch_size: int = 1000, limit: int | None = -1,
+                       filter: str = "", output_fields: list[str] | None = None,
+                       partition_names: list[str] | None = None, timeout: float | None = None,
+                       **kwargs) -> _PageIterator:
+        rows = self._query(collection_name, filter, output_fields, partition_names, None,
+                           None if limit is None or limit < 0 else limit, 0)
+        return _PageIterator(rows, batch_size)
+
+    @_operation("search_iterator")
+    def search_iterator(self, collection_name: str, data: list | np.ndarray, batch_size: int = 1000,
+                        filter: str | None = None, limit: int | None = -1, output_fields: list[str] | None = None,
+                        search_params: dict | None = None, timeout: float | None = None,
+                        partition_names: list[str] | None = None, anns_field: str | None = None,
+                        **kwargs) -> _PageIterator:
+        collection = self._loaded(collection_name, partition_names)
+        limit = collection.size if limit is None or limit < 0 else limit
+        hits = self._search(collection_name, data, filter, limit, output_fields, search_params,
+                            partition_names, anns_field)
+        return _PageIterator(hits[0], batch_size)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# File: src/milvus/metadata.py
+"""Database and Collection Metadata Cache
+
+Connecting checks that the database exists and creates it when missing, which costs a
+``list_databases`` call per connection. Short-lived workers that reconnect often pay it
+on every start. ``MetadataCache`` remembers, per cluster ("scope") and for ``ttl``
+seconds, which databases and collections are known to exist:
+
+- ``ensure_database`` lists the databases once, creates the missing one, and serves
+  later checks from the cache until the entry expires.
+- ``has_collection`` caches positive answers; missing collections are asked again.
+
+Concurrent checks of the same key are coalesced: the first caller issues the metadata
+call and the others wait for its result, so N workers starting at once send one RPC.
+Threads wait on a per-key lock; asyncio tasks await the first task's future.
+
+``ConnectAPI`` and ``AsyncMilvusClientWrapper`` use the process-wide cache returned by
+``MetadataCache.default()``. Dropped collections are forgotten through a
+``MetadataObserver`` attached to ``CollectionAPI``.
+
+Example Usage:
+```python
+>>> cache = MetadataCache(ttl=60)
+>>> cache.ensure_database("http://localhost:19530", "tenant_a", client.list_databases, client.create_database)
+True
+>>> cache.stats()
+{'hits': 0, 'misses': 1, 'coalesced': 0, 'rpcs': 2, 'entries': 1}
+```
+"""
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, ClassVar
+
+from src.logger import getLogger as GetLogger
+from src.milvus.events import DROP, CollectionEvent
+from src.milvus.interfaces import ICollectionObserver
+
+# Logging setup
+log = GetLogger(__name__)
+
+_MISSING = object()
+
+
+class MetadataCache:
+    """Process-level, TTL'd cache of known databases and collections.
+
+    Attributes:
+        ttl (float): Seconds an entry is trusted; 0 disables caching.
+
+    Methods:
+        ensure_database: Checks and creates a database through the cache.
+        ensure_database_async: Async variant of ``ensure_database``.
+        has_collection: Checks a collection through the cache.
+        has_collection_async: Async variant of ``has_collection``.
+        forget: Drops cached entries of a scope, database or collection.
+        observer: A CollectionAPI observer forgetting dropped collections.
+        stats: Hit, miss, coalescing and RPC counters.
+        default: The process-wide cache.
+
+    Example:
+        ```python
+        cache = MetadataCache.default()
+        exists = cache.has_collection(scope, "default", "docs", lambda: client.has_collection("docs"))
+        ```
+
+    """
+
+    _default: ClassVar['MetadataCache | None'] = None
+    _default_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._pending: dict[tuple[int, Hashable], asyncio.Future] = {}
+        self._counters = dict.fromkeys(("hits", "misses", "coalesced", "rpcs"), 0)
+
+    @classmethod
+    def default(cls) -> 'MetadataCache':
+        """Returns the process-wide cache, creating it on first use."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        return entry[1]
+
+    def _put(self, key: Hashable, value: Any):
+        if self.ttl > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+
+    # Databases
+
+    def _known_database(self, scope: str, db_name: str) -> bool:
+        with self._lock:
+            databases = self._get(("databases", scope))
+            return databases is not _MISSING and db_name in databases
+
+    def _remember_databases(self, scope: str, databases: list[str]):
+        with self._lock:
+            self._put(("databases", scope), frozenset(databases))
+
+    def _add_database(self, scope: str, db_name: str):
+        with self._lock:
+            databases = self._get(("databases", scope))
+            self._put(("databases", scope), (frozenset() if databases is _MISSING else databases) | {db_name})
+
+    def ensure_database(self, scope: str, db_name: str, list_databases: Callable[[], list[str]],
+                        create_database: Callable[[str], Any]) -> bool:
+        """Makes sure a database exists, asking the server only on a cache miss.
+
+        Args:
+            scope (str): Identity of the cluster, e.g. its URI.
+            db_name (str): Database to check.
+            list_databases (Callable[[], List[str]]): Lists the databases of the cluster.
+            create_database (Callable[[str], Any]): Creates a database.
+
+        Returns:
+            bool: True when the database exists or was created.
+
+        Raises:
+            MilvusException: Errors of ``list_databases`` or ``create_database``.
+
+        """
+        if self._known_database(scope, db_name):
+            self._count("hits")
+            return True
+        with self._lock:
+            key_lock = self._key_locks.setdefault(("database", scope, db_name), threading.Lock())
+        with key_lock:
+            # Another thread may have checked while this one waited
+            if self._known_database(scope, db_name):
+                self._count("coalesced")
+                return True
+            self._count("misses")
+            self._count("rpcs")
+            databases = list_databases()
+            self._remember_databases(scope, databases)
+            if db_name not in databases:
+                self._count("rpcs")
+                create_database(db_name)
+                log.info(f"Database {db_name} created.")
+            self._add_database(scope, db_name)
+        return True
+
+    async def ensure_database_async(self, scope: str, db_name: str,
+                                    list_databases: Callable[[], Awaitable[list[str]]],
+                                    create_database: Callable[[str], Awaitable[Any]]) -> bool:
+        """Async variant of ``ensure_database``; concurrent tasks share one check."""
+        if self._known_database(scope, db_name):
+            self._count("hits")
+            return True
+
+        async def load() -> bool:
+            self._count("misses")
+            self._count("rpcs")
+            databases = await list_databases()
+            self._remember_databases(scope, databases)
+            if db_name not in databases:
+                self._count("rpcs")
+                await create_database(db_name)
+                log.info(f"Database {db_name} created.")
+            self._add_database(scope, db_name)
+            return True
+
+        return await self._single_flight(("database", scope, db_name), load)
+
+    # Collections
+
+    def has_collection(self, scope: str, db_name: str, collection_name: str,
+                       check: Callable[[], bool]) -> bool:
+        """Checks whether a collection exists; positive answers are cached.
+
+        Args:
+            scope (str): Identity of the cluster.
+            db_name (str): Database of the collection.
+            collection_name (str): Collection to check.
+            check (Callable[[], bool]): Asks the server.
+
+        Returns:
+            bool: Whether the collection exists.
+
+        """
+        key = ("collection", scope, db_name or "default", collection_name)
+        with self._lock:
+            known = self._get(key)
+        if known is not _MISSING:
+            self._count("hits")
+            return True
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                known = self._get(key)
+            if known is not _MISSING:
+                self._count("coalesced")
+                return True
+            self._count("misses")
+            self._count("rpcs")
+            exists = bool(check())
+            if exists:
+                with self._lock:
+                    self._put(key, True)
+        return exists
+
+    async def has_collection_async(self, scope: str, db_name: str, collection_name: str,
+                                   check: Callable[[], Awaitable[bool]]) -> bool:
+        """Async variant of ``has_collection``; concurrent tasks share one check."""
+        key = ("collection", scope, db_name or "default", collection_name)
+        with self._lock:
+            known = self._get(key)
+        if known is not _MISSING:
+            self._count("hits")
+            return True
+
+        async def load() -> bool:
+            self._count("misses")
+            self._count("rpcs")
+            exists = bool(await check())
+            if exists:
+                with self._lock:
+                    self._put(key, True)
+            return exists
+
+        return await self._single_flight(key, load)
+
+    async def _single_flight(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        flight = (id(loop), key)
+        with self._lock:
+            future = self._pending.get(flight)
+            leader = future is None
+            if leader:
+                future = self._pending[flight] = loop.create_future()
+        if not leader:
+            self._count("coalesced")
+            return await asyncio.shield(future)
+        try:
+            result = await load()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # retrieved here when no other task waits
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(flight, None)
+
+    # Invalidation
+
+    def forget(self, scope: str, db_name: str | None = None, collection_name: str | None = None):
+        """Drops cached entries of a scope, one of its databases, or one collection.
+
+        Args:
+            scope (str): Identity of the cluster.
+            db_name (Optional[str]): Database; None forgets the whole scope.
+            collection_name (Optional[str]): Collection; None forgets the database.
+
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if key[1] != scope:
+                    continue
+                if db_name is None:
+                    del self._entries[key]
+                elif key[0] == "databases" and collection_name is None:
+                    databases = self._entries[key][1] - {db_name}
+                    self._entries[key] = (self._entries[key][0], databases)
+                elif key[0] == "collection" and key[2] == (db_name or "default") and \
+                        collection_name in (None, key[3]):
+                    del self._entries[key]
+
+    def observer(self, connect_api: Any) -> 'MetadataObserver':
+        """Returns an observer forgetting collections dropped through ``connect_api``."""
+        return MetadataObserver(self, connect_api)
+
+    def stats(self) -> dict[str, int]:
+        """Returns hit, miss, coalesced and RPC counters and the number of entries."""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries)}
+
+
+class MetadataObserver(ICollectionObserver):
+    """Forgets dropped collections of a connection's scope.
+
+    The scope is read from ``connect_api.metadata_scope`` when an event arrives, so the
+    observer can be attached before the connection is established.
+    """
+
+    def __init__(self, cache: MetadataCache, connect_api: Any):
+        self._cache = cache
+        self._connect_api = connect_api
+
+    def update(self, event: CollectionEvent):
+        """Forgets the collection of a drop event."""
+        scope = getattr(self._connect_api, "metadata_scope", None)
+        if event.kind == DROP and scope is not None:
+            self._cache.forget(scope, event.database_name, event.collection_name)
@@ -5,7 +5,7 @@
 This module provides a robust, extensible, and maintainable interface to the Milvus vector database using Python.
 It integrates core functionality for managing collections, vectors, indexes, and embeddings, with support for
 asynchronous operations, configuration management, security, and error handling. The implementation employs
-several design patterns (Singleton, Factory, Builder, Strategy, Command, Template Method, Facade) to ensure
+several design patterns (Factory, Builder, Strategy, Command, Template Method, Facade) to ensure
 flexibility and reusability.
 
 Key Features:
@@ -54,36 +54,96 @@ asyncio.run(main())
 
 ```
 """
-import datetime
-from collections.abc import Callable
-from typing import Any
-
-import numpy as np
-from pymilvus import (
-    Collection,
-    CollectionSchema,
-    FieldSchema,
-    MilvusException,
-)
+from __future__ import annotations
+
+import importlib
+import threading
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any
 
 from src.logger import getLogger as GetLogger
-from src.milvus.admin import AdminAPI
-from src.milvus.collection import CollectionAPI
-from src.milvus.data import DataImportAPI
-from src.milvus.embedding import EmbeddingAPI
 from src.milvus.exceptions import MilvusAPIError
-from src.milvus.index import IndexAPI
 from src.milvus.interfaces import IConnectAPI
-from src.milvus.monitor import MonitorAPI
-from src.milvus.partition import PartitionAPI
-from src.milvus.search import SearchAPI
-from src.milvus.stats import StatAPI
-from src.milvus.vector import VectorAPI
+from src.milvus.tracing import traced
 from src.utils import async_log_decorator
 
+if TYPE_CHECKING:
+    import numpy as np
+    from pymilvus import Collection, CollectionSchema, FieldSchema
+
+    from src.milvus.capacity import CapacityEstimate, CapacityEstimator
+    from src.milvus.hedging import HedgePolicy
+    from src.milvus.index import IndexBuildHandle
+    from src.milvus.partition import PartitionResidencyManager, PartitionScheme
+    from src.milvus.profiling import ProfileHook, ProfilingSession
+    from src.milvus.results import ColumnarSearchResult
+    from src.milvus.semantic_cache import SemanticQueryCache
+
 # Logging setup
 log = GetLogger(__name__)
 
+# Defaults of src.milvus.local.DEFAULT_THRESHOLD and src.milvus.shadow.DEFAULT_PARTITION,
+# repeated so that importing the facade does not load those modules
+DEFAULT_THRESHOLD = 50_000
+DEFAULT_PARTITION = "_default"
+
+_build_lock = threading.RLock()
+
+
+class _LazyAPI:
+    """A sub-API of MilvusAPI, imported and built on first access.
+
+    Importing the facade loads none of the sub-API modules (and so neither pymilvus nor
+    NumPy); each is imported when a method first needs it. ``build(api, cls)`` creates
+    the sub-API and wires it to the others; by default it is ``cls(api._connect_api)``.
+    The instance is then cached on the facade.
+    """
+
+    def __init__(self, module: str, name: str, build: Callable[[MilvusAPI, type], Any] | None = None):
+        self._module = module
+        self._name = name
+        self._build = build
+        self._attr = name
+
+    def __set_name__(self, owner: type, attr: str):
+        self._attr = attr
+
+    def __get__(self, api: MilvusAPI | None, owner: type | None = None) -> Any:
+        if api is None:
+            return self
+        with _build_lock:
+            value = api.__dict__.get(self._attr)
+            if value is None:
+                cls = getattr(importlib.import_module(self._module), self._name)
+                value = self._build(api, cls) if self._build else cls(api._connect_api)
+                api.__dict__[self._attr] = value
+                log.debug(f"Built {self._name} on first use")
+        return value
+
+
+def _build_collection_api(api: MilvusAPI, cls: type) -> Any:
+    from src.milvus.metadata import MetadataCache
+
+    collection_api = cls(api._connect_api, api._index_api)
+    collection_api.attach(api._local_search)
+    collection_api.attach(api._shadow_indexes)
+    metadata_cache = getattr(api._connect_api, "metadata_cache", None)
+    if isinstance(metadata_cache, MetadataCache):
+        collection_api.attach(metadata_cache.observer(api._connect_api))
+    return collection_api
+
+
+def _build_vector_api(api: MilvusAPI, cls: type) -> Any:
+    vector_api = cls(api._connect_api)
+    vector_api.attach(api._local_search)
+    vector_api.attach(api._shadow_indexes)
+    return vector_api
+
+
+def _build_search_api(api: MilvusAPI, cls: type) -> Any:
+    return cls(api._connect_api, api._local_search, api._shadow_indexes)
+
 
 # Implementation Classes
 
@@ -91,13 +151,21 @@ class MilvusAPI:
     """Facade class integrating all Milvus APIs for a unified interface.
 
     Provides a simplified API for interacting with Milvus, supporting operations like
-    collection management, vector operations, searches, and administration.
+    collection management, vector operations, searches, and administration. Sub-APIs
+    are imported and built on first use, so importing the facade stays cheap. Methods
+    calling the server are traced (see ``src.milvus.tracing``) when tracing is enabled
+    and can be profiled (see ``src.milvus.profiling``).
 
     Attributes:
         _connect_api (IConnectAPI): The connection API instance.
         _collection_api (CollectionAPI): The collection API instance.
         _vector_api (VectorAPI): The vector API instance.
         _search_api (SearchAPI): The search API instance.
+        _local_search (LocalSearchCache): Local exact search for small collections.
+        _shadow_indexes (ShadowIndexManager): HNSW shadow indexes of hot partitions.
+        _query_cache (SemanticQueryCache | None): Cache of near-duplicate search results, when enabled.
+        _hedging (HedgePolicy | None): Hedging policy of server searches, when enabled.
+        _query_api (QueryAPI): The query API instance.
         _index_api (IndexAPI): The index API instance.
         _partition_api (PartitionAPI): The partition API instance.
         _stat_api (StatAPI): The statistics API instance.
@@ -112,11 +180,35 @@ class MilvusAPI:
         insert: Inserts entities into a collection.
         delete: Deletes entities from a collection.
         search: Searches for vectors in a collection.
-        create_index: Creates an index on a field.
+        register_partition_scheme: Enables filter-based partition pruning for a collection.
+        enable_local_search: Answers searches on a small collection locally.
+        disable_local_search: Sends searches on a collection back to the server.
+        designate_hot_partition: Serves searches on a hot partition from a shadow index.
+        release_hot_partition: Drops the shadow index of a partition.
+        enable_partition_residency: Loads searched partitions on demand within a memory budget.
+        disable_partition_residency: Stops managing partition loading.
+        partition_residency_stats: Budget, usage and counters of partition residency.
+        enable_query_cache: Serves near-duplicate queries from a semantic cache.
+        disable_query_cache: Removes the semantic cache.
+        query_cache_stats: Hit, miss and false-hit counters of the semantic cache.
+        resilience_metrics: Endpoint health, circuit breaker states and retry budget.
+        enable_hedging: Sends a duplicate of server searches slower than the running p95.
+        disable_hedging: Turns search hedging off.
+        hedging_stats: Request, hedge and win counters of search hedging.
+        start_profiling: Profiles sampled operations for a time window.
+        stop_profiling: Ends profiling and writes the profile files.
+        profiling_stats: Counters of the profiling session.
+        query: Retrieves entities matching a filter expression.
+        query_iterator: Streams query results in pages.
+        search_iterator: Streams search results in pages.
+        create_index: Queues an index build on a field.
+        index_builds: Lists tracked index builds.
         drop_index: Drops an index from a field.
         create_partition: Creates a partition in a collection.
         drop_partition: Drops a partition from a collection.
         get_collection_stats: Gets collection statistics.
+        estimate_capacity: Estimates memory, disk and layout of a schema before creation.
+        check_capacity: Compares a capacity estimate with a collection's statistics.
         get_monitor_info: Gets server monitoring information.
         generate_embeddings: Generates embeddings for data.
         create_user: Creates a new user.
@@ -143,26 +235,19 @@ class MilvusAPI:
 
     """
 
-    _instance = None
-    _initialized = False
-
-    def __new__(cls, *args, **kwargs):
-        """Ensures a singleton instance of ConnectAPI.
-
-        Args:
-            *args: Positional arguments.
-            **kwargs: Keyword arguments.
-
-        Returns:
-            ConnectAPI: The singleton instance.
-
-        """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            log.info(f"New MilvusAPI instance created @ {datetime.datetime.now()}")
-        else:
-            log.info(f"Using existing MilvusAPI instance created @ {datetime.datetime.now()}")
-        return cls._instance
+    _index_api = _LazyAPI("src.milvus.index", "IndexAPI")
+    _collection_api = _LazyAPI("src.milvus.collection", "CollectionAPI", _build_collection_api)
+    _vector_api = _LazyAPI("src.milvus.vector", "VectorAPI", _build_vector_api)
+    _local_search = _LazyAPI("src.milvus.local", "LocalSearchCache")
+    _shadow_indexes = _LazyAPI("src.milvus.shadow", "ShadowIndexManager")
+    _search_api = _LazyAPI("src.milvus.search", "SearchAPI", _build_search_api)
+    _query_api = _LazyAPI("src.milvus.query", "QueryAPI")
+    _partition_api = _LazyAPI("src.milvus.partition", "PartitionAPI")
+    _stat_api = _LazyAPI("src.milvus.stats", "StatAPI")
+    _monitor_api = _LazyAPI("src.milvus.monitor", "MonitorAPI")
+    _embedding_api = _LazyAPI("src.milvus.embedding", "EmbeddingAPI")
+    _admin_api = _LazyAPI("src.milvus.admin", "AdminAPI")
+    _data_import_api = _LazyAPI("src.milvus.data", "DataImportAPI")
 
     def __init__(self, connect_api: IConnectAPI):
         """Initializes MilvusAPI with a connection instance.
@@ -171,23 +256,12 @@ class MilvusAPI:
             connect_api (IConnectAPI): Connection API instance.
 
         """
-        if not hasattr(self, '_initialized') or not self._initialized:
-            self._connect_api = connect_api
-            self._collection_api = CollectionAPI(connect_api)
-            self._vector_api = VectorAPI(connect_api)
-            self._search_api = SearchAPI(connect_api)
-            self._index_api = IndexAPI(connect_api)
-            self._partition_api = PartitionAPI(connect_api)
-            self._stat_api = StatAPI(connect_api)
-            self._monitor_api = MonitorAPI(connect_api)
-            self._embedding_api = EmbeddingAPI(connect_api)
-            self._admin_api = AdminAPI(connect_api)
-            self._data_import_api = DataImportAPI(connect_api)
-            self._initialized = True
-            log.info("MilvusAPI initialized...")
-        else:
-            log.warning("MilvusAPI instance already exists. Using existing parameters.")
+        self._connect_api = connect_api
+        self._query_cache = None
+        self._hedging = None
+        log.info("MilvusAPI initialized...")
 
+    @traced()
     @async_log_decorator
     async def create_collection(self, collection_name: str,
                                 fields: list[FieldSchema],
@@ -225,6 +299,8 @@ class MilvusAPI:
             MilvusAPIError: If creation fails.
 
         """
+        from pymilvus import MilvusException
+
         try:
             return await self._collection_api.create_collection(
                 collection_name=collection_name,
@@ -245,6 +321,7 @@ class MilvusAPI:
             log.error(f"Failed to create collection: {e}")
             raise MilvusAPIError(f"Collection creation failed: {e}")
 
+    @traced()
     @async_log_decorator
     async def drop_collection(self, collection_name: str, timeout: float = 10) -> dict[str, str]:
         """Drops a collection.
@@ -259,9 +336,10 @@ class MilvusAPI:
         """
         return await self._collection_api.drop_collection(collection_name, timeout=timeout)
 
+    @traced()
     @async_log_decorator
     async def insert(self, collection_name: str, entities: list[dict[str, Any]], partition_name: str | None = None,
-                     database_name: str = "default") -> dict:
+                     database_name: str = "default", flush: bool = True) -> dict:
         """Inserts entities into a collection.
 
         Args:
@@ -269,15 +347,17 @@ class MilvusAPI:
             entities (List[Dict[str, Any]]): Entities to insert.
             partition_name (Optional[str]): Partition name. Defaults to None.
             database_name (str): Database name. Defaults to "default".
+            flush (bool): Flush the collection after the insert. Defaults to True.
 
         Returns:
             Dict: Insertion result.
 
         """
-        return await self._vector_api.insert(collection_name, entities, partition_name, database_name)
+        return await self._vector_api.insert(collection_name, entities, partition_name, database_name, flush)
 
+    @traced()
     @async_log_decorator
-    def delete(self, collection_name: str, expr: str, partition_name: str | None = None,
+    async def delete(self, collection_name: str, expr: str, partition_name: str | None = None,
                      database_name: str = "default") -> None:
         """Deletes entities from a collection.
 
@@ -288,18 +368,21 @@ class MilvusAPI:
             database_name (str): Database name. Defaults to "default".
 
         """
-        self._vector_api.delete(collection_name, expr, partition_name, database_name)
+        await self._vector_api.delete(collection_name, expr, partition_name, database_name)
 
+    @traced()
     @async_log_decorator
-    async def search(self, collection_name: str, data: list[list[float]], anns_field: str, search_params: dict[str, Any],
+    async def search(self, collection_name: str, data: list[list[float]] | np.ndarray, anns_field: str,
+                     search_params: dict[str, Any],
                      limit: int, expr: str | None = None, output_fields: list[str] | None = None,
                      partition_names: list[str] | None = None, database_name: str = "default",
-                     rerank: bool = False, **kwargs) -> list[dict]:
+                     rerank: bool = False, compact: bool = False, **kwargs) -> list[dict] | ColumnarSearchResult:
         """Searches for vectors in a collection.
 
         Args:
             collection_name (str): Name of the collection.
-            data (List[List[float]]): Query vectors.
+            data (List[List[float]] | np.ndarray): Query vectors; float32, float16 and
+                bfloat16 arrays go to the server as raw bytes without Python lists.
             anns_field (str): Field to search against.
             search_params (Dict[str, Any]): Search parameters.
             limit (int): Maximum number of results.
@@ -308,10 +391,13 @@ class MilvusAPI:
             partition_names (Optional[List[str]]): Partitions to search. Defaults to None.
             database_name (str): Database name. Defaults to "default".
             rerank (bool): Whether to rerank results. Defaults to False.
+            compact (bool): Return a ColumnarSearchResult holding ``(nq, limit)`` NumPy
+                arrays for all queries; hit dictionaries are built only on access.
+                Defaults to False.
             **kwargs: Additional search parameters.
 
         Returns:
-            List[Dict]: Search results.
+            List[Dict] | ColumnarSearchResult: Search results.
 
         """
         return await self._search_api.search(
@@ -325,24 +411,387 @@ class MilvusAPI:
             partition_names,
             database_name,
             rerank,
+            compact,
             **kwargs)
 
+    def register_partition_scheme(self, collection_name: str, scheme: PartitionScheme | None,
+                                  database_name: str = "default") -> None:
+        """Registers the partitioning scheme used to prune partitions from search filters.
+
+        Args:
+            collection_name (str): Name of the collection.
+            scheme (PartitionScheme | None): Partitioning scheme, or None to disable pruning.
+            database_name (str): Database name. Defaults to "default".
+
+        """
+        self._search_api.register_partition_scheme(collection_name, scheme, database_name)
+
+    def enable_local_search(self, collection_name: str, threshold: int = DEFAULT_THRESHOLD,
+                            anns_field: str = "vector", metric_type: str = "COSINE",
+                            database_name: str = "default") -> None:
+        """Answers searches on a small collection from a local exact index.
+
+        The collection's vectors are mirrored on the first search and kept current from
+        inserts and deletes made through this API. Searches go to the server while the
+        collection has more than ``threshold`` rows, and for filters, partitions or output
+        fields other than the primary key.
+
+        Args:
+            collection_name (str): Name of the collection.
+            threshold (int): Largest row count searched locally. Defaults to 50000.
+            anns_field (str): Vector field to mirror. Defaults to "vector".
+            metric_type (str): Metric of the collection's index. Defaults to "COSINE".
+            database_name (str): Database name. Defaults to "default".
+
+        """
+        self._local_search.configure(collection_name, threshold, anns_field, metric_type, database_name)
+
+    def disable_local_search(self, collection_name: str) -> None:
+        """Sends all searches on a collection to the server again.
+
+        Args:
+            collection_name (str): Name of the collection.
+
+        """
+        self._local_search.disable(collection_name)
+
+    def designate_hot_partition(self, collection_name: str, partition_name: str = DEFAULT_PARTITION,
+                                anns_field: str = "vector", metric_type: str = "COSINE",
+                                max_staleness: float = 30.0, database_name: str = "default",
+                                **index_params: int) -> None:
+        """Serves unfiltered searches of one partition from an in-process HNSW shadow index.
+
+        The shadow is built in the background and follows writes made through this API;
+        searches go to the server while it is building, behind on writes, or older than
+        ``max_staleness`` seconds since its last check against the server.
+
+        Args:
+            collection_name (str): Name of the collection.
+            partition_name (str): Hot partition. Defaults to "_default".
+            anns_field (str): Vector field. Defaults to "vector".
+            metric_type (str): Metric of the collection's index. Defaults to "COSINE".
+            max_staleness (float): Seconds between consistency checks. Defaults to 30.
+            database_name (str): Database name. Defaults to "default".
+            **index_params: HNSW ``M``, ``ef_construction`` and ``ef_search``.
+
+        """
+        self._shadow_indexes.designate(collection_name, partition_name, anns_field, metric_type, max_staleness,
+                                       database_name=database_name, **index_params)
+
+    def release_hot_partition(self, collection_name: str, partition_name: str = DEFAULT_PARTITION) -> None:
+        """Drops the shadow index of a partition; its searches go to the server again.
+
+        Args:
+            collection_name (str): Name of the collection.
+            partition_name (str): The partition. Defaults to "_default".
+
+        """
+        self._shadow_indexes.release(collection_name, partition_name)
+
+    def enable_partition_residency(self, collection_names: list[str], memory_budget: int,
+                                   estimator: CapacityEstimator | None = None,
+                                   database_name: str = "default") -> PartitionResidencyManager:
+        """Loads the partitions searches target on demand, releasing the least recently used.
+
+        Searches on the given collections load only their (pruned or named) partitions
+        instead of the whole collection; partitions that were not searched for longest are
+        released when the estimated memory of loaded partitions would exceed the budget.
+
+        Args:
+            collection_names (List[str]): Collections whose partitions are managed.
+            memory_budget (int): Bytes of query node memory the managed partitions may use.
+            estimator (CapacityEstimator | None): Estimates partition memory. Defaults to a new one.
+            database_name (str): Database of the collections. Defaults to "default".
+
+        Returns:
+            PartitionResidencyManager: The manager.
+
+        """
+        self.disable_partition_residency()
+        manager = self._partition_api.enable_residency(memory_budget, estimator)
+        for collection_name in collection_names:
+            manager.manage(collection_name, database_name)
+        self._collection_api.attach(manager)
+        self._vector_api.attach(manager)
+        self._search_api.use_residency(manager)
+        return manager
+
+    def disable_partition_residency(self) -> None:
+        """Stops managing partitions; loaded partitions stay loaded."""
+        manager = self._partition_api.residency
+        if manager is not None:
+            self._search_api.use_residency(None)
+            self._vector_api.detach(manager)
+            self._collection_api.detach(manager)
+            self._partition_api.disable_residency()
+
+    def partition_residency_stats(self) -> dict[str, Any]:
+        """Returns the residency manager's budget, usage and counters (empty when disabled)."""
+        manager = self._partition_api.residency
+        return manager.stats() if manager is not None else {}
+
+    def enable_query_cache(self, threshold: float = 0.98, capacity: int = 1024,
+                           verify_fraction: float = 0.0) -> SemanticQueryCache:
+        """Serves single-query COSINE searches from a semantic cache of recent results.
+
+        A search hits when its query vector has at least ``threshold`` cosine similarity
+        with a cached query and all other arguments match; searches with other metrics
+        always go to the server. Writes through this API
+        invalidate the written collection's entries.
+
+        Args:
+            threshold (float): Minimum cosine similarity of a hit. Defaults to 0.98.
+            capacity (int): Cached results, evicted least recently used. Defaults to 1024.
+            verify_fraction (float): Share of hits also searched on the server to count
+                false hits. Defaults to 0.0.
+
+        Returns:
+            SemanticQueryCache: The cache.
+
+        """
+        from src.milvus.semantic_cache import SemanticQueryCache
+
+        self.disable_query_cache()
+        self._query_cache = SemanticQueryCache(threshold, capacity, verify_fraction)
+        self._vector_api.attach(self._query_cache)
+        self._collection_api.attach(self._query_cache)
+        self._search_api.use_query_cache(self._query_cache)
+        return self._query_cache
+
+    def disable_query_cache(self) -> None:
+        """Removes the semantic query cache."""
+        if self._query_cache is not None:
+            self._search_api.use_query_cache(None)
+            self._vector_api.detach(self._query_cache)
+            self._collection_api.detach(self._query_cache)
+            self._query_cache = None
+
+    def query_cache_stats(self) -> dict[str, float]:
+        """Returns the semantic cache counters (empty when the cache is disabled).
+
+        Returns:
+            Dict[str, float]: lookups, hits, misses, verified, false_hits, stores, evictions,
+                invalidations, size, hit_rate and false_hit_rate.
+
+        """
+        return self._query_cache.stats() if self._query_cache is not None else {}
+
+    def enable_hedging(self, quantile: float = 0.95, budget: float = 0.05, min_delay: float = 0.0,
+                       min_samples: int = 20) -> HedgePolicy:
+        """Hedges server searches: a duplicate goes out once the running quantile has passed.
+
+        Args:
+            quantile (float): Latency quantile that triggers a hedge. Defaults to 0.95.
+            budget (float): Maximum share of extra searches. Defaults to 0.05.
+            min_delay (float): Lower bound of the hedge delay in seconds. Defaults to 0.
+            min_samples (int): Latencies per collection needed before hedging. Defaults to 20.
+
+        Returns:
+            HedgePolicy: The active policy.
+
+        """
+        from src.milvus.hedging import HedgePolicy
+
+        self._hedging = HedgePolicy(quantile=quantile, budget=budget, min_delay=min_delay, min_samples=min_samples)
+        self._search_api.use_hedging(self._hedging)
+        return self._hedging
+
+    def disable_hedging(self) -> None:
+        """Turns search hedging off."""
+        self._search_api.use_hedging(None)
+        self._hedging = None
+
+    def hedging_stats(self) -> dict[str, Any]:
+        """Returns hedging counters (empty when hedging is off)."""
+        return self._hedging.stats() if self._hedging is not None else {}
+
+    def start_profiling(self, kind: str = "cpu", output_dir: str = "profiles", sample_rate: float = 1.0,
+                        duration: float | None = None, operations: list[str] | None = None,
+                        hook: ProfileHook | None = None) -> ProfilingSession:
+        """Profiles traced operations ("MilvusAPI.search", ...) and writes one profile per operation.
+
+        The session is process-wide: it covers the operations of every facade and
+        replaces a running session.
+
+        Args:
+            kind (str): "cpu" (cProfile, ``.prof`` files) or "memory" (tracemalloc,
+                ``.folded`` files). Defaults to "cpu".
+            output_dir (str): Directory of the profile files. Defaults to "profiles".
+            sample_rate (float): Fraction of calls profiled. Defaults to 1.0.
+            duration (Optional[float]): Seconds after which profiling stops and the files
+                are written. Defaults to None (until ``stop_profiling``).
+            operations (Optional[List[str]]): Operations profiled. Defaults to all.
+            hook (Optional[ProfileHook]): Custom profiler replacing ``kind``. Defaults to None.
+
+        Returns:
+            ProfilingSession: The running session.
+
+        Raises:
+            MilvusValidationError: If an argument is invalid.
+
+        """
+        from src.milvus.profiling import start_profiling
+
+        return start_profiling(kind, output_dir, sample_rate, duration, operations, hook)
+
+    def stop_profiling(self) -> list[str]:
+        """Stops profiling and returns the paths of the files written."""
+        from src.milvus.profiling import stop_profiling
+
+        return stop_profiling()
+
+    def profiling_stats(self) -> dict[str, Any]:
+        """Returns the counters of the current or last profiling session (empty without one)."""
+        from src.milvus.profiling import get_profiling_session
+
+        session = get_profiling_session()
+        return session.stats() if session is not None else {}
+
+    def resilience_metrics(self) -> dict[str, Any]:
+        """Returns endpoint health, circuit breaker states and the retry budget.
+
+        Returns:
+            Dict[str, Any]: "endpoints", "circuit_breakers" and "retry_budget"; empty when
+                the connection uses a single plain client.
+
+        """
+        metrics = getattr(self._connect_api.client, "resilience_metrics", None)
+        return metrics() if callable(metrics) else {}
+
+    @traced()
     @async_log_decorator
-    def create_index(self,
+    async def query(self, collection_name: str, expr: str = "", output_fields: list[str] | None = None,
+                    partition_names: list[str] | None = None, database_name: str = "default",
+                    limit: int | None = None, offset: int | None = None, **kwargs) -> list[dict]:
+        """Retrieves entities matching a filter expression.
+
+        Args:
+            collection_name (str): Name of the collection.
+            expr (str): Filter expression. Defaults to "".
+            output_fields (Optional[List[str]]): Fields to return. Defaults to None.
+            partition_names (Optional[List[str]]): Partitions to query. Defaults to None.
+            database_name (str): Database name. Defaults to "default".
+            limit (Optional[int]): Maximum number of entities. Defaults to None.
+            offset (Optional[int]): Number of entities to skip. Defaults to None.
+            **kwargs: Additional query parameters.
+
+        Returns:
+            List[Dict]: Matching entities.
+
+        """
+        partition_names = await self._search_api.resolve_partitions_async(collection_name, expr, partition_names,
+                                                                          database_name)
+        if partition_names is not None and not partition_names:
+            return []
+        return await self._query_api.query(
+            collection_name, expr, output_fields, partition_names, database_name, limit, offset, **kwargs)
+
+    @traced()
+    async def query_iterator(self, collection_name: str, expr: str = "", output_fields: list[str] | None = None,
+                             partition_names: list[str] | None = None, page_size: int | None = None,
+                             limit: int | None = None, prefetch: int | None = None,
+                             database_name: str = "default", **kwargs) -> AsyncIterator[list[dict]]:
+        """Streams entities matching a filter expression in pages.
+
+        Args:
+            collection_name (str): Name of the collection.
+            expr (str): Filter expression. Defaults to "" (all entities).
+            output_fields (Optional[List[str]]): Fields to return. Defaults to None.
+            partition_names (Optional[List[str]]): Partitions to query. Defaults to None.
+            page_size (Optional[int]): Entities per page. Defaults to 1000.
+            limit (Optional[int]): Maximum total number of entities. Defaults to unlimited.
+            prefetch (Optional[int]): Pages fetched ahead of the consumer. Defaults to 1.
+            database_name (str): Database name. Defaults to "default".
+            **kwargs: Additional iterator parameters.
+
+        Yields:
+            List[Dict]: A page of entities.
+
+        """
+        partition_names = await self._search_api.resolve_partitions_async(collection_name, expr, partition_names,
+                                                                          database_name)
+        if partition_names is not None and not partition_names:
+            return
+        async with aclosing(self._query_api.query_iterator(
+                collection_name, expr, output_fields, partition_names, page_size, limit, prefetch, database_name,
+                **kwargs)) as pages:
+            async for page in pages:
+                yield page
+
+    @traced()
+    async def search_iterator(self, collection_name: str, data: list[list[float]], anns_field: str,
+                              search_params: dict[str, Any] | None = None, page_size: int | None = None,
+                              expr: str | None = None, output_fields: list[str] | None = None,
+                              partition_names: list[str] | None = None, limit: int | None = None,
+                              prefetch: int | None = None, database_name: str = "default",
+                              **kwargs) -> AsyncIterator[list[dict]]:
+        """Streams search hits for one query vector in pages of increasing distance.
+
+        Args:
+            collection_name (str): Name of the collection.
+            data (List[List[float]]): A single query vector, as a one-element list.
+            anns_field (str): Field to search against.
+            search_params (Optional[Dict[str, Any]]): Search parameters. Defaults to None.
+            page_size (Optional[int]): Hits per page. Defaults to 1000.
+            expr (Optional[str]): Filter expression. Defaults to None.
+            output_fields (Optional[List[str]]): Fields to return. Defaults to None.
+            partition_names (Optional[List[str]]): Partitions to search. Defaults to None.
+            limit (Optional[int]): Maximum total number of hits. Defaults to unlimited.
+            prefetch (Optional[int]): Pages fetched ahead of the consumer. Defaults to 1.
+            database_name (str): Database name. Defaults to "default".
+            **kwargs: Additional iterator parameters.
+
+        Yields:
+            List[Dict]: A page of hits.
+
+        """
+        partition_names = await self._search_api.resolve_partitions_async(collection_name, expr, partition_names,
+                                                                          database_name)
+        if partition_names is not None and not partition_names:
+            return
+        async with aclosing(self._query_api.search_iterator(
+                collection_name, data, anns_field, search_params, page_size, expr, output_fields,
+                partition_names, limit, prefetch, database_name, **kwargs)) as pages:
+            async for page in pages:
+                yield page
+
+    @traced()
+    @async_log_decorator
+    async def create_index(self,
                            collection_name: str, field_name: str,
-                           index_params: dict, database_name: str = "default", **kwargs) -> None:
-        """Creates an index on a field.
+                           index_params: dict, database_name: str = "default",
+                           wait: bool = False, **kwargs) -> IndexBuildHandle:
+        """Queues an index build on a field.
 
         Args:
             collection_name (str): Name of the collection.
             field_name (str): Field to index.
             index_params (Dict): Index parameters.
             database_name (str): Database name. Defaults to "default".
+            wait (bool): Wait for the build to finish. Defaults to False.
             **kwargs: Additional index parameters.
 
+        Returns:
+            IndexBuildHandle: Handle reporting state, progress, elapsed time and rows/s.
+
         """
-        self._index_api.create_index(collection_name, field_name, index_params, database_name, **kwargs)
+        return await self._index_api.create_index(collection_name, field_name, index_params, database_name,
+                                                  wait=wait, **kwargs)
+
+    def index_builds(self, active_only: bool = False) -> list[IndexBuildHandle]:
+        """Lists tracked index builds.
+
+        Args:
+            active_only (bool): Only builds currently in flight. Defaults to False.
+
+        Returns:
+            List[IndexBuildHandle]: Build handles.
 
+        """
+        scheduler = self._index_api.scheduler
+        return scheduler.active() if active_only else list(scheduler.builds)
+
+    @traced()
     @async_log_decorator
     def drop_index(self, collection_name: str, field_name: str, database_name: str = "default") -> None:
         """Drops an index from a field.
@@ -355,6 +804,7 @@ class MilvusAPI:
         """
         self._index_api.drop_index(collection_name, field_name, database_name)
 
+    @traced()
     @async_log_decorator
     def create_partition(self, collection_name: str, partition_name: str, database_name: str = "default") -> None:
         """Creates a partition in a collection.
@@ -367,8 +817,9 @@ class MilvusAPI:
         """
         self._partition_api.create_partition(collection_name, partition_name, database_name)
 
+    @traced()
     @async_log_decorator
-    def drop_partition(self, collection_name: str, partition_name: str, database_name: str = "default") -> None:
+    async def drop_partition(self, collection_name: str, partition_name: str, database_name: str = "default") -> None:
         """Drops a partition from a collection.
 
         Args:
@@ -377,10 +828,11 @@ class MilvusAPI:
             database_name (str): Database name. Defaults to "default".
 
         """
-        self._partition_api.drop_partition(collection_name, partition_name, database_name)
+        await self._partition_api.drop_partition(collection_name, partition_name, database_name)
 
+    @traced()
     @async_log_decorator
-    def get_collection_stats(self, collection_name: str, database_name: str = "default") -> dict[str, Any]:
+    async def get_collection_stats(self, collection_name: str, database_name: str = "default") -> dict[str, Any]:
         """Gets collection statistics.
 
         Args:
@@ -391,8 +843,52 @@ class MilvusAPI:
             Dict[str, Any]: Collection statistics.
 
         """
-        return self._stat_api.get_collection_stats(collection_name, database_name)
+        return await self._stat_api.get_collection_stats(collection_name, database_name)
+
+    def estimate_capacity(self, schema: CollectionSchema | list[FieldSchema] | dict[str, Any], rows: int,
+                          index_params: dict[str, Any] | None = None, estimator: CapacityEstimator | None = None,
+                          **kwargs) -> CapacityEstimate:
+        """Estimates raw size, index memory, disk, segments, replicas and partitions of a schema.
+
+        Args:
+            schema (CollectionSchema | List[FieldSchema] | Dict[str, Any]): Collection schema.
+            rows (int): Expected row count.
+            index_params (Dict[str, Any] | None): Index parameters of the vector fields.
+            estimator (CapacityEstimator | None): Estimator with the cluster's query node
+                memory and count. Defaults to a new one.
+            **kwargs: Further ``CapacityEstimator.estimate`` arguments.
+
+        Returns:
+            CapacityEstimate: The estimate.
+
+        """
+        from src.milvus.capacity import CapacityEstimator
+
+        return (estimator or CapacityEstimator()).estimate(schema, rows, index_params, **kwargs)
+
+    @traced()
+    @async_log_decorator
+    async def check_capacity(self, collection_name: str, estimate: CapacityEstimate | None = None,
+                             index_params: dict[str, Any] | None = None, database_name: str = "default",
+                             estimator: CapacityEstimator | None = None) -> dict[str, Any]:
+        """Compares a capacity estimate with the statistics of a collection.
+
+        Args:
+            collection_name (str): Name of the collection.
+            estimate (CapacityEstimate | None): Estimate made before creation. Defaults to
+                the estimate at the actual row count.
+            index_params (Dict[str, Any] | None): Index parameters; read from the server when None.
+            database_name (str): Database name. Defaults to "default".
+            estimator (CapacityEstimator | None): Estimator to use. Defaults to a new one.
+
+        Returns:
+            Dict[str, Any]: Row and size comparison and the current estimate.
+
+        """
+        return await self._stat_api.check_capacity(collection_name, estimate, index_params, database_name,
+                                                   estimator)
 
+    @traced()
     @async_log_decorator
     def get_monitor_info(self) -> dict[str, Any]:
         """Gets server monitoring information.
@@ -403,8 +899,9 @@ class MilvusAPI:
         """
         return self._monitor_api.get_monitor_info()
 
+    @traced()
     @async_log_decorator
-    def generate_embeddings(self, data: list[Any], embedding_model: Callable[[list[Any]], np.ndarray],
+    async def generate_embeddings(self, data: list[Any], embedding_model: Callable[[list[Any]], np.ndarray],
                                   embedding_type: str = "float", batch_size: int = 32) -> np.ndarray:
         """Generates embeddings for data.
 
@@ -418,8 +915,9 @@ class MilvusAPI:
             np.ndarray: Generated embeddings.
 
         """
-        return self._embedding_api.generate_embeddings(data, embedding_model, embedding_type, batch_size)
+        return await self._embedding_api.generate_embeddings(data, embedding_model, embedding_type, batch_size)
 
+    @traced()
     @async_log_decorator
     def create_user(self, username: str, password: str) -> None:
         """Creates a new user.
@@ -431,6 +929,7 @@ class MilvusAPI:
         """
         self._admin_api.create_user(username, password)
 
+    @traced()
     @async_log_decorator
     def list_users(self) -> list[str]:
         """Lists all users.
@@ -441,6 +940,7 @@ class MilvusAPI:
         """
         return self._admin_api.list_users()
 
+    @traced()
     @async_log_decorator
     def import_data(self, collection_name: str, file_path: str, database_name: str = "default") -> None:
         """Imports data into a collection.
@@ -1,25 +1,590 @@
+import asyncio
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
 from pymilvus import Collection, MilvusException
 
 from src.logger import getLogger as GetLogger
+from src.milvus.capacity import CapacityEstimator, index_params_of
+from src.milvus.deadline import step_timeout
+from src.milvus.events import DROP, INSERT, CollectionEvent
 from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
-from src.milvus.interfaces import IConnectAPI, IPartitionAPI
+from src.milvus.expression import Interval, parse_expression
+from src.milvus.interfaces import ICollectionObserver, IConnectAPI, IPartitionAPI
 from src.utils import async_log_decorator
 
 # Logging setup
 log = GetLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PartitionKey:
+    """A scalar field that determines which partition an entity is stored in.
+
+    Value keys (``width is None``) map one field value to a partition, e.g. one
+    partition per tenant. Range keys cover ``[start, start + width)`` of a numeric
+    field, e.g. one partition per day of a timestamp field.
+
+    Attributes:
+        field (str): Name of the scalar field.
+        width (float | None): Bucket width for range keys. Defaults to None.
+        converter (Callable[[str], Any] | None): Converts the value captured from a
+            partition name; defaults to ``int`` for range keys and ``str`` otherwise.
+
+    Example:
+        ```python
+        tenant = PartitionKey("tenant")
+        day = PartitionKey("ts", width=86400)
+        ```
+
+    """
+
+    field: str
+    width: float | None = None
+    converter: Callable[[str], Any] | None = None
+
+    def interval(self, value: Any) -> Interval:
+        """Returns the domain of field values held by a partition for this key.
+
+        Args:
+            value (Any): A scalar, a ``(low, high)`` tuple, or an ``Interval``.
+
+        Returns:
+            Interval: The field domain.
+
+        """
+        if isinstance(value, Interval):
+            return value
+        if isinstance(value, tuple):
+            return Interval(*value)
+        if isinstance(value, str) and self.converter is None and self.width is not None:
+            value = int(value)
+        elif isinstance(value, str) and self.converter is not None:
+            value = self.converter(value)
+        if self.width is not None:
+            return Interval(value, value + self.width)
+        return Interval.point(value)
+
+
+class PartitionScheme:
+    """Describes how a collection is partitioned, so filters can be mapped to partitions.
+
+    Partitions are either registered explicitly with ``add_partition`` or recognised by
+    a regular expression whose named groups are partition key fields. Partitions the
+    scheme cannot describe (such as ``_default``) are never pruned.
+
+    Attributes:
+        keys (Dict[str, PartitionKey]): Partition keys by field name.
+        pattern (re.Pattern | None): Pattern matching partition names.
+        ttl (float): Seconds to cache the collection's partition list. Defaults to 60.
+
+    Methods:
+        add_partition: Registers a partition and the key values it holds.
+        bounds: Returns the key domains of a partition.
+        partition_names: Returns the collection's known partition names.
+        prune: Selects the partitions a filter expression can match.
+
+    Example:
+        ```python
+        scheme = PartitionScheme(
+            [PartitionKey("tenant"), PartitionKey("ts", width=86400)],
+            pattern=r"(?P<tenant>[a-z]+)_(?P<ts>[0-9]+)",
+        )
+        scheme.prune('tenant == "acme" and ts >= 172800', ["acme_86400", "acme_172800", "beta_172800"])
+        # ['acme_172800']
+        ```
+
+    Raises:
+        MilvusValidationError: If the scheme definition is invalid.
+
+    """
+
+    def __init__(self, keys: list[PartitionKey], pattern: str | None = None, ttl: float = 60.0):
+        """Initializes the scheme.
+
+        Args:
+            keys (List[PartitionKey]): Partition keys.
+            pattern (str | None): Regex with one named group per key field. Defaults to None.
+            ttl (float): Seconds to cache the partition list. Defaults to 60.
+
+        """
+        if not keys:
+            raise MilvusValidationError("A partition scheme needs at least one partition key")
+        self.keys = {key.field: key for key in keys}
+        self.pattern = re.compile(pattern) if pattern else None
+        if self.pattern is not None and not set(self.pattern.groupindex) <= set(self.keys):
+            raise MilvusValidationError(f"Pattern groups {sorted(self.pattern.groupindex)} are not partition keys")
+        self.ttl = ttl
+        self._explicit: dict[str, dict[str, Interval]] = {}
+        self._names: list[str] = []
+        self._loaded_at: float | None = None
+
+    def add_partition(self, partition_name: str, **values: Any) -> "PartitionScheme":
+        """Registers a partition and the key values it holds.
+
+        Args:
+            partition_name (str): Name of the partition.
+            **values: Key values by field name (scalar, ``(low, high)`` or ``Interval``).
+
+        Returns:
+            PartitionScheme: Self for method chaining.
+
+        """
+        unknown = set(values) - set(self.keys)
+        if unknown:
+            raise MilvusValidationError(f"Unknown partition keys: {sorted(unknown)}")
+        self._explicit[partition_name] = {name: self.keys[name].interval(value) for name, value in values.items()}
+        return self
+
+    def bounds(self, partition_name: str) -> dict[str, Interval] | None:
+        """Returns the key domains of a partition, or None if it is not described."""
+        if partition_name in self._explicit:
+            return self._explicit[partition_name]
+        if self.pattern is None:
+            return None
+        match = self.pattern.fullmatch(partition_name)
+        if match is None:
+            return None
+        try:
+            return {name: self.keys[name].interval(value)
+                    for name, value in match.groupdict().items() if value is not None}
+        except (TypeError, ValueError) as e:
+            log.warning(f"Cannot derive partition bounds from {partition_name}: {e}")
+            return None
+
+    def partition_names(self, loader: Callable[[], list[str]] | None = None) -> list[str]:
+        """Returns the known partition names, refreshing the cached list when stale.
+
+        Listed partitions the scheme cannot describe (``_default`` or partitions neither
+        registered nor matching the pattern) are kept, so ``prune`` never drops them.
+
+        Args:
+            loader (Callable[[], List[str]] | None): Lists the collection's partitions.
+
+        Returns:
+            List[str]: Explicit partitions followed by the listed ones.
+
+        """
+        if loader is not None and (self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl):
+            self._names = list(loader())
+            self._loaded_at = time.monotonic()
+        names = list(self._explicit)
+        names.extend(name for name in self._names if name not in self._explicit)
+        return names
+
+    def invalidate(self):
+        """Forces the partition list to be reloaded on next use."""
+        self._loaded_at = None
+
+    def prune(self, expr: str, partition_names: list[str]) -> list[str]:
+        """Selects the partitions that can hold entities matching ``expr``.
+
+        Args:
+            expr (str): Milvus filter expression.
+            partition_names (List[str]): Candidate partitions.
+
+        Returns:
+            List[str]: Partitions for which the filter is not certainly false.
+
+        Raises:
+            MilvusValidationError: If the expression cannot be parsed.
+
+        """
+        tree = parse_expression(expr)
+        if not tree.fields() & set(self.keys):
+            return list(partition_names)
+        selected = []
+        for name in partition_names:
+            bounds = self.bounds(name)
+            if bounds is None or tree.evaluate(bounds) is not False:
+                selected.append(name)
+        log.debug(f"Pruned partitions for filter {expr!r}: {len(selected)}/{len(partition_names)} kept")
+        return selected
+
+
+class PartitionResidencyManager(ICollectionObserver):
+    """Keeps the partitions searches need loaded within a memory budget.
+
+    Query nodes can hold only some partitions of a collection with many (e.g. one per
+    day). For the collections it manages, the manager loads the partitions a search
+    targets on demand and releases the least recently used ones when loading another
+    would exceed ``memory_budget``:
+
+    - A partition's memory is estimated from its row count with a ``CapacityEstimator``
+      (schema and indexes are read once per collection), or by ``size_of``.
+    - Partitions used by a running search are pinned and never released; when the pinned
+      partitions alone exceed the budget, the load goes ahead and is counted as
+      "over_budget".
+    - Concurrent requests for a partition share one ``load_partitions`` call, and a
+      partition being released is loaded again only after the release finished.
+
+    Partitions loaded before the manager took over are unknown to it until
+    ``refresh`` is called. As an observer of CollectionAPI and VectorAPI, it forgets
+    dropped collections and adds inserted rows to the size of resident partitions.
+
+    Attributes:
+        memory_budget (int): Bytes of query node memory the managed partitions may use.
+
+    Methods:
+        manage: Puts a collection under the manager.
+        unmanage: Stops managing a collection.
+        manages: Whether a collection is managed.
+        acquire: Loads and pins partitions for a search.
+        release: Unpins partitions after a search.
+        discard: Releases and forgets a partition, e.g. before dropping it.
+        refresh: Registers the partitions of a collection that are already loaded.
+        stats: Budget, usage and load, hit, coalescing and eviction counters.
+
+    Example:
+        ```python
+        manager = PartitionResidencyManager(connect_api, memory_budget=48 * 2**30)
+        manager.manage("events")
+        partitions = await manager.acquire("events", ["day_19800", "day_19801"])
+        try:
+            hits = client.search("events", data, partition_names=partitions, ...)
+        finally:
+            manager.release("events", partitions)
+        ```
+
+    Raises:
+        MilvusAPIError: If loading a partition fails.
+
+    """
+
+    def __init__(self, connect_api: IConnectAPI, memory_budget: int, estimator: CapacityEstimator | None = None,
+                 size_of: Callable[[str, str, str], Awaitable[int]] | None = None):
+        """Initializes the manager.
+
+        Args:
+            connect_api (IConnectAPI): The connection API instance.
+            memory_budget (int): Bytes the managed partitions may use.
+            estimator (CapacityEstimator | None): Estimates partition memory. Defaults to a new one.
+            size_of (Callable[[str, str, str], Awaitable[int]] | None): Returns the memory of
+                (collection, partition, database) instead of the estimator. Defaults to None.
+
+        """
+        if memory_budget <= 0:
+            raise MilvusValidationError(f"Memory budget must be positive, got {memory_budget}")
+        self._connect_api = connect_api
+        self.memory_budget = memory_budget
+        self._estimator = estimator or CapacityEstimator()
+        self._size_of = size_of
+        self._lock = threading.Lock()
+        # Managed (database, collection) pairs
+        self._collections: set[tuple[str, str]] = set()
+        # Resident (database, collection, partition) keys and their bytes, least recently used first
+        self._residents: OrderedDict[tuple[str, str, str], int] = OrderedDict()
+        self._used = 0
+        self._reserved = 0
+        self._pins: Counter = Counter()
+        self._pending: dict[tuple[int, tuple[str, str, str]], asyncio.Future] = {}
+        self._releasing: dict[tuple[str, str, str], asyncio.Future] = {}
+        self._layouts: dict[tuple[str, str], tuple[dict[str, Any], dict[str, Any]]] = {}
+        self._counters = dict.fromkeys(("hits", "loads", "coalesced", "evictions", "over_budget"), 0)
+
+    def manage(self, collection_name: str, database_name: str = "default"):
+        """Loads and releases the partitions of ``collection_name`` through the manager."""
+        with self._lock:
+            self._collections.add((database_name, collection_name))
+
+    def unmanage(self, collection_name: str, database_name: str = "default"):
+        """Stops managing a collection; its partitions stay loaded but are forgotten."""
+        with self._lock:
+            self._collections.discard((database_name, collection_name))
+            self._forget(database_name, collection_name)
+
+    def manages(self, collection_name: str, database_name: str = "default") -> bool:
+        return (database_name, collection_name) in self._collections
+
+    # Loading
+
+    async def acquire(self, collection_name: str, partition_names: list[str] | None = None,
+                      database_name: str = "default") -> list[str]:
+        """Makes sure partitions are loaded and pins them until ``release``.
+
+        Args:
+            collection_name (str): Managed collection.
+            partition_names (List[str] | None): Partitions a search targets; all
+                partitions of the collection when None.
+            database_name (str): Database name. Defaults to "default".
+
+        Returns:
+            List[str]: The pinned partitions, to be passed to the search and to ``release``.
+
+        Raises:
+            MilvusAPIError: If listing, sizing or loading partitions fails.
+
+        """
+        client = self._connect_api.client
+        try:
+            if partition_names is None:
+                partition_names = await asyncio.to_thread(client.list_partitions, collection_name=collection_name,
+                                                          db_name=database_name)
+        except MilvusException as e:
+            log.error(f"Failed to list partitions of {collection_name}: {e}")
+            raise MilvusAPIError(f"Partition load failed: {e}")
+        partition_names = list(dict.fromkeys(partition_names))
+        keys = [(database_name, collection_name, name) for name in partition_names]
+        with self._lock:
+            self._pins.update(keys)
+            missing = []
+            for key in keys:
+                if key in self._residents:
+                    self._residents.move_to_end(key)
+                    self._counters["hits"] += 1
+                else:
+                    missing.append(key)
+        try:
+            if missing:
+                await asyncio.gather(*(self._single_flight(key) for key in missing))
+        except BaseException:
+            self.release(collection_name, partition_names, database_name)
+            raise
+        return partition_names
+
+    def release(self, collection_name: str, partition_names: list[str], database_name: str = "default"):
+        """Unpins partitions pinned by ``acquire``; they stay loaded until evicted."""
+        with self._lock:
+            for name in partition_names:
+                key = (database_name, collection_name, name)
+                self._pins[key] -= 1
+                if self._pins[key] <= 0:
+                    del self._pins[key]
+
+    async def _single_flight(self, key: tuple[str, str, str]):
+        loop = asyncio.get_running_loop()
+        flight = (id(loop), key)
+        with self._lock:
+            future = self._pending.get(flight)
+            leader = future is None
+            if leader:
+                future = self._pending[flight] = loop.create_future()
+        if not leader:
+            with self._lock:
+                self._counters["coalesced"] += 1
+            return await asyncio.shield(future)
+        try:
+            await self._load(key)
+            future.set_result(None)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # retrieved here when no other task waits
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(flight, None)
+
+    async def _load(self, key: tuple[str, str, str]):
+        database_name, collection_name, partition_name = key
+        releasing = self._releasing.get(key)
+        if releasing is not None and releasing.get_loop() is asyncio.get_running_loop():
+            await asyncio.shield(releasing)
+        client = self._connect_api.client
+        try:
+            size = await self._partition_bytes(key)
+            victims = self._reserve(key, size)
+            try:
+                await self._release_partitions(victims)
+                await asyncio.to_thread(client.load_partitions, collection_name=collection_name,
+                                        partition_names=[partition_name], db_name=database_name,
+                                        timeout=step_timeout(step="load_partitions"))
+            finally:
+                with self._lock:
+                    self._reserved -= size
+        except MilvusException as e:
+            log.error(f"Failed to load partition {partition_name} of {collection_name}: {e}")
+            raise MilvusAPIError(f"Partition load failed: {e}")
+        with self._lock:
+            self._residents[key] = size
+            self._used += size
+            self._counters["loads"] += 1
+        log.info(f"Loaded partition {partition_name} of {collection_name} ({size} bytes, "
+                 f"{self._used}/{self.memory_budget} bytes used)")
+
+    def _reserve(self, key: tuple[str, str, str], size: int) -> list[tuple[tuple[str, str, str], int]]:
+        """Reserves ``size`` bytes, picking unpinned least recently used partitions to release.
+
+        Every victim is marked as being released before the lock is dropped, so that a
+        concurrent load of it waits for the release instead of racing it.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            excess = self._used + self._reserved + size - self.memory_budget
+            victims = []
+            for other, other_size in self._residents.items():
+                if excess <= 0:
+                    break
+                if self._pins[other] <= 0:
+                    victims.append((other, other_size))
+                    excess -= other_size
+            for victim, victim_size in victims:
+                del self._residents[victim]
+                self._used -= victim_size
+                self._releasing[victim] = loop.create_future()
+            if excess > 0:
+                self._counters["over_budget"] += 1
+                log.warning(f"Loading partition {key[2]} of {key[1]} exceeds the memory budget by {excess} bytes; "
+                            f"the remaining partitions are in use")
+            self._reserved += size
+        return victims
+
+    async def _release_partitions(self, victims: list[tuple[tuple[str, str, str], int]]):
+        for i, (victim, size) in enumerate(victims):
+            try:
+                await self._release_partition(victim, size)
+            except BaseException:
+                # The victims not released yet are still loaded
+                for other, other_size in victims[i + 1:]:
+                    self._restore(other, other_size)
+                    self._releasing.pop(other).set_result(None)
+                raise
+
+    async def _release_partition(self, key: tuple[str, str, str], size: int):
+        database_name, collection_name, partition_name = key
+        future = self._releasing[key]
+        try:
+            await asyncio.to_thread(self._connect_api.client.release_partitions, collection_name=collection_name,
+                                    partition_names=[partition_name], db_name=database_name,
+                                    timeout=step_timeout(step="release_partitions"))
+            with self._lock:
+                self._counters["evictions"] += 1
+            log.info(f"Released partition {partition_name} of {collection_name}")
+        except MilvusException as e:
+            log.error(f"Failed to release partition {partition_name} of {collection_name}: {e}")
+            self._restore(key, size)
+        finally:
+            future.set_result(None)
+            self._releasing.pop(key, None)
+
+    def _restore(self, key: tuple[str, str, str], size: int):
+        """Counts a partition that could not be released again, as the next candidate for eviction."""
+        with self._lock:
+            self._residents[key] = size
+            self._residents.move_to_end(key, last=False)
+            self._used += size
+
+    async def _partition_bytes(self, key: tuple[str, str, str]) -> int:
+        database_name, collection_name, partition_name = key
+        if self._size_of is not None:
+            return int(await self._size_of(collection_name, partition_name, database_name))
+        client = self._connect_api.client
+        layout = self._layouts.get((database_name, collection_name))
+        if layout is None:
+            schema = await asyncio.to_thread(client.describe_collection, collection_name=collection_name,
+                                             db_name=database_name)
+            indexes = await asyncio.to_thread(index_params_of, client, collection_name, db_name=database_name)
+            layout = self._layouts[(database_name, collection_name)] = (schema, indexes)
+        stats = await asyncio.to_thread(client.get_partition_stats, collection_name=collection_name,
+                                        partition_name=partition_name, db_name=database_name)
+        return self._estimate(database_name, collection_name, int(stats.get("row_count", 0)))
+
+    def _estimate(self, database_name: str, collection_name: str, rows: int) -> int:
+        schema, indexes = self._layouts[(database_name, collection_name)]
+        return self._estimator.estimate(schema, rows, indexes or None).memory_bytes
+
+    # Bookkeeping
+
+    async def discard(self, collection_name: str, partition_name: str, database_name: str = "default"):
+        """Releases a resident partition and forgets it, e.g. before it is dropped.
+
+        Raises:
+            MilvusAPIError: If releasing the partition fails.
+
+        """
+        key = (database_name, collection_name, partition_name)
+        with self._lock:
+            size = self._residents.pop(key, None)
+            if size is not None:
+                self._used -= size
+        if size is None:
+            return
+        try:
+            await asyncio.to_thread(self._connect_api.client.release_partitions, collection_name=collection_name,
+                                    partition_names=[partition_name], db_name=database_name,
+                                    timeout=step_timeout(step="release_partitions"))
+        except MilvusException as e:
+            log.error(f"Failed to release partition {partition_name} of {collection_name}: {e}")
+            raise MilvusAPIError(f"Partition release failed: {e}")
+
+    async def refresh(self, collection_name: str, database_name: str = "default") -> list[str]:
+        """Registers the partitions of a collection that are loaded but not yet tracked.
+
+        Returns:
+            List[str]: The loaded partitions of the collection.
+
+        """
+        client = self._connect_api.client
+        loaded = []
+        for name in await asyncio.to_thread(client.list_partitions, collection_name=collection_name,
+                                            db_name=database_name):
+            state = await asyncio.to_thread(client.get_load_state, collection_name=collection_name,
+                                            partition_name=name, db_name=database_name)
+            if str(state.get("state")).endswith("Loaded"):
+                loaded.append(name)
+        for name in loaded:
+            key = (database_name, collection_name, name)
+            if key not in self._residents:
+                size = await self._partition_bytes(key)
+                self._restore(key, size)
+        return loaded
+
+    def _forget(self, database_name: str, collection_name: str):
+        for key in [key for key in self._residents if key[:2] == (database_name, collection_name)]:
+            self._used -= self._residents.pop(key)
+        self._layouts.pop((database_name, collection_name), None)
+
+    def update(self, event: CollectionEvent):
+        """Forgets dropped collections and grows resident partitions by inserted rows."""
+        collection = (event.database_name, event.collection_name)
+        if event.kind == DROP:
+            with self._lock:
+                self._forget(*collection)
+        elif event.kind == INSERT and collection in self._layouts:
+            key = (*collection, event.partition_name or "_default")
+            with self._lock:
+                if key in self._residents:
+                    added = self._estimate(*collection, len(event.entities))
+                    self._residents[key] += added
+                    self._used += added
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the budget, bytes used and reserved, resident partitions and counters.
+
+        ``partitions`` lists the resident partitions by database and collection.
+        """
+        with self._lock:
+            residents: dict[str, dict[str, list[str]]] = {}
+            for database_name, collection_name, partition_name in self._residents:
+                residents.setdefault(database_name, {}).setdefault(collection_name, []).append(partition_name)
+            return {"budget_bytes": self.memory_budget, "used_bytes": self._used, "reserved_bytes": self._reserved,
+                    "resident": len(self._residents), "pinned": len(self._pins), **self._counters,
+                    "partitions": residents}
+
+
 class PartitionAPI(IPartitionAPI):
     """Manages partitions within Milvus collections.
 
     Implements the IPartitionAPI interface to handle partition creation and deletion.
+    Partition loading can be handed to a ``PartitionResidencyManager``.
 
     Attributes:
         _connect_api (IConnectAPI): The connection API instance.
+        residency (PartitionResidencyManager | None): Loads and releases partitions of
+            managed collections within a memory budget, when enabled.
 
     Methods:
         create_partition: Creates a partition in a collection.
         drop_partition: Drops a partition from a collection.
+        enable_residency: Creates the partition residency manager.
+        disable_residency: Removes the partition residency manager.
 
     Example:
         ```python
@@ -42,6 +607,27 @@ class PartitionAPI(IPartitionAPI):
 
         """
         self._connect_api = connect_api
+        self.residency: PartitionResidencyManager | None = None
+
+    def enable_residency(self, memory_budget: int, estimator: CapacityEstimator | None = None,
+                         size_of: Callable[[str, str, str], Awaitable[int]] | None = None) -> PartitionResidencyManager:
+        """Creates the partition residency manager, replacing an existing one.
+
+        Args:
+            memory_budget (int): Bytes the managed partitions may use.
+            estimator (CapacityEstimator | None): Estimates partition memory.
+            size_of (Callable[[str, str, str], Awaitable[int]] | None): Custom partition sizes.
+
+        Returns:
+            PartitionResidencyManager: The manager; collections still need ``manage``.
+
+        """
+        self.residency = PartitionResidencyManager(self._connect_api, memory_budget, estimator, size_of)
+        return self.residency
+
+    def disable_residency(self):
+        """Removes the residency manager; loaded partitions stay loaded."""
+        self.residency = None
 
     @async_log_decorator
     def create_partition(self, collection_name: str, partition_name: str, database_name: str = "default"):
@@ -70,7 +656,7 @@ class PartitionAPI(IPartitionAPI):
             raise MilvusAPIError(f"Partition creation failed: {e}")
 
     @async_log_decorator
-    def drop_partition(self, collection_name: str, partition_name: str, database_name: str = "default"):
+    async def drop_partition(self, collection_name: str, partition_name: str, database_name: str = "default"):
         """Drops a partition from a collection.
 
         Args:
@@ -88,8 +674,10 @@ class PartitionAPI(IPartitionAPI):
         if not partition_name or not isinstance(partition_name, str):
             raise MilvusValidationError("Partition name must be a non-empty string")
         try:
+            if self.residency is not None:
+                await self.residency.discard(collection_name, partition_name, database_name)
             collection = Collection(collection_name, using=self._connect_api._alias, db_name=database_name)
-            collection.drop_partition(partition_name=partition_name)
+            await asyncio.to_thread(collection.drop_partition, partition_name=partition_name)
             log.info(f"Dropped partition {partition_name} from {collection_name}")
         except MilvusException as e:
             log.error(f"Failed to drop partition: {e}")
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# File: src/milvus/profiling.py
+"""Hot-Path Profiling
+
+Profiles ``MilvusAPI`` operations in a running process. A ``ProfilingSession`` installs
+itself as the call hook of ``src.milvus.tracing.traced``, so every traced facade method
+("MilvusAPI.search", "MilvusAPI.insert", ...) can be profiled without code changes:
+
+- ``duration`` limits the session to a time window; it stops and writes its files when
+  the window ends.
+- ``sample_rate`` profiles only that fraction of calls; ``operations`` only some methods.
+- The profiler is a pluggable ``ProfileHook``. ``CProfileHook`` ("cpu") records
+  deterministic CPU profiles; ``TracemallocHook`` ("memory") records where a call's
+  allocations come from.
+
+Profiles are kept per operation and written to ``output_dir`` when the session stops:
+``.prof`` files (pstats format, read by snakeviz, flameprof or gprof2dot) for CPU and
+``.folded`` files (folded stacks weighted by bytes, read by flamegraph.pl and
+speedscope) for memory, plus a ``-summary.json`` with the session counters. File names
+carry the start time and process id, so workers sharing a directory do not collide.
+
+One call is profiled at a time; calls arriving while another is profiled run
+unprofiled and are counted as "busy". Work the process runs concurrently with a
+profiled call (other requests on the event loop) lands in its profile, so profiles are
+cleanest at low concurrency or a low ``sample_rate``. Without a session, traced methods
+pay one global check.
+
+Example Usage:
+```python
+>>> api = MilvusAPI(connect_api)
+>>> api.start_profiling("cpu", output_dir="/tmp/profiles", sample_rate=0.05, duration=300)
+>>> await api.search("docs", [embedding], "vector", {"metric_type": "COSINE"}, 10)
+>>> api.stop_profiling()
+['/tmp/profiles/20240501T120000-4242-cpu-MilvusAPI.search.prof',
+ '/tmp/profiles/20240501T120000-4242-cpu-summary.json']
+```
+"""
+import cProfile
+import json
+import os
+import random
+import re
+import threading
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from src.logger import getLogger as GetLogger
+from src.milvus import tracing
+from src.milvus.exceptions import MilvusValidationError
+
+# Logging setup
+log = GetLogger(__name__)
+
+
+def _slug(operation: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", operation)
+
+
+class ProfileHook(ABC):
+    """Profiler plugged into a ProfilingSession.
+
+    ``start`` and ``stop`` bracket one sampled call and must be cheap enough to run on
+    the request path; ``dump`` writes what was collected per operation.
+
+    Attributes:
+        kind (str): Short name used in file names, e.g. "cpu".
+
+    Example:
+        ```python
+        class WallClockHook(ProfileHook):
+            kind = "wall"
+
+            def start(self, operation):
+                return time.perf_counter()
+
+            def stop(self, operation, token):
+                self.totals[operation] += time.perf_counter() - token
+
+            def dump(self, prefix):
+                ...
+        ```
+
+    """
+
+    kind = "custom"
+
+    @abstractmethod
+    def start(self, operation: str) -> Any:
+        """Starts profiling a call of ``operation``; the result is passed to ``stop``."""
+        raise NotImplementedError("The 'start' method must be implemented by subclasses.")
+
+    @abstractmethod
+    def stop(self, operation: str, token: Any):
+        """Stops profiling the call started with ``token``."""
+        raise NotImplementedError("The 'stop' method must be implemented by subclasses.")
+
+    @abstractmethod
+    def dump(self, prefix: str) -> list[str]:
+        """Writes the profiles to files starting with ``prefix`` and returns their paths."""
+        raise NotImplementedError("The 'dump' method must be implemented by subclasses.")
+
+    def close(self):
+        """Releases profiler resources when the session ends."""
+
+    def stats(self) -> dict[str, Any]:
+        """Returns per-operation figures for ``ProfilingSession.stats``."""
+        return {}
+
+
+class CProfileHook(ProfileHook):
+    """Deterministic CPU profiles, one accumulated ``cProfile.Profile`` per operation."""
+
+    kind = "cpu"
+
+    def __init__(self):
+        self._profiles: dict[str, cProfile.Profile] = {}
+
+    def start(self, operation: str) -> cProfile.Profile:
+        profile = self._profiles.get(operation)
+        if profile is None:
+            profile = self._profiles[operation] = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def stop(self, operation: str, token: cProfile.Profile):
+        token.disable()
+
+    def dump(self, prefix: str) -> list[str]:
+        paths = []
+        for operation, profile in self._profiles.items():
+            path = f"{prefix}-{_slug(operation)}.prof"
+            profile.dump_stats(path)
+            paths.append(path)
+        return paths
+
+
+class TracemallocHook(ProfileHook):
+    """Allocation profiles: bytes a call leaves allocated, per allocating stack.
+
+    Each sampled call is bracketed by two tracemalloc snapshots; the growth per
+    traceback is added to the operation's folded stacks. Tracing starts with the first
+    sampled call (if not already on) and stops with the session.
+
+    Attributes:
+        frames (int): Stack depth recorded per allocation.
+
+    """
+
+    kind = "memory"
+
+    def __init__(self, frames: int = 25):
+        self.frames = frames
+        self._started = False
+        self._stacks: dict[str, Counter] = {}
+        self._totals: dict[str, dict[str, int]] = {}
+        self._filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def start(self, operation: str) -> tuple[tracemalloc.Snapshot, int]:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        tracemalloc.reset_peak()
+        return self._snapshot(), tracemalloc.get_traced_memory()[0]
+
+    def stop(self, operation: str, token: tuple[tracemalloc.Snapshot, int]):
+        before, traced = token
+        current, peak = tracemalloc.get_traced_memory()
+        stacks = self._stacks.setdefault(operation, Counter())
+        for diff in self._snapshot().compare_to(before, "traceback"):
+            if diff.size_diff > 0:
+                stacks[";".join(f"{frame.filename}:{frame.lineno}" for frame in diff.traceback)] += diff.size_diff
+        totals = self._totals.setdefault(operation, {"net_bytes": 0, "peak_bytes": 0})
+        totals["net_bytes"] += current - traced
+        totals["peak_bytes"] = max(totals["peak_bytes"], peak - traced)
+
+    def dump(self, prefix: str) -> list[str]:
+        paths = []
+        for operation, stacks in self._stacks.items():
+            path = f"{prefix}-{_slug(operation)}.folded"
+            with open(path, "w") as f:
+                f.writelines(f"{stack} {size}\n" for stack, size in stacks.most_common())
+            paths.append(path)
+        return paths
+
+    def close(self):
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def stats(self) -> dict[str, Any]:
+        return {operation: dict(totals) for operation, totals in self._totals.items()}
+
+
+HOOKS: dict[str, type[ProfileHook]] = {"cpu": CProfileHook, "memory": TracemallocHook}
+
+
+class ProfilingSession:
+    """Profiles sampled traced calls for a time window and writes the profiles to files.
+
+    Attributes:
+        hook (ProfileHook): The profiler.
+        output_dir (str): Directory the files are written to.
+        sample_rate (float): Fraction of calls profiled.
+        duration (float | None): Seconds until the session stops itself; None runs until
+            ``stop``.
+        operations (Set[str] | None): Operation names profiled; None profiles all.
+        files (List[str]): Files written by ``stop``.
+
+    Methods:
+        stop: Ends the session and writes its files.
+        stats: Call, sample and skip counters.
+
+    Example:
+        ```python
+        session = ProfilingSession(TracemallocHook(), "/tmp/profiles", duration=60)
+        session.install()
+        ...
+        session.stop()
+        ```
+
+    """
+
+    def __init__(self, hook: ProfileHook, output_dir: str = "profiles", sample_rate: float = 1.0,
+                 duration: float | None = None, operations: list[str] | None = None):
+        if not 0.0 < sample_rate <= 1.0:
+            raise MilvusValidationError(f"sample_rate must be in (0, 1], got {sample_rate}")
+        if duration is not None and duration <= 0:
+            raise MilvusValidationError(f"duration must be positive, got {duration}")
+        self.hook = hook
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.duration = duration
+        self.operations = set(operations) if operations else None
+        self.files: list[str] = []
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._expires = None if duration is None else time.monotonic() + duration
+        self._prefix = f"{time.strftime('%Y%m%dT%H%M%S', time.localtime(self._started))}-{os.getpid()}-{hook.kind}"
+        self._running = False
+        self._closed = False
+        self._dumped = False
+        self._timer: threading.Timer | None = None
+        self._counters = dict.fromkeys(("calls", "sampled", "skipped", "busy"), 0)
+        self._sampled: Counter = Counter()
+
+    def install(self) -> 'ProfilingSession':
+        """Makes this session the call hook of traced methods and starts its window."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        tracing.set_call_hook(self)
+        if self.duration is not None:
+            self._timer = threading.Timer(self.duration, self.stop)
+            self._timer.daemon = True
+            self._timer.start()
+        log.info(f"Profiling ({self.hook.kind}) started: sample_rate={self.sample_rate}, "
+                 f"duration={self.duration}, output_dir={self.output_dir}")
+        return self
+
+    def __call__(self, operation: str) -> Any:
+        """Call hook: returns a context manager profiling this call, or the no-op span."""
+        if self._expires is not None and time.monotonic() >= self._expires:
+            self.stop()
+            return tracing.NOOP_SPAN
+        if self.operations is not None and operation not in self.operations:
+            return tracing.NOOP_SPAN
+        with self._lock:
+            self._counters["calls"] += 1
+            if self._closed or (self.sample_rate < 1.0 and random.random() >= self.sample_rate):
+                self._counters["skipped"] += 1
+                return tracing.NOOP_SPAN
+            if self._running:
+                self._counters["busy"] += 1
+                return tracing.NOOP_SPAN
+            self._running = True
+            self._counters["sampled"] += 1
+            self._sampled[operation] += 1
+        return self._profile(operation)
+
+    @contextmanager
+    def _profile(self, operation: str) -> Iterator[None]:
+        try:
+            token = self.hook.start(operation)
+        except Exception as e:
+            # e.g. another profiler already owns the interpreter's profiling slot
+            log.warning(f"Profiling {operation} skipped: {e}")
+            self._finish()
+            yield
+            return
+        try:
+            yield
+        finally:
+            try:
+                self.hook.stop(operation, token)
+            except Exception as e:
+                log.warning(f"Profiling {operation} failed: {e}")
+            self._finish()
+
+    def _finish(self):
+        with self._lock:
+            self._running = False
+            closed = self._closed
+        if closed:
+            self._dump()
+
+    def stop(self) -> list[str]:
+        """Ends the session and writes its files.
+
+        A call being profiled is finished first: its files are then written when it
+        returns, and this method returns an empty list.
+
+        Returns:
+            List[str]: Paths of the files written.
+
+        """
+        with self._lock:
+            already, self._closed = self._closed, True
+            running = self._running
+        if not already:
+            tracing.set_call_hook(None, only=self)
+            if self._timer is not None:
+                self._timer.cancel()
+            log.info(f"Profiling ({self.hook.kind}) stopped after {time.time() - self._started:.1f}s")
+        if running:
+            return []
+        return self._dump()
+
+    def _dump(self) -> list[str]:
+        with self._lock:
+            if self._dumped:
+                return self.files
+            self._dumped = True
+        prefix = os.path.join(self.output_dir, self._prefix)
+        try:
+            files = self.hook.dump(prefix)
+            summary = f"{prefix}-summary.json"
+            with open(summary, "w") as f:
+                json.dump({**self.stats(), "files": files}, f, indent=2)
+            self.files = [*files, summary]
+            log.info(f"Profiling ({self.hook.kind}) wrote {len(self.files)} files to {self.output_dir}")
+        except OSError as e:
+            log.error(f"Writing profiles to {self.output_dir} failed: {e}")
+        finally:
+            self.hook.close()
+        return self.files
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the session settings, counters and per-operation figures."""
+        with self._lock:
+            counters, sampled, active = dict(self._counters), dict(self._sampled), not self._closed
+        remaining = None if self._expires is None or not active else max(0.0, self._expires - time.monotonic())
+        hook_stats = self.hook.stats()
+        return {"kind": self.hook.kind, "active": active, "sample_rate": self.sample_rate,
+                "started": self._started, "remaining_s": remaining, **counters,
+                "operations": {operation: {"sampled": count, **hook_stats.get(operation, {})}
+                               for operation, count in sampled.items()},
+                "files": list(self.files)}
+
+
+_session: ProfilingSession | None = None
+_session_lock = threading.Lock()
+
+
+def start_profiling(kind: str = "cpu", output_dir: str = "profiles", sample_rate: float = 1.0,
+                    duration: float | None = None, operations: list[str] | None = None,
+                    hook: ProfileHook | None = None) -> ProfilingSession:
+    """Starts a profiling session, stopping the previous one.
+
+    Args:
+        kind (str): "cpu" or "memory"; ignored when ``hook`` is given. Defaults to "cpu".
+        output_dir (str): Directory of the profile files. Defaults to "profiles".
+        sample_rate (float): Fraction of calls profiled. Defaults to 1.0.
+        duration (Optional[float]): Seconds until the session stops itself. Defaults to None.
+        operations (Optional[List[str]]): Operations profiled, e.g. ["MilvusAPI.search"].
+            Defaults to all.
+        hook (Optional[ProfileHook]): Custom profiler. Defaults to None.
+
+    Returns:
+        ProfilingSession: The running session.
+
+    Raises:
+        MilvusValidationError: If ``kind``, ``sample_rate`` or ``duration`` is invalid.
+
+    """
+    global _session
+    if hook is None:
+        if kind not in HOOKS:
+            raise MilvusValidationError(f"Unknown profiling kind {kind!r}; expected one of {sorted(HOOKS)}")
+        hook = HOOKS[kind]()
+    session = ProfilingSession(hook, output_dir, sample_rate, duration, operations)
+    with _session_lock:
+        previous, _session = _session, session
+    if previous is not None:
+        previous.stop()
+    return session.install()
+
+
+def stop_profiling() -> list[str]:
+    """Stops the current session and returns the files it wrote (empty without one)."""
+    session = _session
+    return session.stop() if session is not None else []
+
+
+def get_profiling_session() -> ProfilingSession | None:
+    """Returns the current session, which may have stopped at the end of its window."""
+    return _session
@@ -1,3 +1,315 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from typing import Any
+
+from pymilvus import MilvusException
+
+from src.logger import getLogger as GetLogger
+from src.milvus.deadline import step_timeout, within
+from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
+from src.milvus.interfaces import IConnectAPI, IQueryAPI
+from src.milvus.tracing import span
+from src.utils import async_log_decorator
+
+# Logging setup
+log = GetLogger(__name__)
+
+# Largest page the Milvus iterators accept
+MAX_PAGE_SIZE = 16384
+
+
+class QueryAPI(IQueryAPI):
+    """Runs scalar queries and streams large query/search results page by page.
+
+    Implements the IQueryAPI interface. The iterators wrap the server-side Milvus
+    iterators: a background task fetches up to ``prefetch`` pages ahead of the
+    consumer, so network time overlaps with processing while the number of pages held
+    in memory stays bounded by ``prefetch``, however many entities are scanned.
+
+    Attributes:
+        _connect_api (IConnectAPI): The connection API instance.
+        page_size (int): Default number of entities per page.
+        prefetch (int): Default number of pages fetched ahead of the consumer.
+
+    Methods:
+        query: Retrieves entities matching a filter expression.
+        query_iterator: Streams query results in pages.
+        search_iterator: Streams search results in pages.
+
+    Example:
+        ```python
+        connect_api = ConnectAPI()
+        api = QueryAPI(connect_api, page_size=5000)
+        async for page in api.query_iterator("test_collection", "id > 0", ["id"]):
+            process(page)
+        ```
+
+    Raises:
+        MilvusAPIError: If query operations fail.
+        MilvusValidationError: If input parameters are invalid.
+
+    """
+
+    def __init__(self, connect_api: IConnectAPI, page_size: int = 1000, prefetch: int = 1):
+        """Initializes QueryAPI with a connection instance.
+
+        Args:
+            connect_api (IConnectAPI): The connection API instance for Milvus operations.
+            page_size (int): Default number of entities per page. Defaults to 1000.
+            prefetch (int): Default number of pages fetched ahead. Defaults to 1.
+
+        """
+        self._connect_api = connect_api
+        self.page_size = self._validate_page_size(page_size)
+        self.prefetch = self._validate_prefetch(prefetch)
+
+    @staticmethod
+    def _validate_page_size(page_size: int) -> int:
+        if not isinstance(page_size, int) or not 0 < page_size <= MAX_PAGE_SIZE:
+            raise MilvusValidationError(f"Page size must be an integer between 1 and {MAX_PAGE_SIZE}")
+        return page_size
+
+    @staticmethod
+    def _validate_prefetch(prefetch: int) -> int:
+        if not isinstance(prefetch, int) or prefetch < 0:
+            raise MilvusValidationError("Prefetch must be a non-negative integer")
+        return prefetch
+
+    @async_log_decorator
+    async def query(self, collection_name: str, expr: str = "",
+                    output_fields: list[str] | None = None,
+                    partition_names: list[str] | None = None,
+                    database_name: str = "default",
+                    limit: int | None = None, offset: int | None = None, **kwargs) -> list[dict]:
+        """Retrieves entities matching a filter expression.
+
+        Args:
+            collection_name (str): Name of the collection.
+            expr (str): Filter expression. Defaults to "".
+            output_fields (Optional[List[str]]): Fields to return. Defaults to all scalar fields.
+            partition_names (Optional[List[str]]): Partitions to query. Defaults to None.
+            database_name (str): Database name. Defaults to "default".
+            limit (Optional[int]): Maximum number of entities. Defaults to None.
+            offset (Optional[int]): Number of entities to skip. Defaults to None.
+            **kwargs: Additional query arguments.
+
+        Returns:
+            List[Dict]: Matching entities.
+
+        Raises:
+            MilvusValidationError: If inputs are invalid.
+            MilvusAPIError: If the query fails.
+
+        """
+        if not collection_name or not isinstance(collection_name, str):
+            raise MilvusValidationError("Collection name must be a non-empty string")
+        if not expr and limit is None:
+            raise MilvusValidationError("Query needs a filter expression or a limit; use query_iterator for full scans")
+        if limit is not None:
+            kwargs["limit"] = limit
+        if offset is not None:
+            kwargs["offset"] = offset
+        try:
+            timeout = step_timeout(kwargs.get("timeout"), step="query")
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+            with span("query.rpc", limit=limit) as step:
+                results = await within(asyncio.to_thread(
+                    self._connect_api.client.query,
+                    collection_name=collection_name,
+                    filter=expr,
+                    output_fields=output_fields,
+                    partition_names=partition_names,
+                    db_name=database_name,
+                    **kwargs
+                ), "query")
+                step.set_attribute("rows", len(results))
+            log.info(f"Queried {len(results)} entities from {collection_name}")
+            return results
+        except MilvusException as e:
+            log.error(f"Failed to query: {e}")
+            raise MilvusAPIError(f"Query failed: {e}")
+
+    async def query_iterator(self, collection_name: str, expr: str = "",
+                             output_fields: list[str] | None = None,
+                             partition_names: list[str] | None = None,
+                             page_size: int | None = None,
+                             limit: int | None = None,
+                             prefetch: int | None = None,
+                             database_name: str = "default", **kwargs) -> AsyncIterator[list[dict]]:
+        """Streams entities matching a filter expression in pages.
+
+        Args:
+            collection_name (str): Name of the collection.
+            expr (str): Filter expression. Defaults to "" (all entities).
+            output_fields (Optional[List[str]]): Fields to return. Defaults to None.
+            partition_names (Optional[List[str]]): Partitions to query. Defaults to None.
+            page_size (Optional[int]): Entities per page. Defaults to ``self.page_size``.
+            limit (Optional[int]): Maximum total number of entities. Defaults to unlimited.
+            prefetch (Optional[int]): Pages fetched ahead. Defaults to ``self.prefetch``.
+            database_name (str): Database name. Defaults to "default".
+            **kwargs: Additional iterator arguments.
+
+        Yields:
+            List[Dict]: A page of entities.
+
+        Raises:
+            MilvusValidationError: If inputs are invalid.
+            MilvusAPIError: If the query fails.
+
+        """
+        if not collection_name or not isinstance(collection_name, str):
+            raise MilvusValidationError("Collection name must be a non-empty string")
+        page_size = self._validate_page_size(page_size or self.page_size)
+        if limit is not None:
+            kwargs["limit"] = limit
+
+        def open_iterator():
+            return self._connect_api.client.query_iterator(
+                collection_name=collection_name,
+                batch_size=page_size,
+                filter=expr,
+                output_fields=output_fields,
+                partition_names=partition_names,
+                db_name=database_name,
+                **kwargs
+            )
+
+        async with aclosing(self._paginate(open_iterator, prefetch, f"query on {collection_name}")) as pages:
+            async for page in pages:
+                yield page
+
+    async def search_iterator(self, collection_name: str, data: list[list[float]], anns_field: str,
+                              param: dict[str, Any] | None = None,
+                              page_size: int | None = None,
+                              expr: str | None = None,
+                              output_fields: list[str] | None = None,
+                              partition_names: list[str] | None = None,
+                              limit: int | None = None,
+                              prefetch: int | None = None,
+                              database_name: str = "default", **kwargs) -> AsyncIterator[list[dict]]:
+        """Streams search hits for one query vector in pages of increasing distance.
+
+        Args:
+            collection_name (str): Name of the collection.
+            data (List[List[float]]): A single query vector, as a one-element list.
+            anns_field (str): Field to search against.
+            param (Optional[Dict[str, Any]]): Search parameters. Defaults to None.
+            page_size (Optional[int]): Hits per page. Defaults to ``self.page_size``.
+            expr (Optional[str]): Filter expression. Defaults to None.
+            output_fields (Optional[List[str]]): Fields to return. Defaults to None.
+            partition_names (Optional[List[str]]): Partitions to search. Defaults to None.
+            limit (Optional[int]): Maximum total number of hits. Defaults to unlimited.
+            prefetch (Optional[int]): Pages fetched ahead. Defaults to ``self.prefetch``.
+            database_name (str): Database name. Defaults to "default".
+            **kwargs: Additional iterator arguments.
+
+        Yields:
+            List[Dict]: A page of hits.
+
+        Raises:
+            MilvusValidationError: If inputs are invalid.
+            MilvusAPIError: If the search fails.
+
+        """
+        if not collection_name or not isinstance(collection_name, str):
+            raise MilvusValidationError("Collection name must be a non-empty string")
+        if data is None or len(data) != 1:
+            raise MilvusValidationError("Search iterator takes exactly one query vector")
+        if not anns_field or not isinstance(anns_field, str):
+            raise MilvusValidationError("ANNS field must be a non-empty string")
+        page_size = self._validate_page_size(page_size or self.page_size)
+        if limit is not None:
+            kwargs["limit"] = limit
+
+        def open_iterator():
+            return self._connect_api.client.search_iterator(
+                collection_name=collection_name,
+                data=data,
+                batch_size=page_size,
+                filter=expr,
+                output_fields=output_fields,
+                search_params=param,
+                partition_names=partition_names,
+                anns_field=anns_field,
+                db_name=database_name,
+                **kwargs
+            )
+
+        async with aclosing(self._paginate(open_iterator, prefetch, f"search on {collection_name}")) as pages:
+            async for page in pages:
+                yield page
+
+    async def _paginate(self, open_iterator: Callable[[], Any], prefetch: int | None,
+                        description: str) -> AsyncIterator[list[dict]]:
+        """Drives a blocking Milvus iterator from a background task with bounded read-ahead.
+
+        Args:
+            open_iterator (Callable[[], Any]): Creates the Milvus iterator.
+            prefetch (Optional[int]): Pages fetched ahead. Defaults to ``self.prefetch``.
+            description (str): Operation description for logs and errors.
+
+        Yields:
+            List[Dict]: Pages until the iterator is exhausted.
+
+        """
+        prefetch = self._validate_prefetch(self.prefetch if prefetch is None else prefetch)
+        try:
+            iterator = await asyncio.to_thread(open_iterator)
+        except MilvusException as e:
+            log.error(f"Failed to open iterator for {description}: {e}")
+            raise MilvusAPIError(f"Iterator for {description} failed: {e}")
+
+        pages: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+        fetching: asyncio.Future | None = None
+
+        def fetch() -> asyncio.Future:
+            # Cancelling the caller must not abandon next() in its thread
+            nonlocal fetching
+            fetching = asyncio.ensure_future(asyncio.to_thread(iterator.next))
+            return asyncio.shield(fetching)
+
+        async def produce():
+            try:
+                while True:
+                    page = await fetch()
+                    await pages.put(page)
+                    if not page:
+                        return
+            except Exception as e:  # handed over to the consumer
+                await pages.put(e)
+
+        # Without read-ahead the consumer fetches each page itself
+        producer = asyncio.create_task(produce()) if prefetch else None
+        total = 0
+        try:
+            while True:
+                try:
+                    page = await pages.get() if producer else await fetch()
+                except Exception as e:
+                    page = e
+                if isinstance(page, MilvusException):
+                    log.error(f"Failed to fetch page for {description}: {page}")
+                    raise MilvusAPIError(f"Iterator for {description} failed: {page}")
+                if isinstance(page, Exception):
+                    raise page
+                if not page:
+                    break
+                total += len(page)
+                yield list(page)
+        finally:
+            if producer is not None:
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+            if fetching is not None:
+                # The iterator is not thread-safe: let an in-flight next() finish before closing
+                await asyncio.gather(fetching, return_exceptions=True)
+            await asyncio.to_thread(iterator.close)
+            log.info(f"Streamed {total} entities for {description}")
 
 
 class QueryInterpreter:
@@ -30,4 +342,3 @@ class QueryInterpreter:
 
         """
         return {"expr": expression}
-
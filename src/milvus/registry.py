@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# File: src/milvus/registry.py
+"""Connection Registry
+
+``ConnectAPI``, ``MilvusAPI`` and ``AsyncMilvusClientWrapper`` are plain classes, so one
+process can hold facades for several clusters, databases and users. ``ConnectionRegistry``
+hands them out per ``ConnectionKey`` (uri, database, user):
+
+- ``acquire`` returns the MilvusAPI facade of a key, connecting it on first use. Callers
+  asking for the same key share one facade; other keys get independent ones.
+- ``release`` drops a reference; the facade is disconnected when the last one goes.
+- ``lease`` does both around a ``with`` block.
+
+Facades of the same cluster share gRPC channels: pymilvus pools them per address and
+token, so a second database or user on a cluster adds no connection. Facades of the same
+``memory://`` URI share one in-memory deployment, as separate clusters would.
+
+Example Usage:
+```python
+>>> from src.milvus.registry import ConnectionRegistry
+>>> registry = ConnectionRegistry.default()
+>>> with registry.lease("http://primary:19530", db_name="tenant_a", user="svc") as primary, \\
+...         registry.lease("http://dr:19530", db_name="tenant_a", user="svc") as dr:
+...     await primary.search("docs", [embedding], "vector", {"metric_type": "COSINE"}, 10)
+>>> registry.stats()
+```
+"""
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+from src.logger import getLogger as GetLogger
+from src.milvus.connect import ConnectAPI
+from src.milvus.memory import MEMORY_URI_SCHEME, InMemoryMilvusClient
+from src.milvus.milvus import MilvusAPI
+
+# Logging setup
+log = GetLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConnectionKey:
+    """Identity of a facade: cluster URI, database and user."""
+
+    uri: str
+    db_name: str = ""
+    user: str = ""
+
+    def __str__(self) -> str:
+        return f"{self.user + '@' if self.user else ''}{self.uri}/{self.db_name or 'default'}"
+
+
+@dataclass
+class _Entry:
+    key: ConnectionKey
+    options: dict[str, Any]
+    connect_api: ConnectAPI | None = None
+    api: MilvusAPI | None = None
+    refs: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ConnectionRegistry:
+    """Lazily built, reference-counted MilvusAPI facades keyed by (uri, database, user).
+
+    Methods:
+        acquire: Returns the facade of a key, connecting it on first use.
+        release: Drops a reference, disconnecting the facade with the last one.
+        lease: Acquires a facade for the duration of a ``with`` block.
+        stats: References and state of each facade.
+        close_all: Disconnects every facade.
+        default: The process-wide registry.
+
+    Example:
+        ```python
+        registry = ConnectionRegistry()
+        api = registry.acquire("http://localhost:19530", db_name="tenant_a", password="...")
+        try:
+            await api.search("docs", [embedding], "vector", {"metric_type": "COSINE"}, 10)
+        finally:
+            registry.release(api)
+        ```
+
+    Raises:
+        MilvusAPIError: If connecting a facade fails.
+
+    """
+
+    _default: ClassVar['ConnectionRegistry | None'] = None
+    _default_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[ConnectionKey, _Entry] = {}
+        self._by_api: dict[int, _Entry] = {}
+        # Root client of each memory:// URI, shared by all facades of that URI
+        self._memory: dict[str, InMemoryMilvusClient] = {}
+
+    @classmethod
+    def default(cls) -> 'ConnectionRegistry':
+        """Returns the process-wide registry, creating it on first use."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def acquire(self, uri: str, db_name: str = "", user: str = "", **options: Any) -> MilvusAPI:
+        """Returns the MilvusAPI facade of (uri, db_name, user), connecting it on first use.
+
+        Args:
+            uri (str): Milvus server URI.
+            db_name (str): Database name. Defaults to "".
+            user (str): Username. Defaults to "".
+            **options: Further ConnectAPI arguments (password, token, timeout, ...), used
+                when the facade is built.
+
+        Returns:
+            MilvusAPI: The facade of the key; release it with ``release``.
+
+        Raises:
+            MilvusAPIError: If connecting fails.
+
+        """
+        key = ConnectionKey(uri, db_name, user)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(key, options)
+            entry.refs += 1
+        try:
+            with entry.lock:
+                if entry.api is None:
+                    self._build(entry)
+        except Exception:
+            self._drop(entry)
+            raise
+        return entry.api
+
+    def _build(self, entry: _Entry):
+        key = entry.key
+        options = dict(entry.options)
+        if key.uri.startswith(MEMORY_URI_SCHEME):
+            with self._lock:
+                root = self._memory.get(key.uri)
+                if root is None:
+                    root = self._memory[key.uri] = InMemoryMilvusClient(uri=key.uri)
+            options["shared"] = root
+        connect_api = ConnectAPI(uri=key.uri, db_name=key.db_name, user=key.user, **options)
+        connect_api.__enter__()
+        entry.connect_api = connect_api
+        entry.api = MilvusAPI(connect_api)
+        with self._lock:
+            self._by_api[id(entry.api)] = entry
+        log.info(f"Connection registry: connected {key}")
+
+    def release(self, api: MilvusAPI):
+        """Drops a reference to a facade; the last one disconnects it.
+
+        Facades unknown to the registry, e.g. already closed by ``close_all``, are ignored.
+        """
+        with self._lock:
+            entry = self._by_api.get(id(api))
+        if entry is None or entry.api is not api:
+            log.warning("Connection registry: released a facade it does not hold")
+            return
+        self._drop(entry)
+
+    def _drop(self, entry: _Entry):
+        with self._lock:
+            entry.refs -= 1
+            if entry.refs > 0:
+                return
+            self._entries.pop(entry.key, None)
+            if entry.api is not None:
+                self._by_api.pop(id(entry.api), None)
+            if not any(key.uri == entry.key.uri for key in self._entries):
+                self._memory.pop(entry.key.uri, None)
+        # Disconnect outside the registry lock; a concurrent acquire builds a new facade
+        with entry.lock:
+            if entry.connect_api is not None:
+                entry.connect_api.__exit__(None, None, None)
+                log.info(f"Connection registry: disconnected {entry.key}")
+            entry.connect_api = entry.api = None
+
+    @contextmanager
+    def lease(self, uri: str, db_name: str = "", user: str = "", **options: Any) -> Iterator[MilvusAPI]:
+        """Acquires the facade of (uri, db_name, user) for the enclosed block."""
+        api = self.acquire(uri, db_name, user, **options)
+        try:
+            yield api
+        finally:
+            self.release(api)
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Returns the key, reference count and connection state of each facade."""
+        with self._lock:
+            entries = list(self._entries.values())
+        return [{"uri": e.key.uri, "db_name": e.key.db_name, "user": e.key.user, "refs": e.refs,
+                 "connected": e.api is not None} for e in entries]
+
+    def close_all(self):
+        """Disconnects every facade regardless of outstanding references."""
+        with self._lock:
+            entries = list(self._entries.values())
+            for entry in entries:
+                entry.refs = 1
+        for entry in entries:
+            self._drop(entry)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# File: src/milvus/resilience.py
+"""Circuit Breakers and Retry Budget
+
+During a partial outage every call to a failing endpoint waits for its full timeout
+and callers pile up. ``CircuitBreaker`` fails fast instead: after ``failure_threshold``
+consecutive backend failures it opens and rejects calls for ``recovery_timeout``
+seconds, then half-opens and lets ``half_open_max_calls`` real calls through as probes;
+their successes close it again, a failure re-opens it.
+
+``CircuitBreakers`` holds one breaker per (endpoint, operation), so a failing search
+path does not block inserts or other proxies. ``RetryBudget`` bounds retries across the
+whole process to a fraction of the request rate, so failovers cannot multiply load
+during an outage. Both are used by ``EndpointPool`` (see ``src.milvus.endpoints``) and
+report their state through ``metrics()``.
+
+Only backend failures count against a breaker (``is_backend_failure``): service,
+replica, channel, segment and node errors, and unavailable endpoints. Request errors
+such as unknown collections or invalid parameters mean the backend answered.
+
+Example Usage:
+```python
+>>> from src.milvus.connect import ConnectAPI
+>>> from src.milvus.resilience import CircuitBreakers, RetryBudget
+>>> with ConnectAPI(uri=["http://proxy-1:19530", "http://proxy-2:19530"],
+...                 circuit_breakers=CircuitBreakers(failure_threshold=5, recovery_timeout=30),
+...                 retry_budget=RetryBudget(ratio=0.1)) as connect_api:
+...     connect_api.client.resilience_metrics()
+```
+"""
+import threading
+import time
+from typing import Any
+
+from pymilvus import MilvusException, MilvusUnavailableException
+
+from src.logger import getLogger as GetLogger
+from src.milvus.exceptions import MilvusValidationError
+
+# Logging setup
+log = GetLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Milvus error code ranges that indicate an unhealthy backend rather than a bad request
+_BACKEND_ERROR_CODES = (range(1, 100), range(400, 700), range(900, 1000))
+
+
+class CircuitOpenError(MilvusUnavailableException):
+    """Raised without contacting the backend while the circuit of an operation is open."""
+
+
+def is_backend_failure(error: Exception) -> bool:
+    """Returns whether an error means the backend is unhealthy (not that the request was bad)."""
+    if isinstance(error, MilvusUnavailableException):
+        return True
+    if not isinstance(error, MilvusException):
+        return True
+    return any(error.code in codes for codes in _BACKEND_ERROR_CODES)
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker.
+
+    Attributes:
+        name (str): Label used in logs and metrics.
+        failure_threshold (int): Consecutive failures that open the circuit.
+        recovery_timeout (float): Seconds the circuit stays open before probing.
+        half_open_max_calls (int): Probe calls admitted, and successes needed, to close.
+        state (str): "closed", "open" or "half_open".
+
+    Methods:
+        allow: Admits or rejects a call.
+        record_success: Accounts a call that reached a healthy backend.
+        record_failure: Accounts a backend failure.
+        metrics: State and counters.
+
+    Example:
+        ```python
+        breaker = CircuitBreaker("search@proxy-1", failure_threshold=3)
+        if breaker.allow():
+            try:
+                result = call()
+                breaker.record_success()
+            except MilvusException:
+                breaker.record_failure()
+                raise
+        ```
+
+    Raises:
+        MilvusValidationError: If parameters are invalid.
+
+    """
+
+    def __init__(self, name: str = "", failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1):
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise MilvusValidationError("failure_threshold and half_open_max_calls must be positive")
+        if recovery_timeout < 0:
+            raise MilvusValidationError("recovery_timeout must not be negative")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._counters = dict.fromkeys(("calls", "successes", "failures", "rejections", "opened"), 0)
+
+    def _transition(self, state: str):
+        if state != self.state:
+            log.warning(f"Circuit {self.name} {self.state} -> {state}")
+            self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self._counters["opened"] += 1
+        self._probes = self._probe_successes = 0
+
+    def allow(self) -> bool:
+        """Returns True if a call may go to the backend now."""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self._transition(HALF_OPEN)
+            if self.state == CLOSED or (self.state == HALF_OPEN and self._probes < self.half_open_max_calls):
+                if self.state == HALF_OPEN:
+                    self._probes += 1
+                self._counters["calls"] += 1
+                return True
+            self._counters["rejections"] += 1
+            return False
+
+    def record_success(self):
+        """Accounts a call answered by the backend; enough half-open successes close the circuit."""
+        with self._lock:
+            self._counters["successes"] += 1
+            self._consecutive_failures = 0
+            if self.state == HALF_OPEN:
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._transition(CLOSED)
+
+    def record_failure(self):
+        """Accounts a backend failure; opens the circuit at the threshold or on a failed probe."""
+        with self._lock:
+            self._counters["failures"] += 1
+            self._consecutive_failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED
+                                           and self._consecutive_failures >= self.failure_threshold):
+                self._transition(OPEN)
+
+    def metrics(self) -> dict[str, Any]:
+        """Returns the state, consecutive failures and call counters."""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self._transition(HALF_OPEN)
+            return {"name": self.name, "state": self.state, "consecutive_failures": self._consecutive_failures,
+                    **self._counters}
+
+
+class CircuitBreakers:
+    """One CircuitBreaker per (endpoint, operation), created on first use.
+
+    Attributes:
+        failure_threshold (int): Threshold of new breakers.
+        recovery_timeout (float): Open duration of new breakers in seconds.
+        half_open_max_calls (int): Half-open probes of new breakers.
+
+    Methods:
+        get: Returns the breaker of an endpoint operation.
+        metrics: States of all breakers.
+
+    Raises:
+        MilvusValidationError: If parameters are invalid.
+
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1):
+        if failure_threshold < 1 or half_open_max_calls < 1 or recovery_timeout < 0:
+            raise MilvusValidationError("Invalid circuit breaker parameters")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._lock = threading.Lock()
+        self._breakers: dict[tuple[str, str], CircuitBreaker] = {}
+
+    def get(self, endpoint: str, operation: str) -> CircuitBreaker:
+        """Returns (creating if needed) the breaker of an operation on an endpoint."""
+        key = (endpoint, operation)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(f"{operation}@{endpoint}", self.failure_threshold,
+                                                               self.recovery_timeout, self.half_open_max_calls)
+            return breaker
+
+    def metrics(self) -> list[dict[str, Any]]:
+        """Returns the metrics of every breaker with its endpoint and operation."""
+        with self._lock:
+            items = list(self._breakers.items())
+        return [{"endpoint": endpoint, "operation": operation, **breaker.metrics()}
+                for (endpoint, operation), breaker in items]
+
+
+class RetryBudget:
+    """Process-wide token bucket that caps retries at a fraction of requests.
+
+    Every request deposits ``ratio`` tokens and every retry spends one. A floor of
+    ``min_per_second`` tokens per second keeps retries possible at low traffic; the
+    balance never exceeds ``capacity``.
+
+    Attributes:
+        ratio (float): Retries allowed per request.
+        min_per_second (float): Retries always allowed per second.
+        capacity (float): Maximum balance of tokens.
+
+    Methods:
+        record_request: Deposits the share of a request.
+        try_spend: Withdraws a token for a retry if available.
+        metrics: Balance and counters.
+
+    Raises:
+        MilvusValidationError: If parameters are invalid.
+
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 1.0, capacity: float = 100.0):
+        if ratio < 0 or min_per_second < 0 or capacity <= 0:
+            raise MilvusValidationError("Retry budget parameters must be positive")
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._tokens = min(capacity, max(min_per_second, 1.0))
+        self._updated = time.monotonic()
+        self._counters = dict.fromkeys(("requests", "retries", "exhausted"), 0)
+
+    def _refill(self, amount: float):
+        now = time.monotonic()
+        amount += (now - self._updated) * self.min_per_second
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+    def record_request(self):
+        """Deposits ``ratio`` tokens for a first attempt."""
+        with self._lock:
+            self._counters["requests"] += 1
+            self._refill(self.ratio)
+
+    def try_spend(self) -> bool:
+        """Returns True and spends a token if a retry is allowed."""
+        with self._lock:
+            self._refill(0.0)
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._counters["retries"] += 1
+                return True
+            self._counters["exhausted"] += 1
+            return False
+
+    def metrics(self) -> dict[str, float]:
+        """Returns the token balance and request, retry and exhaustion counters."""
+        with self._lock:
+            self._refill(0.0)
+            return {"tokens": self._tokens, **self._counters}
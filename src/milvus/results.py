@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# File: src/milvus/results.py
+"""Columnar Search Results
+
+Compact representation of Milvus search results for ``nq`` query vectors and ``k``
+hits per query. Primary keys and distances are held as ``(nq, k)`` NumPy arrays and
+output fields as ``(nq, k)`` columns, so client-side scoring, merging and reranking
+are vectorized. Per-hit dictionaries are only built when a row is accessed.
+
+Queries that returned fewer than ``k`` hits are padded: ``ids`` with ``-1`` (or
+``None`` for string keys), ``distances`` with ``NaN``; ``counts`` holds the number of
+real hits per query and ``mask`` marks them.
+
+Example Usage:
+```python
+>>> result = await api.search("docs", vectors, "vector", {"metric_type": "COSINE"}, 10, compact=True)
+>>> result.ids.shape
+(32, 10)
+>>> best = result.distances.max(axis=1)
+>>> result[0][0]
+{'id': 42, 'distance': 0.97, 'entity': {'title': '...'}}
+```
+"""
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+# Metrics for which a larger distance means a closer match
+SIMILARITY_METRICS = frozenset({"IP", "COSINE", "BM25"})
+
+
+def larger_is_closer(metric_type: str | None) -> bool:
+    """Returns whether a metric ranks larger distances first."""
+    return (metric_type or "").upper() in SIMILARITY_METRICS
+
+
+class ColumnarSearchResult(Sequence):
+    """Search results for ``nq`` queries stored as ``(nq, k)`` columns.
+
+    Behaves as a read-only sequence of per-query hit lists, like the pymilvus result,
+    but only materializes the dictionaries of the rows that are accessed.
+
+    Attributes:
+        ids (np.ndarray): ``(nq, k)`` primary keys.
+        distances (np.ndarray): ``(nq, k)`` float32 distances.
+        counts (np.ndarray): ``(nq,)`` number of real hits per query.
+        fields (Dict[str, np.ndarray]): ``(nq, k)`` output field columns.
+        pk_name (str): Name of the primary key field.
+
+    Methods:
+        from_hits: Builds a result from pymilvus search output.
+        empty: Creates a result without hits.
+        to_dicts: Materializes all rows as lists of hit dictionaries.
+        sort: Reorders every row by distance.
+        merge: Merges results for the same queries, e.g. from several partitions.
+
+    Example:
+        ```python
+        result = ColumnarSearchResult.from_hits(client.search(...), limit=10)
+        top_ids = result.ids[:, 0]
+        ```
+
+    """
+
+    __slots__ = ("ids", "distances", "counts", "fields", "pk_name")
+
+    def __init__(self, ids: np.ndarray, distances: np.ndarray, counts: np.ndarray | None = None,
+                 fields: dict[str, np.ndarray] | None = None, pk_name: str = "id"):
+        """Initializes the result from prepared columns.
+
+        Args:
+            ids (np.ndarray): ``(nq, k)`` primary keys.
+            distances (np.ndarray): ``(nq, k)`` distances.
+            counts (np.ndarray | None): Real hits per query. Defaults to ``k`` for every query.
+            fields (Dict[str, np.ndarray] | None): ``(nq, k)`` output field columns.
+            pk_name (str): Name of the primary key field. Defaults to "id".
+
+        """
+        if ids.shape != distances.shape or ids.ndim != 2:
+            raise ValueError(f"ids {ids.shape} and distances {distances.shape} must be matching (nq, k) arrays")
+        self.ids = ids
+        self.distances = distances
+        self.counts = counts if counts is not None else np.full(ids.shape[0], ids.shape[1], dtype=np.int64)
+        self.fields = fields or {}
+        self.pk_name = pk_name
+
+    @classmethod
+    def from_hits(cls, results: Iterable[Iterable[Any]], limit: int | None = None,
+                  output_fields: list[str] | None = None) -> "ColumnarSearchResult":
+        """Builds a columnar result from pymilvus search output.
+
+        Uses the ``ids``/``distances`` lists of pymilvus ``Hits`` when available and
+        falls back to reading the hit dictionaries.
+
+        Args:
+            results (Iterable[Iterable[Any]]): Per-query hits as returned by ``search``.
+            limit (int | None): Columns to allocate; defaults to the longest hit list.
+            output_fields (List[str] | None): Fields to extract. Defaults to all returned.
+
+        Returns:
+            ColumnarSearchResult: The columnar result.
+
+        """
+        rows = [hits if isinstance(hits, Sequence) else list(hits) for hits in results]
+        nq = len(rows)
+        k = limit if limit is not None else max((len(hits) for hits in rows), default=0)
+        counts = np.fromiter((min(len(hits), k) for hits in rows), dtype=np.int64, count=nq)
+
+        pk_name = "id"
+        first = next((hits[0] for hits in rows if len(hits)), None)
+        if isinstance(first, dict):
+            pk_name = next((key for key in first if key not in ("distance", "entity")), pk_name)
+            if output_fields is None:
+                output_fields = list(first.get("entity", {}))
+        output_fields = output_fields or []
+
+        string_ids = isinstance(first.get(pk_name) if isinstance(first, dict) else None, str)
+        ids = np.full((nq, k), None, dtype=object) if string_ids else np.full((nq, k), -1, dtype=np.int64)
+        distances = np.full((nq, k), np.nan, dtype=np.float32)
+        columns = {name: np.full((nq, k), None, dtype=object) for name in output_fields}
+
+        for row, hits in enumerate(rows):
+            count = counts[row]
+            if not count:
+                continue
+            if hasattr(hits, "ids") and hasattr(hits, "distances"):
+                ids[row, :count] = hits.ids[:count]
+                distances[row, :count] = hits.distances[:count]
+            else:
+                ids[row, :count] = [hit[pk_name] for hit in hits[:count]]
+                distances[row, :count] = [hit["distance"] for hit in hits[:count]]
+            for name, column in columns.items():
+                column[row, :count] = [hit.get("entity", {}).get(name) for hit in hits[:count]]
+
+        return cls(ids, distances, counts, {name: _narrow(column) for name, column in columns.items()}, pk_name)
+
+    @classmethod
+    def empty(cls, nq: int, k: int) -> "ColumnarSearchResult":
+        """Creates a result of ``nq`` queries without hits."""
+        return cls(np.full((nq, k), -1, dtype=np.int64), np.full((nq, k), np.nan, dtype=np.float32),
+                   np.zeros(nq, dtype=np.int64))
+
+    @property
+    def nq(self) -> int:
+        """Number of query vectors."""
+        return self.ids.shape[0]
+
+    @property
+    def k(self) -> int:
+        """Number of hit slots per query."""
+        return self.ids.shape[1]
+
+    @property
+    def mask(self) -> np.ndarray:
+        """``(nq, k)`` boolean array marking real (non-padding) hits."""
+        return np.arange(self.k)[None, :] < self.counts[:, None]
+
+    def __len__(self) -> int:
+        return self.nq
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self.nq))]
+        if index < 0:
+            index += self.nq
+        if not 0 <= index < self.nq:
+            raise IndexError("search result index out of range")
+        return self._row(index)
+
+    def _row(self, row: int) -> list[dict]:
+        """Materializes the hit dictionaries of one query."""
+        count = int(self.counts[row])
+        ids = self.ids[row, :count].tolist()
+        distances = self.distances[row, :count].tolist()
+        columns = {name: column[row, :count].tolist() for name, column in self.fields.items()}
+        return [
+            {self.pk_name: ids[i], "distance": distances[i],
+             "entity": {name: values[i] for name, values in columns.items()}}
+            for i in range(count)
+        ]
+
+    def to_dicts(self) -> list[list[dict]]:
+        """Materializes all rows as lists of hit dictionaries."""
+        return [self._row(row) for row in range(self.nq)]
+
+    def sort(self, descending: bool = False) -> "ColumnarSearchResult":
+        """Returns a copy with every row ordered by distance; padding stays last.
+
+        Args:
+            descending (bool): Largest distance first (similarity metrics). Defaults to False.
+
+        Returns:
+            ColumnarSearchResult: The reordered result.
+
+        """
+        keys = np.where(self.mask, -self.distances if descending else self.distances, np.inf)
+        order = np.argsort(keys, axis=1, kind="stable")
+        return self._take(order, self.counts)
+
+    @classmethod
+    def merge(cls, results: Sequence["ColumnarSearchResult"], limit: int,
+              descending: bool = False) -> "ColumnarSearchResult":
+        """Merges results for the same queries into the ``limit`` best hits per query.
+
+        Args:
+            results (Sequence[ColumnarSearchResult]): Results with identical ``nq``.
+            limit (int): Hits to keep per query.
+            descending (bool): Largest distance first (similarity metrics). Defaults to False.
+
+        Returns:
+            ColumnarSearchResult: The merged result.
+
+        """
+        if not results:
+            raise ValueError("Nothing to merge")
+        if len({result.nq for result in results}) != 1:
+            raise ValueError("Merged results must have the same number of queries")
+        names = set(results[0].fields).intersection(*(result.fields for result in results[1:]))
+        combined = cls(
+            np.concatenate([result.ids for result in results], axis=1),
+            np.concatenate([result.distances for result in results], axis=1),
+            None,
+            {name: np.concatenate([result.fields[name] for result in results], axis=1) for name in names},
+            results[0].pk_name,
+        )
+        mask = np.concatenate([result.mask for result in results], axis=1)
+        keys = np.where(mask, -combined.distances if descending else combined.distances, np.inf)
+        limit = min(limit, keys.shape[1])
+        if limit < keys.shape[1]:
+            top = np.argpartition(keys, limit - 1, axis=1)[:, :limit]
+            order = np.take_along_axis(top, np.argsort(np.take_along_axis(keys, top, axis=1), axis=1), axis=1)
+        else:
+            order = np.argsort(keys, axis=1, kind="stable")
+        counts = np.minimum(mask.sum(axis=1), limit)
+        return combined._take(order, counts)
+
+    def _take(self, order: np.ndarray, counts: np.ndarray) -> "ColumnarSearchResult":
+        return ColumnarSearchResult(
+            np.take_along_axis(self.ids, order, axis=1),
+            np.take_along_axis(self.distances, order, axis=1),
+            counts.copy(),
+            {name: np.take_along_axis(column, order, axis=1) for name, column in self.fields.items()},
+            self.pk_name,
+        )
+
+    def __repr__(self) -> str:
+        return f"ColumnarSearchResult(nq={self.nq}, k={self.k}, fields={list(self.fields)})"
+
+
+def _narrow(column: np.ndarray) -> np.ndarray:
+    """Converts an object column of scalars to a native NumPy dtype where possible."""
+    values = [value for value in column.ravel() if value is not None]
+    if not values or len(values) != column.size:
+        return column
+    if all(isinstance(value, (bool, np.bool_)) for value in values):
+        return column.astype(bool)
+    if all(isinstance(value, (int, np.integer)) and not isinstance(value, bool) for value in values):
+        return column.astype(np.int64)
+    if all(isinstance(value, (int, float, np.number)) and not isinstance(value, bool) for value in values):
+        return column.astype(np.float64)
+    return column
@@ -1,10 +1,22 @@
+import asyncio
+from functools import partial
 from typing import Any
 
-from pymilvus import Collection, MilvusException
+import numpy as np
+from pymilvus import MilvusException
 
 from src.logger import getLogger as GetLogger
+from src.milvus.deadline import step_timeout, within
+from src.milvus.encoding import as_query_matrix, encode_queries, is_query_array, l2_normalize, to_float32
 from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
+from src.milvus.hedging import HedgePolicy
 from src.milvus.interfaces import IConnectAPI, ISearchAPI, IStrategy
+from src.milvus.local import LocalSearchCache
+from src.milvus.partition import PartitionResidencyManager, PartitionScheme
+from src.milvus.results import ColumnarSearchResult, larger_is_closer
+from src.milvus.semantic_cache import SemanticQueryCache
+from src.milvus.shadow import ShadowIndexManager
+from src.milvus.tracing import current_span, span
 from src.utils import async_log_decorator
 
 # Logging setup
@@ -18,9 +30,23 @@ class SearchAPI(ISearchAPI):
 
     Attributes:
         _connect_api (IConnectAPI): The connection API instance.
+        _partition_schemes (Dict[Tuple[str, str], PartitionScheme]): Partitioning schemes by
+            (database, collection).
+        _local_cache (LocalSearchCache | None): Answers searches on small collections locally.
+        _shadow_indexes (ShadowIndexManager | None): Answers searches on hot partitions locally.
+        _query_cache (SemanticQueryCache | None): Returns cached results of near-duplicate queries.
+        _vector_types (Dict[tuple, DataType]): Vector field types, for encoding NumPy queries.
+        _hedging (HedgePolicy | None): Sends delayed duplicates of slow server searches.
+        _residency (PartitionResidencyManager | None): Loads the partitions of managed collections.
 
     Methods:
         search: Performs a vector search in a collection.
+        register_partition_scheme: Enables partition pruning for a collection.
+        resolve_partitions: Computes the partitions a filter expression can match.
+        resolve_partitions_async: Async variant of ``resolve_partitions``.
+        use_query_cache: Puts a semantic query cache in front of searches.
+        use_hedging: Hedges slow server searches.
+        use_residency: Loads partitions of managed collections on demand.
 
     Example:
         ```python
@@ -35,24 +61,142 @@ class SearchAPI(ISearchAPI):
 
     """
 
-    def __init__(self, connect_api: IConnectAPI):
-        """Initializes SearchAPI with a connection instance."""
+    def __init__(self, connect_api: IConnectAPI, local_cache: LocalSearchCache | None = None,
+                 shadow_indexes: ShadowIndexManager | None = None):
+        """Initializes SearchAPI with a connection instance.
+
+        Args:
+            connect_api (IConnectAPI): The connection API instance for Milvus operations.
+            local_cache (LocalSearchCache | None): Local exact search for small collections,
+                consulted before the server. Defaults to None.
+            shadow_indexes (ShadowIndexManager | None): HNSW shadows of hot partitions,
+                consulted before the server. Defaults to None.
+
+        """
         self._connect_api = connect_api
+        self._partition_schemes: dict[tuple[str, str], PartitionScheme] = {}
+        self._local_cache = local_cache
+        self._shadow_indexes = shadow_indexes
+        self._query_cache: SemanticQueryCache | None = None
+        self._vector_types: dict[tuple[str, str, str], Any] = {}
+        self._hedging: HedgePolicy | None = None
+        self._residency: PartitionResidencyManager | None = None
+
+    def use_query_cache(self, cache: SemanticQueryCache | None):
+        """Puts a semantic query cache in front of single-query searches (None removes it).
+
+        Args:
+            cache (SemanticQueryCache | None): The cache; it should also observe the write
+                paths so that writes invalidate it.
+
+        """
+        self._query_cache = cache
+
+    def use_hedging(self, policy: HedgePolicy | None):
+        """Hedges server searches with the given policy (None turns hedging off).
+
+        Hedges go to the second-best endpoint when the client routes over several
+        endpoints (see ``src.milvus.endpoints``), otherwise over the same client.
+
+        Args:
+            policy (HedgePolicy | None): Hedge delay and budget.
+
+        """
+        self._hedging = policy
+
+    def use_residency(self, manager: PartitionResidencyManager | None):
+        """Loads the targeted partitions of managed collections through ``manager`` (None stops).
+
+        Searches on collections the manager does not manage keep loading the whole collection.
+
+        Args:
+            manager (PartitionResidencyManager | None): The partition residency manager.
+
+        """
+        self._residency = manager
+
+    def register_partition_scheme(self, collection_name: str, scheme: PartitionScheme | None,
+                                  database_name: str = "default"):
+        """Registers (or removes, when None) the partitioning scheme of a collection.
+
+        Searches on the collection that pass a filter but no partition names are then
+        restricted to the partitions the filter can match.
+
+        Args:
+            collection_name (str): Name of the collection.
+            scheme (PartitionScheme | None): The collection's partitioning scheme.
+            database_name (str): Database name. Defaults to "default".
+
+        """
+        if scheme is None:
+            self._partition_schemes.pop((database_name, collection_name), None)
+        else:
+            self._partition_schemes[(database_name, collection_name)] = scheme
+        log.info(f"Partition scheme for {collection_name}: {'removed' if scheme is None else 'registered'}")
+
+    def resolve_partitions(self, collection_name: str, expr: str | None,
+                           partition_names: list[str] | None = None,
+                           database_name: str = "default") -> list[str] | None:
+        """Computes the partitions a search has to touch.
+
+        Args:
+            collection_name (str): Name of the collection.
+            expr (Optional[str]): Filter expression.
+            partition_names (Optional[List[str]]): Partitions named by the caller.
+            database_name (str): Database name. Defaults to "default".
+
+        Returns:
+            Optional[List[str]]: The caller's partitions if given, the pruned partitions
+                if a scheme applies, otherwise None (all partitions). An empty list means
+                no partition can match.
+
+        """
+        scheme = self._partition_schemes.get((database_name, collection_name))
+        if partition_names is not None or not expr or scheme is None:
+            return partition_names
+        candidates = scheme.partition_names(
+            lambda: self._connect_api.client.list_partitions(collection_name=collection_name, db_name=database_name))
+        try:
+            return scheme.prune(expr, candidates)
+        except MilvusValidationError as e:
+            log.warning(f"Partition pruning skipped for {collection_name}: {e}")
+            return None
+
+    async def resolve_partitions_async(self, collection_name: str, expr: str | None,
+                                       partition_names: list[str] | None = None,
+                                       database_name: str = "default") -> list[str] | None:
+        """Async variant of ``resolve_partitions``; a stale partition list is fetched in a worker thread.
+
+        Raises:
+            MilvusAPIError: If listing the partitions fails.
+
+        """
+        if partition_names is not None or not expr or (database_name, collection_name) not in self._partition_schemes:
+            return partition_names
+        try:
+            return await asyncio.to_thread(self.resolve_partitions, collection_name, expr, partition_names,
+                                           database_name)
+        except MilvusException as e:
+            log.error(f"Failed to list partitions of {collection_name}: {e}")
+            raise MilvusAPIError(f"Partition listing failed: {e}")
 
     @async_log_decorator
     async def search(self,
-                     collection_name: str, data: list[list[float]],
+                     collection_name: str, data: list[list[float]] | np.ndarray,
                      anns_field: str, param: dict[str, Any],
                      limit: int, expr: str | None = None,
                      output_fields: list[str] | None = None,
                      partition_names: list[str] | None = None,
                      database_name: str = "default",
-                     rerank: bool = False, **kwargs) -> list[dict]:
+                     rerank: bool = False, compact: bool = False,
+                     **kwargs) -> list[dict] | ColumnarSearchResult:
         """Performs a vector search in the specified collection.
 
         Args:
             collection_name (str): Name of the collection.
-            data (List[List[float]]): Query vectors.
+            data (List[List[float]] | np.ndarray): Query vectors, as lists or as a float32,
+                float16 or bfloat16 ``(nq, dim)`` array. Arrays are L2-normalized on the
+                client for COSINE and sent as raw bytes in the field's vector type.
             anns_field (str): Field to search against.
             param (Dict[str, Any]): Search parameters (e.g., metric_type).
             limit (int): Maximum number of results.
@@ -61,27 +205,97 @@ class SearchAPI(ISearchAPI):
             partition_names (Optional[List[str]]): Partitions to search. Defaults to None.
             database_name (str): Database name. Defaults to "default".
             rerank (bool): Whether to rerank results by distance. Defaults to False.
+            compact (bool): Return a ColumnarSearchResult with ``(nq, limit)`` arrays for
+                all query vectors instead of hit dictionaries. Defaults to False.
             **kwargs: Additional search arguments.
 
         Returns:
-            List[Dict]: Search results with IDs and distances.
+            List[Dict] | ColumnarSearchResult: Search results with IDs and distances.
 
         Raises:
             MilvusValidationError: If inputs are invalid.
             MilvusAPIError: If search fails.
 
         """
-        if not collection_name or not isinstance(collection_name, str):
-            raise MilvusValidationError("Collection name must be a non-empty string")
-        if not data or not all(isinstance(v, list) for v in data):
-            raise MilvusValidationError("Data must be a non-empty list of lists")
-        if not anns_field or not isinstance(anns_field, str):
-            raise MilvusValidationError("ANNS field must be a non-empty string")
+        with span("search.validate"):
+            if not collection_name or not isinstance(collection_name, str):
+                raise MilvusValidationError("Collection name must be a non-empty string")
+            if is_query_array(data):
+                data = as_query_matrix(data)
+                if str(param.get("metric_type", "")).upper() == "COSINE":
+                    data = l2_normalize(data)
+            elif not data or not all(isinstance(v, list) for v in data):
+                raise MilvusValidationError("Data must be a non-empty list of lists or a NumPy array")
+            if not anns_field or not isinstance(anns_field, str):
+                raise MilvusValidationError("ANNS field must be a non-empty string")
+        current_span().set_attributes(nq=len(data), limit=limit, metric_type=param.get("metric_type"))
+        cache = self._query_cache
+        if cache is None or len(data) != 1 or not cache.cacheable(param):
+            return await self._search(collection_name, data, anns_field, param, limit, expr, output_fields,
+                                      partition_names, database_name, rerank, compact, **kwargs)
+        key = cache.search_key(collection_name, anns_field, param, limit, expr, output_fields, partition_names,
+                               database_name, rerank=rerank, compact=compact, **kwargs)
+        with span("search.cache_lookup") as step:
+            cached = cache.lookup(key, data[0])
+            step.set_attribute("hit", cached is not None)
+        if cached is not None and not cache.should_verify():
+            log.debug(f"Answered search on {collection_name} from the query cache")
+            return cached
+        generation = cache.generation(collection_name)
+        result = await self._search(collection_name, data, anns_field, param, limit, expr, output_fields,
+                                    partition_names, database_name, rerank, compact, **kwargs)
+        if cached is not None:
+            cache.record_verification(key, data[0], cached, result)
+        else:
+            cache.store(key, data[0], result, generation)
+        return result
+
+    async def _search(self, collection_name: str, data: list[list[float]] | np.ndarray, anns_field: str, param: dict[str, Any],
+                      limit: int, expr: str | None, output_fields: list[str] | None,
+                      partition_names: list[str] | None, database_name: str, rerank: bool, compact: bool,
+                      **kwargs) -> list[dict] | ColumnarSearchResult:
+        """Runs a validated search locally when possible, otherwise on the server."""
+        local_data = None
+        for engine in (self._local_cache, self._shadow_indexes):
+            if engine is None:
+                continue
+            if local_data is None:
+                local_data = to_float32(data) if isinstance(data, np.ndarray) else data
+            with span("search.local", engine=type(engine).__name__) as step:
+                try:
+                    local = await within(engine.search(collection_name, local_data, anns_field, param, limit, expr,
+                                                       output_fields, partition_names, database_name), "local search")
+                except MilvusException as e:
+                    log.error(f"Failed to search locally: {e}")
+                    raise MilvusAPIError(f"Search failed: {e}")
+                step.set_attribute("hit", local is not None)
+            if local is not None:
+                log.debug(f"Answered search on {collection_name} locally")
+                return local if compact else local[0]
+        residency = self._residency
+        if residency is not None and not residency.manages(collection_name, database_name):
+            residency = None
+        pinned = None
         try:
-            collection = Collection(collection_name, using=self._connect_api._alias, db_name=database_name)
-            collection.load()
-            # Search the database
-            results = await self._connect_api.connect_api.search(
+            partition_names = await self.resolve_partitions_async(collection_name, expr, partition_names, database_name)
+            if partition_names is not None and not partition_names:
+                log.info(f"No partition of {collection_name} can match filter {expr!r}; skipping search")
+                return ColumnarSearchResult.empty(len(data), limit) if compact else []
+            client = self._connect_api.client
+            with span("search.load", managed=residency is not None):
+                if residency is not None:
+                    pinned = partition_names = await within(
+                        residency.acquire(collection_name, partition_names, database_name), "load_partitions")
+                else:
+                    await within(asyncio.to_thread(client.load_collection, collection_name=collection_name,
+                                                   db_name=database_name, timeout=step_timeout(step="load_collection")),
+                                 "load_collection")
+            if isinstance(data, np.ndarray):
+                with span("search.encode") as step:
+                    vector_type = await self._vector_type(collection_name, anns_field, database_name)
+                    data = encode_queries(data, vector_type)
+                    step.set_attribute("vector_type", str(vector_type))
+            request = dict(
                 collection_name=collection_name,
                 data=data,
                 anns_field=anns_field,
@@ -93,24 +307,69 @@ class SearchAPI(ISearchAPI):
                 db_name=database_name,
                 **kwargs
             )
+            timeout = step_timeout(request.get("timeout"), step="search")
+            if timeout is not None:
+                request["timeout"] = timeout
+            # Search the database
+            hedging = self._hedging
+            with span("search.rpc", hedged=hedging is not None,
+                      partitions=len(partition_names) if partition_names else 0):
+                if hedging is None:
+                    results = await within(asyncio.to_thread(client.search, **request), "search")
+                else:
+                    pool = getattr(client, "pool", None)
+                    alternate = partial(pool.call_alternate, "search") if pool is not None else client.search
+                    results = await within(hedging.run(collection_name,
+                                                       lambda: asyncio.to_thread(client.search, **request),
+                                                       lambda: asyncio.to_thread(alternate, **request)), "search")
+            if compact:
+                with span("search.postprocess", rerank=rerank, compact=True):
+                    result = ColumnarSearchResult.from_hits(results, limit=limit, output_fields=output_fields)
+                    if rerank:
+                        result = result.sort(descending=larger_is_closer(param.get("metric_type")))
+                with span("search.log"):
+                    log.info(f"Completed search in {collection_name}, {result}")
+                return result
             # Get the results at index 0
             results = results[0]
-            log.debug(f"Contents of results: {results}, "
-                      f"\nAttributes of results: {dir(results)}, "
-                      f"\nType of results: {type(results)}, "
-                      f"\nLength of results: {len(results)}, "
-                      f"\nContains distance: {'distance' in str(results)}")
+            with span("search.log"):
+                log.debug(f"Contents of results: {results}, "
+                          f"\nAttributes of results: {dir(results)}, "
+                          f"\nType of results: {type(results)}, "
+                          f"\nLength of results: {len(results)}, "
+                          f"\nContains distance: {'distance' in str(results)}")
 
             # Check if reranking is needed
-            if rerank and "distance" in str(results):
-                log.info(f"Reranking {len(results)} results by distance")
-                results = self._rerank_results(results)
-
-            log.info(f"Completed search in {collection_name}, \nResults: {results}")
+            with span("search.postprocess", rerank=rerank, compact=False) as step:
+                if rerank and "distance" in str(results):
+                    log.info(f"Reranking {len(results)} results by distance")
+                    results = self._rerank_results(results)
+                step.set_attribute("hits", len(results))
+
+            with span("search.log"):
+                log.info(f"Completed search in {collection_name}, \nResults: {results}")
             return results
         except MilvusException as e:
+            # The collection may have been recreated with another vector type
+            self._vector_types.pop((database_name, collection_name, anns_field), None)
             log.error(f"Failed to search: {e}")
             raise MilvusAPIError(f"Search failed: {e}")
+        finally:
+            if pinned is not None:
+                residency.release(collection_name, pinned, database_name)
+
+    async def _vector_type(self, collection_name: str, anns_field: str, database_name: str) -> Any:
+        """Returns (and caches) the data type of a collection's vector field."""
+        key = (database_name, collection_name, anns_field)
+        if key not in self._vector_types:
+            description = await within(asyncio.to_thread(self._connect_api.client.describe_collection,
+                                                         collection_name=collection_name, db_name=database_name),
+                                       "describe_collection")
+            field = next((f for f in description["fields"] if f["name"] == anns_field), None)
+            if field is None:
+                raise MilvusValidationError(f"Field {anns_field} does not exist in {collection_name}")
+            self._vector_types[key] = field["type"]
+        return self._vector_types[key]
 
     @async_log_decorator
     def _rerank_results(self, results: list[dict]) -> list[dict]:
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# File: src/milvus/semantic_cache.py
+"""Semantic Query Cache
+
+Embeddings of the same question differ by floating-point noise or trivial text edits,
+so exact-key caches rarely hit. ``SemanticQueryCache`` keeps recently searched query
+vectors and returns the cached result of a search when a new query vector is within
+a cosine-similarity threshold of a cached one and every other search argument
+(collection, filter, limit, parameters, ...) is identical.
+
+- Entries are evicted least recently used once ``capacity`` is reached.
+- Any insert, delete or drop on a collection invalidates its entries (the cache is an
+  ``ICollectionObserver`` of ``VectorAPI``/``CollectionAPI``).
+- A ``verify_fraction`` of hits is also searched on the server; hits whose top ids
+  differ from the fresh result count as false hits and are replaced.
+
+Only single-query COSINE searches are cached: their results depend on the direction
+of the query vector alone. Under L2 or IP, a query with the same direction but another
+norm can have different neighbours.
+
+Example Usage:
+```python
+>>> api = MilvusAPI(connect_api)
+>>> api.enable_query_cache(threshold=0.99, capacity=4096, verify_fraction=0.01)
+>>> await api.search("docs", [embedding], "vector", {"metric_type": "COSINE"}, 10)
+>>> api.query_cache_stats()
+{'lookups': 1, 'hits': 0, ...}
+```
+"""
+import copy
+import json
+import random
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from src.logger import getLogger as GetLogger
+from src.milvus.events import CollectionEvent
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.interfaces import ICollectionObserver
+
+# Logging setup
+log = GetLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    """A cached search result."""
+
+    key: Hashable
+    row: int
+    result: Any
+
+
+class _Bucket:
+    """Normalized query vectors of the entries sharing one search key."""
+
+    def __init__(self, dim: int):
+        self.vectors = np.empty((8, dim), dtype=np.float32)
+        self.entry_ids: list[int] = []
+
+    def add(self, vector: np.ndarray, entry_id: int) -> int:
+        row = len(self.entry_ids)
+        if row == len(self.vectors):
+            self.vectors = np.concatenate([self.vectors, np.empty_like(self.vectors)])
+        self.vectors[row] = vector
+        self.entry_ids.append(entry_id)
+        return row
+
+    def remove(self, row: int) -> int | None:
+        """Removes a row by moving the last one into it; returns the moved entry id."""
+        last = len(self.entry_ids) - 1
+        moved = None
+        if row != last:
+            self.vectors[row] = self.vectors[last]
+            moved = self.entry_ids[row] = self.entry_ids[last]
+        self.entry_ids.pop()
+        return moved
+
+    def nearest(self, vector: np.ndarray) -> tuple[int, float]:
+        similarities = self.vectors[:len(self.entry_ids)] @ vector
+        row = int(np.argmax(similarities))
+        return row, float(similarities[row])
+
+
+class SemanticQueryCache(ICollectionObserver):
+    """LRU cache of search results looked up by query-vector similarity.
+
+    Attributes:
+        threshold (float): Minimum cosine similarity of a cached query to count as a hit.
+        capacity (int): Maximum number of cached results.
+        verify_fraction (float): Share of hits re-checked against the server.
+
+    Methods:
+        cacheable: Whether searches with the given parameters can be cached.
+        search_key: Builds the exact-match part of a cache key.
+        lookup: Returns a cached result for a query vector, or None.
+        generation: Write counter of a collection, to discard results raced by writes.
+        store: Caches a result.
+        should_verify: Decides whether a hit is checked against the server.
+        record_verification: Accounts a checked hit and replaces false hits.
+        invalidate: Drops the entries of a collection.
+        update: Invalidates on a CollectionEvent (ICollectionObserver).
+        stats: Hit, miss, false-hit and eviction counters.
+
+    Example:
+        ```python
+        cache = SemanticQueryCache(threshold=0.99)
+        key = cache.search_key("docs", "vector", {"metric_type": "COSINE"}, 10)
+        result = cache.lookup(key, embedding)
+        if result is None:
+            result = await search(...)
+            cache.store(key, embedding, result)
+        ```
+
+    Raises:
+        MilvusValidationError: If parameters are invalid.
+
+    """
+
+    def __init__(self, threshold: float = 0.98, capacity: int = 1024, verify_fraction: float = 0.0,
+                 seed: int | None = None):
+        if not -1.0 <= threshold <= 1.0:
+            raise MilvusValidationError("Similarity threshold must be between -1 and 1")
+        if capacity < 1:
+            raise MilvusValidationError("Cache capacity must be positive")
+        if not 0.0 <= verify_fraction <= 1.0:
+            raise MilvusValidationError("verify_fraction must be between 0 and 1")
+        self.threshold = threshold
+        self.capacity = capacity
+        self.verify_fraction = verify_fraction
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._buckets: dict[Hashable, _Bucket] = {}
+        self._next_id = 0
+        self._generations: dict[str, int] = {}
+        self._counters = dict.fromkeys(
+            ("lookups", "hits", "misses", "verified", "false_hits", "stores", "evictions", "invalidations"), 0)
+
+    @staticmethod
+    def cacheable(param: dict[str, Any] | None) -> bool:
+        """Returns True for COSINE searches, whose results depend on the query direction only."""
+        return str((param or {}).get("metric_type", "")).upper() == "COSINE"
+
+    @staticmethod
+    def search_key(collection_name: str, anns_field: str, param: dict[str, Any], limit: int,
+                   expr: str | None = None, output_fields: list[str] | None = None,
+                   partition_names: list[str] | None = None, database_name: str = "default",
+                   **options: Any) -> tuple:
+        """Builds the part of the key that must match exactly; the collection name comes first."""
+        rest = json.dumps([anns_field, param, limit, expr, output_fields, partition_names, database_name, options],
+                          sort_keys=True, default=str)
+        return collection_name, rest
+
+    @staticmethod
+    def _normalize(vector: Any) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, key: tuple, vector: Any) -> Any | None:
+        """Returns (a copy of) the cached result of the most similar query above the threshold."""
+        query = self._normalize(vector)
+        with self._lock:
+            self._counters["lookups"] += 1
+            bucket = self._buckets.get(key)
+            if bucket is not None and bucket.entry_ids and bucket.vectors.shape[1] == len(query):
+                row, similarity = bucket.nearest(query)
+                if similarity >= self.threshold:
+                    entry_id = bucket.entry_ids[row]
+                    self._entries.move_to_end(entry_id)
+                    self._counters["hits"] += 1
+                    return _copy(self._entries[entry_id].result)
+            self._counters["misses"] += 1
+            return None
+
+    def generation(self, collection_name: str) -> int:
+        """Returns a counter bumped by every invalidation of the collection."""
+        return self._generations.get(collection_name, 0)
+
+    def store(self, key: tuple, vector: Any, result: Any, generation: int | None = None):
+        """Caches a result, evicting the least recently used entries beyond capacity.
+
+        Args:
+            key (tuple): Key from ``search_key``.
+            vector (Any): The query vector.
+            result (Any): The search result.
+            generation (Optional[int]): ``generation`` of the collection taken before the
+                search; the result is dropped if the collection was written since.
+
+        """
+        query = self._normalize(vector)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key[0], 0):
+                return
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.vectors.shape[1] != len(query):
+                bucket = self._buckets[key] = _Bucket(len(query))
+            entry_id, self._next_id = self._next_id, self._next_id + 1
+            self._entries[entry_id] = _Entry(key, bucket.add(query, entry_id), _copy(result))
+            self._counters["stores"] += 1
+            while len(self._entries) > self.capacity:
+                self._remove(next(iter(self._entries)))
+                self._counters["evictions"] += 1
+
+    def _remove(self, entry_id: int):
+        entry = self._entries.pop(entry_id)
+        bucket = self._buckets[entry.key]
+        moved = bucket.remove(entry.row)
+        if moved is not None:
+            self._entries[moved].row = entry.row
+        if not bucket.entry_ids:
+            del self._buckets[entry.key]
+
+    def should_verify(self) -> bool:
+        """Returns True for a random ``verify_fraction`` of hits."""
+        return self.verify_fraction > 0 and self._random.random() < self.verify_fraction
+
+    def record_verification(self, key: tuple, vector: Any, cached: Any, fresh: Any) -> bool:
+        """Compares a served hit with the fresh result; false hits are replaced by it.
+
+        Returns:
+            bool: True when the cached result was a false hit.
+
+        """
+        false_hit = _top_ids(cached) != _top_ids(fresh)
+        with self._lock:
+            self._counters["verified"] += 1
+            if not false_hit:
+                return False
+            self._counters["false_hits"] += 1
+            bucket = self._buckets.get(key)
+            if bucket is not None and bucket.entry_ids:
+                row, similarity = bucket.nearest(self._normalize(vector))
+                if similarity >= self.threshold:
+                    self._remove(bucket.entry_ids[row])
+        log.debug(f"Semantic cache false hit on {key[0]}")
+        self.store(key, vector, fresh)
+        return True
+
+    def invalidate(self, collection_name: str):
+        """Drops all entries of a collection."""
+        with self._lock:
+            self._generations[collection_name] = self._generations.get(collection_name, 0) + 1
+            stale = [entry_id for entry_id, entry in self._entries.items() if entry.key[0] == collection_name]
+            for entry_id in stale:
+                self._remove(entry_id)
+            if stale:
+                self._counters["invalidations"] += 1
+
+    def update(self, event: CollectionEvent):
+        """Invalidates the entries of the written collection."""
+        self.invalidate(event.collection_name)
+
+    def clear(self):
+        """Drops all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Returns counters plus the current size, hit rate and false-hit rate."""
+        with self._lock:
+            counters = dict(self._counters)
+            counters["size"] = len(self._entries)
+        counters["hit_rate"] = counters["hits"] / counters["lookups"] if counters["lookups"] else 0.0
+        counters["false_hit_rate"] = counters["false_hits"] / counters["verified"] if counters["verified"] else 0.0
+        return counters
+
+
+def _copy(result: Any) -> Any:
+    """Hit lists are mutable dictionaries; callers get their own copy."""
+    return copy.deepcopy(result) if isinstance(result, list) else result
+
+
+def _top_ids(result: Any) -> list:
+    """Primary keys of a single-query result, as hit dictionaries or a ColumnarSearchResult."""
+    hits = result[0] if hasattr(result, "ids") else result
+    return [next((value for name, value in hit.items() if name not in ("distance", "entity")), None)
+            for hit in hits]
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# File: src/milvus/shadow.py
+"""Hot-Partition Shadow Indexes
+
+A few tenants often receive most of the query traffic. ``ShadowIndexManager`` keeps
+an in-process ``HNSWIndex`` for designated hot partitions and answers their searches
+without a server round trip.
+
+Consistency: a shadow is built from the server and then follows the insert/delete
+events of this process (it is an ``ICollectionObserver``). Writes are applied in the
+background; until every write made through this process is in the shadow, searches
+go to the server, so the process always reads its own writes. Writes made by other
+clients are detected by comparing the partition's live row count (``count(*)``) with
+the shadow at most ``max_staleness`` seconds apart; a shadow older than that is
+re-verified (and rebuilt on mismatch) while searches fall back to the server.
+Out-of-band changes that leave the row count unchanged are not detected.
+
+Example Usage:
+```python
+>>> api = MilvusAPI(connect_api)
+>>> api.designate_hot_partition("docs", "tenant_acme", max_staleness=30)
+>>> hits = await api.search("docs", [[0.1] * 128], "vector", {"metric_type": "COSINE"}, 10,
+...                         partition_names=["tenant_acme"])
+```
+"""
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from pymilvus import DataType
+
+from src.logger import getLogger as GetLogger
+from src.milvus.deadline import no_deadline
+from src.milvus.events import DROP, INSERT, CollectionEvent
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.expression import Comparison, Membership, parse_expression
+from src.milvus.hnsw import METRICS, HNSWIndex
+from src.milvus.interfaces import ICollectionObserver, IConnectAPI
+from src.milvus.results import ColumnarSearchResult
+
+# Logging setup
+log = GetLogger(__name__)
+
+DEFAULT_PARTITION = "_default"
+
+
+@dataclass
+class _Shadow:
+    """Shadow index state of one hot partition."""
+
+    collection_name: str
+    partition_name: str
+    anns_field: str
+    metric_type: str
+    database_name: str
+    max_staleness: float
+    build_params: dict[str, int]
+    index: HNSWIndex | None = None
+    pk_name: str = "id"
+    string_pk: bool = False
+    verified_at: float = float("-inf")
+    needs_rebuild: bool = True
+    backlog: list[CollectionEvent] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    task: asyncio.Task | None = None
+    hits: int = 0
+    fallbacks: int = 0
+    rebuilds: int = 0
+
+
+class ShadowIndexManager(ICollectionObserver):
+    """Maintains HNSW shadow indexes of hot partitions and serves their searches.
+
+    Attributes:
+        _connect_api (IConnectAPI): Connection used to build and verify shadows.
+        _shadows (Dict[Tuple[str, str], _Shadow]): Shadows by (collection, partition).
+        max_deleted_fraction (float): Deleted share of a graph that triggers a rebuild.
+
+    Methods:
+        designate: Starts shadowing a partition.
+        release: Stops shadowing a partition.
+        search: Searches a fresh shadow, or returns None when the server must answer.
+        update: Queues a CollectionEvent for the affected shadows (ICollectionObserver).
+        refresh: Brings a shadow up to date now.
+        stats: Per-shadow state and counters.
+
+    Example:
+        ```python
+        shadows = ShadowIndexManager(connect_api)
+        vector_api.attach(shadows)
+        shadows.designate("docs", "tenant_acme")
+        result = await shadows.search("docs", queries, "vector", {}, 10, partition_names=["tenant_acme"])
+        ```
+
+    """
+
+    def __init__(self, connect_api: IConnectAPI, max_deleted_fraction: float = 0.3):
+        """Initializes the manager with the connection used to build shadows."""
+        self._connect_api = connect_api
+        self._shadows: dict[tuple[str, str], _Shadow] = {}
+        self.max_deleted_fraction = max_deleted_fraction
+
+    def designate(self, collection_name: str, partition_name: str = DEFAULT_PARTITION, anns_field: str = "vector",
+                  metric_type: str = "COSINE", max_staleness: float = 30.0, M: int = 16, ef_construction: int = 100,
+                  ef_search: int = 64, database_name: str = "default"):
+        """Starts shadowing a partition; the shadow is built in the background on first use.
+
+        Args:
+            collection_name (str): Name of the collection.
+            partition_name (str): Hot partition. Defaults to "_default".
+            anns_field (str): Vector field. Defaults to "vector".
+            metric_type (str): Metric of the collection's index. Defaults to "COSINE".
+            max_staleness (float): Seconds between checks for writes by other clients. Defaults to 30.
+            M (int): HNSW links per node. Defaults to 16.
+            ef_construction (int): HNSW build candidate list size. Defaults to 100.
+            ef_search (int): HNSW search candidate list size. Defaults to 64.
+            database_name (str): Database name. Defaults to "default".
+
+        Raises:
+            MilvusValidationError: If the names or metric type are invalid.
+
+        """
+        if not collection_name or not isinstance(collection_name, str):
+            raise MilvusValidationError("Collection name must be a non-empty string")
+        if not partition_name or not isinstance(partition_name, str):
+            raise MilvusValidationError("Partition name must be a non-empty string")
+        metric_type = metric_type.upper()
+        if metric_type not in METRICS:
+            raise MilvusValidationError(f"Unsupported metric type for HNSW: {metric_type}")
+        self.release(collection_name, partition_name)
+        self._shadows[(collection_name, partition_name)] = _Shadow(
+            collection_name, partition_name, anns_field, metric_type, database_name, max_staleness,
+            {"M": M, "ef_construction": ef_construction, "ef_search": ef_search})
+        log.info(f"Shadow index designated for {collection_name}/{partition_name}")
+
+    def release(self, collection_name: str, partition_name: str = DEFAULT_PARTITION):
+        """Stops shadowing a partition and frees its index."""
+        shadow = self._shadows.pop((collection_name, partition_name), None)
+        if shadow is not None and shadow.task is not None:
+            shadow.task.cancel()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Returns per-shadow rows, age, pending writes and hit/fallback counters."""
+        now = time.monotonic()
+        return {f"{s.collection_name}/{s.partition_name}": {
+            "rows": len(s.index) if s.index is not None else None,
+            "age": now - s.verified_at,
+            "pending": len(s.backlog),
+            "hits": s.hits,
+            "fallbacks": s.fallbacks,
+            "rebuilds": s.rebuilds,
+        } for s in self._shadows.values()}
+
+    def update(self, event: CollectionEvent):
+        """Queues a write event for the shadows of the affected collection."""
+        for shadow in self._shadows.values():
+            if shadow.collection_name != event.collection_name:
+                continue
+            if event.kind == DROP:
+                # Rebuilt on the next search, should the collection be recreated
+                shadow.needs_rebuild = True
+                continue
+            if event.database_name != shadow.database_name:
+                continue
+            if event.kind == INSERT and (event.partition_name or DEFAULT_PARTITION) != shadow.partition_name:
+                continue
+            shadow.backlog.append(event)
+            self._schedule(shadow)
+
+    def _fresh(self, shadow: _Shadow) -> bool:
+        return (shadow.index is not None and not shadow.needs_rebuild and not shadow.backlog
+                and time.monotonic() - shadow.verified_at <= shadow.max_staleness)
+
+    async def search(self, collection_name: str, data: Any, anns_field: str, param: dict[str, Any], limit: int,
+                     expr: str | None = None, output_fields: list[str] | None = None,
+                     partition_names: list[str] | None = None,
+                     database_name: str = "default") -> ColumnarSearchResult | None:
+        """Searches the shadow of a hot partition.
+
+        Only unfiltered searches of exactly one shadowed partition are served, and only
+        while the shadow is fresh; otherwise a refresh is scheduled and None returned.
+
+        Args:
+            collection_name (str): Name of the collection.
+            data (Any): Query vectors.
+            anns_field (str): Field to search against.
+            param (Dict[str, Any]): Search parameters; ``metric_type`` and ``params.ef`` are used.
+            limit (int): Hits per query.
+            expr (Optional[str]): Filter expression; filtered searches go to the server.
+            output_fields (Optional[List[str]]): Only the primary key can be served locally.
+            partition_names (Optional[List[str]]): Must name a single shadowed partition.
+            database_name (str): Database name. Defaults to "default".
+
+        Returns:
+            ColumnarSearchResult | None: Shadow results, or None when the server must answer.
+
+        """
+        if not partition_names or len(partition_names) != 1:
+            return None
+        shadow = self._shadows.get((collection_name, partition_names[0]))
+        if shadow is None:
+            return None
+        param = param or {}
+        metric_type = (param.get("metric_type") or shadow.metric_type).upper()
+        if (expr or anns_field != shadow.anns_field or metric_type != shadow.metric_type
+                or database_name != shadow.database_name
+                or any(name != shadow.pk_name for name in output_fields or ())):
+            shadow.fallbacks += 1
+            return None
+        if not self._fresh(shadow) or not shadow.lock.acquire(blocking=False):
+            self._schedule(shadow)
+            shadow.fallbacks += 1
+            return None
+        try:
+            ids, distances, counts = shadow.index.search(data, limit, (param.get("params") or {}).get("ef"))
+        finally:
+            shadow.lock.release()
+        shadow.hits += 1
+        if not shadow.string_pk:
+            ids = np.where(ids == None, -1, ids).astype(np.int64)  # noqa: E711 - elementwise
+        fields = {shadow.pk_name: ids} if output_fields else None
+        return ColumnarSearchResult(ids, distances, counts, fields, pk_name=shadow.pk_name)
+
+    def _schedule(self, shadow: _Shadow):
+        """Starts background maintenance of a shadow unless it is already running."""
+        if shadow.task is not None and not shadow.task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No event loop: maintenance starts with the next search
+        with no_deadline():  # maintenance is not bounded by the request that triggered it
+            shadow.task = loop.create_task(self.refresh(shadow.collection_name, shadow.partition_name))
+
+    async def refresh(self, collection_name: str, partition_name: str = DEFAULT_PARTITION):
+        """Rebuilds, verifies and applies pending writes to a shadow until it is fresh.
+
+        Failures are logged; searches keep falling back to the server until a later
+        refresh succeeds.
+        """
+        shadow = self._shadows.get((collection_name, partition_name))
+        if shadow is None:
+            return
+        running = shadow.task
+        if running is not None and not running.done() and running is not asyncio.current_task():
+            # One maintenance pass at a time; continue from where the background one ends
+            await asyncio.shield(running)
+        checked = False
+        try:
+            while self._shadows.get((collection_name, partition_name)) is shadow and not self._fresh(shadow):
+                if shadow.needs_rebuild or shadow.index is None or \
+                        shadow.index.deleted_fraction > self.max_deleted_fraction:
+                    await self._rebuild(shadow)
+                    checked = True
+                elif shadow.backlog:
+                    events, shadow.backlog = shadow.backlog, []
+                    await asyncio.to_thread(self._apply, shadow, events)
+                elif checked:
+                    break  # Only age is left; checking again now would spin when max_staleness is tiny
+                else:
+                    await asyncio.to_thread(self._verify, shadow)
+                    checked = True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.warning(f"Shadow index refresh of {collection_name}/{partition_name} failed: {e}")
+
+    async def _rebuild(self, shadow: _Shadow):
+        # Writes arriving during the build stay in the backlog and are replayed afterwards
+        shadow.needs_rebuild = False
+        started = time.monotonic()
+        index = await asyncio.to_thread(self._build, shadow)
+        with shadow.lock:
+            shadow.index = index
+            shadow.verified_at = started
+            shadow.rebuilds += 1
+
+    def _build(self, shadow: _Shadow) -> HNSWIndex:
+        client = self._connect_api.client
+        description = client.describe_collection(collection_name=shadow.collection_name, db_name=shadow.database_name)
+        fields = {f["name"]: f for f in description["fields"]}
+        shadow.pk_name = next(name for name, f in fields.items() if f.get("is_primary"))
+        shadow.string_pk = fields[shadow.pk_name].get("type") == DataType.VARCHAR
+        index = HNSWIndex(int(fields[shadow.anns_field]["params"]["dim"]), shadow.metric_type, **shadow.build_params)
+        iterator = client.query_iterator(collection_name=shadow.collection_name, batch_size=5000, filter="",
+                                         output_fields=[shadow.pk_name, shadow.anns_field],
+                                         partition_names=[shadow.partition_name], db_name=shadow.database_name)
+        try:
+            while page := iterator.next():
+                index.add_items([row[shadow.pk_name] for row in page], [row[shadow.anns_field] for row in page])
+        finally:
+            iterator.close()
+        log.info(f"Built shadow index of {shadow.collection_name}/{shadow.partition_name} with {len(index)} vectors")
+        return index
+
+    def _apply(self, shadow: _Shadow, events: list[CollectionEvent]):
+        with shadow.lock:
+            for event in events:
+                if event.kind == INSERT:
+                    ids = event.ids or [row.get(shadow.pk_name) for row in event.entities]
+                    if len(ids) != len(event.entities) or any(pk is None for pk in ids):
+                        shadow.needs_rebuild = True
+                        continue
+                    shadow.index.add_items(ids, [row[shadow.anns_field] for row in event.entities])
+                    continue
+                node = parse_expression(event.expr or "")
+                if isinstance(node, Membership) and node.field == shadow.pk_name and not node.negate:
+                    shadow.index.remove(list(node.values))
+                elif isinstance(node, Comparison) and node.field == shadow.pk_name and node.op == "==":
+                    shadow.index.remove([node.value])
+                else:
+                    shadow.needs_rebuild = True
+
+    def _verify(self, shadow: _Shadow):
+        # Partition stats count deleted rows until compaction; count(*) matches the shadow
+        started = time.monotonic()
+        result = self._connect_api.client.query(collection_name=shadow.collection_name, filter="",
+                                                output_fields=["count(*)"], partition_names=[shadow.partition_name],
+                                                db_name=shadow.database_name)
+        if int(result[0]["count(*)"]) == len(shadow.index):
+            shadow.verified_at = started
+        else:
+            log.info(f"Shadow index of {shadow.collection_name}/{shadow.partition_name} is out of date; rebuilding")
+            shadow.needs_rebuild = True
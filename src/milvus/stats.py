@@ -1,8 +1,10 @@
+import asyncio
 from typing import Any
 
-from pymilvus import Collection, MilvusException
+from pymilvus import MilvusException
 
 from src.logger import getLogger as GetLogger
+from src.milvus.capacity import CapacityEstimate, CapacityEstimator, index_params_of
 from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
 from src.milvus.interfaces import IConnectAPI, IStatAPI
 from src.utils import async_log_decorator
@@ -21,6 +23,7 @@ class StatAPI(IStatAPI):
 
     Methods:
         get_collection_stats: Retrieves statistics for a collection.
+        check_capacity: Compares a capacity estimate with a collection's statistics.
 
     Example:
         ```python
@@ -45,7 +48,7 @@ class StatAPI(IStatAPI):
         self._connect_api = connect_api
 
     @async_log_decorator
-    def get_collection_stats(self, collection_name: str, database_name: str = "default") -> dict[str, Any]:
+    async def get_collection_stats(self, collection_name: str, database_name: str = "default") -> dict[str, Any]:
         """Gets statistics for a collection.
 
         Args:
@@ -63,10 +66,55 @@ class StatAPI(IStatAPI):
         if not collection_name or not isinstance(collection_name, str):
             raise MilvusValidationError("Collection name must be a non-empty string")
         try:
-            collection = Collection(collection_name, using=self._connect_api._alias, db_name=database_name)
-            stats = collection.stats
+            stats = await asyncio.to_thread(self._connect_api.client.get_collection_stats,
+                                            collection_name=collection_name, db_name=database_name)
             log.info(f"Retrieved stats for {collection_name}")
             return stats
         except MilvusException as e:
             log.error(f"Failed to retrieve stats: {e}")
             raise MilvusAPIError(f"Stats retrieval failed: {e}")
+
+    @async_log_decorator
+    async def check_capacity(self, collection_name: str, estimate: CapacityEstimate | None = None,
+                             index_params: dict[str, Any] | None = None, database_name: str = "default",
+                             estimator: CapacityEstimator | None = None) -> dict[str, Any]:
+        """Compares a capacity estimate with the statistics of an existing collection.
+
+        The collection's schema and indexes are read from the server and estimated at
+        its actual row count, so the report shows what the collection should take now.
+
+        Args:
+            collection_name (str): Name of the collection.
+            estimate (CapacityEstimate | None): Estimate made before creating the
+                collection. Defaults to the estimate at the actual row count.
+            index_params (Dict[str, Any] | None): Index parameters; read from the
+                collection's indexes when None.
+            database_name (str): Database name. Defaults to "default".
+            estimator (CapacityEstimator | None): Estimator to use. Defaults to a new one.
+
+        Returns:
+            Dict[str, Any]: The ``CapacityEstimator.compare`` report and the current
+                estimate under "estimate".
+
+        Raises:
+            MilvusValidationError: If inputs are invalid.
+            MilvusAPIError: If reading the collection fails.
+
+        """
+        if not collection_name or not isinstance(collection_name, str):
+            raise MilvusValidationError("Collection name must be a non-empty string")
+        estimator = estimator or CapacityEstimator()
+        client = self._connect_api.client
+        try:
+            stats = await self.get_collection_stats(collection_name, database_name)
+            schema = await asyncio.to_thread(client.describe_collection, collection_name, db_name=database_name)
+            if index_params is None:
+                index_params = await asyncio.to_thread(index_params_of, client, collection_name, db_name=database_name)
+        except MilvusException as e:
+            log.error(f"Failed to read collection {collection_name}: {e}")
+            raise MilvusAPIError(f"Capacity check failed: {e}")
+        current = estimator.estimate(schema, int(stats.get("row_count", 0)), index_params)
+        report = estimator.compare(estimate or current, stats, schema, index_params)
+        report["estimate"] = current.to_dict()
+        log.info(f"Capacity of {collection_name}: {current.rows} rows, {current.memory_bytes} bytes loaded")
+        return report
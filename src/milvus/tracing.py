@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# File: src/milvus/tracing.py
+"""Request Tracing
+
+OpenTelemetry-style spans over the ``MilvusAPI`` facade and the steps below it. A span
+has a name, a parent, start and end times, attributes (collection, nq, limit, rows,
+...) and a status. The current span travels in a context variable, so steps run in
+``asyncio.to_thread`` workers or tasks started by a request nest under it.
+
+- ``enable_tracing(exporter)`` starts tracing; finished spans go to the exporter.
+- ``span(name, **attributes)`` times a step; ``traced()`` times a whole method, or
+  each page of an async generator method.
+- ``InMemorySpanExporter`` keeps spans for tests and local profiling and summarizes
+  their durations per name.
+
+Tracing is off by default. ``span`` then returns a shared no-op span and ``traced``
+methods call straight through, so instrumented code costs one global check per step.
+With ``sample_rate`` below 1, only that fraction of root spans is recorded; the steps
+of an unsampled request are no-ops too.
+
+``set_call_hook`` plugs a further context manager factory around ``traced`` calls,
+independently of tracing; ``src.milvus.profiling`` uses it to profile operations.
+
+Example Usage:
+```python
+>>> from src.milvus.tracing import InMemorySpanExporter, enable_tracing
+>>> exporter = InMemorySpanExporter()
+>>> enable_tracing(exporter)
+>>> await api.search("docs", [embedding], "vector", {"metric_type": "COSINE"}, 10)
+>>> [(s.name, round(s.duration_ms, 2)) for s in exporter.spans]
+[('search.validate', 0.01), ('search.load', 0.4), ('search.rpc', 3.1), ('search.postprocess', 0.05),
+ ('MilvusAPI.search', 3.7)]
+>>> exporter.summary()["search.rpc"]
+{'count': 1, 'total_ms': 3.1, 'mean_ms': 3.1, 'p50_ms': 3.1, 'p99_ms': 3.1, 'errors': 0}
+```
+"""
+import inspect
+import os
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any
+
+from src.logger import getLogger as GetLogger
+
+# Logging setup
+log = GetLogger(__name__)
+
+OK = "OK"
+ERROR = "ERROR"
+
+
+@dataclass
+class Span:
+    """A timed step of a request.
+
+    Attributes:
+        name (str): Step name, e.g. "MilvusAPI.search" or "search.rpc".
+        trace_id (str): Identifier shared by all spans of a request.
+        span_id (str): Identifier of this span.
+        parent_id (str | None): ``span_id`` of the enclosing span.
+        start_ns (int): Start on the ``time.time_ns()`` clock.
+        end_ns (int | None): End, once finished.
+        attributes (Dict[str, Any]): Step attributes.
+        status (str): "OK" or "ERROR".
+        error (str | None): Exception of a failed step.
+
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = OK
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any):
+        self.attributes.update(attributes)
+
+    def record_exception(self, error: BaseException):
+        self.status = ERROR
+        self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "trace_id": self.trace_id, "span_id": self.span_id, "parent_id": self.parent_id,
+                "start_ns": self.start_ns, "end_ns": self.end_ns, "duration_ms": self.duration_ms,
+                "attributes": dict(self.attributes), "status": self.status, "error": self.error}
+
+
+class _NoopSpan:
+    """Span stand-in used while tracing is off or the request is not sampled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, **attributes: Any):
+        pass
+
+    def record_exception(self, error: BaseException):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+# Current span of the request; NOOP_SPAN inside an unsampled request
+_current: ContextVar[Span | _NoopSpan | None] = ContextVar("milvus_span", default=None)
+
+
+class InMemorySpanExporter:
+    """Keeps the most recent finished spans in memory.
+
+    Methods:
+        export: Receives a finished span.
+        find: Spans of a name.
+        summary: Count, total, mean, p50, p99 and errors per span name.
+        clear: Forgets all spans.
+
+    """
+
+    def __init__(self, max_spans: int = 100_000):
+        self._lock = threading.Lock()
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span):
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def find(self, name: str) -> list[Span]:
+        return [s for s in self.spans if s.name == name]
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        by_name: dict[str, list[Span]] = {}
+        for s in self.spans:
+            by_name.setdefault(s.name, []).append(s)
+        summary = {}
+        for name, spans in by_name.items():
+            durations = sorted(s.duration_ms for s in spans)
+            total = sum(durations)
+            summary[name] = {"count": len(durations), "total_ms": total, "mean_ms": total / len(durations),
+                             "p50_ms": durations[(len(durations) - 1) // 2],
+                             "p99_ms": durations[min(len(durations) - 1, int(len(durations) * 0.99))],
+                             "errors": sum(s.status == ERROR for s in spans)}
+        return summary
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+
+class Tracer:
+    """Creates spans and hands finished ones to an exporter.
+
+    Attributes:
+        exporter (Any): Object with an ``export(span)`` method.
+        sample_rate (float): Fraction of root spans recorded.
+
+    """
+
+    def __init__(self, exporter: Any, sample_rate: float = 1.0):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def start(self, name: str, **attributes: Any) -> Span | _NoopSpan:
+        """Starts a span under the current one without making it current; ``finish`` ends it."""
+        parent = _current.get()
+        if parent is NOOP_SPAN or (parent is None and self.sample_rate < 1.0 and random.random() >= self.sample_rate):
+            return NOOP_SPAN
+        return Span(name, parent.trace_id if parent is not None else os.urandom(16).hex(), os.urandom(8).hex(),
+                    parent.span_id if parent is not None else None, attributes=attributes)
+
+    def finish(self, current: Span | _NoopSpan):
+        """Ends a span and exports it."""
+        if current is NOOP_SPAN:
+            return
+        current.end_ns = time.time_ns()
+        try:
+            self.exporter.export(current)
+        except Exception as e:
+            log.error(f"Span exporter failed on {current.name}: {e}")
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | _NoopSpan]:
+        current = self.start(name, **attributes)
+        token = _current.set(current)
+        try:
+            yield current
+        except BaseException as e:
+            current.record_exception(e)
+            raise
+        finally:
+            _current.reset(token)
+            self.finish(current)
+
+
+_tracer: Tracer | None = None
+# Called with the operation name around every traced call; returns a context manager
+_call_hook: Callable[[str], Any] | None = None
+
+
+def enable_tracing(exporter: Any | None = None, sample_rate: float = 1.0) -> Tracer:
+    """Turns tracing on; spans go to ``exporter`` (a new InMemorySpanExporter by default)."""
+    global _tracer
+    _tracer = Tracer(exporter if exporter is not None else InMemorySpanExporter(), sample_rate)
+    return _tracer
+
+
+def disable_tracing():
+    """Turns tracing off."""
+    global _tracer
+    _tracer = None
+
+
+def set_call_hook(hook: Callable[[str], Any] | None, only: Any | None = None):
+    """Sets the hook wrapped around traced calls; None removes it.
+
+    Args:
+        hook (Callable[[str], Any] | None): Returns a context manager for an operation name.
+        only (Any | None): Change the hook only while ``only`` is the installed one.
+
+    """
+    global _call_hook
+    if only is None or _call_hook is only:
+        _call_hook = hook
+
+
+def get_tracer() -> Tracer | None:
+    """Returns the active tracer, or None while tracing is off."""
+    return _tracer
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """Returns a context manager timing a step; a shared no-op while tracing is off."""
+    tracer = _tracer
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.span(name, **attributes)
+
+
+def current_span() -> Span | _NoopSpan:
+    """Returns the span of the running step, or the no-op span."""
+    current = _current.get()
+    return NOOP_SPAN if current is None else current
+
+
+def traced(name: str | None = None) -> Callable:
+    """Decorator timing every call of a coroutine function or function in a span.
+
+    The span is named ``name`` (by default ``Class.method``) and gets the call's
+    ``collection_name`` and ``database_name`` arguments as attributes. For async
+    generators it lasts until the iteration ends and has a ``<name>.page`` child span
+    per item fetched.
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        parameters = list(inspect.signature(func).parameters)
+        positions = [(key, parameters.index(argument)) for key, argument in
+                     (("collection", "collection_name"), ("database", "database_name")) if argument in parameters]
+
+        def attributes(args: tuple, kwargs: dict) -> dict[str, Any]:
+            found = {}
+            for key, position in positions:
+                value = args[position] if position < len(args) else kwargs.get(parameters[position])
+                if value is not None:
+                    found[key] = value
+            return found
+
+        if inspect.isasyncgenfunction(func):
+            @wraps(func)
+            async def async_gen_wrapper(*args, **kwargs):
+                tracer, hook = _tracer, _call_hook
+                if tracer is None and hook is None:
+                    async for item in func(*args, **kwargs):
+                        yield item
+                    return
+                # The span lasts the whole iteration but is current only while a page is
+                # fetched, so the consumer's own steps between pages do not nest under it
+                outer = tracer.start(span_name, **attributes(args, kwargs)) if tracer is not None else NOOP_SPAN
+                items = func(*args, **kwargs)
+                page = 0
+                try:
+                    while True:
+                        token = _current.set(outer)
+                        try:
+                            with (tracer.span(f"{span_name}.page", page=page) if tracer is not None else NOOP_SPAN,
+                                  hook(span_name) if hook is not None else NOOP_SPAN):
+                                try:
+                                    item = await anext(items)
+                                except StopAsyncIteration:
+                                    break
+                        finally:
+                            _current.reset(token)
+                        page += 1
+                        yield item
+                except GeneratorExit:
+                    raise
+                except BaseException as e:
+                    outer.record_exception(e)
+                    raise
+                finally:
+                    await items.aclose()
+                    outer.set_attribute("pages", page)
+                    if tracer is not None:
+                        tracer.finish(outer)
+            return async_gen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                tracer, hook = _tracer, _call_hook
+                if tracer is None and hook is None:
+                    return await func(*args, **kwargs)
+                with (tracer.span(span_name, **attributes(args, kwargs)) if tracer is not None else NOOP_SPAN,
+                      hook(span_name) if hook is not None else NOOP_SPAN):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer, hook = _tracer, _call_hook
+            if tracer is None and hook is None:
+                return func(*args, **kwargs)
+            with (tracer.span(span_name, **attributes(args, kwargs)) if tracer is not None else NOOP_SPAN,
+                  hook(span_name) if hook is not None else NOOP_SPAN):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
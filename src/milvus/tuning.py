@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# File: src/milvus/tuning.py
+"""Index Parameter Tuning
+
+Sweeps candidate index configurations (index type, build parameters and search
+parameters) over a sample of vectors and queries and measures, for each one, the
+recall@k against exact NumPy brute-force ground truth, the query throughput and the
+latency percentiles. The Pareto front of recall versus throughput tells which
+``index_params`` are worth passing to ``IndexAPI.create_index``.
+
+The tuner talks to any ``MilvusClient``-compatible client, so it runs against a
+Milvus Lite database file, an in-process stand-in or a real cluster.
+
+Example Usage:
+```python
+>>> import numpy as np
+>>> from pymilvus import MilvusClient
+>>> from src.milvus.tuning import IndexTuner, default_candidates
+>>> vectors = np.random.random((20000, 64)).astype(np.float32)
+>>> queries = np.random.random((200, 64)).astype(np.float32)
+>>> tuner = IndexTuner(MilvusClient("./tuning.db"), vectors, queries, k=10, metric_type="L2")
+>>> results = tuner.run(default_candidates(["IVF_FLAT", "HNSW"]))
+>>> print(tuner.report(results))
+>>> index_params = tuner.best(results, min_recall=0.95).candidate.index_params("L2")
+```
+
+Command line:
+    python -m src.milvus.tuning --uri ./tuning.db --vectors base.npy --queries queries.npy --k 10
+"""
+import argparse
+import itertools
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from pymilvus import DataType, MilvusException
+
+from src.logger import getLogger as GetLogger
+from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
+
+# Logging setup
+log = GetLogger(__name__)
+
+# Build and search parameter grids swept by default, per index type
+DEFAULT_GRIDS: dict[str, tuple[dict[str, list], dict[str, list]]] = {
+    "FLAT": ({}, {}),
+    "IVF_FLAT": ({"nlist": [128, 1024]}, {"nprobe": [8, 32, 128]}),
+    "IVF_SQ8": ({"nlist": [128, 1024]}, {"nprobe": [8, 32, 128]}),
+    "IVF_PQ": ({"nlist": [1024], "m": [8, 16], "nbits": [8]}, {"nprobe": [16, 64]}),
+    "HNSW": ({"M": [16, 32], "efConstruction": [200]}, {"ef": [32, 64, 128, 256]}),
+}
+
+
+@dataclass(frozen=True)
+class IndexCandidate:
+    """One index configuration to evaluate.
+
+    Attributes:
+        index_type (str): Milvus index type, e.g. "HNSW".
+        build_params (Dict[str, Any]): Index build parameters, e.g. ``{"M": 16}``.
+        search_params (Dict[str, Any]): Search parameters, e.g. ``{"ef": 64}``.
+
+    """
+
+    index_type: str
+    build_params: dict[str, Any] = field(default_factory=dict)
+    search_params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def build_key(self) -> tuple:
+        """Identifies the index build shared by candidates differing only in search parameters."""
+        return self.index_type, tuple(sorted(self.build_params.items()))
+
+    @property
+    def label(self) -> str:
+        """Short human-readable description."""
+        build = ",".join(f"{k}={v}" for k, v in sorted(self.build_params.items()))
+        search = ",".join(f"{k}={v}" for k, v in sorted(self.search_params.items()))
+        return f"{self.index_type}({build})[{search}]"
+
+    def index_params(self, metric_type: str) -> dict[str, Any]:
+        """Returns the candidate as ``index_params`` for ``IndexAPI.create_index``."""
+        return {"index_type": self.index_type, "metric_type": metric_type, "params": dict(self.build_params)}
+
+
+def candidate_grid(index_type: str, build_grid: dict[str, list] | None = None,
+                   search_grid: dict[str, list] | None = None) -> list[IndexCandidate]:
+    """Expands parameter grids into the cartesian product of candidates.
+
+    Args:
+        index_type (str): Milvus index type.
+        build_grid (Dict[str, List] | None): Values to try per build parameter.
+        search_grid (Dict[str, List] | None): Values to try per search parameter.
+
+    Returns:
+        List[IndexCandidate]: One candidate per parameter combination.
+
+    """
+    def expand(grid: dict[str, list] | None) -> list[dict[str, Any]]:
+        grid = grid or {}
+        return [dict(zip(grid, values, strict=True)) for values in itertools.product(*grid.values())]
+
+    return [IndexCandidate(index_type, build, search)
+            for build in expand(build_grid) for search in expand(search_grid)]
+
+
+def default_candidates(index_types: Iterable[str] | None = None) -> list[IndexCandidate]:
+    """Returns the default sweep for the given index types (all known types by default)."""
+    candidates = []
+    for index_type in index_types or DEFAULT_GRIDS:
+        if index_type not in DEFAULT_GRIDS:
+            raise MilvusValidationError(f"No default parameter grid for index type {index_type}")
+        candidates.extend(candidate_grid(index_type, *DEFAULT_GRIDS[index_type]))
+    return candidates
+
+
+@dataclass
+class TuningResult:
+    """Measurements for one candidate.
+
+    Attributes:
+        candidate (IndexCandidate): The evaluated configuration.
+        recall (float): Mean recall@k against exact ground truth.
+        qps (float): Queries per second, one query per request.
+        p50_ms (float): Median latency in milliseconds.
+        p99_ms (float): 99th percentile latency in milliseconds.
+        build_seconds (float): Time to build and load the index.
+        pareto (bool): Whether the result is on the recall/QPS Pareto front.
+
+    """
+
+    candidate: IndexCandidate
+    recall: float
+    qps: float
+    p50_ms: float
+    p99_ms: float
+    build_seconds: float
+    pareto: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns a JSON-serializable representation."""
+        return {
+            "index_type": self.candidate.index_type,
+            "build_params": self.candidate.build_params,
+            "search_params": self.candidate.search_params,
+            "recall": self.recall,
+            "qps": self.qps,
+            "p50_ms": self.p50_ms,
+            "p99_ms": self.p99_ms,
+            "build_seconds": self.build_seconds,
+            "pareto": self.pareto,
+        }
+
+
+def exact_ground_truth(vectors: np.ndarray, queries: np.ndarray, k: int, metric_type: str = "L2",
+                       chunk_size: int = 256) -> np.ndarray:
+    """Computes exact top-k neighbours by brute force.
+
+    Queries are processed in chunks so the distance matrix stays bounded at
+    ``chunk_size x len(vectors)``.
+
+    Args:
+        vectors (np.ndarray): ``(n, dim)`` base vectors.
+        queries (np.ndarray): ``(nq, dim)`` query vectors.
+        k (int): Number of neighbours.
+        metric_type (str): "L2", "IP" or "COSINE". Defaults to "L2".
+        chunk_size (int): Queries per chunk. Defaults to 256.
+
+    Returns:
+        np.ndarray: ``(nq, k)`` row indices into ``vectors``, closest first.
+
+    """
+    metric_type = metric_type.upper()
+    if metric_type not in ("L2", "IP", "COSINE"):
+        raise MilvusValidationError(f"Unsupported metric for ground truth: {metric_type}")
+    base = np.asarray(vectors, dtype=np.float32)
+    queries = np.asarray(queries, dtype=np.float32)
+    k = min(k, len(base))
+    if metric_type == "COSINE":
+        base = base / np.maximum(np.linalg.norm(base, axis=1, keepdims=True), 1e-12)
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+    base_norms = np.einsum("ij,ij->i", base, base) if metric_type == "L2" else None
+    truth = np.empty((len(queries), k), dtype=np.int64)
+    for start in range(0, len(queries), chunk_size):
+        chunk = queries[start:start + chunk_size]
+        scores = chunk @ base.T
+        # Smaller is closer: negative similarity, or squared L2 without the constant query norm
+        keys = base_norms[None, :] - 2 * scores if metric_type == "L2" else -scores
+        top = np.argpartition(keys, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(keys, top, axis=1), axis=1)
+        truth[start:start + len(chunk)] = np.take_along_axis(top, order, axis=1)
+    return truth
+
+
+def recall_at_k(found: list[list[int]] | np.ndarray, truth: np.ndarray, k: int) -> float:
+    """Returns the mean fraction of the true top-k found in the returned top-k."""
+    hits = sum(len(set(list(row)[:k]) & set(truth_row[:k].tolist())) for row, truth_row in zip(found, truth, strict=True))
+    return hits / (len(truth) * min(k, truth.shape[1])) if len(truth) else 0.0
+
+
+def pareto_front(results: list[TuningResult]) -> list[TuningResult]:
+    """Marks and returns the results not dominated in both recall and QPS.
+
+    Args:
+        results (List[TuningResult]): Measured candidates.
+
+    Returns:
+        List[TuningResult]: Non-dominated results, by decreasing recall.
+
+    """
+    front = []
+    best_qps = -1.0
+    for result in sorted(results, key=lambda r: (-r.recall, -r.qps)):
+        result.pareto = result.qps > best_qps
+        if result.pareto:
+            front.append(result)
+            best_qps = result.qps
+    return front
+
+
+class IndexTuner:
+    """Builds candidate indexes on a sample and measures recall, throughput and latency.
+
+    The sample is inserted once into a scratch collection; each distinct index build
+    is created, loaded and searched with every search-parameter setting of the
+    candidates that share it, then released and dropped.
+
+    Attributes:
+        client (Any): A ``MilvusClient``-compatible client.
+        vectors (np.ndarray): ``(n, dim)`` sample of base vectors.
+        queries (np.ndarray): ``(nq, dim)`` sample of query vectors.
+        k (int): Neighbours per query for recall@k.
+        metric_type (str): Distance metric.
+        collection_name (str): Scratch collection name.
+
+    Methods:
+        run: Evaluates candidates and marks the Pareto front.
+        best: Picks the fastest result meeting a recall target.
+        report: Formats results as a table.
+
+    Example:
+        ```python
+        tuner = IndexTuner(MilvusClient("./tuning.db"), vectors, queries, k=10)
+        results = tuner.run(candidate_grid("HNSW", {"M": [16]}, {"ef": [64, 128]}))
+        ```
+
+    Raises:
+        MilvusValidationError: If the sample is invalid.
+        MilvusAPIError: If a Milvus operation fails.
+
+    """
+
+    def __init__(self, client: Any, vectors: np.ndarray, queries: np.ndarray, k: int = 10,
+                 metric_type: str = "COSINE", collection_name: str = "index_tuning",
+                 insert_batch_size: int = 10000):
+        """Initializes the tuner.
+
+        Args:
+            client (Any): A ``MilvusClient``-compatible client.
+            vectors (np.ndarray): ``(n, dim)`` sample of base vectors.
+            queries (np.ndarray): ``(nq, dim)`` sample of query vectors.
+            k (int): Neighbours per query. Defaults to 10.
+            metric_type (str): Distance metric. Defaults to "COSINE".
+            collection_name (str): Scratch collection name. Defaults to "index_tuning".
+            insert_batch_size (int): Rows per insert request. Defaults to 10000.
+
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        queries = np.asarray(queries, dtype=np.float32)
+        if vectors.ndim != 2 or queries.ndim != 2 or vectors.shape[1] != queries.shape[1]:
+            raise MilvusValidationError("Vectors and queries must be 2-D arrays of the same dimension")
+        if not len(vectors) or not len(queries):
+            raise MilvusValidationError("Vectors and queries must not be empty")
+        if k < 1:
+            raise MilvusValidationError("k must be positive")
+        self.client = client
+        self.vectors = vectors
+        self.queries = queries
+        self.k = k
+        self.metric_type = metric_type.upper()
+        self.collection_name = collection_name
+        self.insert_batch_size = insert_batch_size
+        self._truth: np.ndarray | None = None
+
+    @property
+    def ground_truth(self) -> np.ndarray:
+        """Exact top-k row indices per query, computed on first use."""
+        if self._truth is None:
+            started = time.perf_counter()
+            self._truth = exact_ground_truth(self.vectors, self.queries, self.k, self.metric_type)
+            log.info(f"Computed exact ground truth for {len(self.queries)} queries "
+                     f"in {time.perf_counter() - started:.2f}s")
+        return self._truth
+
+    def _load_sample(self):
+        if self.client.has_collection(self.collection_name):
+            self.client.drop_collection(self.collection_name)
+        schema = self.client.create_schema(auto_id=False, enable_dynamic_field=False)
+        schema.add_field(field_name="id", datatype=DataType.INT64, is_primary=True)
+        schema.add_field(field_name="vector", datatype=DataType.FLOAT_VECTOR, dim=self.vectors.shape[1])
+        self.client.create_collection(collection_name=self.collection_name, schema=schema)
+        for start in range(0, len(self.vectors), self.insert_batch_size):
+            batch = self.vectors[start:start + self.insert_batch_size]
+            self.client.insert(collection_name=self.collection_name, data=[
+                {"id": start + i, "vector": vector} for i, vector in enumerate(batch)])
+        self.client.flush(collection_name=self.collection_name)
+        log.info(f"Loaded {len(self.vectors)} sample vectors into {self.collection_name}")
+
+    def _build(self, candidate: IndexCandidate) -> float:
+        started = time.perf_counter()
+        index_params = self.client.prepare_index_params()
+        index_params.add_index(field_name="vector", index_type=candidate.index_type, index_name="vector_idx",
+                               metric_type=self.metric_type, params=dict(candidate.build_params))
+        self.client.create_index(collection_name=self.collection_name, index_params=index_params)
+        self.client.load_collection(collection_name=self.collection_name)
+        return time.perf_counter() - started
+
+    def _teardown_index(self):
+        self.client.release_collection(collection_name=self.collection_name)
+        self.client.drop_index(collection_name=self.collection_name, index_name="vector_idx")
+
+    def _measure(self, candidate: IndexCandidate, build_seconds: float) -> TuningResult:
+        search_params = {"metric_type": self.metric_type, "params": dict(candidate.search_params)}
+        latencies = np.empty(len(self.queries))
+        found = []
+        started = time.perf_counter()
+        for i, query in enumerate(self.queries):
+            request_started = time.perf_counter()
+            hits = self.client.search(collection_name=self.collection_name, data=[query], limit=self.k,
+                                      search_params=search_params, anns_field="vector")
+            latencies[i] = time.perf_counter() - request_started
+            found.append([hit["id"] for hit in hits[0]])
+        elapsed = time.perf_counter() - started
+        result = TuningResult(
+            candidate=candidate,
+            recall=recall_at_k(found, self.ground_truth, self.k),
+            qps=len(self.queries) / elapsed if elapsed > 0 else float("inf"),
+            p50_ms=float(np.percentile(latencies, 50) * 1000),
+            p99_ms=float(np.percentile(latencies, 99) * 1000),
+            build_seconds=build_seconds,
+        )
+        log.info(f"{candidate.label}: recall@{self.k}={result.recall:.4f} qps={result.qps:.1f} "
+                 f"p99={result.p99_ms:.2f}ms")
+        return result
+
+    def run(self, candidates: list[IndexCandidate], keep_collection: bool = False) -> list[TuningResult]:
+        """Evaluates every candidate and marks the Pareto front.
+
+        Args:
+            candidates (List[IndexCandidate]): Configurations to evaluate.
+            keep_collection (bool): Keep the scratch collection afterwards. Defaults to False.
+
+        Returns:
+            List[TuningResult]: One result per candidate, in evaluation order.
+
+        Raises:
+            MilvusValidationError: If no candidates are given.
+            MilvusAPIError: If a Milvus operation fails.
+
+        """
+        if not candidates:
+            raise MilvusValidationError("At least one index candidate is required")
+        self.ground_truth  # noqa: B018 - computed before timing starts
+        builds: dict[tuple, list[IndexCandidate]] = {}
+        for candidate in candidates:
+            builds.setdefault(candidate.build_key, []).append(candidate)
+        results = []
+        try:
+            self._load_sample()
+            for group in builds.values():
+                build_seconds = self._build(group[0])
+                try:
+                    results.extend(self._measure(candidate, build_seconds) for candidate in group)
+                finally:
+                    self._teardown_index()
+        except MilvusException as e:
+            log.error(f"Index tuning failed: {e}")
+            raise MilvusAPIError(f"Index tuning failed: {e}")
+        finally:
+            if not keep_collection:
+                try:
+                    self.client.drop_collection(collection_name=self.collection_name)
+                except MilvusException as e:
+                    log.warning(f"Failed to drop tuning collection {self.collection_name}: {e}")
+        pareto_front(results)
+        return results
+
+    @staticmethod
+    def best(results: list[TuningResult], min_recall: float) -> TuningResult | None:
+        """Returns the highest-throughput result reaching ``min_recall``, if any."""
+        eligible = [result for result in results if result.recall >= min_recall]
+        return max(eligible, key=lambda result: result.qps) if eligible else None
+
+    def report(self, results: list[TuningResult]) -> str:
+        """Formats results as a text table, Pareto-optimal rows marked with ``*``."""
+        lines = [f"{'':1} {'candidate':<48} {'recall@' + str(self.k):>9} {'qps':>10} {'p50 ms':>8} "
+                 f"{'p99 ms':>8} {'build s':>8}"]
+        for result in sorted(results, key=lambda r: (-r.recall, -r.qps)):
+            lines.append(f"{'*' if result.pareto else ' ':1} {result.candidate.label:<48} {result.recall:>9.4f} "
+                         f"{result.qps:>10.1f} {result.p50_ms:>8.2f} {result.p99_ms:>8.2f} "
+                         f"{result.build_seconds:>8.2f}")
+        return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None):
+    """Command line entry point."""
+    import json
+
+    from pymilvus import MilvusClient
+
+    parser = argparse.ArgumentParser(description="Sweep Milvus index parameters for recall, QPS and p99.")
+    parser.add_argument("--uri", default="./index_tuning.db", help="Milvus URI or Milvus Lite file")
+    parser.add_argument("--token", default="", help="Milvus token")
+    parser.add_argument("--vectors", help=".npy file of base vectors (random if omitted)")
+    parser.add_argument("--queries", help=".npy file of query vectors (sampled from vectors if omitted)")
+    parser.add_argument("--rows", type=int, default=20000, help="Random base vectors to generate")
+    parser.add_argument("--dim", type=int, default=64, help="Dimension of random vectors")
+    parser.add_argument("--nq", type=int, default=200, help="Number of queries")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query")
+    parser.add_argument("--metric", default="COSINE", help="Distance metric")
+    parser.add_argument("--index-types", nargs="+", default=["IVF_FLAT", "HNSW"], help="Index types to sweep")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    vectors = np.load(args.vectors, mmap_mode="r") if args.vectors else rng.random((args.rows, args.dim),
+                                                                                   dtype=np.float32)
+    if args.queries:
+        queries = np.load(args.queries)[:args.nq]
+    else:
+        queries = vectors[rng.choice(len(vectors), size=min(args.nq, len(vectors)), replace=False)]
+    tuner = IndexTuner(MilvusClient(uri=args.uri, token=args.token), vectors, queries, args.k, args.metric)
+    results = tuner.run(default_candidates(args.index_types))
+    print(tuner.report(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([result.to_dict() for result in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,24 @@
+import asyncio
 from typing import Any
 
-from pymilvus import Collection, MilvusException
+from pymilvus import MilvusException
 
 from src.logger import getLogger as GetLogger
+from src.milvus.deadline import step_timeout
+from src.milvus.events import DELETE, INSERT, CollectionEvent, CollectionSubject
 from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
 from src.milvus.interfaces import IConnectAPI, IVectorAPI
+from src.milvus.tracing import current_span, span
 from src.utils import async_log_decorator
 
 # Logging setup
 log = GetLogger(__name__)
 
-class VectorAPI(IVectorAPI):
+class VectorAPI(IVectorAPI, CollectionSubject):
     """Handles vector operations like insertion and deletion in Milvus.
 
-    Implements the IVectorAPI interface to manage vector data.
+    Implements the IVectorAPI interface to manage vector data. Successful writes are
+    published as CollectionEvents to attached observers.
 
     Attributes:
         _connect_api (IConnectAPI): The connection API instance.
@@ -21,6 +26,7 @@ class VectorAPI(IVectorAPI):
     Methods:
         insert: Inserts entities into a collection.
         delete: Deletes entities from a collection.
+        attach: Registers an ICollectionObserver for write events.
 
     Example:
         ```python
@@ -41,7 +47,7 @@ class VectorAPI(IVectorAPI):
 
     @async_log_decorator
     async def insert(self, collection_name: str, entities: list[dict[str, Any]], partition_name: str | None = None,
-                     database_name: str = "default") -> dict:
+                     database_name: str = "default", flush: bool = True) -> dict:
         """Inserts entities into a collection.
 
         Args:
@@ -49,6 +55,8 @@ class VectorAPI(IVectorAPI):
             entities (List[Dict[str, Any]]): Entities to insert.
             partition_name (Optional[str]): Partition name. Defaults to None.
             database_name (str): Database name. Defaults to "default".
+            flush (bool): Flush the collection after the insert. Bulk loads pass False
+                for all but the last batch. Defaults to True.
 
         Returns:
             List[int]: List of primary keys for inserted entities.
@@ -62,28 +70,35 @@ class VectorAPI(IVectorAPI):
             raise MilvusValidationError("Collection name must be a non-empty string")
         if not entities or not all(isinstance(e, dict) for e in entities):
             raise MilvusValidationError("Entities must be a non-empty list of dictionaries")
+        current_span().set_attribute("rows", len(entities))
         try:
-            collection = Collection(
-                name=collection_name,
-                using=self._connect_api._db_name
-            )
+            client = self._connect_api.client
             # MR: MilvusResultS
-            mr: dict = await self._connect_api.client.insert(
-                collection_name=collection_name,
-                data=entities,
-                partition_name=partition_name,
-                db_name=database_name
-            )
+            with span("insert.rpc", rows=len(entities)):
+                mr: dict = await asyncio.to_thread(
+                    client.insert,
+                    collection_name=collection_name,
+                    data=entities,
+                    partition_name=partition_name or "",
+                    db_name=database_name,
+                    timeout=step_timeout(step="insert")
+                )
             log.debug(f"Insert result: {mr}")
-            collection.flush()
+            if flush:
+                with span("insert.flush"):
+                    await asyncio.to_thread(client.flush, collection_name=collection_name, db_name=database_name,
+                                            timeout=step_timeout(step="flush"))
             log.info(f"Inserted {len(entities)} entities into {collection_name}")
+            with span("insert.notify"):
+                self.notify(CollectionEvent(INSERT, collection_name, database_name, partition_name or None,
+                                            entities=entities, ids=list(mr.get("ids", []))))
             return mr
         except MilvusException as e:
             log.error(f"Failed to insert entities: {e}")
             raise MilvusAPIError(f"Insert failed: {e}")
 
     @async_log_decorator
-    def delete(self, collection_name: str, expr: str, partition_name: str | None = None,
+    async def delete(self, collection_name: str, expr: str, partition_name: str | None = None,
                      database_name: str = "default"):
         """Deletes entities from a collection based on an expression.
 
@@ -103,15 +118,23 @@ class VectorAPI(IVectorAPI):
         if not expr or not isinstance(expr, str):
             raise MilvusValidationError("Expression must be a non-empty string")
         try:
-            self._connect_api.client.delete(
-                collection_name=collection_name,
-                expr=expr,
-                partition_name=partition_name,
-                db_name=database_name
-            )
-            collection = Collection(collection_name, using=self._connect_api._alias, db_name=database_name)
-            collection.flush()
+            client = self._connect_api.client
+            with span("delete.rpc"):
+                await asyncio.to_thread(
+                    client.delete,
+                    collection_name=collection_name,
+                    filter=expr,
+                    partition_name=partition_name or "",
+                    db_name=database_name,
+                    timeout=step_timeout(step="delete")
+                )
+            with span("delete.flush"):
+                await asyncio.to_thread(client.flush, collection_name=collection_name, db_name=database_name,
+                                        timeout=step_timeout(step="flush"))
             log.info(f"Deleted entities from {collection_name} with expression: {expr}")
+            with span("delete.notify"):
+                self.notify(CollectionEvent(DELETE, collection_name, database_name, partition_name or None,
+                                            expr=expr))
         except MilvusException as e:
             log.error(f"Failed to delete entities: {e}")
             raise MilvusAPIError(f"Delete failed: {e}")
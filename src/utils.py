@@ -6,13 +6,15 @@ import hmac
 import json
 import os
 from functools import wraps
-from typing import Any
-
-# from PIL import Image
-from cryptography.fernet import Fernet
+from typing import TYPE_CHECKING, Any
 
+from src.__config__ import load_env
 from src.logger import getLogger as GetLogger
 
+if TYPE_CHECKING:
+    # from PIL import Image
+    from cryptography.fernet import Fernet
+
 # Logging setup
 log = GetLogger(__name__)
 
@@ -107,6 +109,7 @@ class ConfigManager:
             with open(config_file) as f:
                 config = json.load(f)
                 defaults.update(config)
+        load_env()
         for key in defaults:
             defaults[key] = os.getenv(key.upper(), defaults[key])
         return defaults
@@ -146,7 +149,7 @@ class SecurityManager:
 
     """
 
-    cipher: Fernet = None
+    cipher: 'Fernet' = None
     config: ConfigManager = None
 
     def __init__(self, config: ConfigManager):
@@ -161,6 +164,8 @@ class SecurityManager:
             ValueError: If the encryption key is not valid.
 
         """
+        from cryptography.fernet import Fernet
+
         self.cipher = Fernet(config.get("encryption_key"))
         self.config = config
 
@@ -512,19 +512,6 @@ def test_milvus_api_generate_embeddings():
 #     with pytest.raises(MilvusAPIError, match="Configuration load failed"):
 #         ConfigurationLoader(config_file)
 #
-# # Test DataGenerator
-# def test_data_generator_vectors():
-#     """Tests generating synthetic vectors."""
-#     generator = DataGenerator()
-#     vectors = generator.generate_vectors("float", 128, 10)
-#     assert vectors.shape == (10, 128)
-#     assert np.all((vectors >= 0) & (vectors <= 1))
-#
-# def test_data_generator_invalid_type():
-#     """Tests handling of invalid vector type."""
-#     generator = DataGenerator()
-#     with pytest.raises(MilvusValidationError, match="Unsupported vector type"):
-#         generator.generate_vectors("invalid", 128, 10)
 
 
 if __name__ == "__main__":
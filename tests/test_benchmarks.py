@@ -0,0 +1,96 @@
+import pytest
+from benchmarks import cases
+from benchmarks.harness import BenchmarkResult, Report, compare
+from benchmarks.loadgen import LatencyHistogram, LoadConfig, LoadGenerator, parse_mix
+
+
+def result(name, throughput, p99, **params):
+    return BenchmarkResult(name, params, 10, 1, {"mean": p99, "min": p99, "p50": p99, "p90": p99, "p99": p99,
+                                                  "max": p99}, throughput, "ops/s")
+
+
+@pytest.fixture
+def backend():
+    with cases.open_backend("memory://") as backend:
+        yield backend
+
+
+###########################################################
+# Benchmark harness tests
+class TestBenchmarkHarness:
+    def test_from_timings(self):
+        summary = BenchmarkResult.from_timings("insert", {"batch_size": 10}, [0.01, 0.03], items=10,
+                                               unit="rows/s")
+        assert summary.throughput == pytest.approx(500)
+        assert summary.latency_ms["p50"] == pytest.approx(20)
+        assert summary.key == "insert batch_size=10"
+
+    def test_report_round_trip_and_compare(self, tmp_path):
+        base = Report.create(backend="memory://")
+        base.add(result("search", 1000, 2.0, nq=1))
+        base.add(result("insert", 500, 10.0, batch_size=10))
+        base.save(tmp_path / "base.json")
+        head = Report.create(backend="memory://")
+        head.add(result("search", 800, 2.1, nq=1))
+        head.add(result("insert", 520, 9.0, batch_size=10))
+        head.add(result("embeddings", 1, 1.0))
+        comparison = compare(Report.load(tmp_path / "base.json"), head, threshold=0.1)
+        assert [row["key"] for row in comparison.rows] == ["search nq=1", "insert batch_size=10"]
+        assert [row["key"] for row in comparison.regressions] == ["search nq=1"]
+
+    def test_cases_run_on_memory_backend(self, backend):
+        inserts = cases.insert_throughput(backend, [5], [8], repeat=2)
+        searches = cases.search_latency(backend, [2], [3], ["none", "compound"], dim=8, rows=200, repeat=2)
+        embeddings = cases.embedding_throughput(backend, [64], items=128, dim=8, repeat=1)
+        assert [r.key for r in inserts] == ["insert batch_size=5 dim=8"]
+        assert len(searches) == 2 and all(r.unit == "queries/s" for r in searches)
+        assert embeddings[0].throughput > 0
+        assert not backend.client.list_collections()
+
+
+###########################################################
+# Load generator tests
+class TestLoadGenerator:
+    def test_histogram_percentiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for micros in range(1, 100_001):
+            histogram.record(micros / 1e6)
+        assert histogram.count == 100_000
+        assert histogram.percentile(50) == pytest.approx(0.05, rel=1 / 64)
+        assert histogram.percentile(99) == pytest.approx(0.099, rel=1 / 64)
+        assert histogram.percentile(100) == pytest.approx(0.1)
+        other = LatencyHistogram()
+        other.record(1.0)
+        histogram.merge(other)
+        assert histogram.max_us == 1_000_000
+
+    def test_parse_mix_and_validation(self):
+        assert parse_mix("search=0.9, insert=0.1") == {"search": 0.9, "insert": 0.1}
+        with pytest.raises(ValueError):
+            LoadConfig(mix={"upsert": 1.0})
+
+    async def test_latency_counts_queueing_behind_slow_requests(self):
+        # One worker and 20 ms calls cannot keep up with 200 requests/s: open-loop latency
+        # must include the time requests waited for their turn, not only the service time.
+        config = LoadConfig(qps=200, duration=0.5, mix={"search": 1.0}, arrival="uniform", workers=1, dim=8,
+                            preload=100, latency=0.02, interval=0.25)
+        report = await LoadGenerator(config).run()
+        search = report.totals["search"]
+        assert search["count"] == 100 and search["errors"] == 0
+        assert search["max_ms"] > 500
+        assert report.timeseries and "search" in report.timeseries[0]["ops"]
+
+
+###########################################################
+# Startup tests
+class TestStartup:
+    def test_facade_import_stays_light(self):
+        # Sub-APIs, pymilvus, NumPy, cryptography and the .env file load on first use
+        # (checked through sys.modules of a fresh interpreter; wall-clock time is too noisy)
+        loaded = cases.cold_import("src.milvus.milvus")["modules"]
+        assert loaded == []
+
+    def test_startup_case(self):
+        [result] = cases.startup_time(("src.milvus.exceptions",), repeat=2)
+        assert result.key == "startup module=src.milvus.exceptions" and result.samples == 2
+
@@ -0,0 +1,75 @@
+import pytest
+from pymilvus import CollectionSchema, DataType, FieldSchema
+from src.milvus.capacity import GB, SYSTEM_FIELD_BYTES, CapacityEstimator
+from src.milvus.collection import CollectionSchemaBuilder
+from src.milvus.connect import ConnectAPI
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.milvus import MilvusAPI
+
+
+@pytest.fixture
+def schema():
+    return CollectionSchema([FieldSchema("id", DataType.INT64, is_primary=True),
+                             FieldSchema("text", DataType.VARCHAR, max_length=512),
+                             FieldSchema("vector", DataType.FLOAT_VECTOR, dim=768)])
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        connect_api.client.create_collection("docs", dimension=2)
+        yield MilvusAPI(connect_api)
+
+
+###########################################################
+# Capacity estimator tests
+class TestCapacityEstimator:
+    def test_sizes_follow_schema_and_index(self, schema):
+        estimator = CapacityEstimator()
+        flat = estimator.estimate(schema, 1_000_000)
+        assert flat.field_bytes == {"id": 8, "text": 260, "vector": 3072}
+        assert flat.raw_bytes == 1_000_000 * (8 + 260 + 3072 + SYSTEM_FIELD_BYTES)
+        assert flat.index_types == {"vector": "FLAT"} and flat.index_memory_bytes == 3072 * 1_000_000
+        hnsw = estimator.estimate(schema, 1_000_000, {"index_type": "HNSW", "params": {"M": 16}})
+        pq = estimator.estimate(schema, 1_000_000, {"index_type": "IVF_PQ", "params": {"nlist": 1024, "m": 96}})
+        diskann = estimator.estimate(schema, 1_000_000, {"index_type": "DISKANN"})
+        assert pq.memory_bytes < diskann.memory_bytes < flat.memory_bytes < hnsw.memory_bytes
+        assert diskann.disk_bytes > flat.disk_bytes
+        # Averages override the VARCHAR fill ratio
+        assert estimator.estimate(schema, 10, avg_lengths={"text": 32}).field_bytes["text"] == 36
+        with pytest.raises(MilvusValidationError):
+            estimator.estimate(schema, -1)
+
+    def test_layout_suggestions(self, schema):
+        estimator = CapacityEstimator(query_node_memory_gb=64, query_nodes=8)
+        estimate = estimator.estimate(schema, 50_000_000, {"index_type": "HNSW", "params": {"M": 16}})
+        assert estimate.segments == 157 and estimate.partitions == 157
+        assert estimate.query_nodes_per_replica == 4 and estimate.replicas == 2
+        assert estimate.total_memory_bytes == 2 * estimate.memory_bytes > 300 * GB
+        keyed = CollectionSchema([FieldSchema("id", DataType.INT64, is_primary=True),
+                                  FieldSchema("tenant", DataType.INT64, is_partition_key=True),
+                                  FieldSchema("vector", DataType.FLOAT_VECTOR, dim=8)])
+        assert estimator.estimate(keyed, 10_000_000).partitions == 1
+        builder = CollectionSchemaBuilder().add_field("id", DataType.INT64, is_primary=True)
+        builder.add_field("vector", DataType.BINARY_VECTOR, dim=256)
+        assert builder.estimate(1000).field_bytes["vector"] == 32
+
+    async def test_check_capacity_against_collection_stats(self, api):
+        await api.create_index("docs", "vector", {"index_type": "HNSW", "metric_type": "L2", "params": {"M": 8}},
+                               wait=True)
+        planned = api.estimate_capacity(api._connect_api.client.describe_collection("docs"), 200)
+        await api.insert("docs", [{"id": i, "vector": [0.1, 0.2]} for i in range(100)])
+        report = await api.check_capacity("docs", planned)
+        assert report["estimated_rows"] == 200 and report["actual_rows"] == 100 and report["row_ratio"] == 0.5
+        assert report["estimate"]["index_types"] == {"vector": "HNSW"}
+        assert report["expected"]["raw_bytes"] == 100 * (8 + 8 + SYSTEM_FIELD_BYTES)
+        sizes = CapacityEstimator().compare(planned, {"row_count": 100, "data_size": planned.raw_bytes})
+        assert sizes["data_size"]["ratio"] == 2.0
+
+    async def test_check_capacity_reads_the_requested_database(self, api):
+        client = api._connect_api.client
+        client.create_database("analytics")
+        client.create_collection("docs", dimension=4, db_name="analytics")
+        client.insert("docs", [{"id": i, "vector": [0.1] * 4} for i in range(3)], db_name="analytics")
+        report = await api.check_capacity("docs", database_name="analytics")
+        assert report["actual_rows"] == 3 and report["estimate"]["field_bytes"]["vector"] == 16
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from src.milvus.dataset import DataGenerator, Dataset, ScalarColumn
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.memory import InMemoryMilvusClient
+
+
+class RecordingAPI:
+    def __init__(self):
+        self.client = InMemoryMilvusClient()
+        self.client.create_collection("synthetic", dimension=8)
+        self.flushes = []
+
+    async def insert(self, collection_name, entities, flush=True):
+        self.flushes.append(flush)
+        return self.client.insert(collection_name, entities)
+
+
+###########################################################
+# Data generator tests
+class TestDataGenerator:
+    def test_chunks_are_reproducible_and_normalized(self):
+        generator = DataGenerator(dim=16, clusters=4, normalize=True, seed=7, chunk_size=100)
+        vectors, columns = generator.generate_chunk(3)
+        again, _ = DataGenerator(dim=16, clusters=4, normalize=True, seed=7, chunk_size=100).generate_chunk(3)
+        assert vectors.shape == (100, 16) and vectors.dtype == np.float32
+        np.testing.assert_array_equal(vectors, again)
+        np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, rtol=1e-5)
+        # Vectors lie closest to their own mixture center
+        nearest = np.argmax(vectors @ generator.centers.T, axis=1)
+        assert np.mean(nearest == columns["cluster"]) > 0.95
+
+    def test_scalar_distributions(self):
+        rng = np.random.default_rng(0)
+        zipf = ScalarColumn("category", "zipf", cardinality=50, skew=1.5).sample(rng, 20_000)
+        uniform = ScalarColumn("bucket", "uniform", cardinality=50).sample(rng, 20_000)
+        assert zipf.min() >= 0 and zipf.max() < 50 and uniform.max() < 50
+        assert np.mean(zipf == 0) > 0.3 > np.mean(uniform == 0)
+        assert ScalarColumn("score", "normal").sample(rng, 10).dtype == np.float32
+
+    def test_invalid_parameters(self):
+        with pytest.raises(MilvusValidationError, match="Unsupported vector type"):
+            DataGenerator(dim=8, dtype="int8")
+        with pytest.raises(MilvusValidationError, match="Unsupported distribution"):
+            ScalarColumn("category", "pareto")
+        with pytest.raises(MilvusValidationError):
+            DataGenerator(dim=8, scalars=[ScalarColumn("cluster")])
+
+
+###########################################################
+# Dataset tests
+class TestDataset:
+    async def test_write_and_stream_into_collection(self, tmp_path):
+        generator = DataGenerator(dim=8, clusters=3, dtype="float16", chunk_size=64,
+                                  scalars=[ScalarColumn("category", cardinality=10)])
+        dataset = generator.write(str(tmp_path), num_vectors=250)
+        assert isinstance(dataset.vectors, np.memmap) and dataset.vectors.dtype == np.float16
+        assert len(dataset) == 250 and dataset.dim == 8
+        expected, columns = generator.generate_chunk(2)
+        np.testing.assert_array_equal(Dataset(str(tmp_path)).vectors[128:192], expected)
+        np.testing.assert_array_equal(dataset.columns["category"][128:192], columns["category"])
+
+        api = RecordingAPI()
+        assert await dataset.insert_into(api, "synthetic", batch_size=100, id_offset=1000) == 250
+        assert api.flushes == [False, False, True]
+        assert api.client.get_collection_stats("synthetic")["row_count"] == 250
+        row = api.client.get("synthetic", ids=[1249], output_fields=["category"])[0]
+        assert row["category"] == int(dataset.columns["category"][249])
+
+    def test_open_missing_dataset(self, tmp_path):
+        with pytest.raises(MilvusValidationError, match="No dataset found"):
+            Dataset(str(tmp_path))
@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+import pytest
+from src.milvus.connect import ConnectAPI
+from src.milvus.deadline import DeadlineExceeded, deadline, no_deadline, remaining, step_timeout, within
+from src.milvus.milvus import MilvusAPI
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        connect_api.client.create_collection("docs", dimension=2)
+        yield MilvusAPI(connect_api)
+
+
+###########################################################
+# Deadline helper tests
+class TestDeadline:
+    async def test_budget_nesting_and_threads(self):
+        assert remaining() is None and step_timeout(10) == 10
+        with deadline(1.0):
+            with deadline(5.0):
+                assert remaining() <= 1.0
+            assert step_timeout(10) <= 1.0 and step_timeout(0.5) == 0.5
+            # Worker threads see the caller's deadline
+            assert 0 < await asyncio.to_thread(remaining) <= 1.0
+            with no_deadline():
+                assert remaining() is None
+        assert remaining() is None
+
+    async def test_within_cancels_late_steps(self):
+        with deadline(0.02):
+            with pytest.raises(DeadlineExceeded, match="during sleep"):
+                await within(asyncio.sleep(1), "sleep")
+            with pytest.raises(DeadlineExceeded, match="before"):
+                step_timeout(step="search")
+
+
+###########################################################
+# MilvusAPI deadline tests
+class TestSearchDeadline:
+    async def test_search_gets_remaining_budget_and_is_cancelled(self, api):
+        client = api._connect_api.client
+        await api.insert("docs", [{"id": 1, "vector": [0.1, 0.2]}])
+        timeouts = []
+        search = client.search
+        client.search = lambda *args, **kwargs: timeouts.append(kwargs["timeout"]) or search(*args, **kwargs)
+        with deadline(2.0):
+            await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        assert 0 < timeouts[0] <= 2.0
+        client.latency = {"search": 0.5}
+        started = time.perf_counter()
+        with pytest.raises(DeadlineExceeded):
+            with deadline(0.05):
+                await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        assert time.perf_counter() - started < 0.4
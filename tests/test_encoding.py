@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from pymilvus import CollectionSchema, DataType, FieldSchema
+from src.milvus.connect import ConnectAPI
+from src.milvus.encoding import as_query_matrix, decode_queries, encode_queries, l2_normalize
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.milvus import MilvusAPI
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        yield MilvusAPI(connect_api)
+
+
+###########################################################
+# Query encoding tests
+class TestQueryEncoding:
+    def test_validation_and_normalization(self):
+        assert as_query_matrix(np.ones(4, dtype=np.float16)).shape == (1, 4)
+        assert as_query_matrix([np.ones(4), np.zeros(4)]).shape == (2, 4)
+        with pytest.raises(MilvusValidationError):
+            as_query_matrix(np.ones((2, 4), dtype=np.int64))
+        queries = np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32)
+        normalized = l2_normalize(queries)
+        np.testing.assert_allclose(normalized, [[0.6, 0.8], [0.0, 0.0]])
+        assert queries[0, 0] == 3.0  # the caller's array is untouched
+
+    def test_round_trips(self):
+        queries = np.random.default_rng(0).normal(size=(3, 8)).astype(np.float32)
+        for vector_type, tolerance in ((DataType.FLOAT_VECTOR, 0), (DataType.FLOAT16_VECTOR, 1e-2),
+                                       (DataType.BFLOAT16_VECTOR, 1e-2)):
+            rows = encode_queries(queries, vector_type)
+            assert len(rows) == 3 and all(isinstance(row, bytes) for row in rows)
+            np.testing.assert_allclose(decode_queries(rows, vector_type), queries, rtol=tolerance, atol=tolerance)
+        # bfloat16 rounds to nearest even: 1 + 2**-8 lies halfway between 1 and 1 + 2**-7
+        halfway = np.array([[1 + 2 ** -8, 1 + 3 * 2 ** -8]], dtype=np.float32)
+        np.testing.assert_array_equal(decode_queries(encode_queries(halfway, DataType.BFLOAT16_VECTOR),
+                                                     DataType.BFLOAT16_VECTOR), [[1.0, 1 + 2 ** -6]])
+
+
+###########################################################
+# NumPy search tests
+class TestArraySearch:
+    async def test_arrays_match_list_searches(self, api):
+        client = api._connect_api.client
+        client.create_collection("docs", dimension=4, metric_type="COSINE")
+        vectors = np.random.default_rng(1).normal(size=(20, 4)).astype(np.float32)
+        await api.insert("docs", [{"id": i, "vector": v.tolist()} for i, v in enumerate(vectors)])
+        params = {"metric_type": "COSINE"}
+        expected = await api.search("docs", (vectors[:2] * 5).tolist(), "vector", params, 3, compact=True)
+        sent = []
+        search = client.search
+        client.search = lambda *args, **kwargs: sent.append(kwargs["data"]) or search(*args, **kwargs)
+        result = await api.search("docs", vectors[:2] * 5, "vector", params, 3, compact=True)
+        np.testing.assert_array_equal(result.ids, expected.ids)
+        assert all(isinstance(row, bytes) for row in sent[0])
+        np.testing.assert_allclose(np.linalg.norm(decode_queries(sent[0], DataType.FLOAT_VECTOR), axis=1), 1.0,
+                                   rtol=1e-6)
+        halves = await api.search("docs", vectors[:2].astype(np.float16), "vector", params, 3, compact=True)
+        np.testing.assert_array_equal(halves.ids, expected.ids)
+
+    async def test_float16_field_receives_half_precision_rows(self, api):
+        client = api._connect_api.client
+        schema = CollectionSchema([FieldSchema("id", DataType.INT64, is_primary=True),
+                                   FieldSchema("vector", DataType.FLOAT16_VECTOR, dim=4)])
+        client.create_collection("halves", schema=schema)
+        await api.insert("halves", [{"id": i, "vector": np.eye(4)[i].tolist()} for i in range(4)])
+        sent = []
+        search = client.search
+        client.search = lambda *args, **kwargs: sent.append(kwargs["data"]) or search(*args, **kwargs)
+        hits = await api.search("halves", np.eye(4, dtype=np.float32)[2], "vector", {"metric_type": "L2"}, 1)
+        assert hits[0]["id"] == 2 and len(sent[0][0]) == 4 * 2
@@ -0,0 +1,56 @@
+import pytest
+from pymilvus import MilvusException
+from src.milvus.connect import ConnectAPI
+from src.milvus.endpoints import EndpointPool, FailoverClient
+from src.milvus.exceptions import MilvusAPIError
+from src.milvus.memory import InMemoryMilvusClient
+from src.milvus.milvus import MilvusAPI
+
+
+@pytest.fixture
+def connect_api():
+    endpoints = [{"uri": "memory://slow", "latency": 0.01}, "memory://fast"]
+    with ConnectAPI(uri=endpoints, health_check_interval=None) as connect_api:
+        yield connect_api
+
+
+def _clients(connect_api):
+    return {endpoint.uri: endpoint.client for endpoint in connect_api.client.pool.endpoints}
+
+
+###########################################################
+# EndpointPool tests
+class TestEndpointPool:
+    def test_routes_to_lowest_latency_and_shares_memory_deployment(self, connect_api):
+        assert isinstance(connect_api.client, FailoverClient)
+        clients = _clients(connect_api)
+        connect_api.client.create_collection("docs", dimension=2)
+        assert clients["memory://fast"].calls.get("create_collection") == 1
+        assert "create_collection" not in clients["memory://slow"].calls
+        assert clients["memory://slow"].has_collection("docs")
+
+    async def test_transparent_failover_keeps_facade(self, connect_api):
+        api = MilvusAPI(connect_api)
+        connect_api.client.create_collection("docs", dimension=2)
+        await api.insert("docs", [{"id": 1, "vector": [0.1, 0.2]}])
+        clients = _clients(connect_api)
+        clients["memory://fast"].error_rate = 1.0
+        hits = await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "COSINE"}, 1)
+        assert hits[0]["id"] == 1
+        stats = {s["uri"]: s for s in connect_api.client.endpoint_stats()}
+        assert not stats["memory://fast"]["healthy"] and stats["memory://slow"]["healthy"]
+        # Recovered endpoints are picked up again by the next health check
+        clients["memory://fast"].error_rate = 0.0
+        connect_api.client.pool.check()
+        assert connect_api.client.pool.ranked()[0].uri == "memory://fast"
+
+    def test_request_errors_do_not_fail_over(self, connect_api):
+        with pytest.raises(MilvusException):
+            connect_api.client.describe_collection("missing")
+        assert all(s["healthy"] for s in connect_api.client.endpoint_stats())
+
+    def test_no_reachable_endpoint(self):
+        pool = EndpointPool(["memory://a"], lambda uri, options: InMemoryMilvusClient(uri, error_rate=1.0),
+                            health_check_interval=None)
+        with pytest.raises(MilvusAPIError):
+            pool.connect()
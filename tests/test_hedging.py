@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import pytest
+from src.milvus.connect import ConnectAPI
+from src.milvus.hedging import HedgePolicy
+from src.milvus.milvus import MilvusAPI
+
+
+@pytest.fixture
+def api():
+    # The first endpoint answers probes fastest but is slow to search
+    endpoints = [{"uri": "memory://a", "latency": {"search": 0.3}},
+                 {"uri": "memory://b", "latency": {"list_databases": 0.01}}]
+    with ConnectAPI(uri=endpoints, health_check_interval=None) as connect_api:
+        connect_api.client.create_collection("docs", dimension=2)
+        yield MilvusAPI(connect_api)
+
+
+async def _answer(value, delay, log):
+    try:
+        await asyncio.sleep(delay)
+        return value
+    except asyncio.CancelledError:
+        log.append(value)
+        raise
+
+
+###########################################################
+# HedgePolicy tests
+class TestHedgePolicy:
+    async def test_hedge_after_quantile_and_cancel_loser(self):
+        policy = HedgePolicy(quantile=0.9, budget=1.0, min_samples=5)
+        cancelled = []
+        # No hedge until enough latencies are known
+        assert await policy.run("docs", lambda: _answer("primary", 0.0, cancelled),
+                                lambda: _answer("hedge", 0.0, cancelled)) == "primary"
+        for _ in range(5):
+            policy._record("docs", 0.01)
+        assert policy.delay("docs") == pytest.approx(0.01)
+        result = await policy.run("docs", lambda: _answer("primary", 1.0, cancelled),
+                                  lambda: _answer("hedge", 0.0, cancelled))
+        assert result == "hedge" and cancelled == ["primary"]
+        stats = policy.stats()
+        assert stats["requests"] == 2 and stats["hedges"] == 1 and stats["hedge_wins"] == 1
+
+    async def test_budget_bounds_hedges(self):
+        policy = HedgePolicy(budget=0.05, min_samples=1)
+        policy._record("docs", 0.0)
+        cancelled = []
+        for _ in range(30):
+            await policy.run("docs", lambda: _answer("primary", 0.002, cancelled),
+                             lambda: _answer("hedge", 0.0, cancelled))
+        stats = policy.stats()
+        assert stats["hedges"] <= 2 + 0.05 * 30 and stats["budget_exhausted"] > 0
+
+
+###########################################################
+# SearchAPI hedging tests
+class TestHedgedSearch:
+    async def test_hedge_goes_to_alternate_endpoint(self, api):
+        await api.insert("docs", [{"id": 1, "vector": [0.1, 0.2]}])
+        policy = api.enable_hedging(min_samples=1)
+        policy._record("docs", 0.01)
+        started = time.perf_counter()
+        hits = await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        assert hits[0]["id"] == 1 and time.perf_counter() - started < 0.25
+        stats = api.hedging_stats()
+        assert stats["hedges"] == 1 and stats["hedge_wins"] == 1
+        endpoints = {e.uri: e.client for e in api._connect_api.client.pool.endpoints}
+        assert endpoints["memory://b"].calls["search"] == 1
+        api.disable_hedging()
+        assert api.hedging_stats() == {}
@@ -0,0 +1,115 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from pymilvus import MilvusException
+from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
+from src.milvus.index import IndexAPI
+
+
+class FakeBuildClient:
+    """Client whose index builds advance ``step`` rows per describe_index call."""
+
+    def __init__(self, total_rows=100, step=50, fail=False):
+        self.total_rows = total_rows
+        self.step = step
+        self.fail = fail
+        self.describe_kwargs = []
+        self.indexed = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.create_kwargs = []
+
+    def create_index(self, collection_name, index_params, **kwargs):
+        self.create_kwargs.append(kwargs)
+        if self.fail == "client":
+            raise ConnectionError("channel closed")
+        if self.fail:
+            raise MilvusException(message="out of memory")
+        self.indexed[collection_name] = 0
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def describe_index(self, collection_name, index_name, **kwargs):
+        self.describe_kwargs.append(kwargs)
+        rows = min(self.indexed[collection_name] + self.step, self.total_rows)
+        self.indexed[collection_name] = rows
+        state = "Finished" if rows == self.total_rows else "InProgress"
+        if state == "Finished":
+            self.in_flight -= 1
+        return {"index_name": index_name, "total_rows": self.total_rows, "indexed_rows": rows,
+                "pending_index_rows": self.total_rows - rows, "state": state}
+
+
+def index_api(client, **kwargs):
+    connect_api = MagicMock()
+    connect_api.client = client
+    return IndexAPI(connect_api, poll_interval=0.001, **kwargs)
+
+
+###########################################################
+# IndexAPI build scheduling tests
+class TestIndexBuilds:
+    async def test_create_index_returns_handle(self):
+        client = FakeBuildClient(total_rows=100, step=25)
+        api = index_api(client)
+        handle = await api.create_index("docs", "vector", {"index_type": "HNSW", "metric_type": "L2",
+                                                           "params": {"M": 16}})
+        assert handle.state == "Queued"
+        await handle.wait(timeout=5)
+        assert handle.state == "Finished"
+        assert handle.indexed_rows == 100 and handle.progress == 1.0
+        assert handle.elapsed > 0 and handle.rows_per_second > 0
+        assert client.create_kwargs[0]["sync"] is False
+
+    async def test_database_is_forwarded(self):
+        client = FakeBuildClient(total_rows=10, step=10)
+        await index_api(client).create_index("docs", "vector", {"index_type": "FLAT"}, "analytics", wait=True)
+        assert client.create_kwargs[0]["db_name"] == "analytics"
+        assert client.describe_kwargs == [{"db_name": "analytics"}]
+
+    async def test_scheduler_limits_concurrent_builds(self):
+        client = FakeBuildClient(total_rows=100, step=10)
+        api = index_api(client, max_concurrent_builds=2)
+        handles = [await api.create_index(f"c{i}", "vector", {"index_type": "FLAT"}) for i in range(5)]
+        await api.scheduler.wait_all(timeout=5)
+        assert all(handle.state == "Finished" for handle in handles)
+        assert client.max_in_flight == 2
+
+    async def test_failed_build_raises_on_wait(self):
+        api = index_api(FakeBuildClient(fail=True))
+        handle = await api.create_index("docs", "vector", {"index_type": "FLAT"})
+        with pytest.raises(MilvusAPIError, match="out of memory"):
+            await handle.wait()
+        assert handle.state == "Failed"
+
+    async def test_unexpected_errors_fail_the_build(self):
+        api = index_api(FakeBuildClient(fail="client"))
+        handle = await api.create_index("docs", "vector", {"index_type": "FLAT"})
+        with pytest.raises(MilvusAPIError, match="channel closed"):
+            await handle.wait(timeout=5)
+        assert handle.state == "Failed" and handle.finished_at is not None
+
+    async def test_cancel_queued_build(self):
+        client = FakeBuildClient(total_rows=100, step=1)
+        api = index_api(client, max_concurrent_builds=1)
+        first = await api.create_index("a", "vector", {"index_type": "FLAT"})
+        second = await api.create_index("b", "vector", {"index_type": "FLAT"})
+        await asyncio.sleep(0)
+        assert first.state == "Issued" and not first.cancel()
+        assert second.cancel()
+        with pytest.raises(MilvusAPIError, match="cancelled"):
+            await second.wait()
+        await first.wait(timeout=5)
+        assert "b" not in client.indexed
+
+    async def test_wait_timeout(self):
+        api = index_api(FakeBuildClient(total_rows=10**6, step=1))
+        handle = await api.create_index("docs", "vector", {"index_type": "FLAT"})
+        with pytest.raises(MilvusAPIError, match="did not finish"):
+            await handle.wait(timeout=0.01)
+        handle._task.cancel()
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(MilvusValidationError):
+            index_api(FakeBuildClient(), max_concurrent_builds=0)
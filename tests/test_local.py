@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+from src.milvus.connect import ConnectAPI
+from src.milvus.events import DELETE, CollectionEvent
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.local import BruteForceIndex
+from src.milvus.milvus import MilvusAPI
+from src.milvus.tuning import exact_ground_truth
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        connect_api.client.create_collection("tenant", dimension=8, metric_type="COSINE")
+        yield MilvusAPI(connect_api)
+
+
+def rows(start, count, seed=0):
+    vectors = np.random.default_rng(seed).standard_normal((count, 8), dtype=np.float32)
+    return [{"id": start + i, "vector": vectors[i].tolist(), "tag": i % 3} for i in range(count)]
+
+
+###########################################################
+# BruteForceIndex tests
+class TestBruteForceIndex:
+    @pytest.mark.parametrize("metric_type", ["L2", "IP", "COSINE"])
+    def test_matches_exact_ground_truth(self, metric_type):
+        rng = np.random.default_rng(1)
+        vectors = rng.standard_normal((500, 16), dtype=np.float32)
+        queries = rng.standard_normal((7, 16), dtype=np.float32)
+        index = BruteForceIndex(16, metric_type, capacity=8)
+        index.upsert(list(range(500)), vectors)
+        ids, distances, counts = index.search(queries, 10)
+        np.testing.assert_array_equal(ids.astype(np.int64), exact_ground_truth(vectors, queries, 10, metric_type))
+        assert counts.tolist() == [10] * 7
+        if metric_type == "L2":
+            expected = ((queries[0] - vectors[ids[0, 0]]) ** 2).sum()
+            assert distances[0, 0] == pytest.approx(expected, rel=1e-4)
+
+    def test_delete_and_upsert_keep_rows_contiguous(self):
+        index = BruteForceIndex(2, "L2")
+        index.upsert(["a", "b", "c"], [[0, 0], [1, 0], [2, 0]])
+        assert index.delete(["a", "missing"]) == 1
+        index.upsert(["b"], [[5, 0]])
+        ids, distances, counts = index.search([[0, 0]], 5)
+        assert ids[0, :2].tolist() == ["c", "b"] and counts[0] == 2
+        assert ids[0, 2] is None and np.isnan(distances[0, 2])
+
+
+###########################################################
+# LocalSearchCache tests
+class TestLocalSearchCache:
+    async def test_local_results_match_server_and_follow_writes(self, api):
+        await api.insert("tenant", rows(0, 200))
+        queries = np.random.default_rng(5).standard_normal((3, 8), dtype=np.float32).tolist()
+        remote = await api.search("tenant", queries, "vector", {"metric_type": "COSINE"}, 5, compact=True)
+        api.enable_local_search("tenant", threshold=1000)
+        local = await api.search("tenant", queries, "vector", {"metric_type": "COSINE"}, 5, compact=True)
+        np.testing.assert_array_equal(local.ids, remote.ids)
+        np.testing.assert_allclose(local.distances, remote.distances, rtol=1e-5)
+
+        calls = api._connect_api.client.calls["search"]
+        await api.insert("tenant", rows(1000, 1, seed=9))
+        await api.delete("tenant", "id in [0, 1, 2]")
+        hits = await api.search("tenant", [rows(1000, 1, seed=9)[0]["vector"]], "vector",
+                                {"metric_type": "COSINE"}, 3)
+        assert hits[0]["id"] == 1000 and hits[0]["distance"] == pytest.approx(1.0)
+        assert api._connect_api.client.calls["search"] == calls
+        assert api._local_search.stats()["tenant"]["rows"] == 198
+
+    async def test_mirrors_fill_released_collections_of_their_database(self, api):
+        client = api._connect_api.client
+        client.create_database("analytics")
+        client.create_collection("tenant", dimension=8, metric_type="COSINE", db_name="analytics")
+        await api.insert("tenant", rows(0, 20), database_name="analytics")
+        client.release_collection("tenant", db_name="analytics")
+        api.enable_local_search("tenant", threshold=1000, database_name="analytics")
+        query = [rows(0, 1)[0]["vector"]]
+        hits = await api.search("tenant", query, "vector", {"metric_type": "COSINE"}, 1, database_name="analytics")
+        assert hits[0]["id"] == 0 and client.calls.get("search", 0) == 0
+        assert api._local_search.stats()["tenant"]["rows"] == 20
+
+        # A failed fill falls back to the server instead of raising
+        api.enable_local_search("tenant", threshold=1000, database_name="analytics")
+        client.error_rate = {"query_iterator": 1.0}
+        hits = await api.search("tenant", query, "vector", {"metric_type": "COSINE"}, 1, database_name="analytics")
+        assert hits[0]["id"] == 0 and client.calls["search"] == 1
+
+    async def test_writes_that_cannot_be_applied_drop_the_mirror(self, api):
+        await api.insert("tenant", rows(0, 20))
+        api.enable_local_search("tenant", threshold=1000)
+        await api.search("tenant", [[0.5] * 8], "vector", {"metric_type": "COSINE"}, 3)
+        assert api._local_search.stats()["tenant"]["rows"] == 20
+        with pytest.raises(MilvusValidationError):
+            api._local_search.update(CollectionEvent(DELETE, "tenant", expr="id in ["))
+        assert api._local_search.stats()["tenant"]["rows"] is None
+
+    async def test_server_answers_filtered_and_oversized_searches(self, api):
+        await api.insert("tenant", rows(0, 50))
+        api.enable_local_search("tenant", threshold=60)
+        query = [[0.5] * 8]
+        await api.search("tenant", query, "vector", {"metric_type": "COSINE"}, 3, expr="tag == 1")
+        await api.insert("tenant", rows(100, 20))
+        await api.search("tenant", query, "vector", {"metric_type": "COSINE"}, 3)
+        stats = api._local_search.stats()["tenant"]
+        assert stats["local"] == 0 and stats["remote"] == 2 and stats["oversized"]
+        await api.delete("tenant", "id >= 100")
+        await api.search("tenant", query, "vector", {"metric_type": "COSINE"}, 3)
+        assert api._local_search.stats()["tenant"]["local"] == 1
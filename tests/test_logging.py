@@ -0,0 +1,83 @@
+import json
+import logging
+import sys
+
+import pytest
+from src.logger import (
+    BoundedQueueHandler,
+    JsonFormatter,
+    RateLimitFilter,
+    logging_stats,
+    stop_queue_logging,
+    use_queue_logging,
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record, self.format(record)))
+
+
+def _record(name="svc", level=logging.DEBUG, msg="hello %s", args=("world",), **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+###########################################################
+# Formatter and filter tests
+class TestLogPipelineParts:
+    def test_json_formatter_keeps_extras_and_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("svc", logging.ERROR, __file__, 7, "failed %d", (3,), sys.exc_info())
+        record.request_id = "r-1"
+        entry = json.loads(JsonFormatter().format(record))
+        assert entry["message"] == "failed 3" and entry["level"] == "ERROR" and entry["request_id"] == "r-1"
+        assert "ValueError: boom" in entry["exception"]
+
+    def test_rate_limit_and_sampling_per_logger(self):
+        limiter = RateLimitFilter(rate=1.0, burst=3)
+        assert [limiter.filter(_record()) for _ in range(5)] == [True, True, True, False, False]
+        # Other loggers have their own budget and warnings always pass
+        assert limiter.filter(_record(name="other")) and limiter.filter(_record(level=logging.WARNING))
+        assert limiter.suppressed == {"svc": 2}
+        sampler = RateLimitFilter(sample=0.0)
+        assert not sampler.filter(_record()) and sampler.filter(_record(level=logging.ERROR))
+
+    def test_full_queue_drops_or_rejects_policy(self):
+        handler = BoundedQueueHandler(queue_size=2, policy="drop")
+        for _ in range(5):
+            handler.handle(_record())
+        assert handler.queue.qsize() == 2 and handler.dropped == 3
+        blocking = BoundedQueueHandler(queue_size=1, policy="block", timeout=0.01)
+        blocking.handle(_record())
+        blocking.handle(_record())
+        assert blocking.dropped == 1
+        with pytest.raises(ValueError):
+            BoundedQueueHandler(policy="spill")
+
+
+###########################################################
+# Queue logging mode tests
+class TestQueueLogging:
+    def test_records_are_written_by_the_listener(self):
+        output = _ListHandler()
+        logger = logging.getLogger("test_logging.queue")
+        logger.setLevel(logging.DEBUG)
+        try:
+            use_queue_logging(queue_size=100, json_format=True, rate_limit=1.0, burst=2, handlers=[output])
+            for i in range(4):
+                logger.debug("event %d", i, extra={"tenant": "a"})
+            stats = logging_stats()
+            assert stats["mode"] == "queue" and stats["suppressed"] == {"test_logging.queue": 2}
+        finally:
+            stop_queue_logging()
+        assert logging_stats() == {"mode": "sync"}
+        entries = [json.loads(text) for record, text in output.records if record.name == "test_logging.queue"]
+        assert [e["message"] for e in entries] == ["event 0", "event 1"] and entries[0]["tenant"] == "a"
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from pymilvus import DataType, MilvusException
+from src.milvus.connect import ConnectAPI
+from src.milvus.memory import InMemoryMilvusClient
+from src.milvus.milvus import MilvusAPI
+from src.milvus.tuning import IndexTuner, candidate_grid
+
+
+@pytest.fixture
+def client():
+    client = InMemoryMilvusClient(seed=0)
+    schema = client.create_schema(auto_id=False, enable_dynamic_field=True)
+    schema.add_field("id", DataType.INT64, is_primary=True)
+    schema.add_field("vector", DataType.FLOAT_VECTOR, dim=2)
+    schema.add_field("tag", DataType.VARCHAR, max_length=16)
+    client.create_collection("docs", schema=schema)
+    client.create_partition("docs", "p1")
+    client.insert("docs", [{"id": i, "vector": [float(i), 1.0], "tag": "even" if i % 2 == 0 else "odd",
+                            "score": i * 10} for i in range(6)])
+    client.insert("docs", [{"id": 100, "vector": [0.0, 0.0], "tag": "new"}], partition_name="p1")
+    return client
+
+
+@pytest.fixture
+def connect_api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        yield connect_api
+
+
+###########################################################
+# InMemoryMilvusClient tests
+class TestInMemoryMilvusClient:
+    def test_requires_load(self, client):
+        with pytest.raises(MilvusException, match="not loaded"):
+            client.search("docs", [[0.0, 1.0]], limit=2, search_params={"metric_type": "L2"})
+
+    def test_exact_search_with_filter_and_partitions(self, client):
+        client.load_collection("docs")
+        hits = client.search("docs", [[2.1, 1.0]], limit=2, search_params={"metric_type": "L2"},
+                             output_fields=["tag"])
+        assert [hit["id"] for hit in hits[0]] == [2, 3]
+        assert hits[0][0]["distance"] == pytest.approx(0.01, abs=1e-5)
+        assert hits[0][0]["entity"] == {"tag": "even"}
+        hits = client.search("docs", [[2.1, 1.0]], limit=2, filter='tag == "odd" and id > 1',
+                             search_params={"metric_type": "L2"})
+        assert [hit["id"] for hit in hits[0]] == [3, 5]
+        hits = client.search("docs", [[2.1, 1.0]], limit=5, partition_names=["p1"],
+                             search_params={"metric_type": "L2"})
+        assert [hit["id"] for hit in hits[0]] == [100]
+
+    def test_query_dynamic_fields_and_delete(self, client):
+        client.load_collection("docs")
+        rows = client.query("docs", filter="score in [20, 40]", output_fields=["tag", "score"])
+        assert rows == [{"id": 2, "tag": "even", "score": 20}, {"id": 4, "tag": "even", "score": 40}]
+        assert client.delete("docs", filter="id < 3")["delete_count"] == 3
+        assert client.query("docs", output_fields=["count(*)"], limit=100) == [{"count(*)": 4}]
+        assert client.get_collection_stats("docs") == {"row_count": 4}
+
+    def test_query_iterator(self, client):
+        client.load_collection("docs")
+        iterator = client.query_iterator("docs", batch_size=3)
+        pages = []
+        while page := iterator.next():
+            pages.append(len(page))
+        assert pages == [3, 3, 1]
+
+    def test_injected_errors(self):
+        client = InMemoryMilvusClient(error_rate={"list_collections": 1.0})
+        assert client.list_databases() == ["default"]
+        with pytest.raises(MilvusException, match="injected failure"):
+            client.list_collections()
+
+
+###########################################################
+# ConnectAPI and MilvusAPI over the in-memory client
+class TestInMemoryBackend:
+    async def test_milvus_api_round_trip(self, connect_api):
+        assert isinstance(connect_api.client, InMemoryMilvusClient)
+        connect_api.client.create_collection("docs", dimension=3, metric_type="COSINE")
+        api = MilvusAPI(connect_api)
+        await api.insert("docs", [{"id": i, "vector": [1.0, float(i), 0.0]} for i in range(10)])
+        results = await api.search("docs", [[1.0, 2.0, 0.0]], "vector", {"metric_type": "COSINE"}, 3)
+        assert results[0]["id"] == 2
+        await api.delete("docs", "id >= 5")
+        assert (await api.get_collection_stats("docs"))["row_count"] == 5
+        compact = await api.search("docs", [[1.0, 9.0, 0.0], [1.0, 0.0, 0.0]], "vector",
+                                   {"metric_type": "COSINE"}, 2, compact=True)
+        assert compact.ids.tolist() == [[4, 3], [0, 1]]
+
+    async def test_databases_are_selected_per_call(self, connect_api):
+        client = connect_api.client
+        client.create_database("analytics")
+        client.create_collection("docs", dimension=2)
+        client.create_collection("docs", dimension=2, db_name="analytics")
+        client.release_collection("docs", db_name="analytics")
+        api = MilvusAPI(connect_api)
+        await api.insert("docs", [{"id": 7, "vector": [0.1, 0.2]}], database_name="analytics")
+        hits = await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1, database_name="analytics")
+        assert hits[0]["id"] == 7 and client.get_load_state("docs", db_name="analytics")["state"].name == "Loaded"
+        assert (await api.get_collection_stats("docs"))["row_count"] == 0
+        assert (await api.get_collection_stats("docs", database_name="analytics"))["row_count"] == 1
+        with pytest.raises(MilvusException, match="database not found"):
+            client.list_collections(db_name="missing")
+
+    def test_index_tuner_runs_offline(self):
+        rng = np.random.default_rng(3)
+        vectors = rng.random((500, 8), dtype=np.float32)
+        tuner = IndexTuner(InMemoryMilvusClient(), vectors, vectors[:20], k=5, metric_type="IP")
+        results = tuner.run(candidate_grid("HNSW", {"M": [8]}, {"ef": [16, 32]}))
+        assert [result.recall for result in results] == [1.0, 1.0]
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+from src.milvus.connect import ConnectAPI
+from src.milvus.metadata import MetadataCache
+from src.milvus.milvus import MilvusAPI
+
+
+class _Server:
+    def __init__(self, databases=("default",), delay=0.05):
+        self.databases = list(databases)
+        self.delay = delay
+        self.calls = {"list": 0, "create": 0}
+
+    def list_databases(self):
+        self.calls["list"] += 1
+        time.sleep(self.delay)
+        return list(self.databases)
+
+    def create_database(self, name):
+        self.calls["create"] += 1
+        self.databases.append(name)
+
+
+###########################################################
+# MetadataCache tests
+class TestMetadataCache:
+    def test_concurrent_threads_share_one_check(self):
+        cache, server = MetadataCache(ttl=60), _Server()
+        threads = [threading.Thread(target=cache.ensure_database,
+                                    args=("cluster", "tenant", server.list_databases, server.create_database))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert server.calls == {"list": 1, "create": 1}
+        # Databases of the listing are known too
+        assert cache.ensure_database("cluster", "default", server.list_databases, server.create_database)
+        assert server.calls["list"] == 1 and cache.stats()["coalesced"] == 7
+
+    def test_entries_expire(self):
+        cache, server = MetadataCache(ttl=0.02), _Server(delay=0)
+        cache.ensure_database("cluster", "default", server.list_databases, server.create_database)
+        time.sleep(0.03)
+        cache.ensure_database("cluster", "default", server.list_databases, server.create_database)
+        assert server.calls == {"list": 2, "create": 0}
+
+    async def test_concurrent_tasks_share_one_check(self):
+        cache, checks = MetadataCache(ttl=60), []
+
+        async def exists(answer):
+            checks.append(answer)
+            await asyncio.sleep(0.02)
+            return answer
+
+        results = await asyncio.gather(*(cache.has_collection_async("cluster", "", "docs", lambda: exists(True))
+                                         for _ in range(8)))
+        assert all(results) and len(checks) == 1
+        assert await cache.has_collection_async("cluster", "default", "docs", lambda: exists(False))
+        # Missing collections are not cached
+        assert not await cache.has_collection_async("cluster", "", "other", lambda: exists(False))
+        assert not await cache.has_collection_async("cluster", "", "other", lambda: exists(False))
+        assert len(checks) == 3
+        cache.forget("cluster", "default", "docs")
+        assert not await cache.has_collection_async("cluster", "", "docs", lambda: exists(False))
+
+
+###########################################################
+# ConnectAPI metadata cache tests
+class TestConnectMetadataCache:
+    async def test_reconnects_skip_database_check(self):
+        cache = MetadataCache(ttl=60)
+        with ConnectAPI(uri="memory://", db_name="tenant", metadata_cache=cache) as first:
+            assert first.client.calls["list_databases"] == 1
+            with ConnectAPI(uri="memory://", db_name="tenant", metadata_cache=cache,
+                            shared=first.client) as second:
+                assert "list_databases" not in second.client.calls
+            # Another deployment with the same URI is checked again
+            with ConnectAPI(uri="memory://", db_name="tenant", metadata_cache=cache) as other:
+                assert other.client.calls["list_databases"] == 1
+            api = MilvusAPI(first)
+            first.client.create_collection("docs", dimension=2)
+            assert cache.has_collection(first.metadata_scope, "default", "docs", lambda: True)
+            await api.drop_collection("docs")
+            assert not cache.has_collection(first.metadata_scope, "default", "docs", lambda: False)
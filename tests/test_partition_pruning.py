@@ -0,0 +1,148 @@
+from unittest.mock import MagicMock
+
+import pytest
+from src.milvus.connect import ConnectAPI
+from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
+from src.milvus.expression import Comparison, Interval, Membership, Opaque, parse_expression
+from src.milvus.partition import PartitionKey, PartitionScheme
+from src.milvus.milvus import MilvusAPI
+from src.milvus.search import SearchAPI
+
+DAY = 86400
+
+
+@pytest.fixture
+def scheme():
+    return PartitionScheme(
+        [PartitionKey("tenant"), PartitionKey("ts", width=DAY)],
+        pattern=r"(?P<tenant>[a-z]+)_(?P<ts>[0-9]+)",
+    )
+
+
+@pytest.fixture
+def partitions():
+    return ["_default", "acme_0", f"acme_{DAY}", f"acme_{2 * DAY}", f"beta_{DAY}"]
+
+
+###########################################################
+# Expression parser tests
+class TestParseExpression:
+    def test_comparison(self):
+        assert parse_expression('tenant == "acme"') == Comparison("tenant", "==", "acme")
+
+    def test_mirrored_comparison(self):
+        assert parse_expression("100 < ts") == Comparison("ts", ">", 100)
+
+    def test_membership(self):
+        assert parse_expression("id not in [1, 2]") == Membership("id", (1, 2), True)
+
+    def test_unsupported_terms_are_opaque(self):
+        tree = parse_expression('name like "a%" && ts > 1')
+        assert isinstance(tree.operands[0], Opaque)
+        assert tree.operands[1] == Comparison("ts", ">", 1)
+
+    def test_malformed_expression(self):
+        with pytest.raises(MilvusValidationError):
+            parse_expression("ts > 1 and (")
+
+    def test_kleene_evaluation(self):
+        tree = parse_expression('tenant == "acme" or ts >= 10')
+        assert tree.evaluate({"tenant": Interval.point("acme")}) is True
+        assert tree.evaluate({"tenant": Interval.point("beta")}) is None
+        assert tree.evaluate({"tenant": Interval.point("beta"), "ts": Interval(0, 10)}) is False
+
+
+###########################################################
+# PartitionScheme tests
+class TestPartitionScheme:
+    def test_prune_by_tenant_and_range(self, scheme, partitions):
+        selected = scheme.prune(f'tenant == "acme" and ts >= {DAY} and ts < {2 * DAY}', partitions)
+        assert selected == ["_default", f"acme_{DAY}"]
+
+    def test_prune_with_membership(self, scheme, partitions):
+        selected = scheme.prune('tenant in ["beta"]', partitions)
+        assert selected == ["_default", f"beta_{DAY}"]
+
+    def test_unrelated_filter_keeps_all(self, scheme, partitions):
+        assert scheme.prune("price > 10", partitions) == partitions
+
+    def test_negation(self, scheme, partitions):
+        assert scheme.prune('not (tenant == "acme")', partitions) == ["_default", f"beta_{DAY}"]
+
+    def test_explicit_partitions(self):
+        scheme = PartitionScheme([PartitionKey("tenant")]).add_partition("p1", tenant="a")
+        scheme.add_partition("p2", tenant="b")
+        assert scheme.partition_names() == ["p1", "p2"]
+        assert scheme.prune('tenant == "b"', scheme.partition_names()) == ["p2"]
+
+    def test_undescribed_listed_partitions_are_kept(self):
+        scheme = PartitionScheme([PartitionKey("tenant")]).add_partition("p_a", tenant="a")
+        names = scheme.partition_names(lambda: ["p_a", "_default", "p_b"])
+        assert names == ["p_a", "_default", "p_b"]
+        assert scheme.prune('tenant == "z"', names) == ["_default", "p_b"]
+
+    def test_pattern_must_use_keys(self):
+        with pytest.raises(MilvusValidationError):
+            PartitionScheme([PartitionKey("tenant")], pattern=r"(?P<other>\w+)")
+
+
+###########################################################
+# SearchAPI integration tests
+class TestSearchAPIPruning:
+    def test_resolve_partitions(self, scheme, partitions):
+        connect_api = MagicMock()
+        connect_api.client.list_partitions.return_value = partitions
+        api = SearchAPI(connect_api)
+        api.register_partition_scheme("docs", scheme)
+        assert api.resolve_partitions("docs", 'tenant == "beta"') == ["_default", f"beta_{DAY}"]
+        assert api.resolve_partitions("docs", 'tenant == "beta"', ["p"]) == ["p"]
+        assert api.resolve_partitions("other", 'tenant == "beta"') is None
+        # The partition list is cached for the scheme's TTL
+        api.resolve_partitions("docs", 'tenant == "acme"')
+        connect_api.client.list_partitions.assert_called_once_with(collection_name="docs", db_name="default")
+
+    async def test_search_skipped_when_nothing_matches(self):
+        connect_api = MagicMock()
+        api = SearchAPI(connect_api)
+        api.register_partition_scheme("docs", PartitionScheme([PartitionKey("tenant")]).add_partition("p1", tenant="a"))
+        assert await api.search("docs", [[0.1] * 4], "vector", {}, 5, expr='tenant == "z"') == []
+        connect_api.client.search.assert_not_called()
+
+    async def test_rows_in_default_partition_are_searched(self):
+        with ConnectAPI(uri="memory://") as connect_api:
+            connect_api.client.create_collection("docs", dimension=2)
+            connect_api.client.create_partition("docs", "p_a")
+            api = MilvusAPI(connect_api)
+            await api.insert("docs", [{"id": 1, "vector": [0.1, 0.2], "tenant": "a"}])
+            api.register_partition_scheme("docs", PartitionScheme([PartitionKey("tenant")]).add_partition(
+                "p_a", tenant="a"))
+            hits = await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1, expr='tenant == "a"')
+            assert [hit["id"] for hit in hits] == [1]
+
+    async def test_partition_listing_errors_are_wrapped(self):
+        with ConnectAPI(uri="memory://") as connect_api:
+            connect_api.client.create_collection("docs", dimension=2)
+            connect_api.client.error_rate = {"list_partitions": 1.0}
+            api = MilvusAPI(connect_api)
+            api.register_partition_scheme("docs", PartitionScheme([PartitionKey("tenant")]))
+            with pytest.raises(MilvusAPIError, match="Partition listing failed"):
+                await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1, expr='tenant == "a"')
+            with pytest.raises(MilvusAPIError, match="Partition listing failed"):
+                await api.query("docs", 'tenant == "a"')
+
+    async def test_schemes_are_per_database(self):
+        with ConnectAPI(uri="memory://") as connect_api:
+            client = connect_api.client
+            client.create_database("analytics")
+            client.create_collection("docs", dimension=2)
+            client.create_collection("docs", dimension=2, db_name="analytics")
+            client.create_partition("docs", "p_a", db_name="analytics")
+            client.insert("docs", [{"id": 1, "vector": [0.1, 0.2], "tenant": "a"}])
+            api = MilvusAPI(connect_api)
+            scheme = PartitionScheme([PartitionKey("tenant")]).add_partition("p_a", tenant="a")
+            api.register_partition_scheme("docs", scheme, database_name="analytics")
+            assert api._search_api.resolve_partitions("docs", 'tenant == "a"') is None
+            assert await api._search_api.resolve_partitions_async(
+                "docs", 'tenant == "a"', database_name="analytics") == ["p_a", "_default"]
+            hits = await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1, expr='tenant == "a"')
+            assert [hit["id"] for hit in hits] == [1]
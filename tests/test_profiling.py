@@ -0,0 +1,79 @@
+import json
+import pstats
+import time
+
+import pytest
+from src.milvus.connect import ConnectAPI
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.milvus import MilvusAPI
+from src.milvus.profiling import ProfileHook, get_profiling_session, stop_profiling
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        connect_api.client.create_collection("docs", dimension=2)
+        yield MilvusAPI(connect_api)
+    stop_profiling()
+
+
+class CountingHook(ProfileHook):
+    kind = "count"
+
+    def __init__(self):
+        self.calls = []
+
+    def start(self, operation):
+        return operation
+
+    def stop(self, operation, token):
+        self.calls.append(token)
+
+    def dump(self, prefix):
+        return []
+
+
+###########################################################
+# Profiling tests
+class TestProfiling:
+    async def test_cpu_profiles_are_written_per_operation(self, api, tmp_path):
+        api.start_profiling("cpu", output_dir=str(tmp_path))
+        await api.insert("docs", [{"id": 1, "vector": [0.1, 0.2]}])
+        await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        assert api.profiling_stats()["operations"] == {"MilvusAPI.insert": {"sampled": 1},
+                                                       "MilvusAPI.search": {"sampled": 1}}
+        files = api.stop_profiling()
+        search = next(f for f in files if f.endswith("MilvusAPI.search.prof"))
+        assert any("search" in function for _, _, function in pstats.Stats(search).stats)
+        summary = json.loads(open(files[-1]).read())
+        assert summary["kind"] == "cpu" and summary["sampled"] == 2 and not summary["active"]
+        # After the session, calls are not profiled any more
+        await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        assert api.profiling_stats()["calls"] == 2
+
+    async def test_memory_profiles_fold_allocating_stacks(self, api, tmp_path):
+        api.start_profiling("memory", output_dir=str(tmp_path), operations=["MilvusAPI.insert"])
+        await api.insert("docs", [{"id": i, "vector": [0.1 * i, 0.2]} for i in range(200)])
+        await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        stats = api.profiling_stats()
+        assert list(stats["operations"]) == ["MilvusAPI.insert"]
+        assert stats["operations"]["MilvusAPI.insert"]["peak_bytes"] > 0
+        folded = next(f for f in api.stop_profiling() if f.endswith(".folded"))
+        stack, size = open(folded).readline().rsplit(" ", 1)
+        assert int(size) > 0 and ".py:" in stack
+
+    async def test_sampling_window_and_custom_hooks(self, api, tmp_path):
+        hook = CountingHook()
+        api.start_profiling(output_dir=str(tmp_path), sample_rate=0.5, hook=hook)
+        for i in range(40):
+            await api.insert("docs", [{"id": i, "vector": [0.1, 0.2]}])
+        stats = api.profiling_stats()
+        assert stats["calls"] == 40 and 0 < stats["sampled"] < 40
+        assert len(hook.calls) == stats["sampled"]
+
+        session = api.start_profiling(output_dir=str(tmp_path), duration=0.05, hook=CountingHook())
+        assert get_profiling_session() is session and session.stats()["active"]
+        time.sleep(0.2)
+        assert not session.stats()["active"] and session.files[-1].endswith("-count-summary.json")
+        with pytest.raises(MilvusValidationError):
+            api.start_profiling("gpu")
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from pymilvus import MilvusException
+from src.milvus.connect import ConnectAPI
+from src.milvus.exceptions import MilvusAPIError, MilvusValidationError
+from src.milvus.milvus import MilvusAPI
+from src.milvus.query import QueryAPI
+
+
+class FakeIterator:
+    """Blocking iterator that serves ``pages`` pages of ``size`` entities."""
+
+    def __init__(self, pages: int, size: int, fail_at: int | None = None):
+        self.pages = pages
+        self.size = size
+        self.fail_at = fail_at
+        self.served = 0
+        self.closed = threading.Event()
+
+    def next(self):
+        if self.fail_at is not None and self.served == self.fail_at:
+            raise MilvusException(message="query node unavailable")
+        if self.served >= self.pages:
+            return []
+        start = self.served * self.size
+        self.served += 1
+        return [{"id": i} for i in range(start, start + self.size)]
+
+    def close(self):
+        self.closed.set()
+
+
+@pytest.fixture
+def connect_api():
+    return MagicMock()
+
+
+###########################################################
+# QueryAPI tests
+class TestQueryAPI:
+    async def test_query(self, connect_api):
+        connect_api.client.query.return_value = [{"id": 1}]
+        api = QueryAPI(connect_api)
+        assert await api.query("docs", "id > 0", ["id"], limit=10) == [{"id": 1}]
+        connect_api.client.query.assert_called_once_with(
+            collection_name="docs", filter="id > 0", output_fields=["id"], partition_names=None, db_name="default", limit=10)
+
+    async def test_query_requires_filter_or_limit(self, connect_api):
+        with pytest.raises(MilvusValidationError):
+            await QueryAPI(connect_api).query("docs")
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    async def test_query_iterator_streams_all_pages(self, connect_api, prefetch):
+        iterator = FakeIterator(pages=5, size=4)
+        connect_api.client.query_iterator.return_value = iterator
+        api = QueryAPI(connect_api, page_size=4, prefetch=prefetch)
+        pages = [page async for page in api.query_iterator("docs", "id >= 0")]
+        assert [len(page) for page in pages] == [4] * 5
+        assert pages[-1][-1] == {"id": 19}
+        assert iterator.closed.is_set()
+        assert connect_api.client.query_iterator.call_args.kwargs["batch_size"] == 4
+
+    async def test_prefetch_overlaps_consumption(self, connect_api):
+        iterator = FakeIterator(pages=10, size=1)
+        connect_api.client.query_iterator.return_value = iterator
+        api = QueryAPI(connect_api, prefetch=2)
+        stream = api.query_iterator("docs")
+        await stream.__anext__()
+        await asyncio.sleep(0.05)
+        # One page consumed, two read ahead; the producer is bounded by the queue
+        assert 3 <= iterator.served <= 4
+        await stream.aclose()
+        assert iterator.closed.is_set()
+
+    async def test_close_waits_for_the_page_in_flight(self, connect_api):
+        iterator = FakeIterator(pages=10, size=1)
+        busy, overlapped = threading.Event(), []
+        next_page, close = iterator.next, iterator.close
+
+        def slow_next():
+            busy.set()
+            threading.Event().wait(0.05)
+            busy.clear()
+            return next_page()
+
+        def checked_close():
+            overlapped.append(busy.is_set())
+            close()
+
+        iterator.next, iterator.close = slow_next, checked_close
+        connect_api.client.query_iterator.return_value = iterator
+        stream = QueryAPI(connect_api, prefetch=1).query_iterator("docs")
+        await stream.__anext__()
+        await asyncio.sleep(0.01)  # the producer is reading ahead
+        await stream.aclose()
+        assert overlapped == [False]
+
+    async def test_iterators_read_the_requested_database(self):
+        with ConnectAPI(uri="memory://") as connect_api:
+            client = connect_api.client
+            client.create_database("analytics")
+            client.create_collection("docs", dimension=2)
+            client.create_collection("docs", dimension=2, db_name="analytics")
+            client.insert("docs", [{"id": i, "vector": [0.1 * i, 0.2]} for i in range(5)], db_name="analytics")
+            api = MilvusAPI(connect_api)
+            pages = [page async for page in api.query_iterator("docs", page_size=2, database_name="analytics")]
+            assert [len(page) for page in pages] == [2, 2, 1]
+            hits = [page async for page in api.search_iterator("docs", [[0.0, 0.2]], "vector", {"metric_type": "L2"},
+                                                               database_name="analytics")]
+            assert hits[0][0]["id"] == 0
+            assert [page async for page in api.query_iterator("docs")] == []
+
+    async def test_iterator_error(self, connect_api):
+        connect_api.client.query_iterator.return_value = FakeIterator(pages=5, size=2, fail_at=2)
+        api = QueryAPI(connect_api)
+        with pytest.raises(MilvusAPIError, match="query node unavailable"):
+            async for _ in api.query_iterator("docs"):
+                pass
+
+    async def test_search_iterator_takes_one_vector(self, connect_api):
+        api = QueryAPI(connect_api)
+        with pytest.raises(MilvusValidationError):
+            async for _ in api.search_iterator("docs", [[0.1], [0.2]], "vector"):
+                pass
+
+    def test_invalid_page_size(self, connect_api):
+        with pytest.raises(MilvusValidationError):
+            QueryAPI(connect_api, page_size=0)
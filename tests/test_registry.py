@@ -0,0 +1,54 @@
+import threading
+
+from src.milvus.connect import ConnectAPI
+from src.milvus.milvus import MilvusAPI
+from src.milvus.registry import ConnectionRegistry
+
+
+###########################################################
+# ConnectionRegistry tests
+class TestConnectionRegistry:
+    def test_facades_are_not_singletons(self):
+        first, second = ConnectAPI(uri="memory://a"), ConnectAPI(uri="memory://b")
+        assert first is not second
+        with first, second:
+            assert MilvusAPI(first)._connect_api is first and MilvusAPI(second)._connect_api is second
+
+    def test_keys_share_or_separate_facades(self):
+        registry = ConnectionRegistry()
+        primary = registry.acquire("memory://primary", db_name="tenant_a")
+        assert registry.acquire("memory://primary", db_name="tenant_a") is primary
+        tenant_b = registry.acquire("memory://primary", db_name="tenant_b")
+        dr = registry.acquire("memory://dr", db_name="tenant_a")
+        assert len({id(primary), id(tenant_b), id(dr)}) == 3
+        primary._connect_api.client.create_collection("docs", dimension=2)
+        # Databases of one deployment are shared; other clusters are not
+        assert "tenant_b" in primary._connect_api.client.list_databases()
+        assert tenant_b._connect_api.client.list_collections() == []
+        assert dr._connect_api.client.list_databases() == ["default", "tenant_a"]
+        assert dr._connect_api.client.list_collections() == []
+        registry.close_all()
+
+    def test_lazy_build_and_reference_counted_teardown(self):
+        registry = ConnectionRegistry()
+        assert registry.stats() == []
+        with registry.lease("memory://", db_name="tenant_a") as api:
+            connect_api = api._connect_api
+            with registry.lease("memory://", db_name="tenant_a") as again:
+                assert again is api and registry.stats()[0]["refs"] == 2
+            assert connect_api.client is not None
+        assert connect_api.client is None and registry.stats() == []
+
+    def test_concurrent_acquire_builds_once(self):
+        registry = ConnectionRegistry()
+        facades = []
+        threads = [threading.Thread(target=lambda: facades.append(registry.acquire("memory://", user="svc")))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(api) for api in facades}) == 1 and registry.stats()[0]["refs"] == 8
+        for api in facades:
+            registry.release(api)
+        assert registry.stats() == []
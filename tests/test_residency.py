@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from src.milvus.capacity import index_params_of
+from src.milvus.connect import ConnectAPI
+from src.milvus.milvus import MilvusAPI
+
+PARTITIONS = [f"day_{i}" for i in range(4)]
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        client = connect_api.client
+        client.create_collection("events", dimension=2)
+        for i, name in enumerate(PARTITIONS):
+            client.create_partition("events", name)
+            client.insert("events", [{"id": 10 * i + j, "vector": [0.1 * j, 0.2]} for j in range(10)],
+                          partition_name=name)
+        client.release_collection("events")
+        yield MilvusAPI(connect_api)
+
+
+async def search(api, *partitions):
+    return await api.search("events", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1,
+                            partition_names=list(partitions))
+
+
+def loaded(api):
+    return [name for name in PARTITIONS
+            if str(api._connect_api.client.get_load_state("events", name)["state"]).endswith("Loaded")]
+
+
+###########################################################
+# Partition residency tests
+class TestPartitionResidency:
+    async def test_searches_load_partitions_and_evict_least_recently_used(self, api):
+        client = api._connect_api.client
+        one = api.estimate_capacity(client.describe_collection("events"), 10,
+                                    index_params_of(client, "events")).memory_bytes
+        api.enable_partition_residency(["events"], memory_budget=2 * one)
+        assert await search(api, "day_0") and loaded(api) == ["day_0"]
+        await search(api, "day_1")
+        await search(api, "day_0")
+        await search(api, "day_2")
+        assert loaded(api) == ["day_0", "day_2"]
+        stats = api.partition_residency_stats()
+        assert stats["used_bytes"] == 2 * one and stats["pinned"] == 0
+        assert (stats["loads"], stats["hits"], stats["evictions"]) == (3, 1, 1)
+        assert stats["partitions"] == {"default": {"events": ["day_0", "day_2"]}}
+        # Inserts grow a resident partition; drops forget the collection
+        await api.insert("events", [{"id": 99, "vector": [0.3, 0.3]}], partition_name="day_2")
+        assert api.partition_residency_stats()["used_bytes"] > 2 * one
+        await api.drop_collection("events")
+        assert api.partition_residency_stats()["resident"] == 0
+
+    async def test_concurrent_loads_are_coalesced(self, api):
+        client = api._connect_api.client
+        client.latency = {"load_partitions": 0.05}
+        api.enable_partition_residency(["events"], memory_budget=2 ** 30)
+        results = await asyncio.gather(*(search(api, "day_1") for _ in range(5)))
+        assert all(results) and client.calls["load_partitions"] == 1
+        stats = api.partition_residency_stats()
+        assert stats["loads"] == 1 and stats["coalesced"] == 4
+
+    async def test_pinned_partitions_are_not_evicted(self, api):
+        manager = api.enable_partition_residency(["events"], memory_budget=1)
+        pinned = await manager.acquire("events", ["day_0", "day_1"])
+        assert loaded(api) == ["day_0", "day_1"] and manager.stats()["over_budget"] == 2
+        manager.release("events", pinned)
+        await search(api, "day_3")
+        assert loaded(api) == ["day_3"]
+        # Unmanaged collections keep loading the whole collection
+        api.disable_partition_residency()
+        await search(api, "day_0")
+        assert loaded(api) == PARTITIONS
+
+    async def test_partitions_being_evicted_are_loaded_after_the_release(self, api):
+        client = api._connect_api.client
+        sizes = {"day_0": 1, "day_1": 1, "day_2": 2, "day_3": 1}
+
+        async def size_of(collection_name, partition_name, database_name):
+            return sizes[partition_name]
+
+        manager = api.enable_partition_residency(["events"], memory_budget=2)
+        manager._size_of = size_of
+        await search(api, "day_0")
+        await search(api, "day_1")
+        client.latency = {"release_partitions": 0.05}
+
+        async def search_day_1():
+            await asyncio.sleep(0.01)  # day_2 is evicting day_0 and day_1 by now
+            return await search(api, "day_1")
+
+        await asyncio.gather(search(api, "day_2"), search_day_1())
+        assert loaded(api) == ["day_1", "day_2"]
+        assert manager.stats()["partitions"] == {"default": {"events": ["day_2", "day_1"]}}
+
+    async def test_partitions_are_kept_per_database(self, api):
+        client = api._connect_api.client
+        client.create_database("archive")
+        client.use_database("archive")
+        client.create_collection("events", dimension=2)
+        client.create_partition("events", "day_0")
+        client.insert("events", [{"id": 0, "vector": [0.1, 0.2]}], partition_name="day_0")
+        client.release_collection("events")
+        client.use_database("default")
+        manager = api.enable_partition_residency(["events"], memory_budget=2 ** 30, database_name="archive")
+        assert not manager.manages("events")
+        assert await api.search("events", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1,
+                                partition_names=["day_0"], database_name="archive")
+        assert manager.stats()["partitions"] == {"archive": {"events": ["day_0"]}} and loaded(api) == []
+        await manager.discard("events", "day_0", "archive")
+        assert manager.stats()["resident"] == 0
+        client.use_database("archive")
+        assert not str(client.get_load_state("events", "day_0")["state"]).endswith("Loaded")
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+from pymilvus import MilvusException
+from src.milvus.connect import ConnectAPI
+from src.milvus.exceptions import MilvusAPIError
+from src.milvus.milvus import MilvusAPI
+from src.milvus.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakers,
+    RetryBudget,
+    is_backend_failure,
+)
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://", health_check_interval=None,
+                    circuit_breakers=CircuitBreakers(failure_threshold=2, recovery_timeout=0.05),
+                    retry_budget=RetryBudget(ratio=0.5, min_per_second=0.0)) as connect_api:
+        connect_api.client.create_collection("docs", dimension=2)
+        yield MilvusAPI(connect_api)
+
+
+###########################################################
+# CircuitBreaker and RetryBudget tests
+class TestResiliencePrimitives:
+    def test_breaker_transitions(self):
+        breaker = CircuitBreaker("search@a", failure_threshold=2, recovery_timeout=0.05)
+        breaker.record_failure()
+        assert breaker.allow() and breaker.state == CLOSED
+        breaker.record_failure()
+        assert breaker.state == OPEN and not breaker.allow()
+        time.sleep(0.06)
+        assert breaker.allow() and breaker.state == HALF_OPEN
+        assert not breaker.allow()  # a single probe at a time
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.record_success()
+        metrics = breaker.metrics()
+        assert metrics["state"] == CLOSED and metrics["opened"] == 2 and metrics["rejections"] == 2
+
+    def test_retry_budget_and_error_classes(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0.0, capacity=2)
+        assert budget.try_spend() and not budget.try_spend()
+        budget.record_request()
+        budget.record_request()
+        assert budget.try_spend()
+        assert budget.metrics()["exhausted"] == 1
+        assert is_backend_failure(MilvusException(code=1, message="node down"))
+        assert not is_backend_failure(MilvusException(code=100, message="collection not found"))
+
+
+###########################################################
+# Endpoint circuit breaker tests
+class TestEndpointBreakers:
+    async def test_open_circuit_fails_fast_and_closes_after_probe(self, api):
+        client = api._connect_api.client
+        backend = client.pool.endpoints[0].client
+        await api.insert("docs", [{"id": 1, "vector": [0.1, 0.2]}])
+        backend.error_rate = {"search": 1.0}
+        for _ in range(2):
+            with pytest.raises(MilvusAPIError):
+                await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        calls = backend.calls["search"]
+        with pytest.raises(MilvusAPIError, match="Circuit open"):
+            await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        assert backend.calls["search"] == calls
+        # Other operations on the endpoint are unaffected
+        assert client.has_collection("docs")
+        breakers = {b["operation"]: b for b in api.resilience_metrics()["circuit_breakers"]}
+        assert breakers["search"]["state"] == OPEN and breakers["has_collection"]["state"] == CLOSED
+        backend.error_rate = 0.0
+        time.sleep(0.06)
+        hits = await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        assert hits[0]["id"] == 1
+        breakers = {b["operation"]: b for b in api.resilience_metrics()["circuit_breakers"]}
+        assert breakers["search"]["state"] == CLOSED
+
+    def test_request_errors_do_not_trip_the_breaker(self, api):
+        client = api._connect_api.client
+        for _ in range(3):
+            with pytest.raises(MilvusException):
+                client.describe_collection("missing")
+        breakers = {b["operation"]: b for b in api.resilience_metrics()["circuit_breakers"]}
+        assert breakers["describe_collection"]["state"] == CLOSED
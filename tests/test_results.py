@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from src.milvus.results import ColumnarSearchResult, larger_is_closer
+
+
+@pytest.fixture
+def hits():
+    return [
+        [{"pk": 3, "distance": 0.3, "entity": {"tag": "c"}}, {"pk": 1, "distance": 0.1, "entity": {"tag": "a"}}],
+        [{"pk": 7, "distance": 0.7, "entity": {"tag": "g"}}],
+    ]
+
+
+###########################################################
+# ColumnarSearchResult tests
+class TestColumnarSearchResult:
+    def test_from_hits_pads_rows(self, hits):
+        result = ColumnarSearchResult.from_hits(hits, limit=3)
+        assert result.pk_name == "pk"
+        assert result.ids.tolist() == [[3, 1, -1], [7, -1, -1]]
+        assert result.distances.dtype == np.float32
+        assert np.isnan(result.distances[1, 1:]).all()
+        assert result.counts.tolist() == [2, 1]
+        assert result.mask.tolist() == [[True, True, False], [True, False, False]]
+        assert result.fields["tag"][0, 1] == "a"
+
+    def test_rows_are_materialized_on_access(self, hits):
+        result = ColumnarSearchResult.from_hits(hits, limit=3)
+        assert len(result) == 2
+        assert result[1] == [{"pk": 7, "distance": pytest.approx(0.7), "entity": {"tag": "g"}}]
+        assert [len(row) for row in result.to_dicts()] == [2, 1]
+
+    def test_from_hits_uses_hits_columns(self):
+        class Hits(list):
+            ids = [5, 6]
+            distances = [0.5, 0.6]
+
+        result = ColumnarSearchResult.from_hits([Hits([{"id": 5, "distance": 0.5}, {"id": 6, "distance": 0.6}])])
+        assert result.ids.tolist() == [[5, 6]]
+
+    def test_sort(self, hits):
+        result = ColumnarSearchResult.from_hits(hits, limit=3).sort()
+        assert result.ids.tolist() == [[1, 3, -1], [7, -1, -1]]
+        assert result.sort(descending=True).ids[0, :2].tolist() == [3, 1]
+
+    def test_merge_keeps_best_hits(self):
+        left = ColumnarSearchResult(np.array([[1, 2]]), np.array([[0.1, 0.5]], dtype=np.float32))
+        right = ColumnarSearchResult(np.array([[3, -1]]), np.array([[0.2, np.nan]], dtype=np.float32),
+                                     np.array([1]))
+        merged = ColumnarSearchResult.merge([left, right], limit=2)
+        assert merged.ids.tolist() == [[1, 3]]
+        assert merged.counts.tolist() == [2]
+        merged = ColumnarSearchResult.merge([left, right], limit=2, descending=True)
+        assert merged.ids.tolist() == [[2, 3]]
+
+    def test_empty(self):
+        result = ColumnarSearchResult.empty(2, 5)
+        assert result.to_dicts() == [[], []]
+
+    def test_metric_direction(self):
+        assert larger_is_closer("cosine")
+        assert not larger_is_closer("L2")
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from src.milvus.connect import ConnectAPI
+from src.milvus.milvus import MilvusAPI
+from src.milvus.semantic_cache import SemanticQueryCache
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        connect_api.client.create_collection("docs", dimension=4, metric_type="COSINE")
+        yield MilvusAPI(connect_api)
+
+
+###########################################################
+# SemanticQueryCache tests
+class TestSemanticQueryCache:
+    def test_threshold_and_lru_eviction(self):
+        cache = SemanticQueryCache(threshold=0.99, capacity=2)
+        key = cache.search_key("docs", "vector", {"metric_type": "COSINE"}, 5)
+        cache.store(key, [1, 0, 0, 0], [{"id": 1, "distance": 1.0, "entity": {}}])
+        cache.store(key, [0, 1, 0, 0], [{"id": 2, "distance": 1.0, "entity": {}}])
+        assert cache.lookup(key, [1, 0.01, 0, 0])[0]["id"] == 1
+        assert cache.lookup(key, [1, 0.5, 0, 0]) is None
+        assert cache.lookup(cache.search_key("docs", "vector", {"metric_type": "COSINE"}, 6), [1, 0, 0, 0]) is None
+        cache.store(key, [0, 0, 1, 0], [{"id": 3, "distance": 1.0, "entity": {}}])  # evicts [0, 1, 0, 0]
+        assert cache.lookup(key, [0, 1, 0, 0]) is None
+        assert cache.lookup(key, [1, 0, 0, 0]) is not None
+        stats = cache.stats()
+        assert stats["evictions"] == 1 and stats["hits"] == 2 and stats["size"] == 2
+
+    def test_results_are_copies_and_writes_during_search_are_not_cached(self):
+        cache = SemanticQueryCache()
+        key = cache.search_key("docs", "vector", {}, 1)
+        cache.store(key, [1, 0], [{"id": 1, "distance": 1.0, "entity": {}}])
+        cache.lookup(key, [1, 0])[0]["id"] = 99
+        assert cache.lookup(key, [1, 0])[0]["id"] == 1
+        generation = cache.generation("docs")
+        cache.invalidate("docs")
+        cache.store(key, [1, 0], [], generation)
+        assert cache.lookup(key, [1, 0]) is None
+
+
+###########################################################
+# MilvusAPI query cache tests
+class TestQueryCacheIntegration:
+    async def test_hits_invalidation_and_false_hits(self, api):
+        await api.insert("docs", [{"id": i, "vector": np.eye(4)[i].tolist()} for i in range(4)])
+        api.enable_query_cache(threshold=0.95)
+        client = api._connect_api.client
+        params = {"metric_type": "COSINE"}
+        first = await api.search("docs", [[1.0, 0.0, 0.0, 0.0]], "vector", params, 1)
+        calls = client.calls["search"]
+        noisy = await api.search("docs", [[1.0, 0.001, 0.0, 0.0]], "vector", params, 1)
+        assert noisy == first and client.calls["search"] == calls
+
+        await api.insert("docs", [{"id": 9, "vector": [1.0, 0.01, 0.0, 0.0]}])
+        hits = await api.search("docs", [[1.0, 0.01, 0.0, 0.0]], "vector", params, 1)
+        assert hits[0]["id"] == 9 and client.calls["search"] == calls + 1
+
+        # A loose threshold serves a wrong neighbour; verification counts and replaces it
+        cache = api.enable_query_cache(threshold=0.4, verify_fraction=1.0)
+        await api.search("docs", [[0.0, 1.0, 0.0, 0.0]], "vector", params, 1)
+        hits = await api.search("docs", [[0.0, 0.6, 1.0, 0.0]], "vector", params, 1)
+        assert hits[0]["id"] == 2
+        stats = api.query_cache_stats()
+        assert stats["false_hits"] == 1 and stats["false_hit_rate"] == 1.0
+        assert cache.lookup(cache.search_key("docs", "vector", params, 1, database_name="default", rerank=False,
+                                             compact=False), [0.0, 0.6, 1.0, 0.0])[0]["id"] == 2
+
+    async def test_only_cosine_searches_are_cached(self, api):
+        await api.insert("docs", [{"id": i, "vector": np.eye(4)[i].tolist()} for i in range(4)])
+        api.enable_query_cache(threshold=0.95)
+        client = api._connect_api.client
+        for _ in range(2):
+            await api.search("docs", [[1.0, 0.0, 0.0, 0.0]], "vector", {"metric_type": "L2"}, 1)
+            await api.search("docs", [[2.0, 0.0, 0.0, 0.0]], "vector", {}, 1)
+        assert client.calls["search"] == 4 and api.query_cache_stats()["lookups"] == 0
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+from src.milvus.connect import ConnectAPI
+from src.milvus.dataset import DataGenerator
+from src.milvus.hnsw import HNSWIndex
+from src.milvus.milvus import MilvusAPI
+from src.milvus.tuning import exact_ground_truth, recall_at_k
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        client = connect_api.client
+        client.create_collection("docs", dimension=8, metric_type="COSINE")
+        client.create_partition("docs", "hot")
+        yield MilvusAPI(connect_api)
+
+
+def rows(start, count, seed=0):
+    vectors = np.random.default_rng(seed).standard_normal((count, 8), dtype=np.float32)
+    return [{"id": start + i, "vector": vectors[i].tolist()} for i in range(count)]
+
+
+###########################################################
+# HNSWIndex tests
+class TestHNSWIndex:
+    @pytest.mark.parametrize("metric_type", ["L2", "COSINE"])
+    def test_recall_against_exact_search(self, metric_type):
+        vectors, _ = DataGenerator(dim=16, clusters=8, cluster_std=0.5, seed=3).generate_chunk(0, 800)
+        queries, _ = DataGenerator(dim=16, clusters=8, cluster_std=0.5, seed=3).generate_chunk(1, 20)
+        index = HNSWIndex(16, metric_type, M=8, ef_construction=48)
+        index.add_items(list(range(800)), vectors)
+        ids, distances, counts = index.search(queries, 10, ef=48)
+        assert recall_at_k(ids.astype(np.int64), exact_ground_truth(vectors, queries, 10, metric_type), 10) > 0.95
+        assert (counts == 10).all()
+        steps = np.diff(distances, axis=1)
+        assert (steps >= 0).all() if metric_type == "L2" else (steps <= 0).all()
+
+    def test_remove_and_replace(self):
+        index = HNSWIndex(2, "L2", M=4)
+        index.add_items(["a", "b", "c"], [[0, 0], [1, 0], [2, 0]])
+        index.remove(["a"])
+        index.add("b", [9, 0])
+        ids, _, counts = index.search([[0, 0]], 3)
+        assert ids[0].tolist() == ["c", "b", None] and counts[0] == 2
+        assert len(index) == 2 and index.deleted_fraction == pytest.approx(0.5)
+
+
+###########################################################
+# ShadowIndexManager tests
+class TestShadowIndexManager:
+    async def test_serves_hot_partition_and_follows_writes(self, api):
+        await api.insert("docs", rows(0, 100), partition_name="hot")
+        await api.insert("docs", rows(1000, 10, seed=1))
+        api.designate_hot_partition("docs", "hot", M=8, ef_construction=32)
+        client, shadows = api._connect_api.client, api._shadow_indexes
+        query = [rows(0, 1)[0]["vector"]]
+
+        # The first search falls back to the server and starts the build
+        hits = await api.search("docs", query, "vector", {"metric_type": "COSINE"}, 3, partition_names=["hot"])
+        assert hits[0]["id"] == 0
+        await shadows.refresh("docs", "hot")
+        calls = client.calls["search"]
+        hits = await api.search("docs", query, "vector", {"metric_type": "COSINE"}, 3, partition_names=["hot"])
+        assert hits[0]["id"] == 0 and client.calls["search"] == calls
+
+        # Own writes: served by the server until applied, then by the shadow
+        await api.delete("docs", "id in [0]")
+        await api.search("docs", query, "vector", {"metric_type": "COSINE"}, 3, partition_names=["hot"])
+        await shadows.refresh("docs", "hot")
+        hits = await api.search("docs", query, "vector", {"metric_type": "COSINE"}, 3, partition_names=["hot"])
+        assert hits[0]["id"] != 0 and client.calls["search"] == calls + 1
+        assert shadows.stats()["docs/hot"]["rows"] == 99
+
+    async def test_out_of_band_writes_trigger_rebuild(self, api):
+        await api.insert("docs", rows(0, 50), partition_name="hot")
+        api.designate_hot_partition("docs", "hot", max_staleness=0.0, M=8)
+        shadows = api._shadow_indexes
+        await shadows.refresh("docs", "hot")
+        api._connect_api.client.insert("docs", rows(500, 5, seed=2), partition_name="hot")
+        result = await api.search("docs", [[0.5] * 8], "vector", {"metric_type": "COSINE"}, 3,
+                                  partition_names=["hot"])
+        assert result and shadows.stats()["docs/hot"]["fallbacks"] == 1
+        await shadows.refresh("docs", "hot")
+        stats = shadows.stats()["docs/hot"]
+        assert stats["rows"] == 55 and stats["rebuilds"] == 2
+
+    async def test_deleted_rows_do_not_look_like_out_of_band_writes(self, api):
+        await api.insert("docs", rows(0, 50), partition_name="hot")
+        api.designate_hot_partition("docs", "hot", max_staleness=0.0, M=8)
+        shadows, client = api._shadow_indexes, api._connect_api.client
+        await shadows.refresh("docs", "hot")
+        await api.delete("docs", "id in [0, 1]")
+        # Like Milvus before compaction, partition stats still count the deleted rows
+        client.get_partition_stats = lambda **kwargs: {"row_count": 50}
+        await shadows.refresh("docs", "hot")
+        await shadows.refresh("docs", "hot")
+        stats = shadows.stats()["docs/hot"]
+        assert stats["rows"] == 48 and stats["rebuilds"] == 1
+
+    async def test_shadows_follow_their_database(self, api):
+        client, shadows = api._connect_api.client, api._shadow_indexes
+        client.create_database("archive")
+        client.use_database("archive")
+        client.create_collection("docs", dimension=8, metric_type="COSINE")
+        client.create_partition("docs", "hot")
+        client.use_database("default")
+        await api.insert("docs", rows(0, 20), partition_name="hot")
+        await api.insert("docs", rows(100, 30, seed=3), partition_name="hot", database_name="archive")
+        api.designate_hot_partition("docs", "hot", max_staleness=0.0, database_name="archive", M=8)
+        await shadows.refresh("docs", "hot")
+        await shadows.refresh("docs", "hot")
+        stats = shadows.stats()["docs/hot"]
+        assert stats["rows"] == 30 and stats["rebuilds"] == 1
@@ -0,0 +1,76 @@
+import pytest
+from src.milvus.connect import ConnectAPI
+from src.milvus.exceptions import MilvusAPIError
+from src.milvus.milvus import MilvusAPI
+from src.milvus.tracing import (
+    ERROR,
+    NOOP_SPAN,
+    InMemorySpanExporter,
+    disable_tracing,
+    enable_tracing,
+    span,
+)
+
+
+@pytest.fixture
+def api():
+    with ConnectAPI(uri="memory://") as connect_api:
+        connect_api.client.create_collection("docs", dimension=2)
+        yield MilvusAPI(connect_api)
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    enable_tracing(exporter)
+    yield exporter
+    disable_tracing()
+
+
+###########################################################
+# Tracing tests
+class TestTracing:
+    async def test_disabled_tracing_is_a_no_op(self, api):
+        assert span("search.rpc", collection="docs") is NOOP_SPAN
+        with span("anything") as step:
+            step.set_attribute("rows", 1)
+        await api.insert("docs", [{"id": 1, "vector": [0.1, 0.2]}])
+
+    async def test_search_spans_nest_with_attributes(self, api, exporter):
+        await api.insert("docs", [{"id": 1, "vector": [0.1, 0.2]}, {"id": 2, "vector": [0.2, 0.1]}])
+        await api.search("docs", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 2)
+        [root] = exporter.find("MilvusAPI.search")
+        assert root.parent_id is None
+        assert root.attributes == {"collection": "docs", "nq": 1, "limit": 2, "metric_type": "L2"}
+        steps = [s for s in exporter.spans if s.trace_id == root.trace_id and s is not root]
+        assert {s.name for s in steps} >= {"search.validate", "search.load", "search.rpc", "search.postprocess"}
+        assert all(s.parent_id == root.span_id for s in steps)
+        assert exporter.find("search.postprocess")[0].attributes["hits"] == 2
+        assert exporter.find("MilvusAPI.insert")[0].attributes["rows"] == 2
+        assert exporter.find("insert.rpc")[0].attributes == {"rows": 2}
+        assert exporter.summary()["search.rpc"]["count"] == 1
+
+    async def test_iterator_spans_cover_every_page(self, api, exporter):
+        await api.insert("docs", [{"id": i, "vector": [0.1 * i, 0.2]} for i in range(5)])
+        exporter.clear()
+        pages = 0
+        async for _ in api.query_iterator("docs", output_fields=["id"], page_size=2):
+            pages += 1
+            with span("consumer"):
+                pass
+        [root] = exporter.find("MilvusAPI.query_iterator")
+        assert root.attributes == {"collection": "docs", "pages": pages} and pages == 3
+        children = exporter.find("MilvusAPI.query_iterator.page")
+        assert len(children) == pages + 1 and all(s.parent_id == root.span_id for s in children)
+        assert exporter.find("consumer")[0].parent_id is None
+        assert root.start_ns <= children[0].start_ns and children[-1].end_ns <= root.end_ns
+
+    async def test_failures_and_sampling(self, api, exporter):
+        with pytest.raises(MilvusAPIError):
+            await api.search("missing", [[0.1, 0.2]], "vector", {"metric_type": "L2"}, 1)
+        [root] = exporter.find("MilvusAPI.search")
+        assert root.status == ERROR and "MilvusAPIError" in root.error
+        enable_tracing(exporter, sample_rate=0.0)
+        exporter.clear()
+        await api.insert("docs", [{"id": 1, "vector": [0.1, 0.2]}])
+        assert exporter.spans == []
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+from pymilvus import MilvusClient
+from src.milvus.exceptions import MilvusValidationError
+from src.milvus.tuning import (
+    IndexCandidate,
+    IndexTuner,
+    TuningResult,
+    candidate_grid,
+    default_candidates,
+    exact_ground_truth,
+    pareto_front,
+    recall_at_k,
+)
+
+
+class ExactClient:
+    """Minimal MilvusClient-compatible client answering searches exactly."""
+
+    def __init__(self):
+        self.vectors = {}
+        self.calls = []
+
+    def has_collection(self, collection_name):
+        return False
+
+    create_schema = staticmethod(MilvusClient.create_schema)
+    prepare_index_params = staticmethod(MilvusClient.prepare_index_params)
+
+    def create_collection(self, collection_name, schema):
+        self.calls.append("create_collection")
+
+    def insert(self, collection_name, data):
+        self.vectors.update((row["id"], np.asarray(row["vector"])) for row in data)
+
+    def flush(self, collection_name):
+        pass
+
+    def create_index(self, collection_name, index_params):
+        self.calls.append(f"create_index:{list(index_params)[0].index_type}")
+
+    def load_collection(self, collection_name):
+        pass
+
+    def release_collection(self, collection_name):
+        pass
+
+    def drop_index(self, collection_name, index_name):
+        self.calls.append("drop_index")
+
+    def drop_collection(self, collection_name):
+        self.calls.append("drop_collection")
+
+    def search(self, collection_name, data, limit, search_params, anns_field):
+        ids = np.array(list(self.vectors))
+        matrix = np.stack([self.vectors[i] for i in ids])
+        distances = ((matrix - np.asarray(data[0])) ** 2).sum(axis=1)
+        return [[{"id": int(i), "distance": float(distances[i])} for i in ids[np.argsort(distances)[:limit]]]]
+
+
+###########################################################
+# Tuning helper tests
+class TestTuningHelpers:
+    def test_candidate_grid_is_cartesian(self):
+        candidates = candidate_grid("HNSW", {"M": [16, 32]}, {"ef": [64, 128, 256]})
+        assert len(candidates) == 6
+        assert len({candidate.build_key for candidate in candidates}) == 2
+        assert candidates[0].index_params("L2") == {"index_type": "HNSW", "metric_type": "L2",
+                                                    "params": {"M": 16}}
+
+    def test_default_candidates_rejects_unknown_type(self):
+        with pytest.raises(MilvusValidationError):
+            default_candidates(["NOPE"])
+
+    @pytest.mark.parametrize("metric", ["L2", "IP", "COSINE"])
+    def test_exact_ground_truth(self, metric):
+        rng = np.random.default_rng(1)
+        vectors = rng.random((300, 8), dtype=np.float32)
+        queries = rng.random((7, 8), dtype=np.float32)
+        truth = exact_ground_truth(vectors, queries, k=5, metric_type=metric, chunk_size=3)
+        if metric == "L2":
+            expected = np.argsort(((queries[:, None] - vectors[None]) ** 2).sum(-1), axis=1)[:, :5]
+        else:
+            if metric == "COSINE":
+                vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+            expected = np.argsort(-(queries @ vectors.T), axis=1)[:, :5]
+        assert truth.tolist() == expected.tolist()
+
+    def test_recall_at_k(self):
+        truth = np.array([[1, 2], [3, 4]])
+        assert recall_at_k([[1, 2], [4, 9]], truth, 2) == 0.75
+
+    def test_pareto_front(self):
+        results = [TuningResult(IndexCandidate("X", search_params={"p": i}), recall, qps, 0, 0, 0)
+                   for i, (recall, qps) in enumerate([(0.99, 100), (0.95, 50), (0.9, 400), (0.8, 300)])]
+        front = pareto_front(results)
+        assert [result.candidate.search_params["p"] for result in front] == [0, 2]
+        assert [result.pareto for result in results] == [True, False, True, False]
+
+
+###########################################################
+# IndexTuner tests
+class TestIndexTuner:
+    def test_run_builds_each_index_once(self):
+        rng = np.random.default_rng(2)
+        vectors = rng.random((200, 4), dtype=np.float32)
+        client = ExactClient()
+        tuner = IndexTuner(client, vectors, vectors[:10], k=5, metric_type="L2", insert_batch_size=64)
+        results = tuner.run(candidate_grid("IVF_FLAT", {"nlist": [16]}, {"nprobe": [1, 4]})
+                            + [IndexCandidate("FLAT")])
+        assert [call for call in client.calls if call.startswith("create_index")] == [
+            "create_index:IVF_FLAT", "create_index:FLAT"]
+        assert client.calls[-1] == "drop_collection"
+        assert all(result.recall == 1.0 for result in results)
+        assert any(result.pareto for result in results)
+        assert IndexTuner.best(results, min_recall=0.9) is not None
+        assert "IVF_FLAT(nlist=16)[nprobe=4]" in tuner.report(results)
+
+    def test_rejects_mismatched_dimensions(self):
+        with pytest.raises(MilvusValidationError):
+            IndexTuner(ExactClient(), np.zeros((4, 3)), np.zeros((2, 5)))